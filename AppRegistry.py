@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import importlib
+from collections import namedtuple
+from functools import partial
+
+from GraphicsEventSystem import *
+
+# item of the start menu
+# name: name shown in the start menu
+# icon: colored 35x35 icon as display list (rects, one fill color per rect, white lines), None for no icon
+# factory: function(windowManager, x, y) that is called when the item is clicked, returns the created app (or None)
+# x, y: preferred position of the app window (passed to the factory)
+# taskbarIcon: monochrome icon of the app windows in the taskbar as rects that are filled in black
+# className: class name of the app, used to find the entry of an open app (None for items that are no apps)
+# isolated: true if the app runs in a separate process (see RemoteApp)
+AppEntry = namedtuple("AppEntry", "name icon factory x y taskbarIcon className isolated",
+                      defaults=(0, 0, None, None, False))
+
+
+class AppRegistry:
+    """
+    Items of the start menu. Apps register themselves with the module and class name, the module is only imported
+    when the app is launched for the first time (or restored from a session).
+    """
+    def __init__(self):
+        # entries in start menu order
+        self.entries = []
+        self.entriesByClassName = {}
+        # module names of the registered apps and app classes that were already loaded, by class name
+        self.moduleNames = {}
+        self.loadedClasses = {}
+        # increased whenever an entry is added, the start menu compares it to find out if its cache is still valid
+        self.generation = 0
+
+    def register(self, entry):
+        """
+        Add an item to the start menu.
+        :param entry: AppEntry of the item
+        """
+        self.entries.append(entry)
+        if entry.className is not None:
+            self.entriesByClassName[entry.className] = entry
+        self.generation += 1
+
+    def registerApp(self, name, moduleName, className, x, y, icon=None, taskbarIcon=None, isolated=False):
+        """
+        Register an app without importing its module.
+        :param name: name shown in the start menu
+        :param moduleName: module of the app
+        :param className: app class, constructed with (windowSystem, x, y)
+        :param x: preferred x value of the app window's origin
+        :param y: preferred y value of the app window's origin
+        :param icon: start menu icon (see AppEntry)
+        :param taskbarIcon: taskbar icon (see AppEntry)
+        :param isolated: run the app in a separate process, so it can't block or crash the window system
+        """
+        self.moduleNames[className] = moduleName
+        self.register(AppEntry(name, icon, partial(self.launchApp, className), x, y, taskbarIcon, className,
+                               isolated))
+
+    # factory of registered apps
+    def launchApp(self, className, windowManager, x, y):
+        return windowManager.createApp(self.loadClass(className), x, y)
+
+    def loadClass(self, className):
+        """
+        Import the module of the app (on first use) and return the app class.
+        :param className: class name of a registered app
+        :return: app class
+        """
+        if className not in self.loadedClasses:
+            module = importlib.import_module(self.moduleNames[className])
+            self.loadedClasses[className] = getattr(module, className)
+        return self.loadedClasses[className]
+
+    def entryForClassName(self, className):
+        """
+        :return: entry of the app with the given class name or None if there is no such app
+        """
+        return self.entriesByClassName.get(className)
+
+    def isIsolated(self, className):
+        """
+        :return: true if the app with the given class name is registered to run in a separate process
+        """
+        entry = self.entryForClassName(className)
+        return entry is not None and entry.isolated
+
+    def entryForApp(self, app):
+        """
+        :return: entry of an open app or None if the app is not registered
+        """
+        # apps in another process (see RemoteApp) store the class of the app
+        return self.entryForClassName(getattr(app, "appClass", type(app)).__name__)
+
+
+# start menu item that closes the window system
+def shutdown(windowManager, x, y):
+    windowManager.shutdown()
+
+
+# apps of the start menu
+defaultRegistry = AppRegistry()
+# Hello World App: white "H" on yellow background
+defaultRegistry.registerApp(
+    "Hello World", "HelloWorldApp", "HelloWorldApp", 200, 200,
+    icon=([(0, 0, 35, 35), (5, 5, 10, 30), (25, 5, 30, 30), (5, 15, 30, 20)],
+          ["#E0E081", COLOR_WHITE, COLOR_WHITE, COLOR_WHITE], []),
+    taskbarIcon=[(5, 5, 10, 30), (25, 5, 30, 30), (5, 15, 30, 20)])
+# Colors App: red, green and blue line on dark background
+defaultRegistry.registerApp(
+    "Colors", "ColorsApp", "ColorsApp", 700, 100,
+    icon=([(0, 0, 35, 35), (10, 5, 25, 10), (10, 15, 25, 20), (10, 25, 25, 30)],
+          ["#404040", "#D80000", "#0EB102", "#0001F8"], []),
+    taskbarIcon=[(10, 5, 25, 10), (10, 15, 25, 20), (10, 25, 25, 30)])
+# Calculator App: white division sign on orange background
+defaultRegistry.registerApp(
+    "Calculator", "CalculatorApp", "CalculatorApp", 1200, 200,
+    icon=([(0, 0, 35, 35), (12.5, 5, 21, 12.5), (5, 15, 30, 20), (12.5, 22.5, 21, 30)],
+          ["#FE9F0B", COLOR_WHITE, COLOR_WHITE, COLOR_WHITE], []),
+    taskbarIcon=[(12.5, 5, 21, 12.5), (5, 15, 30, 20), (12.5, 22.5, 21, 30)])
+# Resizing App: white brackets on cyan background
+defaultRegistry.registerApp(
+    "Resizing", "ResizingApp", "ResizingApp", 400, 120,
+    icon=([(0, 0, 35, 35), (5, 5, 20, 10), (5, 5, 10, 20), (15, 25, 30, 30), (25, 15, 30, 30)],
+          ["#04DDF9", COLOR_WHITE, COLOR_WHITE, COLOR_WHITE, COLOR_WHITE], []),
+    taskbarIcon=[(5, 5, 20, 10), (5, 5, 10, 20), (15, 25, 30, 30), (25, 15, 30, 30)])
+# Shutdown: white cross on red background
+defaultRegistry.register(AppEntry("Shutdown", ([(0, 0, 35, 35)], [COLOR_RED], [(5, 5, 30, 30), (30, 5, 5, 30)]),
+                                  shutdown))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import threading
+from collections import deque
+from collections.abc import Coroutine
+from functools import partial
+
+# asyncio and concurrent.futures are imported when the first task is started: most sessions never start one and the
+# imports take a large part of the start time of the window system
+
+# name prefix of the worker threads of runInBackground
+WORKER_THREAD_PREFIX = "AppWorker"
+
+
+class AsyncBridge:
+    def __init__(self, windowSystem, tickInterval=16, maxWorkers=4, wakeInterval=50):
+        """
+        Asyncio event loop that is driven from the Tk main loop. Apps can run coroutine handlers and background tasks
+        on it without blocking input handling and painting of the other windows.
+        :param windowSystem: Window system the bridge belongs to (used for timers and repaints)
+        :param tickInterval: milliseconds between two iterations of the asyncio loop while tasks are pending
+        :param maxWorkers: maximum number of threads used for blocking work (see runInBackground)
+        :param wakeInterval: milliseconds between two checks for ui updates of other threads (see watchThreads)
+        """
+        self.windowSystem = windowSystem
+        # event loop, created with the first task (see loop)
+        self.eventLoop = None
+        self.tickInterval = tickInterval
+        self.maxWorkers = maxWorkers
+        # thread pool for blocking work, only created when it is needed for the first time
+        self.executor = None
+        # the thread the window system runs on, ui updates are only applied there
+        self.uiThread = threading.current_thread()
+        # tasks started by runTask that were not handled as done yet (see tick)
+        self.tasks = set()
+        # ui updates that are applied in one batch right before the next frame is painted
+        self.pendingUpdates = deque()
+        # true if a task finished since the last frame and the screen has to be repainted
+        self.frameRequested = False
+        # true if the next loop iteration is already scheduled on the Tk main loop
+        self.tickScheduled = False
+        self.wakeInterval = wakeInterval
+        # set by other threads that added ui updates, Tk timers can only be scheduled on the ui thread
+        self.wakeRequested = threading.Event()
+        # true if the next check for ui updates of other threads is scheduled
+        self.watchScheduled = False
+
+    @property
+    def loop(self):
+        if self.eventLoop is None:
+            import asyncio
+            self.eventLoop = asyncio.new_event_loop()
+        return self.eventLoop
+
+    def runTask(self, coroutine):
+        """
+        Schedule a coroutine on the bridge's event loop. Once the coroutine is finished, the next frame is repainted.
+        :param coroutine: coroutine object, e.g. returned by an async app handler
+        :return: created asyncio task
+        """
+        task = self.loop.create_task(coroutine)
+        self.tasks.add(task)
+        self.ensureTicking()
+        return task
+
+    def runInBackground(self, function, *args):
+        """
+        Run a blocking function in a worker thread, so heavy computation or I/O does not stall the window system.
+        Has to be awaited from a coroutine that runs on the bridge (see runTask).
+        :param function: blocking function
+        :param args: arguments passed to the function
+        :return: awaitable future holding the return value of the function
+        """
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix=WORKER_THREAD_PREFIX)
+        return self.loop.run_in_executor(self.executor, partial(function, *args))
+
+    def callOnUIThread(self, callback, *args):
+        """
+        Marshal a ui update back to the ui thread. All updates are batched and applied right before the next frame.
+        Safe to call from any thread.
+        :param callback: function that updates the ui (e.g. sets a label text)
+        :param args: arguments passed to the callback
+        """
+        self.pendingUpdates.append(partial(callback, *args))
+        # Tk must only be touched from the ui thread: other threads set a flag that the ui thread checks periodically
+        # (see watchThreads)
+        if threading.current_thread() is self.uiThread:
+            self.ensureTicking()
+        else:
+            self.wakeRequested.set()
+
+    def callBeforePaint(self, callback, *args):
+        """
+        Queue a ui update for the next frame like callOnUIThread, but without scheduling a tick of the event loop, for
+        changes that are painted anyway (e.g. by the repaint after the current input event). Only call it on the ui
+        thread.
+        :param callback: function that updates the ui
+        :param args: arguments passed to the callback
+        """
+        self.pendingUpdates.append(partial(callback, *args))
+
+    def runHandler(self, handler, *args):
+        """
+        Call an app handler (e.g. a button action) that may be a plain function or a coroutine function.
+        :param handler: function or coroutine function
+        :param args: arguments passed to the handler
+        :return: return value of a plain function or the task of a coroutine
+        """
+        result = handler(*args)
+        if isinstance(result, Coroutine):
+            return self.runTask(result)
+        return result
+
+    def flushUpdates(self):
+        """
+        Apply all pending ui updates. Called by the window system before a frame is painted.
+        """
+        self.frameRequested = False
+        while self.pendingUpdates:
+            self.pendingUpdates.popleft()()
+
+    def handleTaskDone(self, task):
+        # the task probably changed the ui, so paint its changes with the next frame
+        self.frameRequested = True
+        if not task.cancelled() and task.exception() is not None:
+            # report errors of app tasks instead of silently dropping them
+            self.loop.call_exception_handler({"message": "Exception in app task", "exception": task.exception(),
+                                              "task": task})
+
+    def watchThreads(self):
+        """
+        Check for ui updates of other threads every wakeInterval milliseconds while threads that were not started by
+        runInBackground are running. Called by the window system after every frame, so the checks start after the
+        event whose handler started such a thread, and stop once the threads are done.
+        """
+        if self.watchScheduled:
+            return
+        # threads are checked first: a thread that finished already set the flag for its last update
+        if self.otherThreadsRunning() or self.wakeRequested.is_set():
+            self.watchScheduled = True
+            self.windowSystem.scheduleTimer(self.wakeInterval, self.checkWakeup)
+
+    def otherThreadsRunning(self):
+        # true if threads besides the ui thread and the workers of runInBackground are running
+        return any(thread is not self.uiThread and not thread.name.startswith(WORKER_THREAD_PREFIX)
+                   for thread in threading.enumerate())
+
+    def checkWakeup(self):
+        # timer callback of watchThreads: applies ui updates of other threads with the next loop iteration
+        self.watchScheduled = False
+        if self.wakeRequested.is_set():
+            self.wakeRequested.clear()
+            self.ensureTicking()
+        self.watchThreads()
+
+    def ensureTicking(self):
+        # schedule the next loop iteration on the Tk main loop if it is not scheduled yet
+        if not self.tickScheduled:
+            self.tickScheduled = True
+            self.windowSystem.scheduleTimer(self.tickInterval, self.tick)
+
+    def tick(self):
+        """
+        Run one iteration of the asyncio loop and repaint once if tasks finished or ui updates are pending.
+        """
+        self.tickScheduled = False
+        tasksPending = False
+        if self.eventLoop is not None:
+            import asyncio
+            # stop is queued behind all callbacks that are ready right now, so only one iteration runs
+            self.eventLoop.call_soon(self.eventLoop.stop)
+            self.eventLoop.run_forever()
+            # finished tasks are handled here instead of in done callbacks, those would only run with the next
+            # iteration, which does not happen if no other task is pending
+            for task in [task for task in self.tasks if task.done()]:
+                self.tasks.discard(task)
+                self.handleTaskDone(task)
+            tasksPending = bool(asyncio.all_tasks(self.eventLoop))
+
+        if self.frameRequested or self.pendingUpdates:
+            self.windowSystem.requestRepaint()
+
+        # keep ticking as long as tasks are pending, otherwise the loop sleeps until the next task is started
+        if tasksPending or self.pendingUpdates:
+            self.ensureTicking()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# the window system is started in fresh interpreters, so module caches of this process don't affect the results
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# starts the window system and prints the seconds from interpreter start to the end of the first paint
+FIRST_PAINT_SCRIPT = """
+import time
+start = time.perf_counter()
+import WindowSystem
+
+class FirstPaintWindowSystem(WindowSystem.WindowSystem):
+    def handlePaint(self):
+        super().handlePaint()
+        if not hasattr(self, "firstPaintTime"):
+            self.firstPaintTime = time.perf_counter() - start
+            print(self.firstPaintTime)
+            self._window.after(0, self._window.destroy)
+
+FirstPaintWindowSystem(1600, 800)
+"""
+
+# opens the calculator in the headless backend, sweeps the pointer over its window and prints the hits and misses of
+# the screen's hit test cache
+HOVER_SCRIPT = """
+import WindowSystem
+from HeadlessEventSystem import HeadlessEventSystem
+from Replay import TraceEvent
+
+class HoverWindowSystem(WindowSystem.WindowSystem, HeadlessEventSystem):
+    def start(self):
+        super().start()
+        self.lazyConstruction = False
+        app = self.windowManager.launchApp("Calculator")
+        # after the first paint, which adds the window decorations
+        self.scheduleTimer(0, self.sweep, app.appWindow)
+
+    def sweep(self, window):
+        for y in range(int(window.y), int(window.y + window.height), 4):
+            for x in range(int(window.x), int(window.x + window.width), 2):
+                self._handleMouseMoved(TraceEvent(x, y))
+        print(self.screen.hitCacheHits, self.screen.hitCacheMisses)
+
+HoverWindowSystem(1600, 800)
+"""
+
+
+def runPython(*args):
+    return subprocess.run([sys.executable, *args], cwd=DIRECTORY, capture_output=True, text=True)
+
+
+def measureImportTime():
+    """
+    Import the window system with -X importtime.
+    :return: list of (cumulative microseconds, module name), slowest first
+    """
+    result = runPython("-X", "importtime", "-c", "import WindowSystem")
+    imports = []
+    for line in result.stderr.splitlines():
+        # format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), module.strip()))
+    return sorted(imports, reverse=True)
+
+
+def measureFirstPaint():
+    """
+    :return: seconds from interpreter start to the end of the first paint or None if the window system can't start
+    (e.g. no display)
+    """
+    result = runPython("-c", FIRST_PAINT_SCRIPT)
+    if result.returncode != 0 or not result.stdout.strip():
+        print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "window system did not paint",
+              file=sys.stderr)
+        return None
+    return float(result.stdout.split()[0])
+
+
+def measureHoverHitRatio():
+    """
+    :return: (hits, misses) of the hit test cache while the pointer moves over an app window or None if the headless
+    window system can't start
+    """
+    result = runPython("-c", HOVER_SCRIPT)
+    if result.returncode != 0 or not result.stdout.strip():
+        print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "hover benchmark did not finish",
+              file=sys.stderr)
+        return None
+    hits, misses = result.stdout.split()[:2]
+    return int(hits), int(misses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold start and hover hit testing of the window system.")
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts to measure")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to list")
+    arguments = parser.parse_args()
+
+    imports = measureImportTime()
+    if imports:
+        print("import WindowSystem: {:.1f} ms".format(imports[0][0] / 1000))
+        for cumulative, module in imports[:arguments.top]:
+            print("  {:8.1f} ms  {}".format(cumulative / 1000, module))
+
+    times = []
+    for _ in range(arguments.runs):
+        firstPaint = measureFirstPaint()
+        if firstPaint is None:
+            break
+        times.append(firstPaint)
+    if times:
+        print("time to first paint: median {:.1f} ms, min {:.1f} ms ({} runs)".format(
+            statistics.median(times) * 1000, min(times) * 1000, len(times)))
+
+    hitRatio = measureHoverHitRatio()
+    if hitRatio is not None:
+        hits, misses = hitRatio
+        print("hover hit test cache: {:.1f}% hits ({} of {} moves)".format(
+            100 * hits / max(1, hits + misses), hits, hits + misses))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from functools import partial
 from GraphicsEventSystem import *
 from Window import *
 from UITK import *
+from Templates import Template
 
 
 # converts float to string while rounding the value to 6 decimal places and using python's string formatting to
@@ -27,6 +28,37 @@ class Operation(Enum):
     DIVIDE = 4
 
 
+# array of arrays storing button labels in order of button grid layout
+BUTTON_LABELS = [["AC", "C", "%", "/"], ["7", "8", "9", "x"], ["4", "5", "6", "-"], ["1", "2", "3", "+"],
+                 ["+/-", "0", ".", "="]]
+
+
+# spec of the button in row i and column j
+def buttonSpec(i, j):
+    if i == 0 and j != 3:
+        # First row, first three buttons
+        backgroundColor, hoverBackgroundColor = "#B4B4B8", "#A4A1AA"
+    elif j == 3:
+        # operation buttons and = button
+        backgroundColor, hoverBackgroundColor = "#FFC100", "#005249"
+    else:
+        # First three buttons in rows 2 to 5
+        backgroundColor, hoverBackgroundColor = "#C07F00", "#2F4858"
+    return {"type": "Button", "id": "button" + str(i) + str(j), "frame": [0, 0, 40, 40], "anchors": ["top", "left"],
+            "text": BUTTON_LABELS[i][j], "font": {"family": "Helvetica", "size": 14, "weight": BOLD},
+            "fontColor": COLOR_WHITE, "borderColor": COLOR_BLACK, "backgroundColor": backgroundColor,
+            "hoverBackgroundColor": hoverBackgroundColor, "pressedBackgroundColor": COLOR_ORANGE}
+
+
+# widgets of the calculator: input label and a horizontal container for each button row
+CALCULATOR_TEMPLATE = Template(
+    [{"type": "Label", "id": "CalcInputLabel", "frame": [0, 20, 0, 80], "anchors": ["top"], "text": "0",
+      "fontColor": "#C07F00", "font": {"family": "Helvetica", "size": 20, "weight": BOLD}}] +
+    [{"type": "Container", "id": "horContainer" + str(i), "frame": [10, 100 + i * 50, -20, 40],
+      "anchors": ["left", "right", "bottom"], "horizontalDist": True, "spacing": 10,
+      "items": [buttonSpec(i, j) for j in range(4)]} for i in range(5)])
+
+
 class CalculatorApp:
     def __init__(self, windowSystem, x, y):
         self.windowSystem = windowSystem
@@ -34,6 +66,8 @@ class CalculatorApp:
         # top level window of the app
         self.appWindow = Window(x, y, 220, 350, self.windowSystem.getInstanceNumber(identifier) + " " + identifier,
                                 backgroundColor="#3b3b3b")
+        # the calculator has many buttons in containers: only lay them out when the resize drag ends or pauses
+        self.appWindow.deferLayoutWhileResizing = True
         self.windowSystem.screen.addChildWindow(self.appWindow)
         # calculator buttons
         self.buttons = []
@@ -47,57 +81,33 @@ class CalculatorApp:
         self.prevOperation = None
         # store previous input to check edge cases
         self.prevInput = None
+        # the widgets are created after the (empty) app window was shown, input until then is handled afterwards
+        self.widgetsBuilt = False
+        self.pendingInput = []
 
-        self.drawWidgets()
-
-    # draws the calculator app (label, buttons) and creates containers
-    def drawWidgets(self):
-        # INPUT LABEL
-        self.inputLabel = Label(0, 20, self.appWindow.width, 80,
-                                "CalcInputLabel", layoutAnchors=LayoutAnchor.top, fontColor="#C07F00",
-                                font=Font(family="Helvetica", size=20, weight=BOLD), text="0")
-        self.appWindow.addChildWindow(self.inputLabel)
-
-        # BUTTONS
-        # array of arrays storing button labels in order of button grid layout
-        buttonLabels = [["AC", "C", "%", "/"], ["7", "8", "9", "x"], ["4", "5", "6", "-"], ["1", "2", "3", "+"],
-                        ["+/-", "0", ".", "="]]
-
-        # Create Button rows
-        for i in range(5):
-            buttonRow = []
-            # create 4 buttons for each row
-            for j in range(4):
-                button = Button(0, 0, 40, 40, "button" + str(i) + str(j),
-                                text=buttonLabels[i][j], hoverBackgroundColor=COLOR_BLACK,
-                                pressedBackgroundColor=COLOR_ORANGE, layoutAnchors=LayoutAnchor.top | LayoutAnchor.left,
-                                fontColor=COLOR_WHITE, font=Font(family="Helvetica", size=14, weight=BOLD),
-                                borderColor=COLOR_BLACK)
-                button.action = partial(self.handleInput, button.text)
-                if i == 0 and j != 3:
-                    # First row, first three buttons
-                    button.setBackgroundColor("#B4B4B8")
-                    button.hoverBackgroundColor = "#A4A1AA"
-                elif j == 3:
-                    # operation buttons and = button
-                    button.setBackgroundColor("#FFC100")
-                    button.hoverBackgroundColor = "#005249"
-                else:
-                    # First three buttons in rows 2 to 5
-                    button.setBackgroundColor("#C07F00")
-                    button.hoverBackgroundColor = "#2F4858"
-                self.buttons.append(button)
-                self.appWindow.addChildWindow(button)
-                buttonRow.append(button)
-            # create horizontal container for each button row
-            buttonRowContainer = Container(10, 100 + i * 50, self.appWindow.width-20, 40, "horContainer" + str(i),
-                                           layoutAnchors=LayoutAnchor.left | LayoutAnchor.right | LayoutAnchor.bottom,
-                                           horizontalDist=True, containerWindows=buttonRow, spacing=10)
-            self.appWindow.addChildWindow(buttonRowContainer)
+        buildInChunks(self.windowSystem, self.buildWidgets(), self.handleWidgetsBuilt)
+
+    # creates the calculator widgets (label, buttons and containers) from the template (see buildInChunks): the first
+    # calculator of a size is built one button row per step, later ones are copied at once
+    def buildWidgets(self):
+        widgets = yield from CALCULATOR_TEMPLATE.instantiateInSteps(self.appWindow)
+        self.inputLabel = widgets["CalcInputLabel"]
+        self.buttons = [widgets["button" + str(i) + str(j)] for i in range(5) for j in range(4)]
+        for button in self.buttons:
+            button.action = partial(self.handleInput, button.text)
+
+    def handleWidgetsBuilt(self):
+        self.widgetsBuilt = True
+        for userInput in self.pendingInput:
+            self.handleInput(userInput)
+        self.pendingInput.clear()
 
     # gets string value from button press or keyboard input (same as label of respective button)
     # and updates the calculator accordingly
     def handleInput(self, userInput):
+        if not self.widgetsBuilt:
+            self.pendingInput.append(userInput)
+            return
         numbers = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "."]
         operations = ["+", "-", "x", "/"]
         # temporarily store string value which is displayed
@@ -171,6 +181,37 @@ class CalculatorApp:
         # update previous input
         self.prevInput = userInput
 
+    # releases the widgets while the app hibernates (see WindowManager.hibernateApp), the calculation is kept
+    def releaseWidgets(self):
+        self.appWindow.removeChildWindows()
+        self.buttons = []
+        self.inputLabel = None
+        self.widgetsBuilt = False
+
+    # creates the widgets again when the app wakes up from hibernation
+    def rebuildWidgets(self):
+        buildInChunks(self.windowSystem, self.buildWidgets(), self.handleWidgetsBuilt)
+
+    # returns the state of the calculation (used to save the session)
+    def getState(self):
+        return {
+            "text": self.inputLabel.text if self.widgetsBuilt else "0",
+            "currentResult": self.currentResult,
+            "prevOperation": None if self.prevOperation is None else self.prevOperation.name,
+            "overrideInput": self.overrideInput,
+            "prevInput": self.prevInput,
+        }
+
+    # restores a state returned by getState
+    def setState(self, state):
+        self.inputLabel.text = state["text"]
+        self.currentResult = state["currentResult"]
+        self.prevOperation = None if state["prevOperation"] is None else Operation[state["prevOperation"]]
+        self.overrideInput = state["overrideInput"]
+        self.prevInput = state["prevInput"]
+        # mark the operation that is going on
+        self.changeOperationColor(None if self.prevOperation is None else self.prevOperation.value)
+
     # perform last operation on current result or set current result (if last operation is None)
     def performPreviousOperation(self):
         fInputText = float(self.inputLabel.text)
@@ -212,9 +253,6 @@ class CalculatorApp:
         # reset background colors for all op buttons:
         for button in operationButtons:
             button.setBackgroundColor("#FFC100")
-            # temp color has to be updated as well, since it still holds the previous bg color which would override the
-            # new one, when the button is not hovered anymore (s. below as well)
-            button.tempBackgroundColor = "#FFC100"
 
         # all buttons reset to old bg color
         if opNum is None:
@@ -222,5 +260,4 @@ class CalculatorApp:
 
         # mark selected operation
         operationButtons[opNum-1].setBackgroundColor(COLOR_ORANGE)
-        operationButtons[opNum-1].tempBackgroundColor = COLOR_ORANGE
 
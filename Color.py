@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+from functools import lru_cache
+
+from GraphicsEventSystem import *
+
+# Colors are interned as packed integers 0xRRGGBBAA. Raster backends work on these ids instead of re-parsing the
+# color strings for every drawing call.
+
+# id of COLOR_CLEAR (fully transparent)
+CLEAR = 0
+
+# RGB values of the Tk colors behind the COLOR_* constants
+NAMED_COLORS = {
+    COLOR_BLACK: (0, 0, 0),
+    COLOR_GRAY: (112, 128, 144),
+    COLOR_LIGHT_GRAY: (245, 245, 245),
+    COLOR_WHITE: (255, 255, 255),
+    COLOR_RED: (255, 0, 0),
+    COLOR_DARK_GREEN: (34, 139, 34),
+    COLOR_GREEN: (0, 205, 0),
+    COLOR_LIGHT_GREEN: (179, 238, 58),
+    COLOR_DARK_BLUE: (0, 0, 128),
+    COLOR_BLUE: (0, 0, 238),
+    COLOR_LIGHT_BLUE: (135, 206, 250),
+    COLOR_TURQUOISE: (72, 209, 204),
+    COLOR_YELLOW: (255, 255, 0),
+    COLOR_ORANGE: (255, 140, 0),
+    COLOR_BROWN: (139, 69, 19),
+    COLOR_PURPLE: (160, 32, 240),
+    COLOR_PINK: (255, 110, 180),
+}
+
+# two-digit hex strings of all byte values, used to build hex colors without string formatting
+HEX_DIGITS = ["{:02x}".format(i) for i in range(256)]
+
+
+@lru_cache(maxsize=4096)
+def colorId(color):
+    """
+    Parse a COLOR_* constant or hex string ("#RGB" or "#RRGGBB") and return its interned id. Results are cached, so
+    colors that are used in every frame are only parsed once.
+    :param color: color string
+    :return: packed color 0xRRGGBBAA, CLEAR for COLOR_CLEAR
+    """
+    if color == COLOR_CLEAR:
+        return CLEAR
+    if color in NAMED_COLORS:
+        red, green, blue = NAMED_COLORS[color]
+    elif color.startswith("#") and len(color) == 4:
+        red, green, blue = (int(c * 2, 16) for c in color[1:])
+    elif color.startswith("#") and len(color) == 7:
+        red, green, blue = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    else:
+        raise ValueError("Unknown color: " + str(color))
+    return packRGBA(red, green, blue)
+
+
+# packs color components in range [0, 255] into a color id
+def packRGBA(red, green, blue, alpha=255):
+    return (red << 24) | (green << 16) | (blue << 8) | alpha
+
+
+# returns the components (red, green, blue, alpha) of a color id
+def unpackColor(packed):
+    return (packed >> 24) & 0xff, (packed >> 16) & 0xff, (packed >> 8) & 0xff, packed & 0xff
+
+
+# packs float color components in range [0, 1] into a color id
+def packRGB(red, green, blue):
+    return packRGBA(int(red * 255), int(green * 255), int(blue * 255))
+
+
+@lru_cache(maxsize=4096)
+def packedToHex(packed):
+    """
+    Convert a color id to a hex string "#rrggbb". The strings are cached, so the same color always returns the same
+    string object.
+    :param packed: packed color 0xRRGGBBAA
+    :return: hex string of the color (alpha is ignored)
+    """
+    return "#" + HEX_DIGITS[(packed >> 24) & 0xff] + HEX_DIGITS[(packed >> 16) & 0xff] + HEX_DIGITS[(packed >> 8) & 0xff]
+
+
+# converts float color components in range [0, 1] to a hex string
+def rgbToHex(red, green, blue):
+    # Ensure the values are within the valid range
+    if not (0 <= red <= 1 and 0 <= green <= 1 and 0 <= blue <= 1):
+        raise ValueError("RGB values must be in the range [0, 1]")
+    return packedToHex(packRGB(red, green, blue))
+
+
+# returns the 4 RGBA bytes of a color id (used by raster backends)
+@lru_cache(maxsize=4096)
+def colorBytes(packed):
+    return bytes(unpackColor(packed))
@@ -4,27 +4,12 @@ by Felix Umland (#406886)
 and Jannick Brändel (#405391)
 """
 
-from UITK import Label, Slider, Container
+from Color import rgbToHex
+from UITK import Label, Slider, Container, internFont
 from Window import Window, LayoutAnchor
 from GraphicsEventSystem import *
 
 
-def rgbToHex(red, green, blue):
-    # Ensure the values are within the valid range
-    if not (0 <= red <= 1 and 0 <= green <= 1 and 0 <= blue <= 1):
-        raise ValueError("RGB values must be in the range [0, 1]")
-
-    # Convert each component to an integer in the range [0, 255]
-    r = int(red * 255)
-    g = int(green * 255)
-    b = int(blue * 255)
-
-    # Format as a hexadecimal string
-    hex_color = "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-    return hex_color
-
-
 class ColorsApp:
     def __init__(self, windowSystem, x, y):
         self.windowSystem = windowSystem
@@ -38,6 +23,9 @@ class ColorsApp:
         self.hexLabel = None
         # array for the three sliders
         self.sliders = []
+        # false while the window is minimized or covered: the label is only updated when it can be seen again
+        self.visible = True
+        self.colorsOutdated = False
         self.drawWidgets()
 
 
@@ -68,7 +56,7 @@ class ColorsApp:
             self.appWindow.addChildWindow(label)
 
         # Label for displaying color hex value
-        self.hexLabel = Label(0, 350, self.appWindow.width * 0.8, 100, "HexLabel", font=Font(family="Helvetica", size=20),
+        self.hexLabel = Label(0, 350, self.appWindow.width * 0.8, 100, "HexLabel", font=internFont(family="Helvetica", size=20),
                               fontColor=COLOR_WHITE, text="#000000", layoutAnchors=LayoutAnchor.bottom)
         self.appWindow.addChildWindow(self.hexLabel)
         self.updateColors()
@@ -86,7 +74,37 @@ class ColorsApp:
         self.appWindow.addChildWindow(wrapperContainer)
 
 
+    # releases the widgets while the app hibernates (see WindowManager.hibernateApp)
+    def releaseWidgets(self):
+        self.appWindow.removeChildWindows()
+        self.sliders = []
+        self.hexLabel = None
+
+    # creates the widgets again when the app wakes up from hibernation
+    def rebuildWidgets(self):
+        self.drawWidgets()
+
+    # returns the slider values (used to save the session)
+    def getState(self):
+        return {"sliderValues": [slider.sliderValue for slider in self.sliders]}
+
+    # restores a state returned by getState
+    def setState(self, state):
+        for slider, value in zip(self.sliders, state["sliderValues"]):
+            slider.setValue(value)
+        self.updateColors()
+
+    # called by the window manager when the app window is shown, hidden, covered or uncovered
+    def handleVisibilityChanged(self, event):
+        self.visible = event in ("shown", "exposed")
+        if self.visible and self.colorsOutdated:
+            self.updateColors()
+
     def updateColors(self):
+        if not self.visible:
+            self.colorsOutdated = True
+            return
+        self.colorsOutdated = False
         # get the current slider values and convert them to a hexadecimal string
         color = rgbToHex(self.sliders[0].sliderValue, self.sliders[1].sliderValue, self.sliders[2].sliderValue)
         # set the text of the label to that string
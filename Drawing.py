@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+# Bulk drawing: long runs of rects or lines are issued with one call. Graphics contexts that implement fillRects /
+# drawLines themselves (e.g. FramebufferContext) get the whole batch. For the Tk graphics context the canvas items of
+# the batch are created by one Tcl script, so the batch costs one call into Tcl instead of one per item. Other contexts
+# fall back to single calls that only change the color when it differs from the previous one.
+
+from GraphicsEventSystem import COLOR_CLEAR
+
+
+# converts rects or lines to a list of 4-tuples. Accepts sequences of 4-tuples, flat buffers (e.g. array('f') with
+# x1, y1, x2, y2, x1, ...) and NumPy arrays of shape (n, 4) or (4n,)
+def toQuads(values):
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    if len(values) == 0:
+        return []
+    if isinstance(values[0], (int, float)):
+        return [tuple(values[i:i + 4]) for i in range(0, len(values), 4)]
+    return values
+
+
+# returns a list with one color per item: colors is either a single color or a sequence of colors
+def toColorList(colors, count):
+    if isinstance(colors, str):
+        return [colors] * count
+    return list(colors)
+
+
+# quotes a color as a word of a Tcl script
+def tclWord(color):
+    return "{" + color + "}"
+
+
+def tkCreateItems(ctx, itemType, items, colors, options):
+    """
+    Create the canvas items of a batch with one Tcl script. The items are the same as the ones the Tk graphics context
+    creates for single fillRect / drawLine calls: shifted by the origin, items in the clear color are skipped.
+    :param ctx: Tk graphics context
+    :param itemType: "rectangle" or "line"
+    :param items: (x1, y1, x2, y2) of the items
+    :param colors: one color per item
+    :param options: options added after the fill color of every item
+    """
+    if not ctx._isDrawing:
+        print("ERROR: Tried to draw outside of handlePaint")
+        return
+    prefix = str(ctx._canvas) + " create " + itemType + " "
+    originX, originY = ctx.originX, ctx.originY
+    commands = []
+    for (x1, y1, x2, y2), color in zip(items, colors):
+        if color != COLOR_CLEAR:
+            commands.append(prefix + " ".join(map(str, (x1 + originX, y1 + originY, x2 + originX, y2 + originY)))
+                            + " -fill " + tclWord(color) + options)
+    if commands:
+        ctx._canvas.tk.eval("\n".join(commands))
+
+
+def fillRects(ctx, rects, colors):
+    """
+    Fill many rects with one call.
+    :param ctx: graphics context
+    :param rects: rects as (x1, y1, x2, y2) in the coordinate system of the current origin (see toQuads)
+    :param colors: one color for all rects or a sequence with one color per rect
+    """
+    if hasattr(ctx, "fillRects"):
+        ctx.fillRects(rects, colors)
+        return
+    rects = toQuads(rects)
+    if getattr(ctx, "_canvas", None) is not None:
+        colors = toColorList(colors, len(rects))
+        tkCreateItems(ctx, "rectangle", rects, colors, " -outline {}")
+        # leave the fill color as after single calls
+        if colors:
+            ctx.setFillColor(colors[-1])
+        return
+    previousColor = None
+    for rect, color in zip(rects, toColorList(colors, len(rects))):
+        if color != previousColor:
+            ctx.setFillColor(color)
+            previousColor = color
+        ctx.fillRect(rect[0], rect[1], rect[2], rect[3])
+
+
+def drawLines(ctx, lines, colors):
+    """
+    Draw many lines with one call.
+    :param ctx: graphics context
+    :param lines: lines as (x1, y1, x2, y2) in the coordinate system of the current origin (see toQuads)
+    :param colors: one color for all lines or a sequence with one color per line
+    """
+    if hasattr(ctx, "drawLines"):
+        ctx.drawLines(lines, colors)
+        return
+    lines = toQuads(lines)
+    if getattr(ctx, "_canvas", None) is not None:
+        colors = toColorList(colors, len(lines))
+        tkCreateItems(ctx, "line", lines, colors, "")
+        if colors:
+            ctx.setStrokeColor(colors[-1])
+        return
+    previousColor = None
+    for line, color in zip(lines, toColorList(colors, len(lines))):
+        if color != previousColor:
+            ctx.setStrokeColor(color)
+            previousColor = color
+        ctx.drawLine(line[0], line[1], line[2], line[3])
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import struct
+import zlib
+from multiprocessing import shared_memory
+
+from Color import CLEAR, colorBytes, colorId
+from Drawing import toColorList, toQuads
+from GraphicsEventSystem import *
+
+# NumPy is optional: rect fills use array slicing if it is installed, otherwise the rows are filled byte-wise
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class FramebufferContext:
+    def __init__(self, width, height, name=None, create=True):
+        """
+        Graphics context that rasterises into an RGBA buffer in shared memory instead of a Tk canvas. Other processes
+        can attach to the same buffer by its name (see attach) and render into it or read from it without copying.
+        :param width: width of the framebuffer in pixels
+        :param height: height of the framebuffer in pixels
+        :param name: name of the shared memory block (generated if None)
+        :param create: True to create a new block, False to attach to an existing one
+        """
+        self.width = width
+        self.height = height
+        self.sharedMemory = shared_memory.SharedMemory(name=name, create=create, size=width * height * 4)
+        self.name = self.sharedMemory.name
+        self.ownsMemory = create
+        # flat byte view of the buffer, row after row with 4 bytes per pixel
+        self.buffer = self.sharedMemory.buf[:width * height * 4]
+        # (height, width, 4) array on the same memory
+        self.pixels = None
+        if numpy is not None:
+            self.pixels = numpy.ndarray((height, width, 4), dtype=numpy.uint8, buffer=self.buffer)
+        self.strokeColor = COLOR_WHITE
+        self.fillColor = COLOR_WHITE
+        # interned ids of the current colors, parsed once when the color is set
+        self.strokeColorId = colorId(COLOR_WHITE)
+        self.fillColorId = colorId(COLOR_WHITE)
+        self.font = None
+        self.originX = 0
+        self.originY = 0
+        # text cannot be rasterised without a font renderer, drawn strings are collected for the current frame instead
+        self.strings = []
+
+    @classmethod
+    def attach(cls, name, width, height):
+        """
+        Attach to the framebuffer of another process.
+        :param name: name of the shared memory block (attribute name of the other framebuffer)
+        :param width: width of the framebuffer in pixels
+        :param height: height of the framebuffer in pixels
+        :return: framebuffer context on the shared buffer
+        """
+        return cls(width, height, name=name, create=False)
+
+    def close(self):
+        """
+        Release the buffer. The shared memory is removed as well if it was created by this context.
+        """
+        self.pixels = None
+        self.buffer.release()
+        self.sharedMemory.close()
+        if self.ownsMemory:
+            self.sharedMemory.unlink()
+
+    def setStrokeColor(self, color):
+        self.strokeColor = color
+        self.strokeColorId = colorId(color)
+
+    def setFillColor(self, color):
+        self.fillColor = color
+        self.fillColorId = colorId(color)
+
+    def setFont(self, font):
+        self.font = font
+
+    def setOrigin(self, x, y):
+        self.originX = x
+        self.originY = y
+
+    def clear(self, color=COLOR_WHITE):
+        """
+        Fill the complete framebuffer with the given color, called at the beginning of every frame.
+        """
+        self.strings.clear()
+        self.fillArea(0, 0, self.width, self.height, colorId(color))
+
+    def fillArea(self, x1, y1, x2, y2, color):
+        # fills the pixels in [x1, x2) x [y1, y2) (screen coordinates, clipped to the buffer) with the color id
+        x1 = max(0, x1)
+        y1 = max(0, y1)
+        x2 = min(self.width, x2)
+        y2 = min(self.height, y2)
+        if color == CLEAR or x1 >= x2 or y1 >= y2:
+            return
+        rgba = colorBytes(color)
+        if self.pixels is not None:
+            self.pixels[y1:y2, x1:x2] = numpy.frombuffer(rgba, dtype=numpy.uint8)
+        else:
+            row = rgba * (x2 - x1)
+            rowStride = self.width * 4
+            for y in range(y1, y2):
+                start = y * rowStride + x1 * 4
+                self.buffer[start:start + len(row)] = row
+
+    def fillRect(self, x1, y1, x2, y2):
+        left, right = sorted((round(x1 + self.originX), round(x2 + self.originX)))
+        top, bottom = sorted((round(y1 + self.originY), round(y2 + self.originY)))
+        self.fillArea(left, top, right, bottom, self.fillColorId)
+
+    def fillRects(self, rects, colors):
+        """
+        Fill many rects with one call (see Drawing.fillRects).
+        :param rects: rects as (x1, y1, x2, y2) relative to the current origin, as sequence, flat buffer or array
+        :param colors: one color for all rects or a sequence with one color per rect
+        """
+        if numpy is not None and isinstance(rects, numpy.ndarray):
+            # shift and round all rects at once
+            offset = numpy.array([self.originX, self.originY, self.originX, self.originY])
+            rects = numpy.rint(rects.reshape(-1, 4) + offset).astype(int).tolist()
+        else:
+            rects = [(round(x1 + self.originX), round(y1 + self.originY), round(x2 + self.originX),
+                      round(y2 + self.originY)) for x1, y1, x2, y2 in toQuads(rects)]
+        if isinstance(colors, str):
+            self.setFillColor(colors)
+            colorIds = [self.fillColorId] * len(rects)
+        else:
+            colorIds = [colorId(color) for color in colors]
+            if colors:
+                self.setFillColor(colors[-1])
+        for (x1, y1, x2, y2), color in zip(rects, colorIds):
+            self.fillArea(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2), color)
+
+    def drawLines(self, lines, colors):
+        """
+        Draw many lines with one call (see Drawing.drawLines).
+        :param lines: lines as (x1, y1, x2, y2) relative to the current origin, as sequence, flat buffer or array
+        :param colors: one color for all lines or a sequence with one color per line
+        """
+        lines = toQuads(lines)
+        for line, color in zip(lines, toColorList(colors, len(lines))):
+            self.setStrokeColor(color)
+            self.drawLine(line[0], line[1], line[2], line[3])
+
+    def strokeRect(self, x1, y1, x2, y2):
+        color = self.strokeColorId
+        left, right = sorted((round(x1 + self.originX), round(x2 + self.originX)))
+        top, bottom = sorted((round(y1 + self.originY), round(y2 + self.originY)))
+        self.fillArea(left, top, right + 1, top + 1, color)
+        self.fillArea(left, bottom, right + 1, bottom + 1, color)
+        self.fillArea(left, top, left + 1, bottom + 1, color)
+        self.fillArea(right, top, right + 1, bottom + 1, color)
+
+    def drawLine(self, x1, y1, x2, y2, dashLength=0, dashGap=0):
+        color = self.strokeColorId
+        if color == CLEAR:
+            return
+        x1, y1 = round(x1 + self.originX), round(y1 + self.originY)
+        x2, y2 = round(x2 + self.originX), round(y2 + self.originY)
+        dashed = dashLength > 0 and dashGap > 0
+        # horizontal and vertical lines (most lines of the window system) are filled as 1px wide rects
+        if not dashed and (x1 == x2 or y1 == y2):
+            self.fillArea(min(x1, x2), min(y1, y2), max(x1, x2) + 1, max(y1, y2) + 1, color)
+            return
+        # Bresenham for all other lines
+        deltaX, deltaY = abs(x2 - x1), -abs(y2 - y1)
+        stepX = 1 if x1 < x2 else -1
+        stepY = 1 if y1 < y2 else -1
+        error = deltaX + deltaY
+        step = 0
+        while True:
+            if not dashed or step % (dashLength + dashGap) < dashLength:
+                self.fillArea(x1, y1, x1 + 1, y1 + 1, color)
+            if x1 == x2 and y1 == y2:
+                break
+            doubleError = 2 * error
+            if doubleError >= deltaY:
+                error += deltaY
+                x1 += stepX
+            if doubleError <= deltaX:
+                error += deltaX
+                y1 += stepY
+            step += 1
+
+    def drawString(self, string, x, y, centered=False):
+        self.strings.append((string, x + self.originX, y + self.originY, centered, self.strokeColor, self.font))
+
+    def blit(self, source, x, y):
+        """
+        Copy the complete content of another framebuffer (e.g. the window of an app process) to the given position.
+        :param source: framebuffer context to copy from
+        :param x: x value of the target position in this framebuffer
+        :param y: y value of the target position in this framebuffer
+        """
+        left, top = max(0, x), max(0, y)
+        right, bottom = min(self.width, x + source.width), min(self.height, y + source.height)
+        if left >= right or top >= bottom:
+            return
+        if self.pixels is not None and source.pixels is not None:
+            self.pixels[top:bottom, left:right] = source.pixels[top - y:bottom - y, left - x:right - x]
+        else:
+            rowLength = (right - left) * 4
+            for row in range(top, bottom):
+                start = row * self.width * 4 + left * 4
+                sourceStart = (row - y) * source.width * 4 + (left - x) * 4
+                self.buffer[start:start + rowLength] = source.buffer[sourceStart:sourceStart + rowLength]
+
+    def savePNG(self, path):
+        """
+        Write the current frame to a PNG file (e.g. for visual regression tests).
+        :param path: path of the PNG file
+        """
+        rowStride = self.width * 4
+        # every row starts with filter type 0 (no filter)
+        raw = b"".join(b"\x00" + bytes(self.buffer[y * rowStride:(y + 1) * rowStride]) for y in range(self.height))
+
+        def chunk(chunkType, data):
+            return (struct.pack(">I", len(data)) + chunkType + data
+                    + struct.pack(">I", zlib.crc32(chunkType + data) & 0xffffffff))
+
+        with open(path, "wb") as file:
+            file.write(b"\x89PNG\r\n\x1a\n")
+            file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 6, 0, 0, 0)))
+            file.write(chunk(b"IDAT", zlib.compress(raw)))
+            file.write(chunk(b"IEND", b""))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import heapq
+import time
+
+from Framebuffer import FramebufferContext
+from GraphicsEventSystem import *
+from UITK import setFontFactory
+
+# Headless backend: the same event system without a Tk window. Frames are rasterised into a framebuffer, timers run on
+# a plain loop and events are injected through the framework's event handlers (e.g. by Replay), so the window system
+# can run on machines without a display.
+
+# font options used for options that were not given when a font was created
+DEFAULT_FONT_OPTIONS = {"family": "Helvetica", "size": 12, "weight": "normal", "slant": "roman", "underline": 0,
+                        "overstrike": 0}
+
+
+class HeadlessFont:
+    """
+    Font without Tk with the interface of tkinter fonts the window system uses (name, configure, actual, cget, measure,
+    metrics). Text is measured with an estimate of the average character width. The headless backend creates the fonts
+    of the widgets with it (see UITK.setFontFactory).
+    """
+    # number of created fonts, used for the font names
+    count = 0
+
+    def __init__(self, **options):
+        HeadlessFont.count += 1
+        self.name = "headless" + str(HeadlessFont.count)
+        self.options = dict(DEFAULT_FONT_OPTIONS)
+        self.options.update(options)
+
+    def __str__(self):
+        return self.name
+
+    def configure(self, **options):
+        if not options:
+            return dict(self.options)
+        self.options.update(options)
+
+    config = configure
+
+    def actual(self, option=None):
+        if option is not None:
+            return self.options[option]
+        return dict(self.options)
+
+    def cget(self, option):
+        return self.options[option]
+
+    def size(self):
+        return abs(int(self.options["size"]))
+
+    def measure(self, text):
+        return round(len(text) * self.size() * 0.6)
+
+    def metrics(self, *options):
+        size = self.size()
+        metrics = {"ascent": size, "descent": size // 4, "linespace": size + size // 4, "fixed": 0}
+        if len(options) == 1:
+            return metrics[options[0]]
+        return {option: metrics[option] for option in options} if options else metrics
+
+
+class HeadlessContext(FramebufferContext):
+    """
+    Framebuffer with the drawing state of the framework's graphics context, so it can be painted by requestRepaint.
+    """
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self._isDrawing = False
+
+    def _beginDrawing(self):
+        self._isDrawing = True
+        # same as deleting all items of the (white) Tk canvas
+        self.clear(COLOR_WHITE)
+        self.setOrigin(0, 0)
+
+    def _endDrawing(self):
+        self._isDrawing = False
+
+
+class HeadlessMainLoop:
+    """
+    Timer loop in place of the Tk main window (after, destroy, mainloop). The loop runs until it is destroyed or no
+    timers are pending anymore.
+    """
+    def __init__(self):
+        # pending timers as a heap of (due time, sequence number, callback, args)
+        self.timers = []
+        self.timerSequence = 0
+        self.running = False
+
+    def after(self, delay, callback, *args):
+        self.timerSequence += 1
+        heapq.heappush(self.timers, (time.monotonic() + delay / 1000, self.timerSequence, callback, args))
+        return self.timerSequence
+
+    def destroy(self):
+        self.running = False
+
+    def mainloop(self):
+        self.running = True
+        while self.running and self.timers:
+            delay = self.timers[0][0] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            _, _, callback, args = heapq.heappop(self.timers)
+            callback(*args)
+        self.running = False
+
+
+class HeadlessEventSystem(GraphicsEventSystem):
+    def __init__(self, width, height):
+        """
+        Start the event system without a display: same life cycle as GraphicsEventSystem (start, first paint, main
+        loop), the graphics context draws into a framebuffer.
+        :param width: screen width
+        :param height: screen height
+        """
+        self.width = width
+        self.height = height
+        setFontFactory(HeadlessFont)
+        self._window = HeadlessMainLoop()
+        self.graphicsContext = HeadlessContext(width, height)
+        try:
+            self.start()
+            self.requestRepaint()
+            self._window.mainloop()
+        finally:
+            self.graphicsContext.close()
@@ -5,7 +5,7 @@ and Jannick Brändel (#405391)
 """
 
 from functools import partial
-from UITK import Label, Button, Container
+from UITK import Label, Button, Container, internFont
 from Window import Window, LayoutAnchor
 from GraphicsEventSystem import *
 
@@ -28,7 +28,7 @@ class HelloWorldApp:
     def drawWidgets(self):
         # GREETING LABEL
         self.greetLabel = Label(20, 50, self.appWindow.width * 0.3, 50, "GreetingLabel",
-                           font=Font(family="Helvetica", size=20), fontColor=COLOR_ORANGE, text="Hello!",
+                           font=internFont(family="Helvetica", size=20), fontColor=COLOR_ORANGE, text="Hello!",
                            layoutAnchors=LayoutAnchor.top)
         self.appWindow.addChildWindow(self.greetLabel)
 
@@ -37,7 +37,7 @@ class HelloWorldApp:
         for i in range(3):
             # each button has the action changeLanguage with the specified language as parameter using partial
             button = Button(0, 0, 60, 40, "LanguageButton" + str(i), text=self.languages[i],
-                            fontColor=COLOR_BLACK, font=Font(family="Helvetica", size=14),
+                            fontColor=COLOR_BLACK, font=internFont(family="Helvetica", size=14),
                             layoutAnchors=LayoutAnchor.top | LayoutAnchor.left, hoverBackgroundColor=COLOR_LIGHT_BLUE,
                             pressedBackgroundColor=COLOR_ORANGE, action=partial(self.changeLanguage, self.languages[i]),
                             borderColor=COLOR_BLACK)
@@ -57,6 +57,23 @@ class HelloWorldApp:
                             action=partial(self.windowSystem.windowManager.closeWindow, self.appWindow))
         self.appWindow.addChildWindow(quitButton)
 
+    # releases the widgets while the app hibernates (see WindowManager.hibernateApp)
+    def releaseWidgets(self):
+        self.appWindow.removeChildWindows()
+        self.greetLabel = None
+
+    # creates the widgets again when the app wakes up from hibernation
+    def rebuildWidgets(self):
+        self.drawWidgets()
+
+    # returns the displayed greeting (used to save the session)
+    def getState(self):
+        return {"greeting": self.greetLabel.text}
+
+    # restores a state returned by getState
+    def setState(self, state):
+        self.greetLabel.text = state["greeting"]
+
     # update greeting label based on the language parameter. German - Guten Tag, English - Hello, French - Bonjour
     def changeLanguage(self, language):
         assert language in self.languages
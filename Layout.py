@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import math
+from collections import namedtuple
+
+# size constraints of a container window (or grid track) along the layout axis:
+# grow/shrink: share of the free space the window gets/gives away (relative to the other windows)
+# basis: size of the window before the free space is distributed
+# minSize/maxSize: the window never gets smaller/bigger than these sizes
+# the defaults distribute the space evenly with at least 20px per window
+LayoutConstraints = namedtuple("LayoutConstraints", "grow shrink basis minSize maxSize",
+                               defaults=(1, 1, 0, 20, math.inf))
+DEFAULT_CONSTRAINTS = LayoutConstraints()
+
+# position of a window in a grid layout, spans are given in number of tracks
+GridCell = namedtuple("GridCell", "row column rowSpan columnSpan", defaults=(1, 1))
+
+
+def resolveSizes(available, constraints):
+    """
+    Distribute the available space between items with the given constraints (like a single line flexbox).
+    :param available: available space along the layout axis (without spacing)
+    :param constraints: list of LayoutConstraints, one per item
+    :return: list of sizes, one per item
+    """
+    sizes = [0] * len(constraints)
+    frozen = [False] * len(constraints)
+    while True:
+        active = [i for i in range(len(constraints)) if not frozen[i]]
+        if not active:
+            break
+        free = available - sum(sizes[i] for i in range(len(constraints)) if frozen[i]) \
+            - sum(constraints[i].basis for i in active)
+        # positive free space is distributed by grow factors, negative free space is taken away by shrink factors
+        if free >= 0:
+            weights = [constraints[i].grow for i in active]
+        else:
+            weights = [constraints[i].shrink * max(constraints[i].basis, 1) for i in active]
+        totalWeight = sum(weights)
+        violated = False
+        tentative = []
+        for i, weight in zip(active, weights):
+            size = constraints[i].basis
+            if totalWeight > 0:
+                size += free * weight / totalWeight
+            clamped = min(max(size, constraints[i].minSize), constraints[i].maxSize)
+            if clamped != size:
+                # min/max constraint violated: fix this item and distribute the rest again
+                sizes[i] = clamped
+                frozen[i] = True
+                violated = True
+            tentative.append(size)
+        if not violated:
+            for i, size in zip(active, tentative):
+                sizes[i] = size
+            break
+    return sizes
+
+
+# returns the offsets of consecutive tracks with the given sizes and spacing in between
+def trackOffsets(sizes, spacing):
+    offsets = []
+    offset = 0
+    for size in sizes:
+        offsets.append(offset)
+        offset += size + spacing
+    return offsets
+
+
+class FlexLayout(namedtuple("FlexLayout", "horizontal spacing", defaults=(True, 0))):
+    """
+    Places the container windows next to each other (horizontal) or below each other (vertical) and distributes the
+    space along that axis according to their constraints. All windows fill the container along the other axis.
+    """
+    def arrange(self, width, height, windows, constraintsOf):
+        """
+        :param width: width of the container
+        :param height: height of the container
+        :param windows: container windows
+        :param constraintsOf: function returning the LayoutConstraints of a window
+        :return: list of frames (x, y, width, height) relative to the container origin, one per window
+        """
+        mainSize = width if self.horizontal else height
+        available = mainSize - self.spacing * (len(windows) - 1)
+        sizes = resolveSizes(available, [constraintsOf(window) for window in windows])
+        offsets = trackOffsets(sizes, self.spacing)
+        if self.horizontal:
+            return [(offset, 0, size, height) for offset, size in zip(offsets, sizes)]
+        return [(0, offset, width, size) for offset, size in zip(offsets, sizes)]
+
+
+class GridLayout(namedtuple("GridLayout", "rows columns spacing rowConstraints columnConstraints",
+                            defaults=(0, None, None))):
+    """
+    Places the container windows in a grid. Row heights and column widths are distributed like in a flex layout
+    (rowConstraints/columnConstraints are tuples with one LayoutConstraints per track, default: even distribution).
+    Windows are placed row by row unless a GridCell is set for them (see Container.setCell).
+    """
+    def arrange(self, width, height, windows, cellOf):
+        """
+        :param width: width of the container
+        :param height: height of the container
+        :param windows: container windows
+        :param cellOf: function returning the GridCell of a window or None for automatic placement
+        :return: list of frames (x, y, width, height) relative to the container origin, one per window
+        """
+        rowConstraints = self.rowConstraints or (DEFAULT_CONSTRAINTS,) * self.rows
+        columnConstraints = self.columnConstraints or (DEFAULT_CONSTRAINTS,) * self.columns
+        rowSizes = resolveSizes(height - self.spacing * (self.rows - 1), rowConstraints)
+        columnSizes = resolveSizes(width - self.spacing * (self.columns - 1), columnConstraints)
+        rowOffsets = trackOffsets(rowSizes, self.spacing)
+        columnOffsets = trackOffsets(columnSizes, self.spacing)
+
+        frames = []
+        for i, window in enumerate(windows):
+            cell = cellOf(window) or GridCell(i // self.columns, i % self.columns)
+            # windows outside of the grid are placed in the last track
+            row = min(cell.row, self.rows - 1)
+            column = min(cell.column, self.columns - 1)
+            lastRow = min(row + cell.rowSpan, self.rows) - 1
+            lastColumn = min(column + cell.columnSpan, self.columns) - 1
+            frames.append((columnOffsets[column], rowOffsets[row],
+                           columnOffsets[lastColumn] + columnSizes[lastColumn] - columnOffsets[column],
+                           rowOffsets[lastRow] + rowSizes[lastRow] - rowOffsets[row]))
+        return frames
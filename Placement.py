@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+from collections import defaultdict
+
+# distance between two windows of a cascade
+CASCADE_OFFSET = 10
+# horizontal distance between the starts of two cascades (when a cascade reaches the end of the work area)
+CASCADE_LINE_OFFSET = 30
+# edge length of the cells of the spatial hash used for overlap queries
+GRID_CELL_SIZE = 128
+# maximum number of free rectangles kept in the index (the largest ones are kept)
+MAX_FREE_RECTS = 64
+# maximum number of positions compared by the least-overlap strategy
+MAX_CANDIDATES = 64
+# placement strategies, see WindowPlacement.findPosition
+STRATEGIES = ("cascade", "leastOverlap", "tile")
+
+
+def intersectionArea(a, b):
+    # area of the intersection of two rects (x1, y1, x2, y2)
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    return width * height if width > 0 and height > 0 else 0
+
+
+def subtractRect(free, rect):
+    """
+    Split a free rectangle around an occupied one.
+    :param free: free rect (x1, y1, x2, y2)
+    :param rect: occupied rect
+    :return: maximal free rects left of, right of, above and below the occupied rect (that are not empty)
+    """
+    x1, y1, x2, y2 = free
+    parts = [(x1, y1, rect[0], y2), (rect[2], y1, x2, y2), (x1, y1, x2, rect[1]), (x1, rect[3], x2, y2)]
+    return [part for part in parts if part[2] > part[0] and part[3] > part[1]]
+
+
+class WindowPlacement:
+    """
+    Finds positions for new top-level windows inside the work area (the screen above the taskbar). The index of the
+    current windows (occupied origins, a spatial hash of the window rects and the maximal free rectangles) is updated
+    for each window that was added, removed, moved, resized, minimized or restored (see windowChanged), the queries then
+    only look at a bounded number of positions instead of comparing every position with every window.
+    """
+    def __init__(self, windowManager):
+        self.windowManager = windowManager
+        # number of top-level windows by origin (x, y)
+        self.origins = defaultdict(int)
+        # shown top-level windows by grid cell (column, row)
+        self.grid = defaultdict(set)
+        # indexed top-level windows: (origin, rect or None if the window is minimized) by window
+        self.entries = {}
+        # maximal free rectangles of the work area, largest first (None: not computed yet)
+        self.freeRects = None
+        # false if rects were freed since the free rectangles were computed: the freed parts were added, but they are
+        # not merged with the free rectangles around them
+        self.freeRectsMaximal = True
+        # windows that changed since the last update of the index
+        self.changedWindows = set()
+
+    @property
+    def windowCount(self):
+        # number of indexed windows
+        return len(self.entries)
+
+    def workArea(self):
+        """
+        :return: (x1, y1, x2, y2) of the screen without the taskbar
+        """
+        windowSystem = self.windowManager.windowSystem
+        return 0, 0, windowSystem.width, windowSystem.height - self.windowManager.taskBarHeight
+
+    def windowChanged(self, window):
+        """
+        Called when a top-level window was added, removed, moved, resized, minimized or restored, its entry is updated
+        before the next query.
+        """
+        self.changedWindows.add(window)
+
+    def updateIndex(self, ignore=None):
+        # updates the entries of the changed windows, the given window is left out until the next update
+        screen = self.windowManager.windowSystem.screen
+        changedWindows = self.changedWindows
+        self.changedWindows = set()
+        for window in changedWindows:
+            if window.parentWindow is not screen or window is ignore:
+                self.removeWindow(window)
+                continue
+            rect = None if window.isHidden else (window.x, window.y, window.x + window.width, window.y + window.height)
+            entry = ((window.x, window.y), rect)
+            if self.entries.get(window) != entry:
+                self.removeWindow(window)
+                self.addWindow(window, entry)
+        if ignore is not None:
+            self.removeWindow(ignore)
+            self.changedWindows.add(ignore)
+
+    def addWindow(self, window, entry):
+        origin, rect = entry
+        self.entries[window] = entry
+        self.origins[origin] += 1
+        if rect is not None:
+            for cell in self.cellsOf(rect):
+                self.grid[cell].add(window)
+            if self.freeRects is not None:
+                self.occupy(rect)
+
+    def removeWindow(self, window):
+        entry = self.entries.pop(window, None)
+        if entry is None:
+            return
+        origin, rect = entry
+        self.origins[origin] -= 1
+        if not self.origins[origin]:
+            del self.origins[origin]
+        if rect is not None:
+            for cell in self.cellsOf(rect):
+                windows = self.grid[cell]
+                windows.discard(window)
+                if not windows:
+                    del self.grid[cell]
+            if self.freeRects is not None:
+                self.release(rect)
+
+    def freeRectangles(self):
+        """
+        :return: free rectangles of the work area (computed on first use)
+        """
+        if self.freeRects is None:
+            self.computeFreeRectangles()
+        return self.freeRects
+
+    def computeFreeRectangles(self):
+        # maximal free rectangles of all shown windows
+        self.freeRects = [self.workArea()]
+        self.freeRectsMaximal = True
+        for _, rect in self.entries.values():
+            if rect is not None:
+                self.occupy(rect)
+
+    def occupy(self, rect):
+        # removes a window rect from the free rectangles
+        freeRects = []
+        for free in self.freeRects:
+            if intersectionArea(free, rect):
+                freeRects.extend(subtractRect(free, rect))
+            else:
+                freeRects.append(free)
+        self.setFreeRects(freeRects)
+
+    def release(self, rect):
+        # adds the parts of a rect that are not covered by other windows to the free rectangles (only the windows in the
+        # grid cells of the rect are looked at)
+        left, top, right, bottom = self.workArea()
+        parts = [(max(rect[0], left), max(rect[1], top), min(rect[2], right), min(rect[3], bottom))]
+        if parts[0][2] <= parts[0][0] or parts[0][3] <= parts[0][1]:
+            return
+        for other in self.windowsAround(rect):
+            otherRect = self.entries[other][1]
+            parts = [piece for part in parts
+                     for piece in (subtractRect(part, otherRect) if intersectionArea(part, otherRect) else [part])]
+        self.freeRectsMaximal = False
+        self.setFreeRects(self.freeRects + parts)
+
+    def setFreeRects(self, freeRects):
+        # drop rects that are part of bigger ones, then keep the largest
+        freeRects.sort(key=lambda r: (r[2] - r[0]) * (r[3] - r[1]), reverse=True)
+        maximal = []
+        for r in freeRects:
+            if not any(m[0] <= r[0] and m[1] <= r[1] and r[2] <= m[2] and r[3] <= m[3] for m in maximal):
+                maximal.append(r)
+                if len(maximal) == MAX_FREE_RECTS:
+                    break
+        self.freeRects = maximal
+
+    def windowsAround(self, rect):
+        # shown windows in the grid cells a rect overlaps
+        windows = set()
+        for cell in self.cellsOf(rect):
+            windows.update(self.grid.get(cell, ()))
+        return windows
+
+    @staticmethod
+    def cellsOf(rect):
+        # grid cells a rect overlaps
+        return [(column, row)
+                for column in range(int(rect[0] // GRID_CELL_SIZE), int((rect[2] - 1) // GRID_CELL_SIZE) + 1)
+                for row in range(int(rect[1] // GRID_CELL_SIZE), int((rect[3] - 1) // GRID_CELL_SIZE) + 1)]
+
+    def overlap(self, rect):
+        """
+        :return: area of the shown top-level windows that a window at the given rect would cover
+        """
+        return sum(intersectionArea(rect, self.entries[other][1]) for other in self.windowsAround(rect))
+
+    def clamp(self, x, y, width, height):
+        # moves a window position into the work area (to its top left corner if the window is bigger than it)
+        left, top, right, bottom = self.workArea()
+        return max(left, min(x, right - width)), max(top, min(y, bottom - height))
+
+    def findPosition(self, window, x, y, strategy="cascade"):
+        """
+        Find a position for a new top-level window. The window always lies within the work area, as far as it fits.
+        cascade: the preferred position, moved diagonally until no other window has the same origin
+        leastOverlap: the position closest to the preferred one that covers the least area of other windows
+        tile: the first free cell (row by row) of a grid of window sized cells, least overlap if all cells are covered
+        :param window: the new window (ignored if it is already on the screen)
+        :param x: preferred x value of the window's origin
+        :param y: preferred y value of the window's origin
+        :param strategy: one of STRATEGIES
+        :return: (x, y) of the position
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError("Unknown placement strategy: " + str(strategy))
+        self.updateIndex(ignore=window)
+        if strategy == "cascade":
+            return self.cascade(x, y, window.width, window.height)
+        if strategy == "tile":
+            return self.tile(x, y, window.width, window.height)
+        return self.leastOverlap(x, y, window.width, window.height)
+
+    def cascade(self, x, y, width, height):
+        x, y = self.clamp(x, y, width, height)
+        left, top, right, bottom = self.workArea()
+        lineX = x
+        # at most one position per window is occupied
+        for _ in range(self.windowCount + 1):
+            if (x, y) not in self.origins:
+                return x, y
+            x += CASCADE_OFFSET
+            y += CASCADE_OFFSET
+            if x + width > right or y + height > bottom:
+                # continue with a new cascade at the top of the work area
+                lineX += CASCADE_LINE_OFFSET
+                if lineX + width > right:
+                    lineX = left
+                x, y = self.clamp(lineX, top, width, height)
+        # all positions were occupied (windows at the same origin): fall back to the least covered position
+        return self.leastOverlap(x, y, width, height)
+
+    def tile(self, x, y, width, height):
+        left, top, right, bottom = self.workArea()
+        if width > right - left or height > bottom - top:
+            return self.clamp(x, y, width, height)
+        for cellY in range(int(top), int(bottom - height) + 1, int(height)):
+            for cellX in range(int(left), int(right - width) + 1, int(width)):
+                if not self.overlap((cellX, cellY, cellX + width, cellY + height)):
+                    return cellX, cellY
+        return self.leastOverlap(x, y, width, height)
+
+    def leastOverlap(self, x, y, width, height):
+        x, y = self.clamp(x, y, width, height)
+
+        def distance(position):
+            return (position[0] - x) ** 2 + (position[1] - y) ** 2
+
+        # free rects the window fits into: the closest position inside of them covers no other window
+        fitting = self.fittingFreeRects(width, height)
+        if not fitting and not self.freeRectsMaximal:
+            # the window might fit into freed parts merged with the free rects around them
+            self.computeFreeRectangles()
+            fitting = self.fittingFreeRects(width, height)
+        if fitting:
+            positions = [(min(max(x, free[0]), free[2] - width), min(max(y, free[1]), free[3] - height))
+                         for free in fitting]
+            return min(positions, key=distance)
+
+        # otherwise compare the preferred position with positions next to the free rects and the other windows
+        candidates = {(x, y)}
+        for free in self.freeRectangles():
+            candidates.add(self.clamp(free[0], free[1], width, height))
+        # next to the windows around the preferred position
+        for window in self.windowsAround((x, y, x + width, y + height)):
+            rect = self.entries[window][1]
+            candidates.add(self.clamp(rect[2], rect[1], width, height))
+            candidates.add(self.clamp(rect[0], rect[3], width, height))
+        candidates = sorted(candidates, key=distance)[:MAX_CANDIDATES]
+        return min(candidates, key=lambda position: (self.overlap((position[0], position[1], position[0] + width,
+                                                                   position[1] + height)), distance(position)))
+
+    def fittingFreeRects(self, width, height):
+        # free rects a window of the given size fits into
+        return [free for free in self.freeRectangles() if free[2] - free[0] >= width and free[3] - free[1] >= height]
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import heapq
+import time
+import tkinter
+
+from AsyncBridge import AsyncBridge
+from GraphicsEventSystem import *
+from UITK import createFont, dragWidget, hoverWidget, pressWidget, releaseWidget, setFontFactory
+from Window import Window, Screen
+
+# op codes of the display list, every op is a tuple starting with one of these codes
+OP_STROKE_COLOR = 0
+OP_FILL_COLOR = 1
+OP_FONT = 2
+OP_ORIGIN = 3
+OP_LINE = 4
+OP_FILL_RECT = 5
+OP_STROKE_RECT = 6
+OP_STRING = 7
+
+
+class DisplayListContext:
+    """
+    Graphics context that records all drawing calls as a list of compact op tuples instead of drawing them. The list
+    can be sent to another process and replayed on a real graphics context there.
+    """
+    def __init__(self):
+        self.ops = []
+        self.strokeColor = COLOR_WHITE
+        self.fillColor = COLOR_WHITE
+        self.font = None
+        self.originX = 0
+        self.originY = 0
+        # fonts are not picklable: they are recorded by their configuration, which is looked up only once per font
+        self.fontKeys = {}
+
+    def setStrokeColor(self, color):
+        self.strokeColor = color
+        self.ops.append((OP_STROKE_COLOR, color))
+
+    def setFillColor(self, color):
+        self.fillColor = color
+        self.ops.append((OP_FILL_COLOR, color))
+
+    def setFont(self, font):
+        self.font = font
+        fontKey = self.fontKeys.get(id(font))
+        if fontKey is None:
+            fontKey = tuple(sorted(font.configure().items()))
+            self.fontKeys[id(font)] = fontKey
+        self.ops.append((OP_FONT, fontKey))
+
+    def setOrigin(self, x, y):
+        self.originX = x
+        self.originY = y
+        self.ops.append((OP_ORIGIN, x, y))
+
+    def drawLine(self, x1, y1, x2, y2, dashLength=0, dashGap=0):
+        self.ops.append((OP_LINE, x1, y1, x2, y2, dashLength, dashGap))
+
+    def fillRect(self, x1, y1, x2, y2):
+        self.ops.append((OP_FILL_RECT, x1, y1, x2, y2))
+
+    def strokeRect(self, x1, y1, x2, y2):
+        self.ops.append((OP_STROKE_RECT, x1, y1, x2, y2))
+
+    def drawString(self, string, x, y, centered=False):
+        self.ops.append((OP_STRING, string, x, y, centered))
+
+
+# returns the changes between two display lists as (length of the common prefix, length of the common suffix, ops
+# between them), so ops inserted or removed in the middle don't shift all later ops into the delta
+def encodeDelta(previousOps, ops):
+    limit = min(len(previousOps), len(ops))
+    prefix = 0
+    while prefix < limit and previousOps[prefix] == ops[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and previousOps[-1 - suffix] == ops[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix, ops[prefix:len(ops) - suffix]
+
+
+# applies a delta created by encodeDelta to the previous display list and returns the new display list
+def applyDelta(previousOps, delta):
+    prefix, suffix, changes = delta
+    return previousOps[:prefix] + changes + previousOps[len(previousOps) - suffix:]
+
+
+# replays a display list on the given graphics context, every origin is shifted by the given offset
+def replayDisplayList(ops, ctx, offsetX, offsetY, fonts):
+    for op in ops:
+        code = op[0]
+        if code == OP_FILL_RECT:
+            ctx.fillRect(op[1], op[2], op[3], op[4])
+        elif code == OP_FILL_COLOR:
+            ctx.setFillColor(op[1])
+        elif code == OP_ORIGIN:
+            ctx.setOrigin(op[1] + offsetX, op[2] + offsetY)
+        elif code == OP_LINE:
+            ctx.drawLine(op[1], op[2], op[3], op[4], op[5], op[6])
+        elif code == OP_STROKE_COLOR:
+            ctx.setStrokeColor(op[1])
+        elif code == OP_STRING:
+            ctx.drawString(op[1], op[2], op[3], centered=op[4])
+        elif code == OP_FONT:
+            # fonts are created once per configuration and reused for all frames
+            font = fonts.get(op[1])
+            if font is None:
+                font = createFont(**dict(op[1]))
+                fonts[op[1]] = font
+            ctx.setFont(font)
+        elif code == OP_STROKE_RECT:
+            ctx.strokeRect(op[1], op[2], op[3], op[4])
+
+
+class RemoteWindow(Window):
+    """
+    Top-level window that displays the display list of an app running in another process and forwards the input
+    events on its content to that process. Only the decorations (title bar) are real child windows, so hits on the
+    content return this window.
+    """
+    isRemote = True
+
+    def __init__(self, remoteApp, originX, originY, width, height, identifier, backgroundColor):
+        super().__init__(originX, originY, width, height, identifier, backgroundColor=backgroundColor)
+        self.remoteApp = remoteApp
+
+    def draw(self, ctx):
+        if self.isHidden:
+            return
+        x, y = self.convertPositionToScreen(0, 0)
+        if not self.remoteApp.started:
+            # placeholder while the app process starts
+            ctx.setOrigin(x, y)
+            ctx.setFillColor(self.backgroundColor)
+            ctx.fillRect(0, 0, self.width, self.height)
+            ctx.setFillColor(COLOR_GRAY)
+            ctx.drawString("Starting " + self.identifier.split(" ", 1)[1] + "...", 10, self.height / 2)
+        replayDisplayList(self.remoteApp.displayList, ctx, x, y, self.remoteApp.fonts)
+        # draw decorations added by the window manager
+        for child in self.childWindows:
+            child.draw(ctx)
+
+    def resize(self, x, y, width, height):
+        super().resize(x, y, width, height)
+        if not self.remoteApp.started:
+            self.remoteApp.resizedBeforeStart = True
+        self.remoteApp.sendEvent("resize", self.width, self.height)
+
+    def handleMousePressed(self, x, y):
+        self.remoteApp.sendEvent("pressed", *self.convertPositionFromScreen(x, y))
+
+    def handleMouseDragged(self, x, y):
+        self.remoteApp.sendEvent("dragged", *self.convertPositionFromScreen(x, y))
+
+    def handleMouseReleased(self, x, y):
+        self.remoteApp.sendEvent("released", *self.convertPositionFromScreen(x, y))
+
+    def handleMouseMoved(self, x, y):
+        self.remoteApp.sendEvent("moved", *self.convertPositionFromScreen(x, y))
+
+    def handleMouseClicked(self, x, y):
+        self.remoteApp.sendEvent("clicked", *self.convertPositionFromScreen(x, y))
+
+
+class RemoteApp:
+    # apps in another process are shut down when their window is closed (see WindowManager.closeWindow)
+    isRemote = True
+
+    def __init__(self, windowSystem, appClass, x, y, pollInterval=16, startTimeout=10, placeholderSize=(300, 300)):
+        """
+        Start the given app in a separate process and show its top-level window in this window system. The window is
+        shown right away as a placeholder until the app process created the app window (see poll).
+        :param windowSystem: window system the app window is displayed in
+        :param appClass: class of the app, constructed with (windowSystem, x, y) inside the app process
+        :param x: x value of the window's origin
+        :param y: y value of the window's origin
+        :param pollInterval: milliseconds between two checks for new frames of the app process
+        :param startTimeout: seconds to wait for the app process to create its window, the window is closed after that
+        :param placeholderSize: size of the window until the app process reported the size of the app window
+        """
+        self.windowSystem = windowSystem
+        self.appClass = appClass
+        self.pollInterval = pollInterval
+        # current display list of the app window and fonts used to replay it
+        self.displayList = []
+        self.fonts = {}
+        self.closed = False
+        # true once the app process created the app window
+        self.started = False
+        self.startDeadline = time.monotonic() + startTimeout
+        # true if the window was resized before the app started (e.g. by a restored session), it keeps that size then
+        self.resizedBeforeStart = False
+
+        # multiprocessing is only imported when an isolated app is started (faster start of the window system)
+        import multiprocessing
+        # spawn a fresh interpreter: forking would share the Tk connection of the window system
+        context = multiprocessing.get_context("spawn")
+        self.connection, childConnection = context.Pipe()
+        self.process = context.Process(target=runAppProcess,
+                                       args=(childConnection, appClass, windowSystem.width, windowSystem.height),
+                                       name=appClass.__name__, daemon=True)
+        self.process.start()
+        childConnection.close()
+
+        # the instance number is given by this window system, not by the app process, apps name their windows like
+        # their class without "App" (e.g. "1 Calculator")
+        name = appClass.__name__[:-len("App")] if appClass.__name__.endswith("App") else appClass.__name__
+        self.appWindow = RemoteWindow(self, x, y, placeholderSize[0], placeholderSize[1],
+                                      self.windowSystem.getInstanceNumber(name) + " " + name, COLOR_WHITE)
+        self.windowSystem.screen.addChildWindow(self.appWindow)
+
+        self.windowSystem.scheduleTimer(self.pollInterval, self.poll)
+
+    # keyboard input is forwarded like for apps running in the window system's process
+    def handleInput(self, userInput):
+        self.sendEvent("key", userInput)
+
+    def sendEvent(self, *event):
+        if self.closed:
+            return
+        try:
+            self.connection.send(event)
+        except (BrokenPipeError, OSError):
+            self.handleProcessExit()
+
+    def poll(self):
+        """
+        Timer callback: apply all frames the app process sent since the last poll and repaint once if the display list
+        changed. Until the app process created its window, this checks for the message that it did (without waiting
+        for it, so the window system keeps running while the process starts).
+        """
+        if self.closed:
+            return
+        changed = False
+        try:
+            while self.connection.poll():
+                message = self.connection.recv()
+                if message[0] == "frame":
+                    self.displayList = applyDelta(self.displayList, message[1])
+                    changed = True
+                elif message[0] == "created":
+                    self.handleAppStarted(*message[1:])
+                    changed = True
+                elif message[0] == "closed":
+                    self.handleProcessExit()
+                    return
+        except (EOFError, OSError):
+            # app process crashed, the rest of the window system keeps running
+            self.handleProcessExit()
+            return
+        if not self.started and time.monotonic() > self.startDeadline:
+            logStartError(self.appClass)
+            self.handleProcessExit()
+            return
+        if changed:
+            self.windowSystem.requestRepaint()
+        self.windowSystem.scheduleTimer(self.pollInterval, self.poll)
+
+    def handleAppStarted(self, identifier, width, height, backgroundColor):
+        # the app process created the app window: the placeholder gets its size (unless it was resized already) and
+        # its background
+        self.started = True
+        self.appWindow.backgroundColor = backgroundColor
+        if not self.resizedBeforeStart:
+            window = self.appWindow
+            window.resize(window.x, window.y, width, height)
+
+    def handleProcessExit(self):
+        if self.closed:
+            return
+        if self.appWindow.parentWindow is not None:
+            self.windowSystem.windowManager.closeWindow(self.appWindow)
+        self.shutdown()
+
+    def shutdown(self):
+        """
+        Stop the app process. Called by the window manager when the app window is closed.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.connection.send(("quit",))
+        except (BrokenPipeError, OSError):
+            pass
+        self.connection.close()
+        self.process.join(0.5)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+# reports an app process that did not create its window in time (logging is only imported if that happens)
+def logStartError(appClass):
+    import logging
+    logging.getLogger(__name__).warning("App process of %s did not start", appClass.__name__)
+
+
+class AppProcessSystem:
+    """
+    Minimal window system inside an app process. The app builds its window tree on this system as usual, input
+    events arrive through the pipe and the app window is sent back as a display list.
+    """
+    def __init__(self, connection, width, height):
+        self.connection = connection
+        self.width = width
+        self.height = height
+        # apps started by the app are not isolated again
+        self.isolatedApps = ()
+        # imported here so the window manager (and all apps it imports) is only loaded in app processes
+        from WindowManager import WindowManager
+        self.windowManager = WindowManager(self)
+        self.screen = Screen(self)
+        self.apps = []
+        self.asyncBridge = AsyncBridge(self)
+        self.lazyConstruction = True
+        self.app = None
+        # pending timers as a heap of (due time, sequence number, callback, args)
+        self.timers = []
+        self.timerSequence = 0
+        self.repaintRequested = True
+        # events are not tracked: widgets that change outside of the window system's events request a frame, which is
+        # sent once after all queued events (see run)
+        self.handlingEvent = False
+        self.running = True
+        # display list of the last frame sent to the window system
+        self.sentDisplayList = []
+        # windows that are currently pressed or hovered and where the mouse was pressed (same as in the window system)
+        self.pressedWindow = None
+        self.hoveredWindow = None
+        self.pressedY = 0
+
+    def getInstanceNumber(self, appName):
+        # the window system assigns the real instance number
+        return "1"
+
+    def requestRepaint(self):
+        self.repaintRequested = True
+
+    def scheduleTimer(self, delay, callback, *args):
+        self.timerSequence += 1
+        heapq.heappush(self.timers, (time.monotonic() + delay / 1000, self.timerSequence, callback, args))
+        return self.timerSequence
+
+    def run(self, app):
+        self.app = app
+        window = app.appWindow
+        self.connection.send(("created", window.identifier, window.width, window.height, window.backgroundColor))
+        while self.running:
+            if window.parentWindow is None:
+                # app closed its own window (e.g. quit button)
+                self.connection.send(("closed",))
+                break
+            if self.repaintRequested:
+                self.sendFrame()
+            # sleep until the next event arrives or the next timer is due
+            timeout = None
+            if self.timers:
+                timeout = max(0.0, self.timers[0][0] - time.monotonic())
+            if self.connection.poll(timeout):
+                # handle all queued events before the next frame is rendered
+                while self.running and self.connection.poll():
+                    self.handleEvent(self.connection.recv())
+            while self.timers and self.timers[0][0] <= time.monotonic():
+                _, _, callback, args = heapq.heappop(self.timers)
+                callback(*args)
+
+    def sendFrame(self):
+        self.repaintRequested = False
+        self.asyncBridge.flushUpdates()
+        ctx = DisplayListContext()
+        self.app.appWindow.draw(ctx)
+        delta = encodeDelta(self.sentDisplayList, ctx.ops)
+        if delta[2] or len(ctx.ops) != len(self.sentDisplayList):
+            self.connection.send(("frame", delta))
+            self.sentDisplayList = ctx.ops
+
+    def handleEvent(self, event):
+        name = event[0]
+        if name == "quit":
+            self.running = False
+            return
+        # mouse moves only change something if a button is entered or left, drags only if a slider value changes
+        if name not in ("moved", "dragged"):
+            self.repaintRequested = True
+        if name == "key":
+            if hasattr(self.app, "handleInput"):
+                self.asyncBridge.runHandler(self.app.handleInput, event[1])
+        elif name == "resize":
+            self.app.appWindow.resize(0, 0, event[1], event[2])
+        elif name == "pressed":
+            self.pressedWindow = self.screen.childWindowAtLocation(event[1], event[2])
+            self.pressedY = event[2]
+            pressWidget(self.pressedWindow, event[1], event[2])
+        elif name == "dragged":
+            if self.pressedWindow is not None and dragWidget(self.pressedWindow, event[1], event[2],
+                                                             event[2] - self.pressedY):
+                self.repaintRequested = True
+        elif name == "released":
+            if self.pressedWindow is not None:
+                releaseWidget(self.pressedWindow, event[1], event[2])
+            self.pressedWindow = None
+        elif name == "clicked":
+            child = self.screen.childWindowAtLocation(event[1], event[2])
+            if child is not self.screen:
+                child.handleMouseClicked(event[1], event[2])
+        elif name == "moved":
+            hoveredWindow = self.screen.childWindowAtLocation(event[1], event[2])
+            if hoverWidget(self.hoveredWindow, hoveredWindow, event[1], event[2]):
+                self.repaintRequested = True
+            self.hoveredWindow = hoveredWindow
+
+
+# entry point of an app process
+def runAppProcess(connection, appClass, width, height):
+    # fonts of the app widgets need a (hidden) Tk root
+    try:
+        root = tkinter.Tk()
+        root.withdraw()
+    except tkinter.TclError:
+        # no display (e.g. the headless backend): widgets get fonts without Tk
+        from HeadlessEventSystem import HeadlessFont
+        setFontFactory(HeadlessFont)
+        root = None
+    system = AppProcessSystem(connection, width, height)
+    app = appClass(system, 0, 0)
+    system.apps.append(app)
+    try:
+        system.run(app)
+    except (EOFError, OSError):
+        # window system closed the pipe
+        pass
+    finally:
+        connection.close()
+        if root is not None:
+            root.destroy()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import json
+from collections import namedtuple
+
+# Input traces are JSON lines, one event per line:
+# {"time": 120, "type": "pressed", "x": 35, "y": 780}
+# time: milliseconds after the start of the replay (optional, events without time follow the previous event)
+# type: pressed, released, moved, dragged, key (with "char") or wheel (with "delta", 1 = up, -1 = down)
+
+# event object with the attributes of the Tk events the framework's handlers read
+TraceEvent = namedtuple("TraceEvent", "x y char", defaults=(0, 0, ""))
+
+# framework handler of each event type, these call the window system's handler and repaint like real input does
+EVENT_HANDLERS = {
+    "pressed": "_handleMousePressed",
+    "released": "_handleMouseReleased",
+    "moved": "_handleMouseMoved",
+    "dragged": "_handleMouseDragged",
+    "key": "_handleKeyPressed",
+}
+
+
+def loadTrace(path):
+    """
+    Read an input trace.
+    :param path: path of the JSON lines file
+    :return: list of events (dicts)
+    """
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def dispatchEvent(windowSystem, event):
+    """
+    Pass one event of a trace to the window system.
+    :param windowSystem: window system that receives the event
+    :param event: event dict (see above)
+    """
+    eventType = event["type"]
+    if eventType == "wheel":
+        windowSystem.handleMouseWheel(event["x"], event["y"], event["delta"])
+    elif eventType in EVENT_HANDLERS:
+        handler = getattr(windowSystem, EVENT_HANDLERS[eventType])
+        handler(TraceEvent(event.get("x", 0), event.get("y", 0), event.get("char", "")))
+    else:
+        raise ValueError("Unknown event type in trace: " + str(eventType))
+
+
+def replayTrace(windowSystem, events):
+    """
+    Schedule the events of a trace on the window system's timers, relative to now.
+    :param windowSystem: window system that receives the events
+    :param events: list of events returned by loadTrace
+    """
+    delay = 0
+    for event in events:
+        delay = event.get("time", delay)
+        windowSystem.scheduleTimer(int(delay), dispatchEvent, windowSystem, event)
@@ -48,3 +48,11 @@ class ResizingApp:
         self.appWindow.addChildWindow(allAnchors)
 
         allAnchors.addChildWindow(grandchild)
+
+    # releases the windows while the app hibernates (see WindowManager.hibernateApp)
+    def releaseWidgets(self):
+        self.appWindow.removeChildWindows()
+
+    # creates the windows again when the app wakes up from hibernation
+    def rebuildWidgets(self):
+        self.drawWindows()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import json
+import os
+import struct
+from collections import namedtuple
+
+from Window import deferredLayout
+
+# Binary session format (little endian):
+# header: magic, format version, number of windows
+# one record per open app (in the order of the app list), followed by the utf-8 encoded app class name, window
+# identifier and app state (JSON, empty for apps without getState)
+SESSION_MAGIC = b"DWSS"
+SESSION_VERSION = 1
+HEADER = struct.Struct("<4sHH")
+# x, y, width, height, position in the z-order (0 = back), flags, lengths of class name, identifier and state
+WINDOW_RECORD = struct.Struct("<ddddHBHHI")
+FLAG_MINIMIZED = 1 << 0
+# decoded window record (state is None for apps without getState)
+SessionRecord = namedtuple("SessionRecord", "x y width height zIndex flags className identifier state")
+
+
+def serializeSession(windowSystem):
+    """
+    Serialize the top-level windows (position, size, z-order, minimized state) and the state of the open apps.
+    :param windowSystem: window system to save
+    :return: session as bytes
+    """
+    zIndices = {window: i for i, window in enumerate(windowSystem.screen.childWindows)}
+    records = []
+    for app in windowSystem.apps:
+        window = app.appWindow
+        if window not in zIndices:
+            continue
+        # apps in another process are saved by their class (their state stays in the app process)
+        className = getattr(app, "appClass", type(app)).__name__.encode()
+        identifier = window.identifier.encode()
+        # hibernated apps have no widgets, the window manager has their state
+        appState = windowSystem.windowManager.appState(app)
+        state = json.dumps(appState).encode() if appState is not None else b""
+        flags = FLAG_MINIMIZED if window.isHidden else 0
+        records.append(WINDOW_RECORD.pack(window.x, window.y, window.width, window.height,
+                                          zIndices[window], flags, len(className), len(identifier),
+                                          len(state)) + className + identifier + state)
+    return HEADER.pack(SESSION_MAGIC, SESSION_VERSION, len(records)) + b"".join(records)
+
+
+def parseSession(data):
+    """
+    Decode a serialized session.
+    :param data: bytes returned by serializeSession
+    :return: list of SessionRecord
+    :raises ValueError: if the data is not a complete session of this version (struct.error if it is truncated)
+    """
+    magic, version, count = HEADER.unpack_from(data, 0)
+    if magic != SESSION_MAGIC or version != SESSION_VERSION:
+        raise ValueError("Not a session of this window system version")
+    offset = HEADER.size
+    records = []
+    for _ in range(count):
+        x, y, width, height, zIndex, flags, classLength, identifierLength, stateLength = \
+            WINDOW_RECORD.unpack_from(data, offset)
+        offset += WINDOW_RECORD.size
+        if offset + classLength + identifierLength + stateLength > len(data):
+            raise ValueError("Session is truncated")
+        className = data[offset:offset + classLength].decode()
+        offset += classLength
+        identifier = data[offset:offset + identifierLength].decode()
+        offset += identifierLength
+        state = json.loads(data[offset:offset + stateLength]) if stateLength else None
+        offset += stateLength
+        records.append(SessionRecord(x, y, width, height, zIndex, flags, className, identifier, state))
+    return records
+
+
+def restoreSession(windowSystem, data):
+    """
+    Open the apps of a serialized session. The widgets of all apps are created without layout passes, every app
+    window is laid out once at its saved size. A corrupt, truncated or outdated session is ignored (the desktop stays
+    empty), so the window system still starts.
+    :param windowSystem: window system to restore the session in
+    :param data: bytes returned by serializeSession
+    :return: list of the restored apps
+    """
+    try:
+        records = parseSession(data)
+    except (struct.error, ValueError) as error:
+        # ValueError includes invalid JSON and utf-8
+        logSessionError("Could not read the session", error)
+        return []
+    # the widgets have to exist to restore the app state
+    lazyConstruction = windowSystem.lazyConstruction
+    windowSystem.lazyConstruction = False
+    try:
+        restored = restoreApps(windowSystem, records)
+    finally:
+        windowSystem.lazyConstruction = lazyConstruction
+
+    # restore the z-order of the saved windows (in front of windows that were already open)
+    for _, window, _ in sorted(restored, key=lambda entry: entry[0]):
+        windowSystem.screen.childWindows.raiseWindow(window)
+    return [app for _, _, app in restored]
+
+
+# opens the apps of the records, returns (z index, window, app) for each app
+def restoreApps(windowSystem, records):
+    restored = []
+    registry = windowSystem.windowManager.appRegistry
+    for record in records:
+        entry = registry.entryForClassName(record.className)
+        if entry is None:
+            # app does not exist anymore
+            continue
+
+        with deferredLayout():
+            app = windowSystem.windowManager.createApp(registry.loadClass(record.className), record.x, record.y,
+                                                       findPosition=False)
+        window = app.appWindow
+        window.identifier = record.identifier
+        windowSystem.registerIdentifier(record.identifier)
+        window.resize(record.x, record.y, record.width, record.height)
+        window.isHidden = bool(record.flags & FLAG_MINIMIZED)
+        windowSystem.screen.topLevelWindowChanged(window)
+        if record.state is not None and hasattr(app, "setState"):
+            app.setState(record.state)
+        restored.append((record.zIndex, window, app))
+    return restored
+
+
+# reports a session that can't be read (logging is only imported if that happens)
+def logSessionError(message, error):
+    import logging
+    logging.getLogger(__name__).warning("%s: %s", message, error)
+
+
+def saveSession(windowSystem, path):
+    """
+    Write the session to a temporary file that replaces the session file when it is complete, so a crash while saving
+    leaves the previous session intact.
+    """
+    writeSessionFile(path, serializeSession(windowSystem))
+
+
+def writeSessionFile(path, data):
+    """
+    Write a serialized session atomically (see saveSession). Does not touch the windows, so it can run in a worker
+    thread.
+    """
+    temporaryPath = path + ".tmp"
+    with open(temporaryPath, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporaryPath, path)
+
+
+def loadSession(windowSystem, path):
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError as error:
+        logSessionError("Could not read the session", error)
+        return []
+    return restoreSession(windowSystem, data)
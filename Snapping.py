@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+from bisect import bisect_left, insort
+
+
+def nearestEdge(edges, value, threshold):
+    """
+    :param edges: sorted list of edge positions
+    :param value: position of an edge of the dragged window
+    :param threshold: maximum distance to snap
+    :return: the edge closest to value if it is within the threshold, None otherwise
+    """
+    i = bisect_left(edges, value)
+    best = None
+    # the closest edges are the ones right before and after the insertion point
+    for edge in edges[max(0, i - 1):i + 1]:
+        if abs(edge - value) <= threshold and (best is None or abs(edge - value) < abs(best - value)):
+            best = edge
+    return best
+
+
+class EdgeIndex:
+    """
+    Sorted lists of the vertical (x) and horizontal (y) edges windows snap to. Every owner (a window or the work area)
+    adds its edges, they are replaced when the owner moved or resized, so the lists are never rebuilt from scratch.
+    """
+    def __init__(self):
+        self.xEdges = []
+        self.yEdges = []
+        # x and y edges by owner
+        self.edgesByOwner = {}
+
+    def update(self, owner, xEdges, yEdges):
+        """
+        Set the edges of an owner, nothing changes if they are the same as before.
+        :param owner: window or other object the edges belong to
+        :param xEdges: tuple of x values of vertical edges
+        :param yEdges: tuple of y values of horizontal edges
+        """
+        if self.edgesByOwner.get(owner) == (xEdges, yEdges):
+            return
+        self.remove(owner)
+        self.edgesByOwner[owner] = (xEdges, yEdges)
+        for edge in xEdges:
+            insort(self.xEdges, edge)
+        for edge in yEdges:
+            insort(self.yEdges, edge)
+
+    def remove(self, owner):
+        """
+        Remove the edges of an owner (does nothing if it has no edges).
+        """
+        if owner not in self.edgesByOwner:
+            return
+        xEdges, yEdges = self.edgesByOwner.pop(owner)
+        for edge in xEdges:
+            del self.xEdges[bisect_left(self.xEdges, edge)]
+        for edge in yEdges:
+            del self.yEdges[bisect_left(self.yEdges, edge)]
+
+    def owners(self):
+        return list(self.edgesByOwner)
+
+    def snap(self, x, y, width, height, threshold):
+        """
+        Snap a window rect to the closest edges: its left or right edge to a vertical edge and its top or bottom edge
+        to a horizontal edge, each within the threshold.
+        :return: (x, y) of the snapped position
+        """
+        return (x + self.snapOffset(self.xEdges, x, width, threshold),
+                y + self.snapOffset(self.yEdges, y, height, threshold))
+
+    @staticmethod
+    def snapOffset(edges, start, size, threshold):
+        # distance to move a window to the closest edge of its start or end, 0 if no edge is close enough
+        offsets = []
+        for value in (start, start + size):
+            edge = nearestEdge(edges, value, threshold)
+            if edge is not None:
+                offsets.append(edge - value)
+        return min(offsets, key=abs) if offsets else 0
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import copy
+
+from GraphicsEventSystem import *
+from UITK import *
+
+# Templates describe the widgets of an app as a list of (JSON compatible) dicts, one per widget:
+# type: class of the widget (see WIDGET_TYPES)
+# id: identifier of the widget
+# frame: [x, y, width, height] in the parent window, a width or height <= 0 is relative to the size of the parent
+#        (0: as wide/high as the parent, -20: 20px less)
+# anchors: list of layout anchors, e.g. ["top", "left"] (default: top left)
+# font: font options, e.g. {"family": "Helvetica", "size": 14, "weight": "bold"}
+# children: specs of the child windows
+# items (containers only): specs of the windows positioned by the container, added to the parent before the container
+# all other keys are passed to the constructor of the widget (e.g. text, fontColor, backgroundColor)
+WIDGET_TYPES = {"Window": Window, "Widget": Widget, "Label": Label, "Button": Button, "Container": Container}
+# keys of a spec that are not constructor arguments
+STRUCTURE_KEYS = {"type", "id", "frame", "anchors", "font", "children", "items"}
+
+
+def cloneWindows(windows):
+    """
+    Copy window trees: every window is copied (shallow), the references between the windows (child windows, parents,
+    containers and their windows) point to the copies.
+    :param windows: root windows of the trees
+    :return: list of the copied root windows (without parent window)
+    """
+    clones = {}
+    roots = [cloneTree(window, None, clones) for window in windows]
+    for original, clone in clones.items():
+        if original.layoutContainer is not None:
+            clone.layoutContainer = clones[original.layoutContainer]
+        if isinstance(original, Container):
+            clone.containerWindows = [clones[window] for window in original.containerWindows]
+            clone.itemConstraints = {clones[window]: constraints
+                                     for window, constraints in original.itemConstraints.items()}
+    return roots
+
+
+# copies a window and its child windows, clones maps the original windows to their copies
+def cloneTree(window, parent, clones):
+    clone = copy.copy(window)
+    clones[window] = clone
+    clone.parentWindow = parent
+    clone.childWindows = [cloneTree(child, clone, clones) for child in window.childWindows]
+    return clone
+
+
+# returns all windows of the given trees by identifier
+def windowsByIdentifier(windows):
+    named = {}
+    stack = list(windows)
+    while stack:
+        window = stack.pop()
+        named[window.identifier] = window
+        stack.extend(window.childWindows)
+    return named
+
+
+class Template:
+    """
+    Declarative description of the widgets of an app. The first instance for a size of the parent window is built from
+    the specs, its laid out widgets are kept as prototype and all later instances with that size are copies of it.
+    """
+    def __init__(self, specs):
+        """
+        :param specs: list of widget specs (see above)
+        """
+        self.specs = specs
+        # laid out widget trees by size of the parent window
+        self.prototypes = {}
+
+    def instantiate(self, parent):
+        """
+        Create the widgets of the template in the given parent window.
+        :param parent: window the widgets are added to (the app window)
+        :return: dict of the created windows by identifier
+        """
+        steps = self.instantiateInSteps(parent)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def instantiateInSteps(self, parent):
+        """
+        Generator version of instantiate for buildInChunks: a template without prototype for the size of the parent is
+        built one top-level spec per step, copies of a prototype are created in one step.
+        Use as windows = yield from template.instantiateInSteps(parent).
+        :param parent: window the widgets are added to (the app window)
+        :return: dict of the created windows by identifier (value of the generator)
+        """
+        size = (parent.width, parent.height)
+        prototype = self.prototypes.get(size)
+        if prototype is None:
+            windows = []
+            for i, spec in enumerate(self.specs):
+                if i > 0:
+                    yield
+                self.build(spec, parent, windows)
+            # keep a copy unless the windows were added without layout (see deferredLayout) or the parent was resized
+            # between the steps
+            if not Window.layoutDeferred and (parent.width, parent.height) == size:
+                self.prototypes[size] = cloneWindows(windows)
+            return windowsByIdentifier(windows)
+
+        windows = cloneWindows(prototype)
+        # the copies already have their layout
+        with deferredLayout():
+            for window in windows:
+                # keep the margins of the prototype (computed when it was added before its layout)
+                margins = window.marginRight, window.marginBottom
+                parent.addChildWindow(window)
+                window.marginRight, window.marginBottom = margins
+        return windowsByIdentifier(windows)
+
+    def build(self, spec, parent, windows):
+        """
+        Create a widget of a spec and add it to the parent window.
+        :param spec: widget spec
+        :param parent: parent window
+        :param windows: list the widget (and the items of a container) is appended to
+        :return: created widget
+        """
+        widgetType = WIDGET_TYPES[spec["type"]]
+        x, y, width, height = spec["frame"]
+        if width <= 0:
+            width += parent.width
+        if height <= 0:
+            height += parent.height
+        options = {key: value for key, value in spec.items() if key not in STRUCTURE_KEYS}
+        if "anchors" in spec:
+            options["layoutAnchors"] = 0
+            for anchor in spec["anchors"]:
+                options["layoutAnchors"] |= getattr(LayoutAnchor, anchor)
+        if "font" in spec:
+            options["font"] = internFont(**spec["font"])
+
+        if widgetType is Container:
+            items = [self.build(item, parent, windows) for item in spec.get("items", [])]
+            widget = Container(x, y, width, height, spec["id"], items, **options)
+        else:
+            widget = widgetType(x, y, width, height, spec["id"], **options)
+        parent.addChildWindow(widget)
+        windows.append(widget)
+        children = []
+        for child in spec.get("children", []):
+            self.build(child, widget, children)
+        return widget
@@ -7,9 +7,180 @@ by  Felix Umland (#406886)
 and Jannick Brändel (#405391)
 """
 
+from collections import OrderedDict
+from functools import partial
+from weakref import WeakValueDictionary
+from Drawing import drawLines, fillRects
 from GraphicsEventSystem import *
+from Layout import DEFAULT_CONSTRAINTS, FlexLayout, GridCell, GridLayout, LayoutConstraints
 from Window import *
 
+# debug output of the widgets (e.g. slider values) through the logging module, which is only imported when this is
+# enabled (it is slow to import), the application still has to configure logging
+debugLogging = False
+
+# visual style of labels and buttons. Styles are immutable and interned (see internStyle): all widgets that look the
+# same reference the same style, changing e.g. the font color of a widget gives it another (shared) style
+Style = namedtuple("Style", "font fontColor backgroundColor hoverBackgroundColor pressedBackgroundColor borderColor",
+                   defaults=(None, None, None))
+# font and colors a widget is drawn with in one state, resolved once per widget class, style and state
+ResolvedStyle = namedtuple("ResolvedStyle", "font fontColor backgroundColor borderColor")
+# interned styles and fonts by their values, resolved styles by widget class, style values and state. The tables keep
+# the most recently used entries (e.g. when a widget's color follows a slider, the styles of the other widgets stay
+# interned), fonts stay interned as long as they are used (Tk deletes a font when its last reference is gone)
+MAX_INTERNED_STYLES = 1024
+MAX_INTERNED_FONTS = 64
+
+
+class InternTable:
+    def __init__(self, maxSize, weak=False):
+        """
+        Table of interned values by key that keeps the maxSize most recently used values.
+        :param maxSize: number of values kept
+        :param weak: keep values that were dropped from the table as long as they are referenced elsewhere (the values
+        have to support weak references)
+        """
+        self.maxSize = maxSize
+        self.values = OrderedDict()
+        self.weakValues = WeakValueDictionary() if weak else None
+
+    def __len__(self):
+        return len(self.values)
+
+    def intern(self, key, create):
+        """
+        :param key: hashable key of the value
+        :param create: function returning a new value, called if there is no value for the key
+        :return: the interned value for the key
+        """
+        value = self.values.get(key)
+        if value is not None:
+            self.values.move_to_end(key)
+            return value
+        if self.weakValues is not None:
+            value = self.weakValues.get(key)
+        if value is None:
+            value = create()
+            if self.weakValues is not None:
+                self.weakValues[key] = value
+        self.values[key] = value
+        if len(self.values) > self.maxSize:
+            self.values.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.values.clear()
+        if self.weakValues is not None:
+            self.weakValues.clear()
+
+
+internedStyles = InternTable(MAX_INTERNED_STYLES)
+internedFonts = InternTable(MAX_INTERNED_FONTS, weak=True)
+resolvedStyles = InternTable(MAX_INTERNED_STYLES)
+
+
+# returns the values of a style as hashable key (tkinter fonts are not hashable, they are identified by their name)
+def styleKey(style):
+    return (None if style.font is None else style.font.name,) + style[1:]
+
+
+def internStyle(style):
+    """
+    :param style: Style
+    :return: the interned style with the same values
+    """
+    return internedStyles.intern(styleKey(style), lambda: style)
+
+
+# creates the fonts of the widgets: tkinter fonts, event systems without Tk supply their own (see setFontFactory)
+fontFactory = Font
+
+
+def setFontFactory(factory):
+    """
+    Set the function that creates fonts from font options. Event systems that can't create tkinter fonts (e.g. the
+    headless backend) supply fonts with the same interface, so widgets never depend on a Tk root.
+    :param factory: function called with the font options (e.g. family="Helvetica", size=12)
+    """
+    global fontFactory
+    if factory is not fontFactory:
+        fontFactory = factory
+        internedFonts.clear()
+
+
+def createFont(**options):
+    """
+    :param options: font options, e.g. family="Helvetica", size=12, weight=BOLD
+    :return: new font of the current font factory
+    """
+    return fontFactory(**options)
+
+
+def internFont(**options):
+    """
+    :param options: font options, e.g. family="Helvetica", size=12, weight=BOLD
+    :return: shared Font with these options
+    """
+    return internedFonts.intern(tuple(sorted(options.items())), lambda: createFont(**options))
+
+
+def resolveStyle(widgetClass, style, state="NORMAL"):
+    """
+    :param widgetClass: class of the widget, resolves the style with styleForState
+    :param style: style of the widget
+    :param state: state of the widget (e.g. "HOVERED")
+    :return: ResolvedStyle (cached)
+    """
+    return resolvedStyles.intern((widgetClass, state, styleKey(style)),
+                                 lambda: widgetClass.styleForState(style, state))
+
+
+# attribute of a widget that is stored in its style
+def styleProperty(name):
+    def getter(self):
+        return getattr(self.style, name)
+
+    def setter(self, value):
+        if getattr(self.style, name) != value:
+            self.style = internStyle(self.style._replace(**{name: value}))
+    return property(getter, setter)
+
+
+# logs a debug message with the given details as extra attributes of the log record (see debugLogging)
+def logDebug(message, **details):
+    import logging
+    logging.getLogger(__name__).debug(message, extra=details)
+
+
+# executes the action of a widget. Actions can be coroutine functions, these are run on the window system's asyncio
+# bridge, so slow app logic does not block input handling and painting
+def runAction(widget, action):
+    windowSystem = widget.getWindowSystem()
+    if windowSystem is None:
+        return action()
+    return windowSystem.asyncBridge.runHandler(action)
+
+
+# runs a generator that creates the widgets of an app step by step: every step runs in its own timer callback, so the
+# window system can paint (e.g. the empty app window) and handle input in between. With lazy construction disabled
+# (e.g. while a session is restored) all steps are run at once
+def buildInChunks(windowSystem, chunks, done=None):
+    def step():
+        for _ in chunks:
+            if windowSystem.lazyConstruction:
+                windowSystem.requestRepaint()
+                windowSystem.scheduleTimer(0, step)
+                return
+        if done is not None:
+            done()
+        if windowSystem.lazyConstruction:
+            windowSystem.requestRepaint()
+
+    if windowSystem.lazyConstruction:
+        windowSystem.scheduleTimer(0, step)
+    else:
+        step()
+
 
 class Widget(Window):
     def __init__(self, originX, originY, width, height, identifier, layoutAnchors=LayoutAnchor.top | LayoutAnchor.left,
@@ -23,19 +194,39 @@ class Widget(Window):
 class Container(Widget):
     def __init__(self, originX, originY, width, height, identifier, containerWindows: [Window],
                  horizontalDist=True, spacing=0, layoutAnchors=LayoutAnchor.top | LayoutAnchor.left,
-                 backgroundColor=COLOR_CLEAR):
+                 backgroundColor=COLOR_CLEAR, layout=None):
+        """
+        :param containerWindows: windows positioned by the container (they still have to be added to a parent window)
+        :param horizontalDist: distribute the windows horizontally (otherwise vertically), ignored if layout is given
+        :param spacing: spacing between the windows, ignored if layout is given
+        :param layout: FlexLayout or GridLayout used to position the windows (default: flex layout which distributes
+        the space evenly as defined by horizontalDist and spacing)
+        """
         super().__init__(originX, originY, width, height, identifier, layoutAnchors, backgroundColor)
         self.containerWindows = containerWindows
         # boolean that is true when items should be horizontally distributed, otherwise they are vertically distributed
         self.horizontalDist = horizontalDist
         # spacing between items
         self.spacing = spacing
+        self.layout = layout if layout is not None else FlexLayout(horizontalDist, spacing)
+        # LayoutConstraints (flex layout) or GridCell (grid layout) of the container windows, default if not set
+        self.itemConstraints = {}
+        # increased whenever windows or constraints change
+        self.constraintsGeneration = 0
+        # frames of the container windows relative to the container origin from the last layout pass and the key
+        # (size, layout, constraints generation) they were computed for
+        self.layoutFrames = []
+        self.layoutKey = None
+        for window in containerWindows:
+            window.layoutContainer = self
 
     # new window is added to container windows array. No window object should be in a container twice
     # (not used right now but maybe useful for future apps?)
     def addWindowToContainer(self, window):
         if window not in self.containerWindows:
             self.containerWindows.append(window)
+            window.layoutContainer = self
+            self.constraintsGeneration += 1
             # adapt container to added window
             self.resize(self.x, self.y, self.width, self.height)
 
@@ -44,61 +235,75 @@ class Container(Widget):
     def removeWindowFromContainer(self, window):
         if window in self.containerWindows:
             self.containerWindows.remove(window)
+            window.layoutContainer = None
+            self.itemConstraints.pop(window, None)
+            self.constraintsGeneration += 1
             # adapt container to removed window
             self.resize(self.x, self.y, self.width, self.height)
 
-    # override resize function of window: container distributes its space between the container windows and resizes
-    # them to have the same width/height and position them while leaving space in between if spacing is defined.
+    def setConstraints(self, window, **constraints):
+        """
+        Set the flex constraints of a container window, e.g. setConstraints(label, grow=0, basis=40).
+        :param window: container window
+        :param constraints: fields of LayoutConstraints, fields which are not given keep their default
+        """
+        self.itemConstraints[window] = LayoutConstraints(**constraints)
+        self.constraintsGeneration += 1
+        self.resize(self.x, self.y, self.width, self.height)
+
+    def setCell(self, window, row, column, rowSpan=1, columnSpan=1):
+        """
+        Set the cell of a container window in a grid layout.
+        """
+        self.itemConstraints[window] = GridCell(row, column, rowSpan, columnSpan)
+        self.constraintsGeneration += 1
+        self.resize(self.x, self.y, self.width, self.height)
+
+    def setLayout(self, layout):
+        self.layout = layout
+        self.resize(self.x, self.y, self.width, self.height)
+
+    # returns the constraints of a container window for the layout
+    def constraintsOf(self, window):
+        if isinstance(self.layout, GridLayout):
+            return self.itemConstraints.get(window)
+        return self.itemConstraints.get(window, DEFAULT_CONSTRAINTS)
+
+    # override resize function of window: container distributes its space between the container windows with its
+    # layout and positions them (in the coordinate system of the parent window, like the container itself)
     def resize(self, x, y, width, height):
         super().resize(x, y, width, height)
         if len(self.containerWindows) == 0:
             return
-        totalSpacing = self.spacing * (len(self.containerWindows) - 1)
-        # if not self.isHidden:
-        if self.horizontalDist:
-            # DISTRIBUTE HORIZONTALLY
-            # calculate width for each window inside container
-            conWindowWidth = (self.width - totalSpacing) / len(self.containerWindows)
-            if conWindowWidth < 20:
-                conWindowWidth = 20
-            # x is increased for each containerWindow ensuring spacing
-            currentX = self.x
-            for window in self.containerWindows:
-                window.x = currentX
-                window.y = self.y
-                window.width = conWindowWidth
-                window.height = self.height
-                currentX += window.width + self.spacing
-                # as window's width changed, check if it reaches out of parent window
-                window.isHidden = window.x + window.width > window.parentWindow.width or window.y + window.height > window.parentWindow.height
-                if isinstance(window, Container):
-                    # nested container: call resize to adjust container windows of that container
-                    window.resize(window.x, window.y, window.width, window.height)
-
-        else:
-            # DISTRIBUTE VERTICALLY
-            # calculate width for each window inside container
-            conWindowHeight = (self.height - totalSpacing) / len(self.containerWindows)
-            if conWindowHeight < 20:
-                conWindowHeight = 20
-            # y is increased for each containerWindow ensuring spacing
-            currentY = self.y
-            for window in self.containerWindows:
-                window.y = currentY
-                window.x = self.x
-                window.width = self.width
-                window.height = conWindowHeight
-                currentY += window.height + self.spacing
-                # as window's height changed, check if it reaches out of parent window
-                window.isHidden = window.x + window.width > window.parentWindow.width or window.y + window.height > window.parentWindow.height
-                if isinstance(window, Container):
-                    # nested container: call resize to adjust container windows of that container
-                    window.resize(window.x, window.y, window.width, window.height)
+        # the frames only have to be computed again if the size, layout or constraints changed. Otherwise (e.g. when
+        # the container only moved or a parent container is laid out again) the cached frames are reused
+        key = (self.width, self.height, self.layout, self.constraintsGeneration, len(self.containerWindows))
+        if key != self.layoutKey:
+            self.layoutFrames = self.layout.arrange(self.width, self.height, self.containerWindows, self.constraintsOf)
+            self.layoutKey = key
+        for window, (offsetX, offsetY, width, height) in zip(self.containerWindows, self.layoutFrames):
+            window.x = self.x + offsetX
+            window.y = self.y + offsetY
+            window.width = width
+            window.height = height
+            # as window's size changed, check if it reaches out of parent window
+            window.isHidden = window.x + window.width > window.parentWindow.width or window.y + window.height > window.parentWindow.height
+            if isinstance(window, Container):
+                # nested container: call resize to adjust container windows of that container
+                window.resize(window.x, window.y, window.width, window.height)
+            else:
+                # container windows are skipped when their parent window resizes its children (see Window.resize),
+                # so their own child windows are resized here
+                for child in window.childWindows:
+                    if child.layoutContainer is None:
+                        child.resize(child.x, child.y, child.width, child.height)
 
     def draw(self, ctx):
         super().draw(ctx)
 
     # override hitTest function and always return false since were are not interested in if the container was hit
+    canBeHit = False
+
     def hitTest(self, x, y):
         return False
 
@@ -113,14 +318,28 @@ class Label(Widget):
         self.centered = centered
         # font as optional parameter, will be set to default if none
         if font is None:
-            font = Font(family="Helvetica", size=12)
+            font = internFont(family="Helvetica", size=12)
         # font color as opt. parameter
         if fontColor is None:
             fontColor = COLOR_BLACK
-        self.font = font
-        self.fontColor = fontColor
+        # font and colors are stored in a style shared with other widgets (the style properties below)
+        self.style = internStyle(Style(font, fontColor, backgroundColor))
         super().__init__(originX, originY, width, height, identifier, layoutAnchors, backgroundColor)
 
+    font = styleProperty("font")
+    fontColor = styleProperty("fontColor")
+    backgroundColor = styleProperty("backgroundColor")
+
+    @staticmethod
+    def styleForState(style, state):
+        return ResolvedStyle(style.font, style.fontColor, style.backgroundColor, None)
+
+    def resolvedStyle(self):
+        return resolveStyle(type(self), self.style)
+
+    def currentBackgroundColor(self):
+        return self.resolvedStyle().backgroundColor
+
     def draw(self, ctx):
         # draw background with superclass function
         super().draw(ctx)
@@ -129,15 +348,19 @@ class Label(Widget):
 
         # draw text with specified font (color) into label
         if not self.isHidden:
-            x, y = self.convertPositionToScreen(0, 0)
-            ctx.setOrigin(x, y)
-            ctx.setStrokeColor(self.fontColor)
-            ctx.setFont(self.font)
-            # check if text should be centered and set coordinates and centered attribute accordingly
-            if self.centered:
-                ctx.drawString(self.text, tempWidth/2, tempHeight/2, centered=True)
-            else:
-                ctx.drawString(self.text, 1, tempHeight*0.2)
+            self.drawText(ctx, tempWidth, tempHeight)
+
+    def drawText(self, ctx, tempWidth, tempHeight):
+        style = self.resolvedStyle()
+        x, y = self.convertPositionToScreen(0, 0)
+        ctx.setOrigin(x, y)
+        ctx.setStrokeColor(style.fontColor)
+        ctx.setFont(style.font)
+        # check if text should be centered and set coordinates and centered attribute accordingly
+        if self.centered:
+            ctx.drawString(self.text, tempWidth/2, tempHeight/2, centered=True)
+        else:
+            ctx.drawString(self.text, 1, tempHeight*0.2)
 
 
 class Button(Label):
@@ -148,31 +371,34 @@ class Button(Label):
         self.action = action
         # state can either be "NORMAL", "HOVERED", or "PRESSED"
         self.state = "NORMAL"
-        # font and font color same as in label class
-        if font is None:
-            font = Font(family="Helvetica", size=12)
-        if fontColor is None:
-            fontColor = COLOR_BLACK
-        self.hoverBackgroundColor = hoverBackgroundColor
-        self.pressedBackgroundColor = pressedBackgroundColor
-        # temp variable to store original background color -> used while changing button state from Hovered to Normal
-        # again
-        self.tempBackgroundColor = None
-        # color used for left and top line of the border as the other lines are drawn in black to get depth effect
-        self.borderColor = borderColor
         super().__init__(originX, originY, width, height, identifier, text, centered, font, fontColor, layoutAnchors,
                          backgroundColor)
+        # borderColor: color used for left and top line of the border as the other lines are drawn in black to get
+        # depth effect
+        self.style = internStyle(self.style._replace(hoverBackgroundColor=hoverBackgroundColor,
+                                                     pressedBackgroundColor=pressedBackgroundColor,
+                                                     borderColor=borderColor))
+
+    hoverBackgroundColor = styleProperty("hoverBackgroundColor")
+    pressedBackgroundColor = styleProperty("pressedBackgroundColor")
+    borderColor = styleProperty("borderColor")
+
+    # background color according to current state, backgroundColor always holds the color of the NORMAL state
+    @staticmethod
+    def styleForState(style, state):
+        if state == "HOVERED":
+            backgroundColor = style.hoverBackgroundColor
+        elif state == "PRESSED":
+            backgroundColor = style.pressedBackgroundColor
+        else:
+            backgroundColor = style.backgroundColor
+        return ResolvedStyle(style.font, style.fontColor, backgroundColor, style.borderColor)
+
+    def resolvedStyle(self):
+        return resolveStyle(type(self), self.style, self.state)
 
     def draw(self, ctx):
         super().draw(ctx)
-        # set background color according to current state
-        if self.state == "HOVERED":
-            self.setBackgroundColor(self.hoverBackgroundColor)
-        elif self.state == "PRESSED":
-            self.setBackgroundColor(self.pressedBackgroundColor)
-        else:
-            if self.tempBackgroundColor is not None:
-                self.setBackgroundColor(self.tempBackgroundColor)
 
         # check temporary size to ensure clipping
         tempWidth, tempHeight = self.getDrawingSize()
@@ -181,34 +407,64 @@ class Button(Label):
             x, y = self.convertPositionToScreen(0,0)
             ctx.setOrigin(x, y)
             # draw border in two colors to get depth effect
-            ctx.setStrokeColor(self.borderColor)
+            ctx.setStrokeColor(self.resolvedStyle().borderColor)
             ctx.drawLine(0, 0, tempWidth, 0)
             ctx.drawLine(0, 0, 0, tempHeight)
             ctx.setStrokeColor(COLOR_BLACK)
             ctx.drawLine(tempWidth, 0, tempWidth, tempHeight)
             ctx.drawLine(0, tempHeight, tempWidth, tempHeight)
 
+    # the buttons of a container (e.g. the button grid of the calculator) are drawn together: the layout of the container
+    # never lets them overlap, so the backgrounds and borders of all buttons can be drawn with one fillRects and one
+    # drawLines call before their texts
+    def drawGroupKey(self):
+        if self.layoutContainer is None or self.childWindows or type(self).draw is not Button.draw:
+            return None
+        return type(self), self.layoutContainer
+
+    @staticmethod
+    def drawGroup(ctx, buttons):
+        rects, rectColors, lines, lineColors, visibleButtons = [], [], [], [], []
+        for button in buttons:
+            tempWidth, tempHeight = button.getDrawingSize()
+            if button.isHidden:
+                continue
+            x, y = button.convertPositionToScreen(0, 0)
+            right, bottom = x + tempWidth, y + tempHeight
+            rects.append((x, y, right, bottom))
+            rectColors.append(button.currentBackgroundColor())
+            borderColor = button.resolvedStyle().borderColor
+            lines += [(x, y, right, y), (x, y, x, bottom), (right, y, right, bottom), (x, bottom, right, bottom)]
+            lineColors += [borderColor, borderColor, COLOR_BLACK, COLOR_BLACK]
+            visibleButtons.append((button, tempWidth, tempHeight))
+        if not visibleButtons:
+            return
+        ctx.setOrigin(0, 0)
+        fillRects(ctx, rects, rectColors)
+        drawLines(ctx, lines, lineColors)
+        for button, tempWidth, tempHeight in visibleButtons:
+            button.drawText(ctx, tempWidth, tempHeight)
+
     # Call-back function that is executed when button is clicked
     def handleMouseClicked(self, x, y):
         if self.action is not None:
-            self.action()
+            runAction(self, self.action)
         # after mouse click mouse is still on button so state changes to HOVERED
         self.changeState("HOVERED")
 
-    # update button state with state parameter
+    # update button state with state parameter, returns true if the state changed (and the button has to be redrawn)
     def changeState(self, state):
-        if self.state == "NORMAL" and state == "HOVERED":
-            # store background color while changing state from NORMAL to HOVERED
-            self.tempBackgroundColor = self.backgroundColor
-        if state in ["NORMAL", "HOVERED", "PRESSED"]:
-            self.state = state
-        else:
+        if state not in ["NORMAL", "HOVERED", "PRESSED"]:
             raise ValueError("Button state must be 'NORMAL' or 'HOVERED' or 'PRESSED'")
+        if self.state == state:
+            return False
+        self.state = state
+        return True
 
 
 class Slider(Widget):
     def __init__(self, originX, originY, width, height, identifier, defaultSliderValue=0.5, action=None,
-                 layoutAnchors=LayoutAnchor.top | LayoutAnchor.left, backgroundColor=COLOR_CLEAR):
+                 layoutAnchors=LayoutAnchor.top | LayoutAnchor.left, backgroundColor=COLOR_CLEAR, steps=1000):
         # Value is in range [0,1]
         self.sliderValue = defaultSliderValue
         # Size of the element that can be moved around
@@ -216,20 +472,45 @@ class Slider(Widget):
         # Position of the slider element, this is offset from the value, because the position
         # is set from the center, and the value is measured from the left side of the element
         self.sliderPosition = self.sliderValue * width
+        # number of distinct values above 0, the value is rounded to multiples of 1/steps
+        self.steps = steps
         self.state = "NORMAL"
         self.action = action
+        # True while a value change is queued for the action, see notifyValueChanged
+        self.notificationPending = False
         super().__init__(originX, originY, width, height, identifier, layoutAnchors, backgroundColor)
-        self.changeSlider(self.sliderValue * width)
+        # the initial value is not reported to the action (the app is still creating its widgets)
+        self.moveSlider(self.sliderValue * width)
 
     def changeState(self, state):
-        if state in ["NORMAL", "PRESSED"]:
-            self.state = state
-        else:
+        """
+        :param state: "NORMAL" or "PRESSED"
+        :return: True if the state changed (and the slider has to be redrawn)
+        """
+        if state not in ["NORMAL", "PRESSED"]:
             raise ValueError("Slider state must be 'NORMAL' or 'PRESSED' instead of: " + str(state))
-        if state == "PRESSED" and self.action is not None:
-            self.action()
+        if state == self.state:
+            return False
+        self.state = state
+        return True
+
+    # sets the slider to the given value in range [0,1]
+    def setValue(self, value):
+        self.changeSlider(value * (self.width - self.sliderElementWidth) + self.sliderElementWidth / 2)
 
     def changeSlider(self, x):
+        """
+        Move the slider element to the given position and notify the action if the value changed.
+        :param x: position of the element's center relative to the slider
+        :return: True if the value changed (and the slider has to be redrawn)
+        """
+        if not self.moveSlider(x):
+            return False
+        self.notifyValueChanged()
+        return True
+
+    # moves the slider element without notifying the action, returns True if the value changed
+    def moveSlider(self, x):
         # clamp values to min and max range
         # The left most position is elementWidth/2 but has to be value 0
         # The right most position is width-elementWidth/2 but has to be value 1
@@ -241,11 +522,39 @@ class Slider(Widget):
         # The usable value range is (width - elementWidth) because having the slider
         # at the right most position means the left slide (where we measure value) of the element isn't at 100%
         usableRange = self.width-self.sliderElementWidth
-        # normalize the position to a value in range [0,1]
-        self.sliderValue = leftPosition/usableRange
-        print(self.sliderValue)
-        self.sliderPosition = x
-        print(self.sliderPosition)
+        # normalize the position to a value in range [0,1] and round it to the slider's steps, the element is placed
+        # at the rounded value, so it only moves when the value changes
+        value = round(leftPosition / usableRange * self.steps) / self.steps if usableRange > 0 else 0
+        self.sliderPosition = value * usableRange + self.sliderElementWidth / 2
+        if value == self.sliderValue:
+            return False
+        self.sliderValue = value
+        if debugLogging:
+            logDebug("slider value changed", widget=self.identifier, value=value, position=self.sliderPosition)
+        return True
+
+    def notifyValueChanged(self):
+        """
+        Run the action for the current value. Changes are coalesced: the action runs once before the next frame is
+        painted, no matter how many drag events changed the value in between. That frame is the repaint after the
+        current input event (or one requested here if the value was changed outside of an event), no extra repaint is
+        scheduled for the action.
+        """
+        if self.action is None or self.notificationPending:
+            return
+        windowSystem = self.getWindowSystem()
+        if windowSystem is None:
+            # slider is not shown yet, nothing is painted that could be coalesced with
+            self.action()
+            return
+        self.notificationPending = True
+        windowSystem.asyncBridge.callBeforePaint(self.emitValueChanged)
+        if not windowSystem.handlingEvent:
+            windowSystem.requestRepaint()
+
+    def emitValueChanged(self):
+        self.notificationPending = False
+        runAction(self, self.action)
 
     def draw(self, ctx):
         super().draw(ctx)
@@ -284,3 +593,240 @@ class Slider(Widget):
             ctx.setStrokeColor(COLOR_BLACK)
             ctx.drawLine(self.sliderElementWidth, 0, self.sliderElementWidth, tempHeight)
             ctx.drawLine(0, tempHeight, self.sliderElementWidth, tempHeight)
+
+
+class ListRow(Label):
+    def __init__(self, listView, identifier, font, fontColor, backgroundColor):
+        # index of the item that is currently displayed in this row (None if the row is unused)
+        self.itemIndex = None
+        self.listView = listView
+        super().__init__(0, 0, listView.width, listView.rowHeight, identifier, "", centered=False, font=font,
+                         fontColor=fontColor, backgroundColor=backgroundColor)
+
+    # rows are positioned by their list view instead of the anchor based resizing. ListView.resize lays them out,
+    # when the size of the list view was set by a container (which only resizes its child windows) the rows are laid
+    # out for the new size here
+    def resize(self, x, y, width, height):
+        if self.listView.rowsLayoutSize != (self.listView.width, self.listView.height):
+            self.listView.layoutRows()
+
+    def handleMouseClicked(self, x, y):
+        self.listView.selectItem(self.itemIndex)
+
+
+class ListView(Widget):
+    def __init__(self, originX, originY, width, height, identifier, items=None, rowHeight=20, font=None,
+                 fontColor=None, rowBackgroundColor=COLOR_WHITE, selectedBackgroundColor=COLOR_LIGHT_BLUE, action=None,
+                 layoutAnchors=LayoutAnchor.top | LayoutAnchor.left, backgroundColor=COLOR_CLEAR):
+        """
+        Scrollable list that only creates widgets for the visible rows. When scrolling, the rows are recycled and show
+        other items, so layout and drawing cost depends on the number of visible rows instead of the number of items.
+        :param items: items of the list, displayed with str()
+        :param rowHeight: height of a single row
+        :param action: function called with (index, item) when an item is clicked
+        """
+        # list of all items (data only, no widgets)
+        self.items = items if items is not None else []
+        self.rowHeight = rowHeight
+        # all rows share the same font
+        if font is None:
+            font = internFont(family="Helvetica", size=12)
+        self.font = font
+        self.fontColor = fontColor
+        self.rowBackgroundColor = rowBackgroundColor
+        self.selectedBackgroundColor = selectedBackgroundColor
+        self.action = action
+        # index of the item shown in the first row
+        self.firstVisibleIndex = 0
+        self.selectedIndex = None
+        # first visible index when dragging started
+        self.dragStartIndex = 0
+        # pool of row widgets, as many as rows fit into the list view
+        self.rows = []
+        # size of the list view the rows were laid out for
+        self.rowsLayoutSize = None
+        super().__init__(originX, originY, width, height, identifier, layoutAnchors, backgroundColor)
+        self.layoutRows()
+
+    def setItems(self, items):
+        self.items = items
+        self.selectedIndex = None
+        self.scrollTo(self.firstVisibleIndex)
+
+    # number of rows that fit into the list view
+    def visibleRowCount(self):
+        return max(1, int(self.height // self.rowHeight))
+
+    def resize(self, x, y, width, height):
+        super().resize(x, y, width, height)
+        self.layoutRows()
+
+    # creates or removes row widgets until the pool matches the visible row count and positions them
+    def layoutRows(self):
+        rowCount = self.visibleRowCount()
+        while len(self.rows) < rowCount:
+            row = ListRow(self, self.identifier + " - Row" + str(len(self.rows)), self.font, self.fontColor,
+                          self.rowBackgroundColor)
+            self.rows.append(row)
+            self.addChildWindow(row)
+        while len(self.rows) > rowCount:
+            self.rows.pop().removeFromParentWindow()
+        for i, row in enumerate(self.rows):
+            row.x = 0
+            row.y = i * self.rowHeight
+            row.width = self.width
+            row.height = self.rowHeight
+        self.rowsLayoutSize = (self.width, self.height)
+        Window.layoutGeneration += 1
+        # the list might show more rows now, so the first index could be too high
+        self.scrollTo(self.firstVisibleIndex)
+
+    # binds the visible items to the row widgets
+    def bindRows(self):
+        for i, row in enumerate(self.rows):
+            itemIndex = self.firstVisibleIndex + i
+            if itemIndex < len(self.items):
+                row.itemIndex = itemIndex
+                row.text = str(self.items[itemIndex])
+                row.isHidden = False
+                if itemIndex == self.selectedIndex:
+                    row.setBackgroundColor(self.selectedBackgroundColor)
+                else:
+                    row.setBackgroundColor(self.rowBackgroundColor)
+            else:
+                # more rows than items
+                row.itemIndex = None
+                row.isHidden = True
+
+    def scrollTo(self, index):
+        """
+        Scroll so the item with the given index is shown in the first row (clamped to the valid range).
+        :param index: index of the item
+        """
+        maxIndex = max(0, len(self.items) - len(self.rows))
+        self.firstVisibleIndex = max(0, min(maxIndex, index))
+        self.bindRows()
+
+    def scrollBy(self, rows):
+        self.scrollTo(self.firstVisibleIndex + rows)
+
+    # mouse wheel scrolling, delta is positive when scrolling up (one step per wheel notch)
+    def handleMouseWheel(self, delta):
+        self.scrollBy(-delta * 3)
+
+    # dragging scrolls the content with the mouse
+    def beginDrag(self):
+        self.dragStartIndex = self.firstVisibleIndex
+
+    def handleDrag(self, deltaY):
+        self.scrollTo(self.dragStartIndex - int(deltaY / self.rowHeight))
+
+    def selectItem(self, index):
+        if index is None:
+            return
+        self.selectedIndex = index
+        self.bindRows()
+        if self.action is not None:
+            runAction(self, partial(self.action, index, self.items[index]))
+
+
+# returns the list view the given window belongs to (the list view itself or one of its rows), otherwise None
+def listViewOf(window):
+    if isinstance(window, ListView):
+        return window
+    if isinstance(window, ListRow):
+        return window.listView
+    return None
+
+
+"""
+INPUT DISPATCH
+"""
+# input handling of the widgets, shared by the window system and the app processes of isolated apps (see RemoteApp),
+# so widgets behave the same in both. Windows of apps in other processes get the events on their content.
+
+
+def pressWidget(window, x, y):
+    """
+    Press a widget: buttons and sliders change their state (the slider element jumps to the mouse), lists remember
+    their scroll position for dragging.
+    :param window: deepest window at the mouse position
+    :param x: x value of the mouse position on the screen
+    :param y: y value of the mouse position on the screen
+    :return: True if the widget changed and has to be redrawn
+    """
+    if isinstance(window, Button):
+        return window.changeState("PRESSED")
+    if isinstance(window, Slider):
+        pressed = window.changeState("PRESSED")
+        moved = window.changeSlider(window.convertPositionFromScreen(x, y)[0])
+        return pressed or moved
+    if window.isRemote:
+        window.handleMousePressed(x, y)
+    elif listViewOf(window) is not None:
+        listViewOf(window).beginDrag()
+    return False
+
+
+def dragWidget(window, x, y, deltaY):
+    """
+    Drag the pressed widget: sliders follow the mouse, lists scroll with it.
+    :param window: window the mouse was pressed on
+    :param x: x value of the mouse position on the screen
+    :param y: y value of the mouse position on the screen
+    :param deltaY: vertical distance to the position the mouse was pressed at
+    :return: True if the widget changed and has to be redrawn
+    """
+    if isinstance(window, Slider):
+        return window.changeSlider(window.convertPositionFromScreen(x, y)[0])
+    if window.isRemote:
+        window.handleMouseDragged(x, y)
+        return False
+    listView = listViewOf(window)
+    if listView is not None:
+        previousIndex = listView.firstVisibleIndex
+        listView.handleDrag(deltaY)
+        return listView.firstVisibleIndex != previousIndex
+    return False
+
+
+def releaseWidget(window, x, y):
+    """
+    Release the pressed widget (buttons are released by their click, see Button.handleMouseClicked).
+    :param window: window the mouse was pressed on
+    :param x: x value of the mouse position on the screen
+    :param y: y value of the mouse position on the screen
+    :return: True if the widget changed and has to be redrawn
+    """
+    if isinstance(window, Slider):
+        return window.changeState("NORMAL")
+    if window.isRemote:
+        window.handleMouseReleased(x, y)
+    return False
+
+
+def hoverWidget(previousWindow, window, x, y):
+    """
+    Update the hover state after the mouse moved from one window to another (or within the same window).
+    :param previousWindow: window under the mouse before (None if unknown)
+    :param window: window under the mouse now
+    :param x: x value of the mouse position on the screen
+    :param y: y value of the mouse position on the screen
+    :return: list of the widgets that changed and have to be redrawn
+    """
+    changedWidgets = []
+    if previousWindow is not window and previousWindow is not None:
+        if isinstance(previousWindow, Button):
+            # this makes sure that fast mouse movements don't create several hovered buttons
+            if previousWindow.changeState("NORMAL"):
+                changedWidgets.append(previousWindow)
+        elif previousWindow.isRemote:
+            # mouse left the content of an app running in another process -> reset its hovered buttons
+            previousWindow.handleMouseMoved(-1, -1)
+    if isinstance(window, Button):
+        # nothing changes if the button already is hovered
+        if window.changeState("HOVERED"):
+            changedWidgets.append(window)
+    elif window is not None and window.isRemote:
+        window.handleMouseMoved(x, y)
+    return changedWidgets
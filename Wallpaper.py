@@ -1,1158 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import os
+from functools import lru_cache
+
+from Drawing import fillRects
+
+# the wallpaper is a grid of square cells, Wallpaper.txt contains one line of hex colors per row
+WALLPAPER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Wallpaper.txt")
+WALLPAPER_CELL_SIZE = 48
+
+
+@lru_cache(maxsize=1)
+def loadWallpaper():
+    """
+    Read the wallpaper data (only once, when the desktop is drawn for the first time).
+    :return: list of cell rects (x1, y1, x2, y2) and list of their colors, row by row
+    """
+    rects = []
+    colors = []
+    with open(WALLPAPER_PATH) as file:
+        for row, line in enumerate(file):
+            for column, color in enumerate(line.split()):
+                x, y = column * WALLPAPER_CELL_SIZE, row * WALLPAPER_CELL_SIZE
+                rects.append((x, y, x + WALLPAPER_CELL_SIZE, y + WALLPAPER_CELL_SIZE))
+                colors.append("#" + color)
+    return rects, colors
+
+
 def draw_wallpaper(ctx):
-    ctx.setOrigin(0,0)
-    ctx.setFillColor("#c0d3da")
-    ctx.fillRect(0, 0, 48, 48)
-    ctx.setFillColor("#b2c8d0")
-    ctx.fillRect(48, 0, 96, 48)
-    ctx.setFillColor("#a8bfca")
-    ctx.fillRect(96, 0, 144, 48)
-    ctx.setFillColor("#9eb7c6")
-    ctx.fillRect(144, 0, 192, 48)
-    ctx.setFillColor("#9bb7c4")
-    ctx.fillRect(192, 0, 240, 48)
-    ctx.setFillColor("#a5bcc8")
-    ctx.fillRect(240, 0, 288, 48)
-    ctx.setFillColor("#aabfca")
-    ctx.fillRect(288, 0, 336, 48)
-    ctx.setFillColor("#afc4cf")
-    ctx.fillRect(336, 0, 384, 48)
-    ctx.setFillColor("#b7cad4")
-    ctx.fillRect(384, 0, 432, 48)
-    ctx.setFillColor("#c4d8e0")
-    ctx.fillRect(432, 0, 480, 48)
-    ctx.setFillColor("#b4c9d2")
-    ctx.fillRect(480, 0, 528, 48)
-    ctx.setFillColor("#9db6c4")
-    ctx.fillRect(528, 0, 576, 48)
-    ctx.setFillColor("#95afbf")
-    ctx.fillRect(576, 0, 624, 48)
-    ctx.setFillColor("#9cb5c0")
-    ctx.fillRect(624, 0, 672, 48)
-    ctx.setFillColor("#9ab4c1")
-    ctx.fillRect(672, 0, 720, 48)
-    ctx.setFillColor("#92afc0")
-    ctx.fillRect(720, 0, 768, 48)
-    ctx.setFillColor("#7ea3b9")
-    ctx.fillRect(768, 0, 816, 48)
-    ctx.setFillColor("#5b85a4")
-    ctx.fillRect(816, 0, 864, 48)
-    ctx.setFillColor("#407fac")
-    ctx.fillRect(864, 0, 912, 48)
-    ctx.setFillColor("#3e7ca7")
-    ctx.fillRect(912, 0, 960, 48)
-    ctx.setFillColor("#4f8db4")
-    ctx.fillRect(960, 0, 1008, 48)
-    ctx.setFillColor("#4382ac")
-    ctx.fillRect(1008, 0, 1056, 48)
-    ctx.setFillColor("#3c7ca7")
-    ctx.fillRect(1056, 0, 1104, 48)
-    ctx.setFillColor("#3b7ca7")
-    ctx.fillRect(1104, 0, 1152, 48)
-    ctx.setFillColor("#3c7aa6")
-    ctx.fillRect(1152, 0, 1200, 48)
-    ctx.setFillColor("#387aa6")
-    ctx.fillRect(1200, 0, 1248, 48)
-    ctx.setFillColor("#397ba5")
-    ctx.fillRect(1248, 0, 1296, 48)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1296, 0, 1344, 48)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1344, 0, 1392, 48)
-    ctx.setFillColor("#3578a3")
-    ctx.fillRect(1392, 0, 1440, 48)
-    ctx.setFillColor("#3578a3")
-    ctx.fillRect(1440, 0, 1488, 48)
-    ctx.setFillColor("#3578a3")
-    ctx.fillRect(1488, 0, 1536, 48)
-    ctx.setFillColor("#3477a2")
-    ctx.fillRect(1536, 0, 1584, 48)
-    ctx.setFillColor("#3276a2")
-    ctx.fillRect(1584, 0, 1632, 48)
-    ctx.setFillColor("#c0d2d9")
-    ctx.fillRect(0, 48, 48, 96)
-    ctx.setFillColor("#b0c5d1")
-    ctx.fillRect(48, 48, 96, 96)
-    ctx.setFillColor("#a5bbc8")
-    ctx.fillRect(96, 48, 144, 96)
-    ctx.setFillColor("#9cb5c0")
-    ctx.fillRect(144, 48, 192, 96)
-    ctx.setFillColor("#97b3c3")
-    ctx.fillRect(192, 48, 240, 96)
-    ctx.setFillColor("#95b4c0")
-    ctx.fillRect(240, 48, 288, 96)
-    ctx.setFillColor("#99b2c3")
-    ctx.fillRect(288, 48, 336, 96)
-    ctx.setFillColor("#a1b7c5")
-    ctx.fillRect(336, 48, 384, 96)
-    ctx.setFillColor("#b3c7d2")
-    ctx.fillRect(384, 48, 432, 96)
-    ctx.setFillColor("#b3c5d3")
-    ctx.fillRect(432, 48, 480, 96)
-    ctx.setFillColor("#a7c1ca")
-    ctx.fillRect(480, 48, 528, 96)
-    ctx.setFillColor("#a2b3c3")
-    ctx.fillRect(528, 48, 576, 96)
-    ctx.setFillColor("#9fb4c3")
-    ctx.fillRect(576, 48, 624, 96)
-    ctx.setFillColor("#9fb6c6")
-    ctx.fillRect(624, 48, 672, 96)
-    ctx.setFillColor("#a1b9c9")
-    ctx.fillRect(672, 48, 720, 96)
-    ctx.setFillColor("#9fb7c8")
-    ctx.fillRect(720, 48, 768, 96)
-    ctx.setFillColor("#91afc2")
-    ctx.fillRect(768, 48, 816, 96)
-    ctx.setFillColor("#4080ae")
-    ctx.fillRect(816, 48, 864, 96)
-    ctx.setFillColor("#427fac")
-    ctx.fillRect(864, 48, 912, 96)
-    ctx.setFillColor("#4b88b1")
-    ctx.fillRect(912, 48, 960, 96)
-    ctx.setFillColor("#7c9eb7")
-    ctx.fillRect(960, 48, 1008, 96)
-    ctx.setFillColor("#6195b5")
-    ctx.fillRect(1008, 48, 1056, 96)
-    ctx.setFillColor("#6594b8")
-    ctx.fillRect(1056, 48, 1104, 96)
-    ctx.setFillColor("#4784ad")
-    ctx.fillRect(1104, 48, 1152, 96)
-    ctx.setFillColor("#397ba7")
-    ctx.fillRect(1152, 48, 1200, 96)
-    ctx.setFillColor("#397ba7")
-    ctx.fillRect(1200, 48, 1248, 96)
-    ctx.setFillColor("#397ba7")
-    ctx.fillRect(1248, 48, 1296, 96)
-    ctx.setFillColor("#387aa6")
-    ctx.fillRect(1296, 48, 1344, 96)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1344, 48, 1392, 96)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1392, 48, 1440, 96)
-    ctx.setFillColor("#3578a3")
-    ctx.fillRect(1440, 48, 1488, 96)
-    ctx.setFillColor("#3578a3")
-    ctx.fillRect(1488, 48, 1536, 96)
-    ctx.setFillColor("#3578a3")
-    ctx.fillRect(1536, 48, 1584, 96)
-    ctx.setFillColor("#3477a4")
-    ctx.fillRect(1584, 48, 1632, 96)
-    ctx.setFillColor("#c1d3da")
-    ctx.fillRect(0, 96, 48, 144)
-    ctx.setFillColor("#b8cad4")
-    ctx.fillRect(48, 96, 96, 144)
-    ctx.setFillColor("#aac1ca")
-    ctx.fillRect(96, 96, 144, 144)
-    ctx.setFillColor("#a2b9c4")
-    ctx.fillRect(144, 96, 192, 144)
-    ctx.setFillColor("#a2b8c6")
-    ctx.fillRect(192, 96, 240, 144)
-    ctx.setFillColor("#9cb8c5")
-    ctx.fillRect(240, 96, 288, 144)
-    ctx.setFillColor("#99b5c4")
-    ctx.fillRect(288, 96, 336, 144)
-    ctx.setFillColor("#96b3c3")
-    ctx.fillRect(336, 96, 384, 144)
-    ctx.setFillColor("#91aebf")
-    ctx.fillRect(384, 96, 432, 144)
-    ctx.setFillColor("#93b0c2")
-    ctx.fillRect(432, 96, 480, 144)
-    ctx.setFillColor("#bdb5b4")
-    ctx.fillRect(480, 96, 528, 144)
-    ctx.setFillColor("#99acb5")
-    ctx.fillRect(528, 96, 576, 144)
-    ctx.setFillColor("#b7c4cf")
-    ctx.fillRect(576, 96, 624, 144)
-    ctx.setFillColor("#b8ccd6")
-    ctx.fillRect(624, 96, 672, 144)
-    ctx.setFillColor("#bbccd7")
-    ctx.fillRect(672, 96, 720, 144)
-    ctx.setFillColor("#afc5d1")
-    ctx.fillRect(720, 96, 768, 144)
-    ctx.setFillColor("#adc1cf")
-    ctx.fillRect(768, 96, 816, 144)
-    ctx.setFillColor("#aec6d0")
-    ctx.fillRect(816, 96, 864, 144)
-    ctx.setFillColor("#a9c2d1")
-    ctx.fillRect(864, 96, 912, 144)
-    ctx.setFillColor("#91abbe")
-    ctx.fillRect(912, 96, 960, 144)
-    ctx.setFillColor("#a2bdcb")
-    ctx.fillRect(960, 96, 1008, 144)
-    ctx.setFillColor("#7da3bd")
-    ctx.fillRect(1008, 96, 1056, 144)
-    ctx.setFillColor("#749ab6")
-    ctx.fillRect(1056, 96, 1104, 144)
-    ctx.setFillColor("#447fa8")
-    ctx.fillRect(1104, 96, 1152, 144)
-    ctx.setFillColor("#3d7ba8")
-    ctx.fillRect(1152, 96, 1200, 144)
-    ctx.setFillColor("#3a7ca8")
-    ctx.fillRect(1200, 96, 1248, 144)
-    ctx.setFillColor("#3a7ca8")
-    ctx.fillRect(1248, 96, 1296, 144)
-    ctx.setFillColor("#397da8")
-    ctx.fillRect(1296, 96, 1344, 144)
-    ctx.setFillColor("#397ba7")
-    ctx.fillRect(1344, 96, 1392, 144)
-    ctx.setFillColor("#387aa6")
-    ctx.fillRect(1392, 96, 1440, 144)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1440, 96, 1488, 144)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1488, 96, 1536, 144)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1536, 96, 1584, 144)
-    ctx.setFillColor("#3679a5")
-    ctx.fillRect(1584, 96, 1632, 144)
-    ctx.setFillColor("#cddce2")
-    ctx.fillRect(0, 144, 48, 192)
-    ctx.setFillColor("#bfd2d7")
-    ctx.fillRect(48, 144, 96, 192)
-    ctx.setFillColor("#b4c7d0")
-    ctx.fillRect(96, 144, 144, 192)
-    ctx.setFillColor("#b2c5d0")
-    ctx.fillRect(144, 144, 192, 192)
-    ctx.setFillColor("#abc1cb")
-    ctx.fillRect(192, 144, 240, 192)
-    ctx.setFillColor("#a4bbc8")
-    ctx.fillRect(240, 144, 288, 192)
-    ctx.setFillColor("#9bb5c4")
-    ctx.fillRect(288, 144, 336, 192)
-    ctx.setFillColor("#95b1c1")
-    ctx.fillRect(336, 144, 384, 192)
-    ctx.setFillColor("#8fadbd")
-    ctx.fillRect(384, 144, 432, 192)
-    ctx.setFillColor("#99b5c3")
-    ctx.fillRect(432, 144, 480, 192)
-    ctx.setFillColor("#a9bfca")
-    ctx.fillRect(480, 144, 528, 192)
-    ctx.setFillColor("#c36432")
-    ctx.fillRect(528, 144, 576, 192)
-    ctx.setFillColor("#bfd5d9")
-    ctx.fillRect(576, 144, 624, 192)
-    ctx.setFillColor("#2e3132")
-    ctx.fillRect(624, 144, 672, 192)
-    ctx.setFillColor("#010105")
-    ctx.fillRect(672, 144, 720, 192)
-    ctx.setFillColor("#bfc9d6")
-    ctx.fillRect(720, 144, 768, 192)
-    ctx.setFillColor("#b8c8d5")
-    ctx.fillRect(768, 144, 816, 192)
-    ctx.setFillColor("#b1c3d1")
-    ctx.fillRect(816, 144, 864, 192)
-    ctx.setFillColor("#a0b7c4")
-    ctx.fillRect(864, 144, 912, 192)
-    ctx.setFillColor("#99b4c1")
-    ctx.fillRect(912, 144, 960, 192)
-    ctx.setFillColor("#8fadbc")
-    ctx.fillRect(960, 144, 1008, 192)
-    ctx.setFillColor("#7aa0b4")
-    ctx.fillRect(1008, 144, 1056, 192)
-    ctx.setFillColor("#4981a8")
-    ctx.fillRect(1056, 144, 1104, 192)
-    ctx.setFillColor("#4580a3")
-    ctx.fillRect(1104, 144, 1152, 192)
-    ctx.setFillColor("#3a7fad")
-    ctx.fillRect(1152, 144, 1200, 192)
-    ctx.setFillColor("#3d7ea8")
-    ctx.fillRect(1200, 144, 1248, 192)
-    ctx.setFillColor("#3b7ea9")
-    ctx.fillRect(1248, 144, 1296, 192)
-    ctx.setFillColor("#3b7ca8")
-    ctx.fillRect(1296, 144, 1344, 192)
-    ctx.setFillColor("#3b7ca6")
-    ctx.fillRect(1344, 144, 1392, 192)
-    ctx.setFillColor("#467eac")
-    ctx.fillRect(1392, 144, 1440, 192)
-    ctx.setFillColor("#397ca7")
-    ctx.fillRect(1440, 144, 1488, 192)
-    ctx.setFillColor("#397ca7")
-    ctx.fillRect(1488, 144, 1536, 192)
-    ctx.setFillColor("#397ba7")
-    ctx.fillRect(1536, 144, 1584, 192)
-    ctx.setFillColor("#397ba7")
-    ctx.fillRect(1584, 144, 1632, 192)
-    ctx.setFillColor("#d6e3e6")
-    ctx.fillRect(0, 192, 48, 240)
-    ctx.setFillColor("#cedfe5")
-    ctx.fillRect(48, 192, 96, 240)
-    ctx.setFillColor("#c8dbde")
-    ctx.fillRect(96, 192, 144, 240)
-    ctx.setFillColor("#c1d4db")
-    ctx.fillRect(144, 192, 192, 240)
-    ctx.setFillColor("#bacdd7")
-    ctx.fillRect(192, 192, 240, 240)
-    ctx.setFillColor("#abc0cb")
-    ctx.fillRect(240, 192, 288, 240)
-    ctx.setFillColor("#a2baca")
-    ctx.fillRect(288, 192, 336, 240)
-    ctx.setFillColor("#9bb6c6")
-    ctx.fillRect(336, 192, 384, 240)
-    ctx.setFillColor("#95b0be")
-    ctx.fillRect(384, 192, 432, 240)
-    ctx.setFillColor("#bbccd8")
-    ctx.fillRect(432, 192, 480, 240)
-    ctx.setFillColor("#bdcdd6")
-    ctx.fillRect(480, 192, 528, 240)
-    ctx.setFillColor("#c4d6da")
-    ctx.fillRect(528, 192, 576, 240)
-    ctx.setFillColor("#d6a893")
-    ctx.fillRect(576, 192, 624, 240)
-    ctx.setFillColor("#c6987f")
-    ctx.fillRect(624, 192, 672, 240)
-    ctx.setFillColor("#27323b")
-    ctx.fillRect(672, 192, 720, 240)
-    ctx.setFillColor("#1d2123")
-    ctx.fillRect(720, 192, 768, 240)
-    ctx.setFillColor("#010206")
-    ctx.fillRect(768, 192, 816, 240)
-    ctx.setFillColor("#7e8a8a")
-    ctx.fillRect(816, 192, 864, 240)
-    ctx.setFillColor("#000000")
-    ctx.fillRect(864, 192, 912, 240)
-    ctx.setFillColor("#000000")
-    ctx.fillRect(912, 192, 960, 240)
-    ctx.setFillColor("#010002")
-    ctx.fillRect(960, 192, 1008, 240)
-    ctx.setFillColor("#0f161b")
-    ctx.fillRect(1008, 192, 1056, 240)
-    ctx.setFillColor("#7da0b3")
-    ctx.fillRect(1056, 192, 1104, 240)
-    ctx.setFillColor("#7f9eb2")
-    ctx.fillRect(1104, 192, 1152, 240)
-    ctx.setFillColor("#94b1c6")
-    ctx.fillRect(1152, 192, 1200, 240)
-    ctx.setFillColor("#a5c1d0")
-    ctx.fillRect(1200, 192, 1248, 240)
-    ctx.setFillColor("#8dacc1")
-    ctx.fillRect(1248, 192, 1296, 240)
-    ctx.setFillColor("#759fb6")
-    ctx.fillRect(1296, 192, 1344, 240)
-    ctx.setFillColor("#a9bfc6")
-    ctx.fillRect(1344, 192, 1392, 240)
-    ctx.setFillColor("#7da6ba")
-    ctx.fillRect(1392, 192, 1440, 240)
-    ctx.setFillColor("#407ea9")
-    ctx.fillRect(1440, 192, 1488, 240)
-    ctx.setFillColor("#3b7ea9")
-    ctx.fillRect(1488, 192, 1536, 240)
-    ctx.setFillColor("#397da8")
-    ctx.fillRect(1536, 192, 1584, 240)
-    ctx.setFillColor("#397da8")
-    ctx.fillRect(1584, 192, 1632, 240)
-    ctx.setFillColor("#cedce3")
-    ctx.fillRect(0, 240, 48, 288)
-    ctx.setFillColor("#cfdfe5")
-    ctx.fillRect(48, 240, 96, 288)
-    ctx.setFillColor("#cedee4")
-    ctx.fillRect(96, 240, 144, 288)
-    ctx.setFillColor("#c5d6de")
-    ctx.fillRect(144, 240, 192, 288)
-    ctx.setFillColor("#bfd2db")
-    ctx.fillRect(192, 240, 240, 288)
-    ctx.setFillColor("#b7cdd5")
-    ctx.fillRect(240, 240, 288, 288)
-    ctx.setFillColor("#85a6bd")
-    ctx.fillRect(288, 240, 336, 288)
-    ctx.setFillColor("#9bb6ca")
-    ctx.fillRect(336, 240, 384, 288)
-    ctx.setFillColor("#c0d2da")
-    ctx.fillRect(384, 240, 432, 288)
-    ctx.setFillColor("#90989d")
-    ctx.fillRect(432, 240, 480, 288)
-    ctx.setFillColor("#d0dfe3")
-    ctx.fillRect(480, 240, 528, 288)
-    ctx.setFillColor("#c4a095")
-    ctx.fillRect(528, 240, 576, 288)
-    ctx.setFillColor("#c5cfd7")
-    ctx.fillRect(576, 240, 624, 288)
-    ctx.setFillColor("#a9b8bc")
-    ctx.fillRect(624, 240, 672, 288)
-    ctx.setFillColor("#dc7635")
-    ctx.fillRect(672, 240, 720, 288)
-    ctx.setFillColor("#9eaaab")
-    ctx.fillRect(720, 240, 768, 288)
-    ctx.setFillColor("#000102")
-    ctx.fillRect(768, 240, 816, 288)
-    ctx.setFillColor("#df6f33")
-    ctx.fillRect(816, 240, 864, 288)
-    ctx.setFillColor("#d66527")
-    ctx.fillRect(864, 240, 912, 288)
-    ctx.setFillColor("#180301")
-    ctx.fillRect(912, 240, 960, 288)
-    ctx.setFillColor("#568954")
-    ctx.fillRect(960, 240, 1008, 288)
-    ctx.setFillColor("#020104")
-    ctx.fillRect(1008, 240, 1056, 288)
-    ctx.setFillColor("#010103")
-    ctx.fillRect(1056, 240, 1104, 288)
-    ctx.setFillColor("#a4b9c4")
-    ctx.fillRect(1104, 240, 1152, 288)
-    ctx.setFillColor("#a4bbca")
-    ctx.fillRect(1152, 240, 1200, 288)
-    ctx.setFillColor("#a2b8c6")
-    ctx.fillRect(1200, 240, 1248, 288)
-    ctx.setFillColor("#a8bfcb")
-    ctx.fillRect(1248, 240, 1296, 288)
-    ctx.setFillColor("#98b4c2")
-    ctx.fillRect(1296, 240, 1344, 288)
-    ctx.setFillColor("#8fb0be")
-    ctx.fillRect(1344, 240, 1392, 288)
-    ctx.setFillColor("#94adc1")
-    ctx.fillRect(1392, 240, 1440, 288)
-    ctx.setFillColor("#4380ad")
-    ctx.fillRect(1440, 240, 1488, 288)
-    ctx.setFillColor("#3c7fab")
-    ctx.fillRect(1488, 240, 1536, 288)
-    ctx.setFillColor("#3b7ea9")
-    ctx.fillRect(1536, 240, 1584, 288)
-    ctx.setFillColor("#3b7ea9")
-    ctx.fillRect(1584, 240, 1632, 288)
-    ctx.setFillColor("#b3cfdd")
-    ctx.fillRect(0, 288, 48, 336)
-    ctx.setFillColor("#bed4e2")
-    ctx.fillRect(48, 288, 96, 336)
-    ctx.setFillColor("#b5cbd7")
-    ctx.fillRect(96, 288, 144, 336)
-    ctx.setFillColor("#b3c9d4")
-    ctx.fillRect(144, 288, 192, 336)
-    ctx.setFillColor("#c0d2dc")
-    ctx.fillRect(192, 288, 240, 336)
-    ctx.setFillColor("#bfd2db")
-    ctx.fillRect(240, 288, 288, 336)
-    ctx.setFillColor("#cfdde7")
-    ctx.fillRect(288, 288, 336, 336)
-    ctx.setFillColor("#d4e1e8")
-    ctx.fillRect(336, 288, 384, 336)
-    ctx.setFillColor("#cadce1")
-    ctx.fillRect(384, 288, 432, 336)
-    ctx.setFillColor("#cad8df")
-    ctx.fillRect(432, 288, 480, 336)
-    ctx.setFillColor("#c8d3d8")
-    ctx.fillRect(480, 288, 528, 336)
-    ctx.setFillColor("#dee3e8")
-    ctx.fillRect(528, 288, 576, 336)
-    ctx.setFillColor("#aaa49c")
-    ctx.fillRect(576, 288, 624, 336)
-    ctx.setFillColor("#afb6b9")
-    ctx.fillRect(624, 288, 672, 336)
-    ctx.setFillColor("#cd6327")
-    ctx.fillRect(672, 288, 720, 336)
-    ctx.setFillColor("#020303")
-    ctx.fillRect(720, 288, 768, 336)
-    ctx.setFillColor("#1b1f1d")
-    ctx.fillRect(768, 288, 816, 336)
-    ctx.setFillColor("#e88646")
-    ctx.fillRect(816, 288, 864, 336)
-    ctx.setFillColor("#e47d38")
-    ctx.fillRect(864, 288, 912, 336)
-    ctx.setFillColor("#020100")
-    ctx.fillRect(912, 288, 960, 336)
-    ctx.setFillColor("#5ca843")
-    ctx.fillRect(960, 288, 1008, 336)
-    ctx.setFillColor("#51a140")
-    ctx.fillRect(1008, 288, 1056, 336)
-    ctx.setFillColor("#040508")
-    ctx.fillRect(1056, 288, 1104, 336)
-    ctx.setFillColor("#000103")
-    ctx.fillRect(1104, 288, 1152, 336)
-    ctx.setFillColor("#a2b9c4")
-    ctx.fillRect(1152, 288, 1200, 336)
-    ctx.setFillColor("#aec6d2")
-    ctx.fillRect(1200, 288, 1248, 336)
-    ctx.setFillColor("#a9bfcd")
-    ctx.fillRect(1248, 288, 1296, 336)
-    ctx.setFillColor("#98b5c4")
-    ctx.fillRect(1296, 288, 1344, 336)
-    ctx.setFillColor("#91aec1")
-    ctx.fillRect(1344, 288, 1392, 336)
-    ctx.setFillColor("#7098b7")
-    ctx.fillRect(1392, 288, 1440, 336)
-    ctx.setFillColor("#417ead")
-    ctx.fillRect(1440, 288, 1488, 336)
-    ctx.setFillColor("#3d80ac")
-    ctx.fillRect(1488, 288, 1536, 336)
-    ctx.setFillColor("#3c7fab")
-    ctx.fillRect(1536, 288, 1584, 336)
-    ctx.setFillColor("#3c7fab")
-    ctx.fillRect(1584, 288, 1632, 336)
-    ctx.setFillColor("#5d96bb")
-    ctx.fillRect(0, 336, 48, 384)
-    ctx.setFillColor("#6499bb")
-    ctx.fillRect(48, 336, 96, 384)
-    ctx.setFillColor("#81aecb")
-    ctx.fillRect(96, 336, 144, 384)
-    ctx.setFillColor("#b6cddb")
-    ctx.fillRect(144, 336, 192, 384)
-    ctx.setFillColor("#c4d5df")
-    ctx.fillRect(192, 336, 240, 384)
-    ctx.setFillColor("#cddde6")
-    ctx.fillRect(240, 336, 288, 384)
-    ctx.setFillColor("#c6d7df")
-    ctx.fillRect(288, 336, 336, 384)
-    ctx.setFillColor("#cfdde6")
-    ctx.fillRect(336, 336, 384, 384)
-    ctx.setFillColor("#c9dce3")
-    ctx.fillRect(384, 336, 432, 384)
-    ctx.setFillColor("#a3acc1")
-    ctx.fillRect(432, 336, 480, 384)
-    ctx.setFillColor("#bfccd3")
-    ctx.fillRect(480, 336, 528, 384)
-    ctx.setFillColor("#a0acb1")
-    ctx.fillRect(528, 336, 576, 384)
-    ctx.setFillColor("#000105")
-    ctx.fillRect(576, 336, 624, 384)
-    ctx.setFillColor("#444c4e")
-    ctx.fillRect(624, 336, 672, 384)
-    ctx.setFillColor("#1a2125")
-    ctx.fillRect(672, 336, 720, 384)
-    ctx.setFillColor("#565b5c")
-    ctx.fillRect(720, 336, 768, 384)
-    ctx.setFillColor("#c05e27")
-    ctx.fillRect(768, 336, 816, 384)
-    ctx.setFillColor("#dd7439")
-    ctx.fillRect(816, 336, 864, 384)
-    ctx.setFillColor("#e49758")
-    ctx.fillRect(864, 336, 912, 384)
-    ctx.setFillColor("#000200")
-    ctx.fillRect(912, 336, 960, 384)
-    ctx.setFillColor("#9ac889")
-    ctx.fillRect(960, 336, 1008, 384)
-    ctx.setFillColor("#7dba69")
-    ctx.fillRect(1008, 336, 1056, 384)
-    ctx.setFillColor("#010100")
-    ctx.fillRect(1056, 336, 1104, 384)
-    ctx.setFillColor("#818f96")
-    ctx.fillRect(1104, 336, 1152, 384)
-    ctx.setFillColor("#9cb5c0")
-    ctx.fillRect(1152, 336, 1200, 384)
-    ctx.setFillColor("#96b2c0")
-    ctx.fillRect(1200, 336, 1248, 384)
-    ctx.setFillColor("#9ab8c5")
-    ctx.fillRect(1248, 336, 1296, 384)
-    ctx.setFillColor("#90b0bf")
-    ctx.fillRect(1296, 336, 1344, 384)
-    ctx.setFillColor("#83a8c0")
-    ctx.fillRect(1344, 336, 1392, 384)
-    ctx.setFillColor("#4082ad")
-    ctx.fillRect(1392, 336, 1440, 384)
-    ctx.setFillColor("#4082ae")
-    ctx.fillRect(1440, 336, 1488, 384)
-    ctx.setFillColor("#4082ad")
-    ctx.fillRect(1488, 336, 1536, 384)
-    ctx.setFillColor("#4082ad")
-    ctx.fillRect(1536, 336, 1584, 384)
-    ctx.setFillColor("#4082ad")
-    ctx.fillRect(1584, 336, 1632, 384)
-    ctx.setFillColor("#5b97bd")
-    ctx.fillRect(0, 384, 48, 432)
-    ctx.setFillColor("#99bbd7")
-    ctx.fillRect(48, 384, 96, 432)
-    ctx.setFillColor("#c8d8e2")
-    ctx.fillRect(96, 384, 144, 432)
-    ctx.setFillColor("#d1e2e7")
-    ctx.fillRect(144, 384, 192, 432)
-    ctx.setFillColor("#cedce3")
-    ctx.fillRect(192, 384, 240, 432)
-    ctx.setFillColor("#d9e6eb")
-    ctx.fillRect(240, 384, 288, 432)
-    ctx.setFillColor("#d3dfe8")
-    ctx.fillRect(288, 384, 336, 432)
-    ctx.setFillColor("#cad8e1")
-    ctx.fillRect(336, 384, 384, 432)
-    ctx.setFillColor("#d0dfe5")
-    ctx.fillRect(384, 384, 432, 432)
-    ctx.setFillColor("#628caa")
-    ctx.fillRect(432, 384, 480, 432)
-    ctx.setFillColor("#c1d0d7")
-    ctx.fillRect(480, 384, 528, 432)
-    ctx.setFillColor("#b0d0dd")
-    ctx.fillRect(528, 384, 576, 432)
-    ctx.setFillColor("#7b91ad")
-    ctx.fillRect(576, 384, 624, 432)
-    ctx.setFillColor("#9ea8ae")
-    ctx.fillRect(624, 384, 672, 432)
-    ctx.setFillColor("#04080b")
-    ctx.fillRect(672, 384, 720, 432)
-    ctx.setFillColor("#030102")
-    ctx.fillRect(720, 384, 768, 432)
-    ctx.setFillColor("#030509")
-    ctx.fillRect(768, 384, 816, 432)
-    ctx.setFillColor("#020203")
-    ctx.fillRect(816, 384, 864, 432)
-    ctx.setFillColor("#000200")
-    ctx.fillRect(864, 384, 912, 432)
-    ctx.setFillColor("#000206")
-    ctx.fillRect(912, 384, 960, 432)
-    ctx.setFillColor("#69b050")
-    ctx.fillRect(960, 384, 1008, 432)
-    ctx.setFillColor("#639d50")
-    ctx.fillRect(1008, 384, 1056, 432)
-    ctx.setFillColor("#010101")
-    ctx.fillRect(1056, 384, 1104, 432)
-    ctx.setFillColor("#8696a0")
-    ctx.fillRect(1104, 384, 1152, 432)
-    ctx.setFillColor("#a1b9c4")
-    ctx.fillRect(1152, 384, 1200, 432)
-    ctx.setFillColor("#9eb6c4")
-    ctx.fillRect(1200, 384, 1248, 432)
-    ctx.setFillColor("#93b0bd")
-    ctx.fillRect(1248, 384, 1296, 432)
-    ctx.setFillColor("#88a8b9")
-    ctx.fillRect(1296, 384, 1344, 432)
-    ctx.setFillColor("#789fb4")
-    ctx.fillRect(1344, 384, 1392, 432)
-    ctx.setFillColor("#4284ae")
-    ctx.fillRect(1392, 384, 1440, 432)
-    ctx.setFillColor("#6594b1")
-    ctx.fillRect(1440, 384, 1488, 432)
-    ctx.setFillColor("#6899b9")
-    ctx.fillRect(1488, 384, 1536, 432)
-    ctx.setFillColor("#4683aa")
-    ctx.fillRect(1536, 384, 1584, 432)
-    ctx.setFillColor("#528aae")
-    ctx.fillRect(1584, 384, 1632, 432)
-    ctx.setFillColor("#5795bc")
-    ctx.fillRect(0, 432, 48, 480)
-    ctx.setFillColor("#84adcc")
-    ctx.fillRect(48, 432, 96, 480)
-    ctx.setFillColor("#92b5cc")
-    ctx.fillRect(96, 432, 144, 480)
-    ctx.setFillColor("#bacdda")
-    ctx.fillRect(144, 432, 192, 480)
-    ctx.setFillColor("#cddde8")
-    ctx.fillRect(192, 432, 240, 480)
-    ctx.setFillColor("#d6e3e8")
-    ctx.fillRect(240, 432, 288, 480)
-    ctx.setFillColor("#dbe6eb")
-    ctx.fillRect(288, 432, 336, 480)
-    ctx.setFillColor("#d2dfe2")
-    ctx.fillRect(336, 432, 384, 480)
-    ctx.setFillColor("#c3d7dc")
-    ctx.fillRect(384, 432, 432, 480)
-    ctx.setFillColor("#b4c2cd")
-    ctx.fillRect(432, 432, 480, 480)
-    ctx.setFillColor("#4b79a1")
-    ctx.fillRect(480, 432, 528, 480)
-    ctx.setFillColor("#b5c6d1")
-    ctx.fillRect(528, 432, 576, 480)
-    ctx.setFillColor("#7c95a9")
-    ctx.fillRect(576, 432, 624, 480)
-    ctx.setFillColor("#3a6ea7")
-    ctx.fillRect(624, 432, 672, 480)
-    ctx.setFillColor("#010204")
-    ctx.fillRect(672, 432, 720, 480)
-    ctx.setFillColor("#678794")
-    ctx.fillRect(720, 432, 768, 480)
-    ctx.setFillColor("#5887bf")
-    ctx.fillRect(768, 432, 816, 480)
-    ctx.setFillColor("#417bb2")
-    ctx.fillRect(816, 432, 864, 480)
-    ctx.setFillColor("#010108")
-    ctx.fillRect(864, 432, 912, 480)
-    ctx.setFillColor("#f0c720")
-    ctx.fillRect(912, 432, 960, 480)
-    ctx.setFillColor("#030203")
-    ctx.fillRect(960, 432, 1008, 480)
-    ctx.setFillColor("#010301")
-    ctx.fillRect(1008, 432, 1056, 480)
-    ctx.setFillColor("#424d51")
-    ctx.fillRect(1056, 432, 1104, 480)
-    ctx.setFillColor("#99b1be")
-    ctx.fillRect(1104, 432, 1152, 480)
-    ctx.setFillColor("#9bb5c3")
-    ctx.fillRect(1152, 432, 1200, 480)
-    ctx.setFillColor("#a3bac7")
-    ctx.fillRect(1200, 432, 1248, 480)
-    ctx.setFillColor("#94afbd")
-    ctx.fillRect(1248, 432, 1296, 480)
-    ctx.setFillColor("#87a7b8")
-    ctx.fillRect(1296, 432, 1344, 480)
-    ctx.setFillColor("#81a2b5")
-    ctx.fillRect(1344, 432, 1392, 480)
-    ctx.setFillColor("#beceda")
-    ctx.fillRect(1392, 432, 1440, 480)
-    ctx.setFillColor("#c7dce0")
-    ctx.fillRect(1440, 432, 1488, 480)
-    ctx.setFillColor("#c3d3dd")
-    ctx.fillRect(1488, 432, 1536, 480)
-    ctx.setFillColor("#b7ccd6")
-    ctx.fillRect(1536, 432, 1584, 480)
-    ctx.setFillColor("#a9bfcb")
-    ctx.fillRect(1584, 432, 1632, 480)
-    ctx.setFillColor("#5999c1")
-    ctx.fillRect(0, 480, 48, 528)
-    ctx.setFillColor("#5c9ac0")
-    ctx.fillRect(48, 480, 96, 528)
-    ctx.setFillColor("#689ec4")
-    ctx.fillRect(96, 480, 144, 528)
-    ctx.setFillColor("#659cc4")
-    ctx.fillRect(144, 480, 192, 528)
-    ctx.setFillColor("#bacddd")
-    ctx.fillRect(192, 480, 240, 528)
-    ctx.setFillColor("#e6ecf2")
-    ctx.fillRect(240, 480, 288, 528)
-    ctx.setFillColor("#e9eef3")
-    ctx.fillRect(288, 480, 336, 528)
-    ctx.setFillColor("#dce7ed")
-    ctx.fillRect(336, 480, 384, 528)
-    ctx.setFillColor("#c8d9dd")
-    ctx.fillRect(384, 480, 432, 528)
-    ctx.setFillColor("#00070b")
-    ctx.fillRect(432, 480, 480, 528)
-    ctx.setFillColor("#a4b9c0")
-    ctx.fillRect(480, 480, 528, 528)
-    ctx.setFillColor("#9eb5bb")
-    ctx.fillRect(528, 480, 576, 528)
-    ctx.setFillColor("#4175bc")
-    ctx.fillRect(576, 480, 624, 528)
-    ctx.setFillColor("#787c7f")
-    ctx.fillRect(624, 480, 672, 528)
-    ctx.setFillColor("#000305")
-    ctx.fillRect(672, 480, 720, 528)
-    ctx.setFillColor("#5682ba")
-    ctx.fillRect(720, 480, 768, 528)
-    ctx.setFillColor("#789dd0")
-    ctx.fillRect(768, 480, 816, 528)
-    ctx.setFillColor("#010713")
-    ctx.fillRect(816, 480, 864, 528)
-    ctx.setFillColor("#e2c740")
-    ctx.fillRect(864, 480, 912, 528)
-    ctx.setFillColor("#f6ce22")
-    ctx.fillRect(912, 480, 960, 528)
-    ctx.setFillColor("#f5d332")
-    ctx.fillRect(960, 480, 1008, 528)
-    ctx.setFillColor("#000300")
-    ctx.fillRect(1008, 480, 1056, 528)
-    ctx.setFillColor("#708590")
-    ctx.fillRect(1056, 480, 1104, 528)
-    ctx.setFillColor("#94b1c0")
-    ctx.fillRect(1104, 480, 1152, 528)
-    ctx.setFillColor("#97b3c1")
-    ctx.fillRect(1152, 480, 1200, 528)
-    ctx.setFillColor("#97b1bf")
-    ctx.fillRect(1200, 480, 1248, 528)
-    ctx.setFillColor("#91afbc")
-    ctx.fillRect(1248, 480, 1296, 528)
-    ctx.setFillColor("#89aab8")
-    ctx.fillRect(1296, 480, 1344, 528)
-    ctx.setFillColor("#8badbc")
-    ctx.fillRect(1344, 480, 1392, 528)
-    ctx.setFillColor("#c9dae1")
-    ctx.fillRect(1392, 480, 1440, 528)
-    ctx.setFillColor("#c3d3db")
-    ctx.fillRect(1440, 480, 1488, 528)
-    ctx.setFillColor("#becfd7")
-    ctx.fillRect(1488, 480, 1536, 528)
-    ctx.setFillColor("#b3c7d0")
-    ctx.fillRect(1536, 480, 1584, 528)
-    ctx.setFillColor("#a4bbc8")
-    ctx.fillRect(1584, 480, 1632, 528)
-    ctx.setFillColor("#5b9cc2")
-    ctx.fillRect(0, 528, 48, 576)
-    ctx.setFillColor("#5d9bc2")
-    ctx.fillRect(48, 528, 96, 576)
-    ctx.setFillColor("#5c9ac0")
-    ctx.fillRect(96, 528, 144, 576)
-    ctx.setFillColor("#629bc0")
-    ctx.fillRect(144, 528, 192, 576)
-    ctx.setFillColor("#c6dde9")
-    ctx.fillRect(192, 528, 240, 576)
-    ctx.setFillColor("#e9ebf2")
-    ctx.fillRect(240, 528, 288, 576)
-    ctx.setFillColor("#e4ebef")
-    ctx.fillRect(288, 528, 336, 576)
-    ctx.setFillColor("#dae6e8")
-    ctx.fillRect(336, 528, 384, 576)
-    ctx.setFillColor("#c8d9de")
-    ctx.fillRect(384, 528, 432, 576)
-    ctx.setFillColor("#b8cdd2")
-    ctx.fillRect(432, 528, 480, 576)
-    ctx.setFillColor("#030608")
-    ctx.fillRect(480, 528, 528, 576)
-    ctx.setFillColor("#a1b2b2")
-    ctx.fillRect(528, 528, 576, 576)
-    ctx.setFillColor("#010104")
-    ctx.fillRect(576, 528, 624, 576)
-    ctx.setFillColor("#2c3233")
-    ctx.fillRect(624, 528, 672, 576)
-    ctx.setFillColor("#2a3033")
-    ctx.fillRect(672, 528, 720, 576)
-    ctx.setFillColor("#34648f")
-    ctx.fillRect(720, 528, 768, 576)
-    ctx.setFillColor("#487fb8")
-    ctx.fillRect(768, 528, 816, 576)
-    ctx.setFillColor("#010001")
-    ctx.fillRect(816, 528, 864, 576)
-    ctx.setFillColor("#fdd85c")
-    ctx.fillRect(864, 528, 912, 576)
-    ctx.setFillColor("#fed43c")
-    ctx.fillRect(912, 528, 960, 576)
-    ctx.setFillColor("#0c0300")
-    ctx.fillRect(960, 528, 1008, 576)
-    ctx.setFillColor("#000204")
-    ctx.fillRect(1008, 528, 1056, 576)
-    ctx.setFillColor("#7d94a1")
-    ctx.fillRect(1056, 528, 1104, 576)
-    ctx.setFillColor("#91afbc")
-    ctx.fillRect(1104, 528, 1152, 576)
-    ctx.setFillColor("#90aebb")
-    ctx.fillRect(1152, 528, 1200, 576)
-    ctx.setFillColor("#90abb8")
-    ctx.fillRect(1200, 528, 1248, 576)
-    ctx.setFillColor("#8cabb7")
-    ctx.fillRect(1248, 528, 1296, 576)
-    ctx.setFillColor("#87a6b5")
-    ctx.fillRect(1296, 528, 1344, 576)
-    ctx.setFillColor("#8eacba")
-    ctx.fillRect(1344, 528, 1392, 576)
-    ctx.setFillColor("#9db8c3")
-    ctx.fillRect(1392, 528, 1440, 576)
-    ctx.setFillColor("#a4bcc6")
-    ctx.fillRect(1440, 528, 1488, 576)
-    ctx.setFillColor("#a9bec9")
-    ctx.fillRect(1488, 528, 1536, 576)
-    ctx.setFillColor("#a4bac5")
-    ctx.fillRect(1536, 528, 1584, 576)
-    ctx.setFillColor("#93afbd")
-    ctx.fillRect(1584, 528, 1632, 576)
-    ctx.setFillColor("#66a0b8")
-    ctx.fillRect(0, 576, 48, 624)
-    ctx.setFillColor("#5f9cc1")
-    ctx.fillRect(48, 576, 96, 624)
-    ctx.setFillColor("#5f9bc1")
-    ctx.fillRect(96, 576, 144, 624)
-    ctx.setFillColor("#639cbf")
-    ctx.fillRect(144, 576, 192, 624)
-    ctx.setFillColor("#bccfda")
-    ctx.fillRect(192, 576, 240, 624)
-    ctx.setFillColor("#dfe6eb")
-    ctx.fillRect(240, 576, 288, 624)
-    ctx.setFillColor("#dce6ee")
-    ctx.fillRect(288, 576, 336, 624)
-    ctx.setFillColor("#d8e3e6")
-    ctx.fillRect(336, 576, 384, 624)
-    ctx.setFillColor("#c2d3d9")
-    ctx.fillRect(384, 576, 432, 624)
-    ctx.setFillColor("#b2c8d1")
-    ctx.fillRect(432, 576, 480, 624)
-    ctx.setFillColor("#a1b8c1")
-    ctx.fillRect(480, 576, 528, 624)
-    ctx.setFillColor("#859ea7")
-    ctx.fillRect(528, 576, 576, 624)
-    ctx.setFillColor("#7e909d")
-    ctx.fillRect(576, 576, 624, 624)
-    ctx.setFillColor("#000406")
-    ctx.fillRect(624, 576, 672, 624)
-    ctx.setFillColor("#000506")
-    ctx.fillRect(672, 576, 720, 624)
-    ctx.setFillColor("#020003")
-    ctx.fillRect(720, 576, 768, 624)
-    ctx.setFillColor("#010103")
-    ctx.fillRect(768, 576, 816, 624)
-    ctx.setFillColor("#020102")
-    ctx.fillRect(816, 576, 864, 624)
-    ctx.setFillColor("#0b0202")
-    ctx.fillRect(864, 576, 912, 624)
-    ctx.setFillColor("#f1c109")
-    ctx.fillRect(912, 576, 960, 624)
-    ctx.setFillColor("#030003")
-    ctx.fillRect(960, 576, 1008, 624)
-    ctx.setFillColor("#73838e")
-    ctx.fillRect(1008, 576, 1056, 624)
-    ctx.setFillColor("#9bb4c0")
-    ctx.fillRect(1056, 576, 1104, 624)
-    ctx.setFillColor("#95afc0")
-    ctx.fillRect(1104, 576, 1152, 624)
-    ctx.setFillColor("#90aebb")
-    ctx.fillRect(1152, 576, 1200, 624)
-    ctx.setFillColor("#8fadbb")
-    ctx.fillRect(1200, 576, 1248, 624)
-    ctx.setFillColor("#90aebb")
-    ctx.fillRect(1248, 576, 1296, 624)
-    ctx.setFillColor("#8eaab9")
-    ctx.fillRect(1296, 576, 1344, 624)
-    ctx.setFillColor("#91afbc")
-    ctx.fillRect(1344, 576, 1392, 624)
-    ctx.setFillColor("#8da9b6")
-    ctx.fillRect(1392, 576, 1440, 624)
-    ctx.setFillColor("#90adb7")
-    ctx.fillRect(1440, 576, 1488, 624)
-    ctx.setFillColor("#9db6c2")
-    ctx.fillRect(1488, 576, 1536, 624)
-    ctx.setFillColor("#90afb9")
-    ctx.fillRect(1536, 576, 1584, 624)
-    ctx.setFillColor("#8fadbb")
-    ctx.fillRect(1584, 576, 1632, 624)
-    ctx.setFillColor("#cddde8")
-    ctx.fillRect(0, 624, 48, 672)
-    ctx.setFillColor("#cbe6ee")
-    ctx.fillRect(48, 624, 96, 672)
-    ctx.setFillColor("#6da2c5")
-    ctx.fillRect(96, 624, 144, 672)
-    ctx.setFillColor("#a2c0d7")
-    ctx.fillRect(144, 624, 192, 672)
-    ctx.setFillColor("#76a9c9")
-    ctx.fillRect(192, 624, 240, 672)
-    ctx.setFillColor("#a1bbd0")
-    ctx.fillRect(240, 624, 288, 672)
-    ctx.setFillColor("#9ab1be")
-    ctx.fillRect(288, 624, 336, 672)
-    ctx.setFillColor("#d6e3e8")
-    ctx.fillRect(336, 624, 384, 672)
-    ctx.setFillColor("#c6d7dd")
-    ctx.fillRect(384, 624, 432, 672)
-    ctx.setFillColor("#b2c9d4")
-    ctx.fillRect(432, 624, 480, 672)
-    ctx.setFillColor("#a4bfcd")
-    ctx.fillRect(480, 624, 528, 672)
-    ctx.setFillColor("#9dbacc")
-    ctx.fillRect(528, 624, 576, 672)
-    ctx.setFillColor("#a9c4d2")
-    ctx.fillRect(576, 624, 624, 672)
-    ctx.setFillColor("#91a7b3")
-    ctx.fillRect(624, 624, 672, 672)
-    ctx.setFillColor("#b0bdc2")
-    ctx.fillRect(672, 624, 720, 672)
-    ctx.setFillColor("#9fadb1")
-    ctx.fillRect(720, 624, 768, 672)
-    ctx.setFillColor("#859699")
-    ctx.fillRect(768, 624, 816, 672)
-    ctx.setFillColor("#7d888e")
-    ctx.fillRect(816, 624, 864, 672)
-    ctx.setFillColor("#000002")
-    ctx.fillRect(864, 624, 912, 672)
-    ctx.setFillColor("#010303")
-    ctx.fillRect(912, 624, 960, 672)
-    ctx.setFillColor("#000201")
-    ctx.fillRect(960, 624, 1008, 672)
-    ctx.setFillColor("#778d96")
-    ctx.fillRect(1008, 624, 1056, 672)
-    ctx.setFillColor("#a7bcc8")
-    ctx.fillRect(1056, 624, 1104, 672)
-    ctx.setFillColor("#a0b7c4")
-    ctx.fillRect(1104, 624, 1152, 672)
-    ctx.setFillColor("#9cb7c5")
-    ctx.fillRect(1152, 624, 1200, 672)
-    ctx.setFillColor("#95b2c2")
-    ctx.fillRect(1200, 624, 1248, 672)
-    ctx.setFillColor("#91acbc")
-    ctx.fillRect(1248, 624, 1296, 672)
-    ctx.setFillColor("#8daebc")
-    ctx.fillRect(1296, 624, 1344, 672)
-    ctx.setFillColor("#8cacbb")
-    ctx.fillRect(1344, 624, 1392, 672)
-    ctx.setFillColor("#90aebc")
-    ctx.fillRect(1392, 624, 1440, 672)
-    ctx.setFillColor("#9ab4bf")
-    ctx.fillRect(1440, 624, 1488, 672)
-    ctx.setFillColor("#8faeb8")
-    ctx.fillRect(1488, 624, 1536, 672)
-    ctx.setFillColor("#8dadb8")
-    ctx.fillRect(1536, 624, 1584, 672)
-    ctx.setFillColor("#87a4b3")
-    ctx.fillRect(1584, 624, 1632, 672)
-    ctx.setFillColor("#bfd2db")
-    ctx.fillRect(0, 672, 48, 720)
-    ctx.setFillColor("#cfdde4")
-    ctx.fillRect(48, 672, 96, 720)
-    ctx.setFillColor("#8ab3cc")
-    ctx.fillRect(96, 672, 144, 720)
-    ctx.setFillColor("#94b8cd")
-    ctx.fillRect(144, 672, 192, 720)
-    ctx.setFillColor("#8fb2c8")
-    ctx.fillRect(192, 672, 240, 720)
-    ctx.setFillColor("#65a1c8")
-    ctx.fillRect(240, 672, 288, 720)
-    ctx.setFillColor("#73a2c8")
-    ctx.fillRect(288, 672, 336, 720)
-    ctx.setFillColor("#9dc0d4")
-    ctx.fillRect(336, 672, 384, 720)
-    ctx.setFillColor("#a2c0d3")
-    ctx.fillRect(384, 672, 432, 720)
-    ctx.setFillColor("#6da4c5")
-    ctx.fillRect(432, 672, 480, 720)
-    ctx.setFillColor("#72a5c5")
-    ctx.fillRect(480, 672, 528, 720)
-    ctx.setFillColor("#adc7da")
-    ctx.fillRect(528, 672, 576, 720)
-    ctx.setFillColor("#a6c0d4")
-    ctx.fillRect(576, 672, 624, 720)
-    ctx.setFillColor("#b0cade")
-    ctx.fillRect(624, 672, 672, 720)
-    ctx.setFillColor("#cfdce1")
-    ctx.fillRect(672, 672, 720, 720)
-    ctx.setFillColor("#d0dde4")
-    ctx.fillRect(720, 672, 768, 720)
-    ctx.setFillColor("#c6d4db")
-    ctx.fillRect(768, 672, 816, 720)
-    ctx.setFillColor("#b8cad2")
-    ctx.fillRect(816, 672, 864, 720)
-    ctx.setFillColor("#96abb4")
-    ctx.fillRect(864, 672, 912, 720)
-    ctx.setFillColor("#11181a")
-    ctx.fillRect(912, 672, 960, 720)
-    ctx.setFillColor("#455156")
-    ctx.fillRect(960, 672, 1008, 720)
-    ctx.setFillColor("#94acb9")
-    ctx.fillRect(1008, 672, 1056, 720)
-    ctx.setFillColor("#9cb5c0")
-    ctx.fillRect(1056, 672, 1104, 720)
-    ctx.setFillColor("#94afbd")
-    ctx.fillRect(1104, 672, 1152, 720)
-    ctx.setFillColor("#8ba9b8")
-    ctx.fillRect(1152, 672, 1200, 720)
-    ctx.setFillColor("#84a3b4")
-    ctx.fillRect(1200, 672, 1248, 720)
-    ctx.setFillColor("#88adbe")
-    ctx.fillRect(1248, 672, 1296, 720)
-    ctx.setFillColor("#7ea3b9")
-    ctx.fillRect(1296, 672, 1344, 720)
-    ctx.setFillColor("#6c9cb9")
-    ctx.fillRect(1344, 672, 1392, 720)
-    ctx.setFillColor("#8cacbe")
-    ctx.fillRect(1392, 672, 1440, 720)
-    ctx.setFillColor("#96b0be")
-    ctx.fillRect(1440, 672, 1488, 720)
-    ctx.setFillColor("#91afbc")
-    ctx.fillRect(1488, 672, 1536, 720)
-    ctx.setFillColor("#8eacba")
-    ctx.fillRect(1536, 672, 1584, 720)
-    ctx.setFillColor("#8eacb8")
-    ctx.fillRect(1584, 672, 1632, 720)
-    ctx.setFillColor("#c7d7dd")
-    ctx.fillRect(0, 720, 48, 768)
-    ctx.setFillColor("#cedee3")
-    ctx.fillRect(48, 720, 96, 768)
-    ctx.setFillColor("#b5c8d4")
-    ctx.fillRect(96, 720, 144, 768)
-    ctx.setFillColor("#b8cdd7")
-    ctx.fillRect(144, 720, 192, 768)
-    ctx.setFillColor("#c3d2dd")
-    ctx.fillRect(192, 720, 240, 768)
-    ctx.setFillColor("#bed4da")
-    ctx.fillRect(240, 720, 288, 768)
-    ctx.setFillColor("#c2dae3")
-    ctx.fillRect(288, 720, 336, 768)
-    ctx.setFillColor("#63a1c3")
-    ctx.fillRect(336, 720, 384, 768)
-    ctx.setFillColor("#689fbf")
-    ctx.fillRect(384, 720, 432, 768)
-    ctx.setFillColor("#5f9ec0")
-    ctx.fillRect(432, 720, 480, 768)
-    ctx.setFillColor("#61a0c4")
-    ctx.fillRect(480, 720, 528, 768)
-    ctx.setFillColor("#6c9ec6")
-    ctx.fillRect(528, 720, 576, 768)
-    ctx.setFillColor("#90b3ca")
-    ctx.fillRect(576, 720, 624, 768)
-    ctx.setFillColor("#9cb8cc")
-    ctx.fillRect(624, 720, 672, 768)
-    ctx.setFillColor("#d7e4e9")
-    ctx.fillRect(672, 720, 720, 768)
-    ctx.setFillColor("#d2dfe3")
-    ctx.fillRect(720, 720, 768, 768)
-    ctx.setFillColor("#c6d4db")
-    ctx.fillRect(768, 720, 816, 768)
-    ctx.setFillColor("#b7c9ce")
-    ctx.fillRect(816, 720, 864, 768)
-    ctx.setFillColor("#aac0ca")
-    ctx.fillRect(864, 720, 912, 768)
-    ctx.setFillColor("#9eb6c0")
-    ctx.fillRect(912, 720, 960, 768)
-    ctx.setFillColor("#73898f")
-    ctx.fillRect(960, 720, 1008, 768)
-    ctx.setFillColor("#8facb6")
-    ctx.fillRect(1008, 720, 1056, 768)
-    ctx.setFillColor("#8ba9b5")
-    ctx.fillRect(1056, 720, 1104, 768)
-    ctx.setFillColor("#85a5b4")
-    ctx.fillRect(1104, 720, 1152, 768)
-    ctx.setFillColor("#7ea0ad")
-    ctx.fillRect(1152, 720, 1200, 768)
-    ctx.setFillColor("#779cad")
-    ctx.fillRect(1200, 720, 1248, 768)
-    ctx.setFillColor("#789eb2")
-    ctx.fillRect(1248, 720, 1296, 768)
-    ctx.setFillColor("#5395b3")
-    ctx.fillRect(1296, 720, 1344, 768)
-    ctx.setFillColor("#5097bc")
-    ctx.fillRect(1344, 720, 1392, 768)
-    ctx.setFillColor("#5394b9")
-    ctx.fillRect(1392, 720, 1440, 768)
-    ctx.setFillColor("#6a9ab7")
-    ctx.fillRect(1440, 720, 1488, 768)
-    ctx.setFillColor("#709bb5")
-    ctx.fillRect(1488, 720, 1536, 768)
-    ctx.setFillColor("#7ea2b3")
-    ctx.fillRect(1536, 720, 1584, 768)
-    ctx.setFillColor("#7d9fae")
-    ctx.fillRect(1584, 720, 1632, 768)
-    ctx.setFillColor("#c6d4db")
-    ctx.fillRect(0, 768, 48, 816)
-    ctx.setFillColor("#c6d7de")
-    ctx.fillRect(48, 768, 96, 816)
-    ctx.setFillColor("#c6d7dd")
-    ctx.fillRect(96, 768, 144, 816)
-    ctx.setFillColor("#bcd0d7")
-    ctx.fillRect(144, 768, 192, 816)
-    ctx.setFillColor("#b4c7d0")
-    ctx.fillRect(192, 768, 240, 816)
-    ctx.setFillColor("#b1c4ce")
-    ctx.fillRect(240, 768, 288, 816)
-    ctx.setFillColor("#b0c3cf")
-    ctx.fillRect(288, 768, 336, 816)
-    ctx.setFillColor("#9cbdcd")
-    ctx.fillRect(336, 768, 384, 816)
-    ctx.setFillColor("#83aec5")
-    ctx.fillRect(384, 768, 432, 816)
-    ctx.setFillColor("#629fc2")
-    ctx.fillRect(432, 768, 480, 816)
-    ctx.setFillColor("#5da1c3")
-    ctx.fillRect(480, 768, 528, 816)
-    ctx.setFillColor("#60a0c0")
-    ctx.fillRect(528, 768, 576, 816)
-    ctx.setFillColor("#87b0ca")
-    ctx.fillRect(576, 768, 624, 816)
-    ctx.setFillColor("#a3c0d0")
-    ctx.fillRect(624, 768, 672, 816)
-    ctx.setFillColor("#abc7d2")
-    ctx.fillRect(672, 768, 720, 816)
-    ctx.setFillColor("#ccd9e3")
-    ctx.fillRect(720, 768, 768, 816)
-    ctx.setFillColor("#c7d7de")
-    ctx.fillRect(768, 768, 816, 816)
-    ctx.setFillColor("#c3d3d9")
-    ctx.fillRect(816, 768, 864, 816)
-    ctx.setFillColor("#b3c7cc")
-    ctx.fillRect(864, 768, 912, 816)
-    ctx.setFillColor("#a6bdc8")
-    ctx.fillRect(912, 768, 960, 816)
-    ctx.setFillColor("#8fa7ae")
-    ctx.fillRect(960, 768, 1008, 816)
-    ctx.setFillColor("#95afbd")
-    ctx.fillRect(1008, 768, 1056, 816)
-    ctx.setFillColor("#87a8b3")
-    ctx.fillRect(1056, 768, 1104, 816)
-    ctx.setFillColor("#7e9fac")
-    ctx.fillRect(1104, 768, 1152, 816)
-    ctx.setFillColor("#789aaa")
-    ctx.fillRect(1152, 768, 1200, 816)
-    ctx.setFillColor("#7295a9")
-    ctx.fillRect(1200, 768, 1248, 816)
-    ctx.setFillColor("#7193ab")
-    ctx.fillRect(1248, 768, 1296, 816)
-    ctx.setFillColor("#6598b2")
-    ctx.fillRect(1296, 768, 1344, 816)
-    ctx.setFillColor("#6b97b5")
-    ctx.fillRect(1344, 768, 1392, 816)
-    ctx.setFillColor("#9ebdcd")
-    ctx.fillRect(1392, 768, 1440, 816)
-    ctx.setFillColor("#5597b6")
-    ctx.fillRect(1440, 768, 1488, 816)
-    ctx.setFillColor("#6595b4")
-    ctx.fillRect(1488, 768, 1536, 816)
-    ctx.setFillColor("#6792ad")
-    ctx.fillRect(1536, 768, 1584, 816)
-    ctx.setFillColor("#648ea4")
-    ctx.fillRect(1584, 768, 1632, 816)
+    ctx.setOrigin(0, 0)
+    rects, colors = loadWallpaper()
+    fillRects(ctx, rects, colors)
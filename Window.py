@@ -9,13 +9,51 @@ and Jannick Brändel (#405391)
 
 from GraphicsEventSystem import *
 from collections import namedtuple
+from contextlib import contextmanager
+from ZOrder import ZOrder
 
 # initialize bit mask for resizing/anchoring
 AllAnchors = namedtuple('AllAnchors', "top right bottom left")
 LayoutAnchor = AllAnchors(1 << 0, 1 << 1, 1 << 2, 1 << 3)
 
+# last result of the screen's hit test: the window that was hit, its origin on screen, the part of the screen where it
+# is hit (clipped to its parents, as (left, top, right, bottom)), windows in front of it that overlap this part (screen
+# rects) and the generations the result is valid for
+CachedHit = namedtuple("CachedHit", "window originX originY rect occluders generation")
+# more windows in front of a hit window than this: the result is not cached
+MAX_CACHED_OCCLUDERS = 8
+
+
+@contextmanager
+def deferredLayout():
+    """
+    Adding child windows inside this block does not resize them (see addChildWindow). Used to build many windows at
+    once, which are then laid out with a single resize of their top-level window.
+    """
+    Window.layoutDeferred += 1
+    try:
+        yield
+    finally:
+        Window.layoutDeferred -= 1
+
 
 class Window:
+    # number of active deferredLayout blocks
+    layoutDeferred = 0
+    # increased whenever a window is added to or removed from a parent window (tree), whenever a window is moved or
+    # resized (layout) and whenever a window is hidden or shown (visibility), caches of hit test results compare them to
+    # find out if they are still valid
+    treeGeneration = 0
+    layoutGeneration = 0
+    visibilityGeneration = 0
+    # see isHidden
+    _isHidden = False
+    # false for windows whose hitTest never succeeds (e.g. containers), they don't hide windows behind them
+    canBeHit = True
+    # true for windows whose content is drawn by an app in another process (see RemoteApp), they get the input events on
+    # their content
+    isRemote = False
+
     def __init__(self, originX, originY, width, height, identifier, layoutAnchors=LayoutAnchor.top | LayoutAnchor.left,
                  backgroundColor=COLOR_CLEAR):
         """
@@ -34,6 +72,8 @@ class Window:
         self.height = height
         self.identifier = identifier
         self.backgroundColor = backgroundColor
+        # size the window was created with (apps create their widgets for this size of their app window)
+        self.initialSize = (width, height)
 
         self.childWindows = []
         self.parentWindow = None
@@ -41,11 +81,28 @@ class Window:
         self.isHidden = False
         # window is anchored to top-left by default
         self.layoutAnchors = layoutAnchors
+        # container that positions this window (None if the window is positioned by its anchors)
+        self.layoutContainer = None
+        # top-level windows: while the window is resized by dragging, only its frame follows the mouse and the child
+        # windows are laid out when the drag ends or pauses (for windows with an expensive layout)
+        self.deferLayoutWhileResizing = False
+        # top-level windows: title bar added by the window manager (see WindowManager.decorateWindow)
+        self.titleBar = None
 
         # non-top level windows: save margins to bottom and right for resizing purposes
         self.marginRight = 0
         self.marginBottom = 0
 
+    @property
+    def isHidden(self):
+        return self._isHidden
+
+    @isHidden.setter
+    def isHidden(self, isHidden):
+        if isHidden != self._isHidden:
+            self._isHidden = isHidden
+            Window.visibilityGeneration += 1
+
     def addChildWindow(self, window):
         """
         Add given window as child window.
@@ -53,21 +110,35 @@ class Window:
         """
         self.childWindows.append(window)
         window.parentWindow = self
+        Window.treeGeneration += 1
 
         # save margins to bottom and right: they might be broken while resizing and have to be re-established
         window.marginRight = self.width - (window.x + window.width)
         window.marginBottom = self.height - (window.y + window.height)
 
         # trigger resize to ensure window is correctly positioned according to anchors
-        if not self.identifier == "SCREEN" and "- Title Bar" not in window.identifier:
+        if not self.identifier == "SCREEN" and "- Title Bar" not in window.identifier and not Window.layoutDeferred:
             window.resize(window.x, window.y, window.width, window.height)
 
     def removeFromParentWindow(self):
         """
         Remove current window from its parent's child windows.
         """
-        self.parentWindow.childWindows.remove(self)
+        parent = self.parentWindow
+        parent.childWindows.remove(self)
         self.parentWindow = None
+        Window.treeGeneration += 1
+        if parent.identifier == "SCREEN":
+            parent.topLevelWindowChanged(self)
+
+    def removeChildWindows(self):
+        """
+        Remove all child windows (e.g. to release the widgets of a hibernated app).
+        """
+        for child in self.childWindows:
+            child.parentWindow = None
+        self.childWindows = []
+        Window.treeGeneration += 1
 
     def childWindowAtLocation(self, x, y):
         """
@@ -80,8 +151,9 @@ class Window:
         # loop through child windows in reverse as they are sorted by ascending z-level, and we want the topmost one
         for i in reversed(range(len(self.childWindows))):
             child = self.childWindows[i]
-            # transform the position into the child's local coord. system and checks if it is hit
-            if child.hitTest(x - child.x, y - child.y):
+            # transform the position into the child's local coord. system and checks if it is hit (hidden windows can't
+            # be hit)
+            if not child.isHidden and child.hitTest(x - child.x, y - child.y):
                 if len(child.childWindows) > 0:
                     # child window has children -> function is called recursively
                     return child.childWindowAtLocation(x - child.x, y - child.y)
@@ -155,13 +227,43 @@ class Window:
         position = self.convertPositionToScreen(0, 0)
         ctx.setOrigin(position[0], position[1])
         # ctx should draw with bg color
-        ctx.setFillColor(self.backgroundColor)
+        ctx.setFillColor(self.currentBackgroundColor())
         # fill the complete window
         ctx.fillRect(0, 0, tempWidth, tempHeight)
 
-        # recursively draw child windows in ascending z-order
-        for child in self.childWindows:
-            child.draw(ctx)
+        # recursively draw child windows in ascending z-order, consecutive children with the same draw group (e.g. the
+        # buttons of a button grid) are drawn together with one drawGroup call
+        children = self.childWindows
+        i = 0
+        while i < len(children):
+            group = children[i].drawGroupKey()
+            if group is None:
+                children[i].draw(ctx)
+                i += 1
+                continue
+            end = i + 1
+            while end < len(children) and children[end].drawGroupKey() == group:
+                end += 1
+            type(children[i]).drawGroup(ctx, children[i:end])
+            i = end
+
+    def drawGroupKey(self):
+        """
+        Key of the draw group of the window: consecutive sibling windows with the same key (not None) are drawn with one
+        drawGroup call of their class instead of one draw call each.
+        :return: key or None if the window is drawn alone
+        """
+        return None
+
+    @staticmethod
+    def drawGroup(ctx, windows):
+        """
+        Draw windows of the same draw group (see drawGroupKey).
+        :param ctx: Current graphics context
+        :param windows: windows in ascending z-order
+        """
+        for window in windows:
+            window.draw(ctx)
 
     def handleMouseClicked(self, x, y):
         """
@@ -174,6 +276,34 @@ class Window:
     def setBackgroundColor(self, color):
         self.backgroundColor = color
 
+    def handleVisibilityChanged(self, event):
+        """
+        Called when the window can be seen again or not anymore. Events of top-level windows (restored or minimized:
+        "shown"/"hidden", uncovered or completely covered by windows in front of it: "exposed"/"occluded") are passed
+        on to all child windows, other windows get "shown"/"hidden" when they are no longer/now clipped away by their
+        parent.
+        :param event: "shown", "hidden", "occluded" or "exposed"
+        """
+        for child in self.childWindows:
+            child.handleVisibilityChanged(event)
+
+    # returns the color the window is filled with (widgets can depend on their state)
+    def currentBackgroundColor(self):
+        return self.backgroundColor
+
+    def windowsInFront(self):
+        """
+        :return: the child windows of the parent window that are in front of this window (after it in the child window
+        list), found from the end of the list, so the cost depends on their number instead of the number of siblings
+        """
+        siblings = self.parentWindow.childWindows
+        if isinstance(siblings, ZOrder):
+            return siblings.inFrontOf(self)
+        for i in range(len(siblings) - 1, -1, -1):
+            if siblings[i] is self:
+                return siblings[i + 1:]
+        raise ValueError("Window is not a child window of its parent")
+
     # returns top level window the current window belongs to
     def getTopLevelWindow(self):
 
@@ -186,8 +316,16 @@ class Window:
 
         return topLevelWindow
 
+    # returns the window system the window is displayed in or None if it is not part of the window tree (yet)
+    def getWindowSystem(self):
+        window = self
+        while window.parentWindow is not None:
+            window = window.parentWindow
+        return getattr(window, "windowSystem", None)
+
     # resizes itself and all its child windows
     def resize(self, x, y, width, height):
+        Window.layoutGeneration += 1
         titleBarHeight = self.getTopLevelWindow().parentWindow.windowSystem.windowManager.titleBarHeight
         parentWidth = self.parentWindow.width
         parentHeight = self.parentWindow.height
@@ -199,6 +337,7 @@ class Window:
             # new width/height should not be lower than minimum width/height
             self.width = max(self.parentWindow.windowSystem.windowManager.tlwMinWidth, width)
             self.height = max(self.parentWindow.windowSystem.windowManager.tlwMinHeight, height)
+            self.parentWindow.topLevelWindowChanged(self)
         else:
             # NO TOP-LEVEL WINDOW: RESIZING
             # keep width and height the same for anchored windows (unless it is changed below)
@@ -250,9 +389,11 @@ class Window:
             self.width = width
             self.height = height
 
-        # resize child windows
+        # resize child windows (windows in a container are positioned by their container instead, the title bar by the
+        # window manager)
         for child in self.childWindows:
-            child.resize(child.x, child.y, child.width, child.height)
+            if child.layoutContainer is None and child is not self.titleBar:
+                child.resize(child.x, child.y, child.width, child.height)
 
     # returns temporary width and height values of a window to clip it to the bounds of its parent window (if exceeding)
     def getDrawingSize(self):
@@ -272,7 +413,10 @@ class Window:
                 tempHeight = max(0, parentTempHeight - self.y)
 
             # window should disappear in the case of temp width or height being 0
-            self.isHidden = tempWidth == 0 or tempHeight == 0
+            isHidden = tempWidth == 0 or tempHeight == 0
+            if isHidden != self.isHidden:
+                self.isHidden = isHidden
+                self.handleVisibilityChanged("hidden" if isHidden else "shown")
 
         return tempWidth, tempHeight
 
@@ -285,6 +429,91 @@ class Screen(Window):
         """
         super().__init__(0, 0, windowSystem.width, windowSystem.height, "SCREEN")
         self.windowSystem = windowSystem
+        # top-level windows are kept in a z-order with O(1) raise and lower instead of a plain list
+        self.childWindows = ZOrder()
+        # result of the last hit test (see childWindowAtLocation) and statistics of the cache
+        self.lastHit = None
+        self.hitCacheHits = 0
+        self.hitCacheMisses = 0
+
+    def addChildWindow(self, window):
+        super().addChildWindow(window)
+        self.topLevelWindowChanged(window)
+
+    def topLevelWindowChanged(self, window):
+        """
+        Called when a top-level window was added, removed, moved, resized, minimized or restored: the window manager
+        updates the entries of this window in its indexes of the top-level windows.
+        :param window: top-level window that changed
+        """
+        self.windowSystem.windowManager.topLevelWindowChanged(window)
+
+    def childWindowAtLocation(self, x, y):
+        """
+        Hit test with a fast path for positions inside the window that was hit last (e.g. the mouse moves within a
+        button): if no window was added, removed, moved, resized, hidden, shown or raised since, the cached window is
+        returned without walking the window tree.
+        :param x: x-value of hit position
+        :param y: y-value of hit position
+        :return: Topmost window that was hit
+        """
+        generation = (Window.treeGeneration, Window.layoutGeneration, Window.visibilityGeneration,
+                      self.childWindows.generation)
+        hit = self.lastHit
+        if hit is not None and hit.generation == generation and self.isCachedHit(hit, x, y):
+            self.hitCacheHits += 1
+            return hit.window
+        self.hitCacheMisses += 1
+        window = super().childWindowAtLocation(x, y)
+        self.lastHit = self.cacheHit(window, generation)
+        return window
+
+    @staticmethod
+    def isCachedHit(hit, x, y):
+        # the position has to be in the hit part of the window, not in a window in front of it and not in one of
+        # its child windows (windows with children are hit where none of their children is)
+        left, top, right, bottom = hit.rect
+        if not (left <= x <= right and top <= y <= bottom):
+            return False
+        for occluderLeft, occluderTop, occluderRight, occluderBottom in hit.occluders:
+            if occluderLeft <= x <= occluderRight and occluderTop <= y <= occluderBottom:
+                return False
+        localX, localY = x - hit.originX, y - hit.originY
+        return not any(not child.isHidden and child.hitTest(localX - child.x, localY - child.y)
+                       for child in hit.window.childWindows)
+
+    def cacheHit(self, window, generation):
+        """
+        Create the cache entry for a hit test result.
+        :param window: window returned by the hit test
+        :param generation: generations of the window tree the result is valid for
+        :return: CachedHit or None if the result can't be cached
+        """
+        if window is self:
+            return None
+        originX, originY = window.convertPositionToScreen(0, 0)
+        left, top, right, bottom = originX, originY, originX + window.width, originY + window.height
+        # walk up to the screen: the window is only hit inside its parents, and windows later in the child lists
+        # (in front) overlapping this area take precedence
+        occluders = []
+        child, childX, childY = window, originX, originY
+        while child.parentWindow is not None:
+            parent = child.parentWindow
+            parentX, parentY = childX - child.x, childY - child.y
+            if parent is not self:
+                left, top = max(left, parentX), max(top, parentY)
+                right, bottom = min(right, parentX + parent.width), min(bottom, parentY + parent.height)
+            for sibling in child.windowsInFront():
+                if not sibling.canBeHit or sibling.isHidden:
+                    continue
+                siblingLeft, siblingTop = parentX + sibling.x, parentY + sibling.y
+                siblingRight, siblingBottom = siblingLeft + sibling.width, siblingTop + sibling.height
+                if siblingLeft <= right and left <= siblingRight and siblingTop <= bottom and top <= siblingBottom:
+                    occluders.append((siblingLeft, siblingTop, siblingRight, siblingBottom))
+            child, childX, childY = parent, parentX, parentY
+        if len(occluders) > MAX_CACHED_OCCLUDERS:
+            return None
+        return CachedHit(window, originX, originY, (left, top, right, bottom), occluders, generation)
 
     def draw(self, ctx):
         """
@@ -292,11 +521,13 @@ class Screen(Window):
         :param ctx: Current graphics context
         """
         self.windowSystem.windowManager.drawDesktop(ctx)
+        self.windowSystem.endLayer("desktop")
         # call draw function on top-level windows and decorate them using the WM.
         for topLevelWindow in self.childWindows:
             if not topLevelWindow.isHidden:
                 self.windowSystem.windowManager.decorateWindow(topLevelWindow, ctx)
                 topLevelWindow.draw(ctx)
                 self.windowSystem.windowManager.drawWindowDecorations(topLevelWindow, ctx)
+                self.windowSystem.endWindowItems(topLevelWindow)
         # task bar is drawn in the end to be in the foreground compared to other windows
         self.windowSystem.windowManager.drawTaskbar(ctx)
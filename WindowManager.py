@@ -7,55 +7,17 @@ by  Felix Umland (#406886)
 and Jannick Brändel (#405391)
 """
 import datetime
+import time
 
-from ColorsApp import ColorsApp
-from CalculatorApp import CalculatorApp
+from AppRegistry import defaultRegistry
+from Drawing import drawLines, fillRects, toQuads
 from GraphicsEventSystem import *
-from ResizingApp import ResizingApp
+from Placement import WindowPlacement, intersectionArea
+from Snapping import EdgeIndex
 from Wallpaper import draw_wallpaper
 from Window import *
-from HelloWorldApp import HelloWorldApp
-
-
-# Draws monochrome versions of the app icons, used for the taskbar
-def drawTaskbarIcon(identifier, ctx):
-    if "HelloWorld" in identifier:
-        # Hello World App
-        # Draw "H"
-        ctx.setFillColor(COLOR_BLACK)
-        # left line of H
-        ctx.fillRect(5, 5, 10, 30)
-        # right line of H
-        ctx.fillRect(25, 5, 30, 30)
-        # middle line of H
-        ctx.fillRect(5, 15, 30, 20)
-    elif "Colors" in identifier:
-        # Colors App
-        ctx.setFillColor(COLOR_BLACK)
-        # Line 1
-        ctx.fillRect(10, 5, 25, 10)
-        # Line 2
-        ctx.fillRect(10, 15, 25, 20)
-        # Line 3
-        ctx.fillRect(10, 25, 25, 30)
-    elif "Calculator" in identifier:
-        # Calculator App
-        ctx.setFillColor(COLOR_BLACK)
-        # Top dot
-        ctx.fillRect(12.5, 5, 21, 12.5)
-        # Middle Line
-        ctx.fillRect(5, 15, 30, 20)
-        # Bottom dot
-        ctx.fillRect(12.5, 22.5, 21, 30)
-    elif "Resizing" in identifier:
-        # Resizing Test App
-        ctx.setFillColor(COLOR_BLACK)
-        # Top Left Bracket
-        ctx.fillRect(5, 5, 20, 10)
-        ctx.fillRect(5, 5, 10, 20)
-        # Bottom Right Bracket
-        ctx.fillRect(15, 25, 30, 30)
-        ctx.fillRect(25, 15, 30, 30)
+from UITK import internFont
+from ZOrder import reorderedWindows
 
 
 class WindowManager:
@@ -72,13 +34,86 @@ class WindowManager:
 
         # Start Menu Variables
         self.startMenuVisible = False
-        self.apps = ["Hello World", "Colors", "Calculator", "Resizing", "Shutdown"]
+        # items of the start menu (apps are loaded when they are launched for the first time)
+        self.appRegistry = defaultRegistry
         # height of a single element in the start menu
         self.startMenuItemHeight = 50
+        # index of the hovered item in the registry
         self.startMenuItemHovered = None
+        # index of the first visible item, the start menu scrolls if it has more items than fit on the screen
+        self.startMenuScroll = 0
         # set size of the start menu
         self.startMenuWidth = 200
-        self.startMenuHeight = len(self.apps * self.startMenuItemHeight)
+        # start menu icons moved to their position in the item, by item index, and the registry generation they were
+        # computed for
+        self.startMenuIconCache = {}
+        self.startMenuIconGeneration = None
+        # names of app classes that are started in a separate process (see RemoteApp), e.g. {"CalculatorApp"}, in
+        # addition to the apps registered as isolated
+        self.isolatedApps = set(windowSystem.isolatedApps)
+        # positions of new app windows (see WindowPlacement.findPosition for the strategies)
+        self.placement = WindowPlacement(self)
+        self.placementStrategy = "cascade"
+
+        # Snapping Variables
+        # dragged windows snap to edges of the screen, the taskbar and other windows closer than this many pixels
+        # (0: no snapping)
+        self.snapThreshold = 10
+        # sorted edges of the work area and the top-level windows, the windows whose edges changed since the last drag
+        # and the window that is dragged
+        self.edgeIndex = EdgeIndex()
+        self.changedEdgeWindows = set()
+        self.snapWindow = None
+        # top-level window that is dragged by its title bar (its visibility and the visibility of the windows it covers
+        # is computed when the drag ends)
+        self.draggedWindow = None
+
+        # Live Resize Variables
+        # top level window that is resized without layout of its child windows (see deferLayoutWhileResizing)
+        self.liveResizeWindow = None
+        # size the child windows of the live resized window were laid out for
+        self.liveResizeLayoutSize = None
+        # time of the last resize drag event and whether a timer is waiting for the pointer to pause
+        self.lastResizeDragTime = 0
+        self.liveResizeTimerScheduled = False
+        # the child windows are laid out when the pointer did not move for this many milliseconds
+        self.liveResizePauseDelay = 150
+
+        # Hibernation Variables
+        # apps that are minimized or completely covered by other windows for this many milliseconds release their
+        # widgets until they are shown again (None: apps never hibernate)
+        self.hibernationDelay = 60000
+        # hibernated apps with the state they had when they released their widgets
+        self.hibernatedApps = {}
+        # apps that are minimized or covered, with the time since when
+        self.hibernationCandidates = {}
+        self.hibernationTimerScheduled = False
+
+        # Visibility Variables
+        # visibility of the top-level windows ("shown", "hidden" or "occluded") and the generations of the window tree
+        # (structure, layout, z-order and minimized states) it was computed for
+        self.windowVisibility = {}
+        self.visibilityKey = None
+        # rects and minimized states of the top-level windows and their z-order when the visibility was computed
+        self.visibilityFrames = {}
+        self.visibilityOrder = []
+        # open apps by their top-level window
+        self.appsByWindow = {}
+
+    # height of the start menu: all items, but not more than fit between the top of the screen and the taskbar
+    @property
+    def startMenuHeight(self):
+        return min(len(self.appRegistry.entries), self.startMenuVisibleItems()) * self.startMenuItemHeight
+
+    # number of start menu items that fit on the screen
+    def startMenuVisibleItems(self):
+        return max(1, int((self.windowSystem.height - self.taskBarHeight) // self.startMenuItemHeight))
+
+    # returns true if the position is inside of the open start menu
+    def isInStartMenu(self, x, y):
+        startMenuBottom = self.windowSystem.height - self.taskBarHeight
+        return (self.startMenuVisible and x <= self.startMenuWidth
+                and startMenuBottom - self.startMenuHeight <= y <= startMenuBottom)
 
     def checkWindowPosition(self, window, x, y):
         # check if window is top-level window and return otherwise
@@ -98,36 +133,60 @@ class WindowManager:
 
     # creates windows for window decorations (title bar, buttons)
     def decorateWindow(self, window, ctx):
-        # add title bar
-        titleBar = Window(0, 0, window.width, self.titleBarHeight, window.identifier + " - Title Bar")
+        # the title bar is created once and only updated when the window is painted, so the window tree (and the hit
+        # test cache of the screen) doesn't change on every paint
+        titleBar = window.titleBar
+        if titleBar is None or titleBar.identifier != window.identifier + " - Title Bar":
+            # first paint or the window got a new identifier (e.g. restored from a session)
+            if titleBar is not None and titleBar.parentWindow is window:
+                titleBar.removeFromParentWindow()
+            titleBar = self.createTitleBar(window)
+            window.titleBar = titleBar
+        # title bar has to be the last child window (child windows might have been added after it)
+        if not window.childWindows or window.childWindows[-1] is not titleBar:
+            if titleBar.parentWindow is window:
+                titleBar.removeFromParentWindow()
+            window.addChildWindow(titleBar)
+        if titleBar.width != window.width:
+            self.layoutTitleBar(titleBar, window.width)
         # set background color based on if window is selected
-        topLevelWindows = self.windowSystem.screen.childWindows
-        windowIsSelected = topLevelWindows[len(topLevelWindows) - 1].identifier == window.identifier
-        if windowIsSelected:
+        if self.windowSystem.screen.childWindows.front() is window:
             # window is selected
             titleBar.setBackgroundColor("#063EA4")
         else:
             # window is in the background
             titleBar.setBackgroundColor("#959595")
-        # append title bar to window
-        window.addChildWindow(titleBar)
-        # remove old title bar if already existing
-        if len(window.childWindows) > 1 and "- Title Bar" in window.childWindows[len(window.childWindows) - 2].identifier:
-            window.childWindows[len(window.childWindows) - 2].removeFromParentWindow()
 
-        # add title window to title Bar
-        titleWindow = Window(0, 0, titleBar.width/2, titleBar.height, titleBar.identifier + " - Title")
-        titleBar.addChildWindow(titleWindow)
+    # draws the title bar and decorations of a top-level window again (e.g. after it gained or lost the focus)
+    def redrawTitleBar(self, window, ctx):
+        self.decorateWindow(window, ctx)
+        window.titleBar.draw(ctx)
+        self.drawWindowDecorations(window, ctx)
 
-        # add buttons windows
-        buttonWidth = self.titleBarButtonWidth
+    # creates the title bar of a top-level window with title window, close and minimize button
+    def createTitleBar(self, window):
+        titleBar = Window(0, 0, window.width, self.titleBarHeight, window.identifier + " - Title Bar")
+        # add title window to title Bar
         buttonHeight = self.titleBarHeight - 8
+        titleBar.addChildWindow(Window(0, 0, 0, titleBar.height, titleBar.identifier + " - Title"))
+        # add buttons windows (positioned by layoutTitleBar)
+        titleBar.addChildWindow(Window(0, 4, self.titleBarButtonWidth, buttonHeight,
+                                       titleBar.identifier + " - Close Button"))
+        titleBar.addChildWindow(Window(0, 4, self.titleBarButtonWidth, buttonHeight,
+                                       titleBar.identifier + " - Minimize Button"))
+        self.layoutTitleBar(titleBar, window.width)
+        return titleBar
+
+    # positions the windows of a title bar for the given window width
+    def layoutTitleBar(self, titleBar, width):
+        titleWindow, closeButton, minimizeButton = titleBar.childWindows
+        buttonWidth = self.titleBarButtonWidth
         distanceBetweenButtons = 5
-        closeButton = Window(titleBar.width - buttonWidth - distanceBetweenButtons, 4, buttonWidth, buttonHeight, titleBar.identifier + " - Close Button")
-        minimizeButton = Window(titleBar.width - (2 * buttonWidth + 2 * distanceBetweenButtons), 4, buttonWidth, buttonHeight, titleBar.identifier + " - Minimize Button")
-        # append buttons to title bar
-        titleBar.addChildWindow(closeButton)
-        titleBar.addChildWindow(minimizeButton)
+        titleBar.width = width
+        titleWindow.width = width / 2
+        closeButton.x = width - buttonWidth - distanceBetweenButtons
+        minimizeButton.x = width - (2 * buttonWidth + 2 * distanceBetweenButtons)
+        Window.layoutGeneration += 1
 
     # Does the drawing part of window decoration (title string, button icons)
     def drawWindowDecorations(self, window, ctx):
@@ -157,7 +216,7 @@ class WindowManager:
         titleWindowX, titleWindowY = titleWindow.convertPositionToScreen(0, 0)
         ctx.setOrigin(titleWindowX, titleWindowY)
         ctx.setStrokeColor(COLOR_WHITE)
-        ctx.setFont(Font(family="Helvetica", size=10, weight="bold"))
+        ctx.setFont(internFont(family="Helvetica", size=10, weight="bold"))
         if window.width > 100:
             # draw full title (without instance number) as window is wide enough
             ctx.drawString(window.identifier.split(" ", 1)[1], 3, 1)
@@ -205,43 +264,24 @@ class WindowManager:
         ctx.fillRect(0, 0, self.windowSystem.width, self.taskBarHeight)
         ctx.strokeRect(0, 0, self.windowSystem.width, self.taskBarHeight)
 
-        # draw start menu button
+        # draw start menu button with its icon
         # different representation for being normal and pressed
+        size = self.taskBarHeight
         if self.startMenuVisible:
-            ctx.setFillColor("#DDDDDD")
-            ctx.fillRect(0, 0, self.taskBarHeight, self.taskBarHeight)
-            # Add button stroke
-            ctx.setStrokeColor(COLOR_BLACK)
-            ctx.drawLine(0, 0, self.taskBarHeight, 0)
-            ctx.drawLine(0, 0, 0, self.taskBarHeight)
-            ctx.setStrokeColor(COLOR_WHITE)
-            ctx.drawLine(0, self.taskBarHeight, self.taskBarHeight, self.taskBarHeight)
-            ctx.drawLine(self.taskBarHeight, 0, self.taskBarHeight, self.taskBarHeight)
+            backgroundColor, topLeftColor, bottomRightColor = "#DDDDDD", COLOR_BLACK, COLOR_WHITE
         else:
-            ctx.setFillColor("#BDBDBD")
-            ctx.fillRect(0, 0, self.taskBarHeight, self.taskBarHeight)
-            # Add button stroke
-            ctx.setStrokeColor(COLOR_WHITE)
-            ctx.drawLine(0, 0, self.taskBarHeight, 0)
-            ctx.drawLine(0, 0, 0, self.taskBarHeight)
-            ctx.setStrokeColor(COLOR_BLACK)
-            ctx.drawLine(0, self.taskBarHeight, self.taskBarHeight, self.taskBarHeight)
-            ctx.drawLine(self.taskBarHeight, 0, self.taskBarHeight, self.taskBarHeight)
-
-        # Add start menu icon
-        ctx.setFillColor(COLOR_RED)
-        ctx.fillRect(self.taskBarHeight/4, self.taskBarHeight/4, self.taskBarHeight/2, self.taskBarHeight/2)
-        ctx.setFillColor(COLOR_GREEN)
-        ctx.fillRect(self.taskBarHeight/2, self.taskBarHeight / 4, self.taskBarHeight / 4 * 3, self.taskBarHeight / 2)
-        ctx.setFillColor(COLOR_BLUE)
-        ctx.fillRect(self.taskBarHeight/4, self.taskBarHeight / 2, self.taskBarHeight / 2, self.taskBarHeight / 4 * 3)
-        ctx.setFillColor(COLOR_YELLOW)
-        ctx.fillRect(self.taskBarHeight / 2, self.taskBarHeight / 2, self.taskBarHeight / 4 * 3, self.taskBarHeight / 4 * 3)
+            backgroundColor, topLeftColor, bottomRightColor = "#BDBDBD", COLOR_WHITE, COLOR_BLACK
+        fillRects(ctx, [(0, 0, size, size), (size/4, size/4, size/2, size/2), (size/2, size/4, size/4*3, size/2),
+                        (size/4, size/2, size/2, size/4*3), (size/2, size/2, size/4*3, size/4*3)],
+                  [backgroundColor, COLOR_RED, COLOR_GREEN, COLOR_BLUE, COLOR_YELLOW])
+        # Add button stroke
+        drawLines(ctx, [(0, 0, size, 0), (0, 0, 0, size), (0, size, size, size), (size, 0, size, size)],
+                  [topLeftColor, topLeftColor, bottomRightColor, bottomRightColor])
 
         # draw date and time
         dateStr = datetime.datetime.now().strftime("%I:%M%p on %B %d, %Y")
         ctx.setStrokeColor(COLOR_BLACK)
-        ctx.setFont(Font(family="Helvetica", size=20, weight="bold"))
+        ctx.setFont(internFont(family="Helvetica", size=20, weight="bold"))
         ctx.drawString(dateStr, self.windowSystem.width - 250, self.taskBarHeight / 4)
 
         # draw window icons
@@ -260,39 +300,26 @@ class WindowManager:
             ctx.setOrigin(curX, curY)
             # check if the window is currently focused
             windowIsSelected = topLevelWindows[-1].identifier == topLevelWindow.identifier
-            # select different color scheme if the window is currently selected
-            if windowIsSelected:
-                # window is selected
-                ctx.setFillColor("#DDDDDD")
-                ctx.setStrokeColor(COLOR_WHITE)
-            else:
-                # window is in the background
-                ctx.setFillColor("#BDBDBD")
-                ctx.setStrokeColor(COLOR_BLACK)
-
-            # draw icon background
-            ctx.fillRect(0, 0, self.taskBarHeight, self.taskBarHeight)
-            # draw app icon
-            drawTaskbarIcon(topLevelWindow.identifier, ctx)
-
-            # Add button stroke
-            if windowIsSelected:
-                ctx.setStrokeColor(COLOR_BLACK)
-                ctx.drawLine(0, 0, self.taskBarHeight, 0)
-                ctx.drawLine(0, 0, 0, self.taskBarHeight)
-                ctx.setStrokeColor(COLOR_WHITE)
-                ctx.drawLine(0, self.taskBarHeight, self.taskBarHeight, self.taskBarHeight)
-                ctx.drawLine(self.taskBarHeight, 0, self.taskBarHeight, self.taskBarHeight)
-            else:
-                ctx.setStrokeColor(COLOR_WHITE)
-                ctx.drawLine(0, 0, self.taskBarHeight, 0)
-                ctx.drawLine(0, 0, 0, self.taskBarHeight)
-                ctx.setStrokeColor(COLOR_BLACK)
-                ctx.drawLine(0, self.taskBarHeight, self.taskBarHeight, self.taskBarHeight)
-                ctx.drawLine(self.taskBarHeight, 0, self.taskBarHeight, self.taskBarHeight)
-
+            self.drawTaskbarIcon(app, windowIsSelected, ctx)
             curX += self.taskBarHeight + 1
 
+    # draws the taskbar icon of an app relative to the origin of the icon: background, monochrome app icon and button
+    # stroke are drawn with one fillRects and one drawLines call
+    def drawTaskbarIcon(self, app, windowIsSelected, ctx):
+        size = self.taskBarHeight
+        # select different color scheme if the window is currently selected (otherwise it is in the background)
+        if windowIsSelected:
+            backgroundColor, topLeftColor, bottomRightColor = "#DDDDDD", COLOR_BLACK, COLOR_WHITE
+        else:
+            backgroundColor, topLeftColor, bottomRightColor = "#BDBDBD", COLOR_WHITE, COLOR_BLACK
+        rects = [(0, 0, size, size)]
+        entry = self.appRegistry.entryForApp(app)
+        if entry is not None and entry.taskbarIcon:
+            rects += toQuads(entry.taskbarIcon)
+        fillRects(ctx, rects, [backgroundColor] + [COLOR_BLACK] * (len(rects) - 1))
+        drawLines(ctx, [(0, 0, size, 0), (0, 0, 0, size), (0, size, size, size), (size, 0, size, size)],
+                  [topLeftColor, topLeftColor, bottomRightColor, bottomRightColor])
+
     def handleTaskBarClicked(self, x):
         topLevelWindows = self.windowSystem.screen.childWindows
         # counter goes through taskbar icons and stops when it reaches the x parameter,
@@ -307,12 +334,14 @@ class WindowManager:
         if iconIndex == 0:
             # start menu button was clicked
             self.startMenuVisible = not self.startMenuVisible
+            # only the start menu button and the start menu change
+            return self.windowSystem.repaintLayers(["chrome", "overlay"])
         elif iconIndex > len(topLevelWindows):
             # clicked outside of app icons in the task bar
             # close start menu again
             if self.startMenuVisible:
                 self.startMenuVisible = False
-            pass
+            return self.windowSystem.repaintLayers(["chrome", "overlay"])
         else:
             # close start menu again
             if self.startMenuVisible:
@@ -320,9 +349,39 @@ class WindowManager:
             # selected window is brought to front or reopened if minimized before
             window = self.windowSystem.apps[iconIndex-1].appWindow
             window.isHidden = False
+            self.topLevelWindowChanged(window)
             self.windowSystem.bringWindowToFront(window)
+            self.windowSystem.sessionChanged()
             self.windowSystem.requestRepaint()
 
+    # draws everything in front of the taskbar (the start menu if it is open, the outline of a live resized window)
+    def drawOverlays(self, ctx):
+        if self.startMenuVisible:
+            self.drawStartMenu(ctx)
+        if self.liveResizeWindow is not None:
+            self.drawRevealedArea(self.liveResizeWindow, ctx)
+            self.drawResizeOutline(self.liveResizeWindow, ctx)
+
+    # fills the part of a live resized window below its title bar that is outside of the size its child windows were
+    # laid out for with its background (the canvas items of the window only cover that size, behind the new part of the
+    # frame the screen would show what was there before)
+    def drawRevealedArea(self, window, ctx):
+        layoutWidth, layoutHeight = self.liveResizeLayoutSize
+        top = self.titleBarHeight
+        ctx.setOrigin(window.x, window.y)
+        ctx.setFillColor(window.currentBackgroundColor())
+        if window.width > layoutWidth:
+            ctx.fillRect(layoutWidth, top, window.width, window.height)
+        if window.height > max(layoutHeight, top):
+            ctx.fillRect(0, max(layoutHeight, top), min(layoutWidth, window.width), window.height)
+
+    # draws the frame of a window that is resized without layout (see handleResizeDragged)
+    def drawResizeOutline(self, window, ctx):
+        ctx.setOrigin(window.x, window.y)
+        ctx.setStrokeColor(COLOR_BLACK)
+        ctx.strokeRect(0, 0, window.width, window.height)
+        ctx.strokeRect(1, 1, window.width - 1, window.height - 1)
+
     def drawStartMenu(self, ctx):
         startMenuOriginY = self.windowSystem.height-self.taskBarHeight-self.startMenuHeight
         iconSize = 35
@@ -333,13 +392,17 @@ class WindowManager:
         ctx.setFillColor("#BDBDBD")
         ctx.fillRect(0, 0, self.startMenuWidth, self.startMenuHeight)
 
-        for i in range(len(self.apps)):
+        entries = self.appRegistry.entries
+        firstItem = self.startMenuScroll
+        lastItem = min(len(entries), firstItem + self.startMenuVisibleItems())
+        for i in range(firstItem, lastItem):
+            # items are drawn relative to their top left corner
+            ctx.setOrigin(0, startMenuOriginY + (i - firstItem) * self.startMenuItemHeight)
             # Item Area
             # Draw blue background if item i is hovered
             if self.startMenuItemHovered == i:
                 ctx.setFillColor("#030280")
-                y = (i * self.startMenuItemHeight)
-                ctx.fillRect(0, y, self.startMenuWidth, y + self.startMenuItemHeight)
+                ctx.fillRect(0, 0, self.startMenuWidth, self.startMenuItemHeight)
 
             # Draw the application icon
             self.drawStartMenuIcon(i, ctx)
@@ -353,163 +416,403 @@ class WindowManager:
                 ctx.setStrokeColor(COLOR_BLACK)
 
             # Draw application name
-            ctx.setFont(Font(family="Helvetica", size=17, weight="bold"))
-            ctx.drawString(self.apps[i], itemSpacing * 2 + iconSize, i * self.startMenuItemHeight + self.startMenuItemHeight / 4)
+            ctx.setFont(internFont(family="Helvetica", size=17, weight="bold"))
+            ctx.drawString(entries[i].name, itemSpacing * 2 + iconSize, self.startMenuItemHeight / 4)
 
+    # draws the icon of item i relative to the origin of the item
     def drawStartMenuIcon(self, i, ctx):
-        iconSize = 35
-        itemSpacing = 10
-        x = itemSpacing
-        # calculate where the position of the icon starts
-        y = i * self.startMenuItemHeight + (self.startMenuItemHeight - iconSize) / 2
-        ctx.setStrokeColor(COLOR_WHITE)
-        if i == 0:
-            # Hello World App
-            ctx.setFillColor("#E0E081")
-            ctx.fillRect(x, y, x + iconSize, y + iconSize)
-            ctx.setFillColor(COLOR_WHITE)
-            # left line of H
-            ctx.fillRect(x + 5, y + 5, x + 10, y + 30)
-            # right line of H
-            ctx.fillRect(x + 25, y + 5, x + 30, y + 30)
-            # middle line of H
-            ctx.fillRect(x + 5, y + 15, x + 30, y + 20)
-        elif i == 1:
-            # Colors APP
-            ctx.setFillColor("#404040")
-            ctx.fillRect(x, y, x + iconSize, y + iconSize)
-            # red line
-            ctx.setFillColor("#D80000")
-            ctx.fillRect(x + 10, y + 5, x + 25, y + 10)
-            # green line
-            ctx.setFillColor("#0EB102")
-            ctx.fillRect(x + 10, y + 15, x + 25, y + 20)
-            # blue line
-            ctx.setFillColor("#0001F8")
-            ctx.fillRect(x + 10, y + 25, x + 25, y + 30)
-        elif i == 2:
-            # Calculator App
-            # Background
-            ctx.setFillColor("#FE9F0B")
-            ctx.fillRect(x, y, x + iconSize, y + iconSize)
-            ctx.setFillColor(COLOR_WHITE)
-            # Top dot
-            ctx.fillRect(x + 12.5, y + 5, x + 21, y + 12.5)
-            # Middle Line
-            ctx.fillRect(x + 5, y + 15, x + 30, y + 20)
-            # Bottom dot
-            ctx.fillRect(x + 12.5, y + 22.5, x + 21, y + 30)
-        elif i == 3:
-            # Resizing App
-            # Background
-            ctx.setFillColor("#04DDF9")
-            ctx.fillRect(x, y, x + iconSize, y + iconSize)
-            ctx.setFillColor(COLOR_WHITE)
-            # Top Left Bracket
-            ctx.fillRect(x + 5, y + 5, x+20, y + 10)
-            ctx.fillRect(x + 5, y + 5, x+10, y + 20)
-            # Bottom Right Bracket
-            ctx.fillRect(x + 15, y + 25, x + 30, y + 30)
-            ctx.fillRect(x + 25, y + 15, x + 30, y + 30)
-        elif i == 4:
-            # Quit Button
-            ctx.setFillColor(COLOR_RED)
-            ctx.fillRect(x, y, x + iconSize, y + iconSize)
-            ctx.drawLine(x + 5, y + 5, x + 30, y + 30)
-            ctx.drawLine(x+ 30, y + 5, x + 5, y + 30)
+        icon = self.startMenuIcon(i)
+        if icon is None:
+            return
+        rects, colors, lines = icon
+        fillRects(ctx, rects, colors)
+        drawLines(ctx, lines, COLOR_WHITE)
+
+    def startMenuIcon(self, i):
+        """
+        Returns the icon of start menu item i moved to its position in the item. Icons are computed once and cached
+        until items are added to the registry.
+        :param i: index of the item
+        :return: (rects, colors, lines) or None if the item has no icon
+        """
+        if self.startMenuIconGeneration != self.appRegistry.generation:
+            self.startMenuIconCache.clear()
+            self.startMenuIconGeneration = self.appRegistry.generation
+        if i not in self.startMenuIconCache:
+            icon = self.appRegistry.entries[i].icon
+            if icon is not None:
+                iconSize = 35
+                itemSpacing = 10
+                # position of the icon in the item
+                x, y = itemSpacing, (self.startMenuItemHeight - iconSize) / 2
+                rects, colors, lines = icon
+                icon = ([(x1 + x, y1 + y, x2 + x, y2 + y) for x1, y1, x2, y2 in toQuads(rects)], list(colors),
+                        [(x1 + x, y1 + y, x2 + x, y2 + y) for x1, y1, x2, y2 in toQuads(lines)])
+            self.startMenuIconCache[i] = icon
+        return self.startMenuIconCache[i]
 
     def handleStartMenuClicked(self, y):
         item = self.startMenuItemAtY(y)
-        if item == 0:
-            x = 200
-            y = 200
-            # check if there already is a window at the coordinates
-            x, y = self.findPossibleWindowPosition(x, y)
-            # create an instance of the app
-            app = HelloWorldApp(self.windowSystem, x, y)
-            # append instance to the list of open apps
-            self.windowSystem.apps.append(app)
-        elif item == 1:
-            x = 700
-            y = 100
-            # check if there already is a window at the coordinates
-            x, y = self.findPossibleWindowPosition(x, y)
-            # create an instance of the app
-            app = ColorsApp(self.windowSystem, x, y)
-            # append instance to the list of open apps
-            self.windowSystem.apps.append(app)
-        elif item == 2:
-            x = 1200
-            y = 200
-            # check if there already is a window at the coordinates
-            x, y = self.findPossibleWindowPosition(x, y)
-            # create an instance of the app
-            app = CalculatorApp(self.windowSystem, x, y)
-            # append instance to the list of open apps
-            self.windowSystem.apps.append(app)
-        elif item == 3:
-            x = 400
-            y = 120
-            # check if there already is a window at the coordinates
-            x, y = self.findPossibleWindowPosition(x, y)
-            # create an instance of the app
-            app = ResizingApp(self.windowSystem, x, y)
-            # append instance to the list of open apps
-            self.windowSystem.apps.append(app)
-        elif item == 4:
-            # goodbye
-            quit()
-
-    def findPossibleWindowPosition(self, x, y):
-        offset = 10
-        while True:
-            # Check if any top level window already exists at the current position
-            position_occupied = False
-            for window in self.windowSystem.screen.childWindows:
-                if window.x == x and window.y == y:
-                    position_occupied = True
-                    break
+        if item is None:
+            return
+        entry = self.appRegistry.entries[item]
+        entry.factory(self, entry.x, entry.y)
 
-            # If no window is found at the current position, return the position
-            if not position_occupied:
-                # clamp x and y positions to make sure window isn't drawn outside of windowsystem
-                x = min(x, self.windowSystem.width)
-                y = min(y, self.windowSystem.height)
-                return x, y
+    def launchApp(self, name):
+        """
+        Create an instance of a registered app at its preferred position (the app module is imported on first launch).
+        :param name: name of the app in the start menu
+        :return: created app or None if there is no app with this name
+        """
+        for entry in self.appRegistry.entries:
+            if entry.name == name:
+                return entry.factory(self, entry.x, entry.y)
+        return None
+
+    def shutdown(self):
+        # goodbye (the desktop is saved if a session path is set)
+        self.windowSystem.saveSession()
+        quit()
 
-            # Increment the position by the offset
-            x += offset
-            y += offset
+    def createApp(self, appClass, x, y, findPosition=True):
+        """
+        Create an instance of the given app and append it to the list of open apps.
+        :param appClass: class of the app, constructed with (windowSystem, x, y)
+        :param x: preferred x value of the app window's origin
+        :param y: preferred y value of the app window's origin
+        :param findPosition: let the window placement choose the position (False to keep it)
+        :return: created app
+        """
+        # create an instance of the app, isolated apps run in their own process
+        if appClass.__name__ in self.isolatedApps or self.appRegistry.isIsolated(appClass.__name__):
+            # imported only when an isolated app is started (it loads multiprocessing)
+            from RemoteApp import RemoteApp
+            app = RemoteApp(self.windowSystem, appClass, x, y)
+        else:
+            app = appClass(self.windowSystem, x, y)
+        # move the window if there already is a window at the coordinates or it is not inside of the work area
+        if findPosition:
+            window = app.appWindow
+            newX, newY = self.placement.findPosition(window, x, y, self.placementStrategy)
+            if (newX, newY) != (window.x, window.y):
+                window.x, window.y = newX, newY
+                Window.layoutGeneration += 1
+                self.topLevelWindowChanged(window)
+        # append instance to the list of open apps
+        self.windowSystem.apps.append(app)
+        self.appsByWindow[app.appWindow] = app
+        self.windowSystem.sessionChanged()
+        return app
 
     def handleStartMenuHovered(self, y):
         # save the start menu item that is currently hovered
         self.startMenuItemHovered = self.startMenuItemAtY(y)
 
     def startMenuItemAtY(self, y):
-        # calculate the index of the item that is at the y coordinate
+        """
+        :param y: y value of a position in the start menu (screen coordinates)
+        :return: index of the item at the y coordinate or None if there is no item
+        """
         startMenuOriginY = self.windowSystem.height - self.taskBarHeight - self.startMenuHeight
         relativeY = y - startMenuOriginY
+        if not 0 <= relativeY < self.startMenuHeight:
+            return None
+        item = self.startMenuScroll + int(relativeY // self.startMenuItemHeight)
+        return item if item < len(self.appRegistry.entries) else None
+
+    def scrollStartMenu(self, delta):
+        """
+        Scroll the start menu by the given number of items (positive: up, to the first items).
+        """
+        maxScroll = max(0, len(self.appRegistry.entries) - self.startMenuVisibleItems())
+        self.startMenuScroll = min(max(self.startMenuScroll - delta, 0), maxScroll)
 
-        return int(relativeY / self.startMenuItemHeight)
+    def topLevelWindowChanged(self, window):
+        """
+        Called when a top-level window was added, removed, moved, resized, minimized or restored (see
+        Screen.topLevelWindowChanged): the window placement updates the entry of this window before its next query, the
+        edge index before the next drag.
+        :param window: top-level window that changed
+        """
+        self.placement.windowChanged(window)
+        self.changedEdgeWindows.add(window)
 
     def handleTitleBarDragged(self, window, x, y, offsetX, offsetY):
         # find top level window this window belongs to
         if window.getTopLevelWindow() is None:
             return
         topLevelWindow = window.getTopLevelWindow()
-        if self.checkWindowPosition(topLevelWindow, x - offsetX, y - offsetY):
-            # reposition the window using the absolute position and subtracting the mouse offset
-            # (offset is important, so you can click anywhere on the title bar to drag)
-            topLevelWindow.x = x - offsetX
-            topLevelWindow.y = y - offsetY
+        # reposition the window using the absolute position and subtracting the mouse offset
+        # (offset is important, so you can click anywhere on the title bar to drag)
+        newX, newY = x - offsetX, y - offsetY
+        self.draggedWindow = topLevelWindow
+        if self.snapThreshold:
+            # snap to the edges of the screen, the taskbar and other windows
+            self.beginSnapping(topLevelWindow)
+            newX, newY = self.edgeIndex.snap(newX, newY, topLevelWindow.width, topLevelWindow.height,
+                                             self.snapThreshold)
+        if self.checkWindowPosition(topLevelWindow, newX, newY):
+            deltaX, deltaY = newX - topLevelWindow.x, newY - topLevelWindow.y
+            topLevelWindow.x = newX
+            topLevelWindow.y = newY
+            Window.layoutGeneration += 1
+            self.topLevelWindowChanged(topLevelWindow)
+            self.windowSystem.sessionChanged()
+            # the content of the window doesn't change: move its canvas items instead of repainting the screen
+            return self.windowSystem.moveWindowItems(topLevelWindow, deltaX, deltaY)
+
+    def beginSnapping(self, window):
+        """
+        Prepare the edge index for dragging the given top-level window: only the edges of windows that were opened,
+        moved, resized, minimized, restored or closed since the last drag are replaced, the dragged window's own edges
+        are removed. Does nothing while the window is dragged, so the drag events only search the index.
+        :param window: dragged top-level window
+        """
+        if self.snapWindow is window:
+            return
+        self.snapWindow = window
+        screen = self.windowSystem.screen
+        # the work area: screen edges and the top of the taskbar
+        self.edgeIndex.update(screen, (0, self.windowSystem.width),
+                              (0, self.windowSystem.height - self.taskBarHeight))
+        changedWindows = self.changedEdgeWindows
+        self.changedEdgeWindows = set()
+        for other in changedWindows:
+            if other.parentWindow is not screen or other.isHidden:
+                self.edgeIndex.remove(other)
+            else:
+                self.edgeIndex.update(other, (other.x, other.x + other.width), (other.y, other.y + other.height))
+        self.edgeIndex.remove(window)
+
+    def endTitleBarDrag(self):
+        # the drag ended: the edges of the window are added again before the next drag, the visibility of the windows
+        # is computed with the next paint
+        if self.snapWindow is not None:
+            self.changedEdgeWindows.add(self.snapWindow)
+        self.snapWindow = None
+        self.draggedWindow = None
 
     def handleResizeDragged(self, window, width, height):
         # get the top level window
         topLevelWindow = window.getTopLevelWindow()
-        # resize the window with the new width and height
-        topLevelWindow.resize(topLevelWindow.x, topLevelWindow.y, width, height)
+        result = None
+        if topLevelWindow.deferLayoutWhileResizing:
+            # live resize: only update the frame, the child windows keep their layout (clipped to the new size) until
+            # the drag ends or the pointer pauses
+            if self.liveResizeWindow is not topLevelWindow:
+                self.liveResizeLayoutSize = (topLevelWindow.width, topLevelWindow.height)
+            topLevelWindow.width = max(self.tlwMinWidth, width)
+            topLevelWindow.height = max(self.tlwMinHeight, height)
+            Window.layoutGeneration += 1
+            self.topLevelWindowChanged(topLevelWindow)
+            self.liveResizeWindow = topLevelWindow
+            self.lastResizeDragTime = time.monotonic()
+            if not self.liveResizeTimerScheduled:
+                self.liveResizeTimerScheduled = True
+                self.windowSystem.scheduleTimer(self.liveResizePauseDelay, self.checkLiveResizePause)
+            # the window keeps its canvas items, only the outline of the new frame is redrawn (in the overlay layer)
+            # instead of repainting the screen after the event, unless the visibility of windows changed
+            if not self.updateVisibility():
+                result = self.windowSystem.repaintLayers(["overlay"])
+        else:
+            # resize the window with the new width and height (the screen is repainted after the event)
+            topLevelWindow.resize(topLevelWindow.x, topLevelWindow.y, width, height)
+        self.windowSystem.sessionChanged()
+        return result
+
+    # timer callback: lays out the live resized window if the pointer paused, otherwise waits for the remaining time
+    def checkLiveResizePause(self):
+        self.liveResizeTimerScheduled = False
+        if self.liveResizeWindow is None:
+            return
+        remaining = self.liveResizePauseDelay - (time.monotonic() - self.lastResizeDragTime) * 1000
+        if remaining > 0:
+            self.liveResizeTimerScheduled = True
+            self.windowSystem.scheduleTimer(int(remaining) + 1, self.checkLiveResizePause)
+            return
+        self.finishLiveResize()
         self.windowSystem.requestRepaint()
 
+    # runs the full resize of the window that was resized without layout (when the resize drag ended or paused)
+    def finishLiveResize(self):
+        window = self.liveResizeWindow
+        self.liveResizeWindow = None
+        self.liveResizeLayoutSize = None
+        # the window might have been closed in the meantime
+        if window is None or window.parentWindow is None:
+            return
+        window.resize(window.x, window.y, window.width, window.height)
+
+    # returns true if the app can release and rebuild its widgets (apps that are still creating them can't)
+    def canHibernate(self, app):
+        return hasattr(app, "releaseWidgets") and hasattr(app, "rebuildWidgets") and getattr(app, "widgetsBuilt", True)
+
+    def updateVisibility(self):
+        """
+        Find out which top-level windows are shown, minimized ("hidden") or completely covered by windows in front of
+        them ("occluded") and notify apps and widgets about changes (see notifyVisibilityChanged). Called before every
+        paint, the visibility is only computed again if windows were added, removed, moved, resized, raised, lowered,
+        minimized or restored since the last paint, and only for these windows and the windows overlapping their old or
+        new rect. While a window is dragged by its title bar, nothing is computed until the drag ends.
+        :return: True if the visibility of a window changed (the notified apps might have changed their content)
+        """
+        if self.draggedWindow is not None:
+            return False
+        topLevelWindows = self.windowSystem.screen.childWindows
+        key = (Window.treeGeneration, Window.layoutGeneration, topLevelWindows.generation, Window.visibilityGeneration)
+        if key == self.visibilityKey:
+            return False
+        zOrderChanged = self.visibilityKey is None or self.visibilityKey[2] != key[2]
+        self.visibilityKey = key
+        order = topLevelWindows.list()
+        frames = {window: ((window.x, window.y, window.x + window.width, window.y + window.height), window.isHidden)
+                  for window in order}
+        # old and new rects of the windows that changed: the other windows can only be covered or uncovered there
+        dirtyRects = [frame[0] for window, frame in self.visibilityFrames.items() if frames.get(window) != frame]
+        changed = reorderedWindows(self.visibilityOrder, order) if zOrderChanged else set()
+        changed.update(window for window in order if self.visibilityFrames.get(window) != frames[window])
+        dirtyRects.extend(frames[window][0] for window in changed)
+        changes = []
+        for index, window in enumerate(order):
+            if window not in changed and not any(intersectionArea(frames[window][0], rect) for rect in dirtyRects):
+                continue
+            # new windows are shown
+            previous = self.windowVisibility.get(window, "shown")
+            if window.isHidden:
+                visibility = "hidden"
+            elif self.isFullyOccluded(window, index):
+                visibility = "occluded"
+            else:
+                visibility = "shown"
+            self.windowVisibility[window] = visibility
+            if visibility == "shown" and previous != "shown":
+                changes.append((window, "shown" if previous == "hidden" else "exposed"))
+            elif visibility != previous:
+                changes.append((window, visibility))
+        # forget closed windows
+        for window in self.visibilityFrames.keys() - frames.keys():
+            self.windowVisibility.pop(window, None)
+        self.visibilityFrames = frames
+        self.visibilityOrder = order
+        for window, event in changes:
+            self.notifyVisibilityChanged(window, event)
+        return bool(changes)
+
+    def notifyVisibilityChanged(self, window, event):
+        """
+        Deliver a visibility change of a top-level window: hibernated apps are woken up first, then the app
+        (handleVisibilityChanged, if it has one) and the widgets of the window are notified.
+        :param window: top-level window
+        :param event: "shown", "hidden", "occluded" or "exposed"
+        """
+        app = self.appsByWindow.get(window)
+        if app is not None:
+            self.updateHibernation(app, event)
+            if hasattr(app, "handleVisibilityChanged"):
+                app.handleVisibilityChanged(event)
+        window.handleVisibilityChanged(event)
+
+    # wakes a hibernated app that became visible or starts the idle time of an app that became invisible
+    def updateHibernation(self, app, event):
+        if event in ("shown", "exposed"):
+            self.hibernationCandidates.pop(app, None)
+            if app in self.hibernatedApps:
+                self.wakeApp(app)
+        elif self.hibernationDelay is not None and app not in self.hibernatedApps:
+            self.hibernationCandidates.setdefault(app, time.monotonic())
+            if not self.hibernationTimerScheduled:
+                self.hibernationTimerScheduled = True
+                self.windowSystem.scheduleTimer(self.hibernationDelay, self.checkHibernation)
+
+    # hibernates the candidates whose idle time is over
+    def checkHibernation(self):
+        self.hibernationTimerScheduled = False
+        now = time.monotonic()
+        nextCheck = None
+        for app, since in list(self.hibernationCandidates.items()):
+            remaining = self.hibernationDelay - (now - since) * 1000
+            if app not in self.windowSystem.apps:
+                # app was closed
+                del self.hibernationCandidates[app]
+            elif remaining > 0 or not self.canHibernate(app):
+                # apps that are still creating their widgets are checked again later
+                remaining = remaining if remaining > 0 else self.hibernationDelay
+                nextCheck = remaining if nextCheck is None else min(nextCheck, remaining)
+            else:
+                del self.hibernationCandidates[app]
+                self.hibernateApp(app)
+        if nextCheck is not None:
+            self.hibernationTimerScheduled = True
+            self.windowSystem.scheduleTimer(int(nextCheck) + 1, self.checkHibernation)
+
+    def hibernateApp(self, app):
+        """
+        Save the state of the app and release its widgets.
+        :param app: app that can hibernate (see canHibernate)
+        """
+        state = app.getState() if hasattr(app, "getState") else None
+        app.releaseWidgets()
+        self.hibernatedApps[app] = state
+
+    def wakeApp(self, app):
+        """
+        Rebuild the widgets of a hibernated app and restore its state. The widgets are created at once for the size
+        the app created them for originally and laid out once at the current size (like a restored session).
+        :param app: hibernated app
+        """
+        state = self.hibernatedApps.pop(app)
+        window = app.appWindow
+        x, y, width, height = window.x, window.y, window.width, window.height
+        window.width, window.height = window.initialSize
+        lazyConstruction = self.windowSystem.lazyConstruction
+        self.windowSystem.lazyConstruction = False
+        try:
+            with deferredLayout():
+                app.rebuildWidgets()
+        finally:
+            self.windowSystem.lazyConstruction = lazyConstruction
+        window.resize(x, y, width, height)
+        if state is not None:
+            app.setState(state)
+
+    # returns the state of an app (e.g. to save the session), hibernated apps return the state they hibernated with
+    def appState(self, app):
+        if app in self.hibernatedApps:
+            return self.hibernatedApps[app]
+        return app.getState() if hasattr(app, "getState") else None
+
+    def isFullyOccluded(self, window, index=None):
+        """
+        :param window: top-level window
+        :param index: position of the window in the z-order (the windows in front of it are looked up if not given)
+        :return: true if the window is completely covered by visible top-level windows in front of it
+        """
+        if index is None:
+            inFront = window.windowsInFront()
+        else:
+            inFront = self.windowSystem.screen.childWindows.list()[index + 1:]
+        left, top, right, bottom = window.x, window.y, window.x + window.width, window.y + window.height
+        occluders = [(max(left, w.x), max(top, w.y), min(right, w.x + w.width), min(bottom, w.y + w.height))
+                     for w in inFront if not w.isHidden]
+        occluders = [rect for rect in occluders if rect[0] < rect[2] and rect[1] < rect[3]]
+        if not occluders:
+            return False
+        # covered by a single window (e.g. a maximized one)
+        if any(rect == (left, top, right, bottom) for rect in occluders):
+            return True
+        # split the window into columns at all vertical edges of the occluders: it is covered if the occluders spanning
+        # each column cover it from top to bottom
+        xs = sorted({left, right}.union(*((x1, x2) for x1, _, x2, _ in occluders)))
+        for x1, x2 in zip(xs, xs[1:]):
+            covered = top
+            for y1, y2 in sorted((oy1, oy2) for ox1, oy1, ox2, oy2 in occluders if ox1 <= x1 and x2 <= ox2):
+                if y1 > covered:
+                    break
+                covered = max(covered, y2)
+            if covered < bottom:
+                return False
+        return True
+
     def handleTitleBarClicked(self, window):
         """
         Checks which title bar button was pressed and calls respective helper function to execute command.
@@ -527,17 +830,25 @@ class WindowManager:
     def closeWindow(self, window):
         # remove the window from the window tree
         window.removeFromParentWindow()
+        self.windowSystem.sessionChanged()
         self.windowSystem.requestRepaint()
         # remove app from the open apps list
-        for app in self.windowSystem.apps:
-            if app.appWindow.identifier == window.identifier:
-                self.windowSystem.apps.remove(app)
+        app = self.appsByWindow.pop(window, None)
+        if app is None:
+            return
+        self.windowSystem.apps.remove(app)
+        self.hibernatedApps.pop(app, None)
+        self.hibernationCandidates.pop(app, None)
+        # stop the process of isolated apps
+        if getattr(app, "isRemote", False):
+            app.shutdown()
 
     def minimizeWindow(self, window):
         # set isHidden so the window isn't drawn anymore
         window.isHidden = True
+        self.topLevelWindowChanged(window)
         # bring the window to the back of the z-index, this makes sure the next window in the z-order is focused
-        window.parentWindow.childWindows.remove(window)
-        window.parentWindow.childWindows.insert(0, window)
+        window.parentWindow.childWindows.lowerWindow(window)
+        self.windowSystem.sessionChanged()
         self.windowSystem.requestRepaint()
 
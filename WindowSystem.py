@@ -7,12 +7,55 @@ by Felix Umland (#406886)
 and Jannick Brändel (#405391)
 """
 import GraphicsEventSystem
+import functools
+import os
 import re
+import time
+from contextlib import contextmanager
+from AppRegistry import defaultRegistry
+from AsyncBridge import AsyncBridge
 from WindowManager import WindowManager
 from UITK import *
 
+# compositing layers of the canvas from back to front, every canvas item is tagged with its layer (and "layered")
+LAYERS = ("desktop", "windows", "chrome", "overlay")
+
+
+# returned by an input event handler that already updated the canvas (e.g. with repaintWidgets): the repaint after the
+# event is skipped, only for this event (see WindowSystem._handleMousePressed)
+HANDLED_WITHOUT_REPAINT = "handledWithoutRepaint"
+
+
+# decorator of the input event handlers: handlingEvent is true while the handler runs
+def inputEvent(handler):
+    @functools.wraps(handler)
+    def handleEvent(self, *args):
+        # input that is still pending when the window system stops (e.g. replayed events) is dropped
+        if self.stopping:
+            return
+        self.handlingEvent = True
+        try:
+            return handler(self, *args)
+        finally:
+            self.handlingEvent = False
+    return handleEvent
+
 
 class WindowSystem(GraphicsEventSystem):
+    # file the desktop is saved to (after changes and on shutdown) and restored from on start (None: sessions are not
+    # saved)
+    sessionPath = None
+    # the session is saved when the desktop did not change for this many milliseconds (see sessionChanged)
+    sessionSaveDelay = 2000
+    # number of frames after which the window system stops (None: run until it is closed)
+    maxFrames = None
+    # true once stop was called
+    stopping = False
+    # input trace that is replayed after the start (None: no replay, see Replay)
+    replayPath = None
+    # class names of apps that run in a separate process (see RemoteApp)
+    isolatedApps = ()
+
     def start(self):
         """
         Prepare screen and initialize needed attributes (e.g. mouse-click tolerance).
@@ -40,6 +83,61 @@ class WindowSystem(GraphicsEventSystem):
         self.mouseClickTolerance = 2
         # list of apps
         self.apps = []
+        # highest instance number of each app name (see getInstanceNumber)
+        self.instanceNumbers = {}
+        # true while an input event handler runs
+        self.handlingEvent = False
+        # draw functions of the layers that can be redrawn without a complete repaint (see repaintLayers)
+        self.layerPainters = {"chrome": self.windowManager.drawTaskbar, "overlay": self.windowManager.drawOverlays}
+        # apps create their widgets step by step after their window is shown (see buildInChunks)
+        self.lazyConstruction = True
+        # asyncio loop for coroutine handlers and background tasks of apps
+        self.asyncBridge = AsyncBridge(self)
+        self.bindMouseWheel()
+        # number of complete frames painted so far
+        self.framesPainted = 0
+        # time of the last change of the desktop and whether a timer is waiting to save the session
+        self.lastSessionChange = 0
+        self.sessionSaveScheduled = False
+        # task writing the session file (see saveSessionInBackground)
+        self.sessionSaveTask = None
+        # reopen the apps of the last session
+        if self.sessionPath is not None and os.path.exists(self.sessionPath):
+            self.restoreSession()
+        if self.replayPath is not None:
+            import Replay
+            Replay.replayTrace(self, Replay.loadTrace(self.replayPath))
+
+    def bindMouseWheel(self):
+        """
+        Forward mouse wheel events of the Tk canvas to handleMouseWheel (not part of the GraphicsEventSystem events).
+        """
+        if not hasattr(self, "_canvas"):
+            return
+        # Windows and macOS send <MouseWheel> events, X11 sends presses of the mouse buttons 4 and 5
+        self._canvas.bind("<MouseWheel>", lambda event: self.handleMouseWheel(event.x, event.y,
+                                                                              1 if event.delta > 0 else -1))
+        self._canvas.bind("<Button-4>", lambda event: self.handleMouseWheel(event.x, event.y, 1))
+        self._canvas.bind("<Button-5>", lambda event: self.handleMouseWheel(event.x, event.y, -1))
+
+    def scheduleTimer(self, delay, callback, *args):
+        """
+        Call the given function once on the ui thread after the given delay.
+        :param delay: delay in milliseconds
+        :param callback: function that is called
+        :param args: arguments passed to the function
+        :return: timer id
+        """
+        return self._window.after(delay, callback, *args)
+
+    def stop(self):
+        """
+        Close the window system after the current event (without saving the session). Input events and repaints after
+        this are ignored, so e.g. the frame limit also holds if more events are due.
+        """
+        self.stopping = True
+        self._window.after(0, self._window.destroy)
+
     """
     WINDOW MANAGEMENT
     """
@@ -63,74 +161,344 @@ class WindowSystem(GraphicsEventSystem):
         """
         Find top-level window the specified window is a child of and bring it to front.
         :param window: window which was selected.
+        :return: True if the z-order changed, False if the window already was in front
         """
         # if screen is clicked don't bring it to front
         if window.parentWindow is None:
-            return
+            return False
 
         # find top level window this window belongs to
         topLevelWindow = window.getTopLevelWindow()
 
-        # calculate new position
-        topLevelWindow.x, topLevelWindow.y = topLevelWindow.convertPositionToScreen(0, 0)
-        # remove the parent
-        topLevelWindow.removeFromParentWindow()
-        # add window as top level window
-        self.screen.addChildWindow(topLevelWindow)
+        # raise the window in the z-order of the screen, nothing changes if it already is the focused window
+        if not self.screen.childWindows.raiseWindow(topLevelWindow):
+            return False
+        self.sessionChanged()
+        return True
+
+    def saveSession(self):
+        """
+        Save the open apps (window positions, z-order, app state) to the session file, if a session path is set.
+        """
+        if self.sessionPath is not None:
+            import Session
+            Session.saveSession(self, self.sessionPath)
+
+    def restoreSession(self):
+        """
+        Reopen the apps saved in the session file.
+        :return: list of the restored apps
+        """
+        import Session
+        return Session.loadSession(self, self.sessionPath)
+
+    def sessionChanged(self):
+        """
+        Save the session once the desktop did not change for sessionSaveDelay milliseconds (apps opened or closed,
+        windows moved, resized, raised or minimized), so it is restored after the window system was killed or the
+        power was lost. Changes in quick succession (e.g. a drag) are saved once.
+        """
+        if self.sessionPath is None:
+            return
+        self.lastSessionChange = time.monotonic()
+        if not self.sessionSaveScheduled:
+            self.sessionSaveScheduled = True
+            self.scheduleTimer(self.sessionSaveDelay, self.checkSessionSave)
+
+    # timer callback: saves the session if the desktop did not change for the delay, otherwise waits for the rest of it
+    def checkSessionSave(self):
+        self.sessionSaveScheduled = False
+        remaining = self.sessionSaveDelay - (time.monotonic() - self.lastSessionChange) * 1000
+        if self.sessionSaveTask is not None and not self.sessionSaveTask.done():
+            # the previous save is still being written, the changes are saved after it
+            remaining = max(remaining, self.asyncBridge.tickInterval)
+        if remaining > 0:
+            self.sessionSaveScheduled = True
+            self.scheduleTimer(int(remaining) + 1, self.checkSessionSave)
+            return
+        self.sessionSaveTask = self.asyncBridge.runTask(self.saveSessionInBackground())
+
+    async def saveSessionInBackground(self):
+        # the windows are serialized on the ui thread, the file is written and synced by a worker thread
+        import Session
+        data = Session.serializeSession(self)
+        await self.asyncBridge.runInBackground(Session.writeSessionFile, self.sessionPath, data)
 
     """
     DRAWING
     """
 
+    def requestRepaint(self):
+        """
+        Repaint the complete screen, unless the window system stops.
+        """
+        if self.stopping:
+            return
+        super().requestRepaint()
+
+    def repaintAfterEvent(self, result):
+        """
+        Repaint the screen after an input event, unless its handler returned HANDLED_WITHOUT_REPAINT.
+        :param result: return value of the handler
+        """
+        if result != HANDLED_WITHOUT_REPAINT:
+            self.requestRepaint()
+
+    @contextmanager
+    def drawingOnCanvas(self):
+        """
+        Draw outside of handlePaint on top of the current frame (the canvas is not cleared), for partial repaints.
+        :return: graphics context to draw with
+        """
+        ctx = self.graphicsContext
+        ctx._isDrawing = True
+        try:
+            yield ctx
+        finally:
+            ctx._isDrawing = False
+
+    def repaintWidgets(self, widgets, afterEvent=True):
+        """
+        Redraw only the given widgets (e.g. buttons that changed their state) on top of the current frame. Falls back to
+        a full repaint if one of them can't be drawn alone.
+        :param widgets: widgets that changed
+        :param afterEvent: true if called by an event handler the screen is repainted after (mouse pressed, released,
+        dragged, key pressed), the handler returns the result then
+        :return: HANDLED_WITHOUT_REPAINT if the widgets were redrawn, None if the screen has to be repainted
+        """
+        if not all(self.canRepaintAlone(widget) for widget in widgets):
+            if not afterEvent:
+                self.requestRepaint()
+            return None
+        with self.drawingOnCanvas() as ctx:
+            for widget in widgets:
+                widget.draw(ctx)
+                self.endWindowItems(widget.getTopLevelWindow(), below="chrome")
+        return HANDLED_WITHOUT_REPAINT
+
+    def repaintLayers(self, layers, afterEvent=True):
+        """
+        Redraw only the given layers (e.g. the start menu in the overlay layer), the items of the other layers stay on
+        the canvas. Falls back to a full repaint if there is no canvas (headless backend).
+        :param layers: names of the layers (chrome or overlay, see LAYERS)
+        :param afterEvent: true if called by an event handler the screen is repainted after, the handler returns the
+        result then
+        :return: HANDLED_WITHOUT_REPAINT if the layers were redrawn, None if the screen has to be repainted
+        """
+        canvas = getattr(self, "_canvas", None)
+        if canvas is None:
+            if not afterEvent:
+                self.requestRepaint()
+            return None
+        with self.drawingOnCanvas() as ctx:
+            for layer in layers:
+                canvas.delete(layer)
+                self.layerPainters[layer](ctx)
+                self.endLayer(layer)
+        # the redrawn items are on top now: restore the order of the layers in front of them
+        for layer in LAYERS[min(LAYERS.index(layer) for layer in layers) + 1:]:
+            canvas.tag_raise(layer)
+        return HANDLED_WITHOUT_REPAINT
+
+    def endWindowItems(self, topLevelWindow, below=None):
+        """
+        Tag the canvas items that were drawn since the last call as items of the given top-level window (in the windows
+        layer), so the window can be moved and raised on the canvas without drawing it again.
+        :param topLevelWindow: window the items belong to
+        :param below: tag the items are moved below (items drawn after the layers in front of the windows)
+        """
+        canvas = getattr(self, "_canvas", None)
+        if canvas is not None:
+            if below is not None:
+                canvas.tag_lower("!layered", below)
+            canvas.addtag_withtag(self.canvasTagOf(topLevelWindow), "!layered")
+            self.endLayer("windows")
+
+    @staticmethod
+    def canvasTagOf(topLevelWindow):
+        """
+        :return: tag of the canvas items of a top-level window
+        """
+        return "window" + str(id(topLevelWindow))
+
+    def moveWindowItems(self, topLevelWindow, deltaX, deltaY):
+        """
+        Move a top-level window on the canvas with the items of the last paint. Does nothing (the screen is repainted)
+        if there is no canvas. The visibility of the windows is computed when the drag ends (see
+        WindowManager.updateVisibility).
+        :param topLevelWindow: window that was moved
+        :param deltaX: distance moved horizontally
+        :param deltaY: distance moved vertically
+        :return: HANDLED_WITHOUT_REPAINT if the items were moved, None if the screen has to be repainted
+        """
+        canvas = getattr(self, "_canvas", None)
+        if canvas is None or topLevelWindow.isHidden:
+            return None
+        canvas.move(self.canvasTagOf(topLevelWindow), deltaX, deltaY)
+        return HANDLED_WITHOUT_REPAINT
+
+    def raiseWindowItems(self, topLevelWindow, previousFront):
+        """
+        Bring the canvas items of a top-level window that was raised in front of the other windows and redraw what
+        depends on the focus: the title bars of it and the previously focused window and the taskbar.
+        :param topLevelWindow: window that is in front now
+        :param previousFront: window that was in front before
+        :return: True if the canvas was updated, False if the screen has to be repainted
+        """
+        canvas = getattr(self, "_canvas", None)
+        if canvas is None or previousFront is None or previousFront.isHidden or topLevelWindow.isHidden:
+            return False
+        # top of the windows layer is right below the taskbar
+        canvas.tag_lower(self.canvasTagOf(topLevelWindow), "chrome")
+        # windows that are uncovered or covered now are notified, they might change their content
+        if self.windowManager.updateVisibility():
+            return False
+        with self.drawingOnCanvas() as ctx:
+            self.windowManager.redrawTitleBar(topLevelWindow, ctx)
+            self.endWindowItems(topLevelWindow, below="chrome")
+            # the previous window is right behind the raised one
+            self.windowManager.redrawTitleBar(previousFront, ctx)
+            self.endWindowItems(previousFront, below=self.canvasTagOf(topLevelWindow))
+        # the taskbar shows which window is in front
+        self.repaintLayers(["chrome"], afterEvent=False)
+        return True
+
+    def endLayer(self, layer):
+        """
+        Tag the canvas items that were drawn since the last call as items of the given layer.
+        :param layer: name of the layer (see LAYERS)
+        """
+        canvas = getattr(self, "_canvas", None)
+        if canvas is not None:
+            canvas.addtag_withtag(layer, "!layered")
+            canvas.addtag_withtag("layered", layer)
+
+    def canRepaintAlone(self, widget):
+        """
+        A widget can be redrawn alone if nothing is drawn on top of it in a full repaint: no other top-level window,
+        window decorations, the taskbar or the start menu may overlap it.
+        :param widget: widget without child windows
+        :return: true if the widget can be redrawn without repainting the screen
+        """
+        if widget.childWindows:
+            return False
+        # the widget and all its parents have to be visible
+        window = widget
+        while window.parentWindow is not self.screen:
+            if window.isHidden or window.parentWindow is None:
+                return False
+            window = window.parentWindow
+        topLevelWindow = window
+        if topLevelWindow.isHidden:
+            return False
+
+        x1, y1 = widget.convertPositionToScreen(0, 0)
+        width, height = widget.getDrawingSize()
+        x2, y2 = x1 + width, y1 + height
+
+        def overlaps(left, top, right, bottom):
+            return x1 <= right and left <= x2 and y1 <= bottom and top <= y2
+
+        # title bar, border and resize corner of the own window
+        windowManager = self.windowManager
+        corner = windowManager.resizeCornerTolerance
+        tlX, tlY = topLevelWindow.x, topLevelWindow.y
+        if (y1 <= tlY + windowManager.titleBarHeight or x1 <= tlX or x2 >= tlX + topLevelWindow.width
+                or y2 >= tlY + topLevelWindow.height
+                or overlaps(tlX + topLevelWindow.width - corner, tlY + topLevelWindow.height - corner,
+                            tlX + topLevelWindow.width, tlY + topLevelWindow.height)):
+            return False
+        # top-level windows in front of the own window
+        for other in topLevelWindow.windowsInFront():
+            if not other.isHidden and overlaps(other.x, other.y, other.x + other.width, other.y + other.height):
+                return False
+        # taskbar and start menu
+        if overlaps(0, self.height - windowManager.taskBarHeight, self.width, self.height):
+            return False
+        if windowManager.startMenuVisible and overlaps(0, self.height - windowManager.taskBarHeight
+                                                       - windowManager.startMenuHeight, windowManager.startMenuWidth,
+                                                       self.height):
+            return False
+        return True
+
     def handlePaint(self):
         """
-        Repaint the screen, taskbar and start menu by calling the draw function.
+        Repaint the screen, taskbar and start menu by calling the draw function. The items are tagged with their layer,
+        so the taskbar and the start menu can be redrawn alone (see repaintLayers).
         """
+        # apply ui updates of async app tasks in one batch before drawing
+        self.asyncBridge.flushUpdates()
+        # keep checking for updates of threads started by the last event
+        self.asyncBridge.watchThreads()
+        # notify apps about windows that were shown or hidden (wakes hibernated apps that are visible again)
+        self.windowManager.updateVisibility()
         self.screen.draw(self.graphicsContext)
         self.windowManager.drawTaskbar(self.graphicsContext)
-        if self.windowManager.startMenuVisible:
-            self.windowManager.drawStartMenu(self.graphicsContext)
+        self.endLayer("chrome")
+        self.windowManager.drawOverlays(self.graphicsContext)
+        self.endLayer("overlay")
+        self.framesPainted += 1
+        if self.framesPainted == self.maxFrames:
+            self.stop()
 
     """
     INPUT EVENTS
     """
 
+    # the framework calls these with the tkinter events and repaints the screen after every event: only repaint if the
+    # handler did not update the canvas itself
+    def _handleMousePressed(self, event):
+        self.repaintAfterEvent(self.handleMousePressed(event.x, event.y))
+
+    def _handleMouseReleased(self, event):
+        self.repaintAfterEvent(self.handleMouseReleased(event.x, event.y))
+
+    def _handleMouseDragged(self, event):
+        self.repaintAfterEvent(self.handleMouseDragged(event.x, event.y))
+
+    def _handleKeyPressed(self, event):
+        self.repaintAfterEvent(self.handleKeyPressed(event.char))
+
+    @inputEvent
     def handleMousePressed(self, x, y):
         """
         When the left mouse button is pressed, bring selected window to front, update buttons and sliders,
         update temp variables for dragging and repaint the screen.
         :param x: x value of mouse position when pressed
         :param y: y value of mouse position when pressed
+        :return: HANDLED_WITHOUT_REPAINT if the screen doesn't have to be repainted
         """
         # save mouse position to check when button is released
         self.tempMouseDown = (x, y)
 
         # check if the start menu was clicked
-        if (self.windowManager.startMenuVisible and x <= self.windowManager.startMenuWidth
-                and self.height - self.windowManager.startMenuHeight - self.windowManager.taskBarHeight <= y <= self.height - self.windowManager.taskBarHeight):
-            # start menu was pressed
-            return
+        if self.windowManager.isInStartMenu(x, y):
+            # start menu was pressed, nothing changes until it is released
+            return HANDLED_WITHOUT_REPAINT
 
         # check if the taskbar was clicked
         if y >= self.height - self.windowManager.taskBarHeight:
             # task bar was clicked, do nothing
-            return
+            return HANDLED_WITHOUT_REPAINT
         # check which window was pressed
         child = self.screen.childWindowAtLocation(x, y)
+        result = None
         if child:
             if child.identifier == "SCREEN":
-                return
-            self.bringWindowToFront(child)
-            # check if button was pressed and change its state accordingly
-            if isinstance(child,Button):
-                child.changeState("PRESSED")
-                self.requestRepaint()
-            # check if slider was pressed and change its state accordingly
-            elif isinstance(child, Slider):
-                child.changeState("PRESSED")
-                localX, _ = child.convertPositionFromScreen(x, y)
-                child.changeSlider(localX)
-                self.requestRepaint()
+                return None
+            previousFront = self.screen.childWindows.front()
+            windowRaised = self.bringWindowToFront(child)
+            # bring the items of the raised window to the front instead of repainting the screen after the event
+            raisedItems = windowRaised and self.raiseWindowItems(child.getTopLevelWindow(), previousFront)
+            if raisedItems and type(child) is Window:
+                # nothing else changes when a window or its title bar is pressed
+                result = HANDLED_WITHOUT_REPAINT
+            # press buttons and sliders, remember the scroll position of lists for dragging and forward the press to
+            # apps running in another process
+            pressWidget(child, x, y)
+            # only a pressed button changed: redraw it instead of repainting the screen after the event
+            if isinstance(child, Button) and (not windowRaised or raisedItems):
+                result = self.repaintWidgets([child])
 
             # DRAGGING TEMP VARIABLES
             # save which window was pressed for dragging
@@ -146,14 +514,18 @@ class WindowSystem(GraphicsEventSystem):
             # check if resizing icon in bottom left of window was pressed
             if x > topLevelWindow.x + topLevelWindow.width - self.windowManager.resizeCornerTolerance and y > topLevelWindow.y + topLevelWindow.height - self.windowManager.resizeCornerTolerance:
                 self.tempMouseDownResizing = True
+        return result
 
+    @inputEvent
     def handleMouseReleased(self, x, y):
         """
         When the left mouse button is released, check if mouse click occurred and send event to respective child
         window OR window manager if title bar was clicked.
         :param x: x value of mouse position when released
         :param y: y value of mouse position when released
+        :return: HANDLED_WITHOUT_REPAINT if the screen doesn't have to be repainted
         """
+        result = None
         # calculate distance between release and pressed position
         deltaX, deltaY = abs(self.tempMouseDown[0] - x), abs(self.tempMouseDown[1] - y)
         # if distance is less than mouseClickTolerance send mouse-click event to child where click occurred.
@@ -161,9 +533,8 @@ class WindowSystem(GraphicsEventSystem):
             # check if taskbar is clicked (without checking the start menu)
             if y >= self.height - self.windowManager.taskBarHeight:
                 # task bar was clicked
-                self.windowManager.handleTaskBarClicked(x)
-            elif (self.windowManager.startMenuVisible and x <= self.windowManager.startMenuWidth
-                  and self.height - self.windowManager.startMenuHeight - self.windowManager.taskBarHeight <= y <= self.height - self.windowManager.taskBarHeight):
+                result = self.windowManager.handleTaskBarClicked(x)
+            elif self.windowManager.isInStartMenu(x, y):
                 # start menu was clicked
                 self.windowManager.handleStartMenuClicked(y)
             else:
@@ -180,57 +551,64 @@ class WindowSystem(GraphicsEventSystem):
                         clickedWindow.handleMouseClicked(x, y)
                         self.requestRepaint()
 
-        # Slider update
-        if isinstance(self.tempMouseDownWindow, Slider):
-            self.tempMouseDownWindow.changeState("NORMAL")
+        # release sliders
+        if self.tempMouseDownWindow is not None:
+            releaseWidget(self.tempMouseDownWindow, x, y)
+
+        # resize drag ended: lay out a window that was resized without layout
+        if self.tempMouseDownResizing:
+            self.windowManager.finishLiveResize()
+        # title bar drag ended
+        self.windowManager.endTitleBarDrag()
 
         # reset temp variables
         self.tempMouseDownWindow = None
         self.tempMouseDownTLWindow = None
         self.tempMouseDownResizing = False
+        return result
 
+    @inputEvent
     def handleMouseMoved(self, x, y):
         hoveredWindow = self.screen.childWindowAtLocation(x, y)
+        # true if the screen has to be repainted completely
+        repaint = False
         # check if start menu is hovered
-        if (self.windowManager.startMenuVisible and x <= self.windowManager.startMenuWidth
-                and self.height - self.windowManager.startMenuHeight - self.windowManager.taskBarHeight <= y <= self.height - self.windowManager.taskBarHeight):
+        if self.windowManager.isInStartMenu(x, y):
             # start menu was hovered, now highlight the element at that location
+            previousItem = self.windowManager.startMenuItemHovered
             self.windowManager.handleStartMenuHovered(y)
-        if isinstance(hoveredWindow, Button):
-            # mouse is moved over a button -> change its state to HOVERED
-            hoveredWindow.changeState("HOVERED")
-        elif isinstance(self.tempHoveredWindow, Button):
-            # mouse moved away from button -> change its state to NORMAL
-            self.tempHoveredWindow.changeState("NORMAL")
-        if self.tempHoveredWindow != hoveredWindow:
-            if isinstance(self.tempHoveredWindow, Button):
-                # make sure that the last hovered window is set to normal again
-                # this makes sure that fast mouse movements don't create several hovered buttons
-                self.tempHoveredWindow.changeState("NORMAL")
+            repaint = previousItem != self.windowManager.startMenuItemHovered
+        # buttons that changed their state and have to be redrawn
+        changedWidgets = hoverWidget(self.tempHoveredWindow, hoveredWindow, x, y)
 
         self.tempHoveredWindow = hoveredWindow
-        self.requestRepaint()
+        # the framework does not repaint after mouse moves: only repaint what changed
+        if changedWidgets:
+            self.repaintWidgets(changedWidgets, afterEvent=False)
+        if repaint:
+            # the start menu is drawn on top of everything else
+            self.repaintLayers(["overlay"], afterEvent=False)
 
+    @inputEvent
     def handleMouseDragged(self, x, y):
         # position of last MousePressed event
         clickedX, clickedY = self.tempMouseDown
         if self.tempMouseDownWindow is None:
-            return
+            return None
+        result = None
         # window where last MousePressed event occurred on
         window = self.tempMouseDownWindow
         # calculate the delta between the originally clicked position and the current drag position
         deltaX, deltaY = x - clickedX, y - clickedY
 
-        # update slider while it is dragged (if current window is a slider)
-        if isinstance(window, Slider):
-            window.changeState("PRESSED")
-            localX, _ = window.convertPositionFromScreen(x, y)
-            window.changeSlider(localX)
-            self.requestRepaint()
+        # move sliders and scroll lists while they are dragged, forward the drag to apps running in another process
+        if not self.tempMouseDownResizing and not dragWidget(window, x, y, deltaY) and isinstance(window, Slider):
+            # the slider only has to be redrawn if its value changed (the action runs before the next paint)
+            result = HANDLED_WITHOUT_REPAINT
 
         # if window is resized, send resized event to WM and let it resize the window
         if self.tempMouseDownResizing:
-            self.windowManager.handleResizeDragged(
+            result = self.windowManager.handleResizeDragged(
                 window,
                 self.tempMouseDownDimensions[0] + deltaX,
                 self.tempMouseDownDimensions[1] + deltaY
@@ -239,14 +617,34 @@ class WindowSystem(GraphicsEventSystem):
         if "- Title Bar" in window.identifier and "Button" not in window.identifier:
             # title bar is dragged but not title bar buttons
             # reposition the window with the absolute position and mouse offset
-            self.windowManager.handleTitleBarDragged(
+            result = self.windowManager.handleTitleBarDragged(
                 self.tempMouseDownTLWindow,
                 clickedX + deltaX,
                 clickedY + deltaY,
                 self.tempMouseDragOffset[0],
                 self.tempMouseDragOffset[1]
             )
+        return result
 
+    @inputEvent
+    def handleMouseWheel(self, x, y, delta):
+        """
+        Scroll the list or start menu at the mouse position.
+        :param x: x value of mouse position
+        :param y: y value of mouse position
+        :param delta: wheel steps, positive when scrolling up
+        """
+        if self.windowManager.isInStartMenu(x, y):
+            self.windowManager.scrollStartMenu(delta)
+            self.windowManager.handleStartMenuHovered(y)
+            self.requestRepaint()
+            return
+        listView = listViewOf(self.screen.childWindowAtLocation(x, y))
+        if listView is not None:
+            listView.handleMouseWheel(delta)
+            self.requestRepaint()
+
+    @inputEvent
     def handleKeyPressed(self, char):
         if len(self.screen.childWindows) == 0:
             # no app is opened, key presses should not do anything here
@@ -263,21 +661,78 @@ class WindowSystem(GraphicsEventSystem):
                 if char == "n":
                     # pressing n should result in +/- (negate)
                     char = "+/-"
-                # pass key input
-                app.handleInput(char)
+                # pass key input (handler may be a coroutine)
+                self.asyncBridge.runHandler(app.handleInput, char)
 
     # When opening a new instance of an app, this function will be called
     # it returns a unique instance number that is then used for the identifier
     def getInstanceNumber(self, appName):
-        openInstances = 0
-        # check if the window is already open
-        for app in reversed(self.apps):
-            if appName in app.appWindow.identifier:
-                # find the highest instance number of this app
-                openInstances = int(re.findall("[0-9]+", app.appWindow.identifier)[0])
-                break
-        return str(openInstances + 1)
+        # numbers are counted per app name and not reused, so the identifiers of open windows stay unique
+        number = self.instanceNumbers.get(appName, 0) + 1
+        self.instanceNumbers[appName] = number
+        return str(number)
+
+    def registerIdentifier(self, identifier):
+        """
+        Advance the instance number of an app past the number of a window identifier that was not assigned by
+        getInstanceNumber (e.g. restored from a session).
+        :param identifier: identifier of a top-level window ("<number> <app name>")
+        """
+        number, _, appName = identifier.partition(" ")
+        if number.isdigit():
+            self.instanceNumbers[appName] = max(self.instanceNumbers.get(appName, 0), int(number))
+
+
+def main(arguments=None):
+    """
+    Start the window system from the command line.
+    :param arguments: command line arguments (None: sys.argv)
+    """
+    # imported here, so importing the window system as a library stays fast
+    import argparse
+    parser = argparse.ArgumentParser(description="Start the window system.")
+    parser.add_argument("--resolution", default="1600x800", help="screen size as WIDTHxHEIGHT")
+    parser.add_argument("--backend", choices=["tk", "headless"], default="tk",
+                        help="tk opens a window, headless draws into a framebuffer (no display needed)")
+    parser.add_argument("--profile", nargs="?", const="", metavar="FILE",
+                        help="run with cProfile and print the stats (or save them to FILE)")
+    parser.add_argument("--replay", metavar="TRACE", help="replay an input trace (JSON lines, see Replay)")
+    parser.add_argument("--frames", type=int, metavar="N", help="stop after N frames")
+    parser.add_argument("--session", metavar="FILE", help="restore the desktop from FILE and save it there after changes and on shutdown")
+    parser.add_argument("--isolate", action="append", default=[], metavar="APP",
+                        choices=sorted(defaultRegistry.entriesByClassName),
+                        help="run the app with class name APP (e.g. CalculatorApp) in a separate process, repeatable")
+    arguments = parser.parse_args(arguments)
+    match = re.fullmatch(r"(\d+)x(\d+)", arguments.resolution)
+    if match is None:
+        parser.error("resolution must be given as WIDTHxHEIGHT, e.g. 1600x800")
+    width, height = int(match.group(1)), int(match.group(2))
+
+    bases = (WindowSystem,)
+    if arguments.backend == "headless":
+        from HeadlessEventSystem import HeadlessEventSystem
+        bases = (WindowSystem, HeadlessEventSystem)
+    # options are class attributes, because the framework starts the window system in the constructor
+    windowSystemClass = type("WindowSystem", bases, {"sessionPath": arguments.session, "maxFrames": arguments.frames,
+                                                     "replayPath": arguments.replay,
+                                                     "isolatedApps": tuple(arguments.isolate)})
+
+    if arguments.profile is None:
+        windowSystemClass(width, height)
+        return
+    import cProfile
+    import pstats
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(windowSystemClass, width, height)
+    finally:
+        if arguments.profile:
+            profiler.dump_stats(arguments.profile)
+        else:
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
 
 
 # Let's start your window system!
-w = WindowSystem(1600, 800)
+if __name__ == "__main__":
+    # guarded, so app processes (see RemoteApp) can import modules without starting another window system
+    main()
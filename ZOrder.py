@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import takewhile
+
+
+def reorderedWindows(previousOrder, order):
+    """
+    Compare two z-orders of windows.
+    :param previousOrder: list of windows from back to front
+    :param order: list of windows from back to front (windows that were added or removed are ignored)
+    :return: set of the fewest windows that moved in the z-order, the other windows kept their order relative to each
+    other (e.g. only the raised window)
+    """
+    previousPosition = {window: i for i, window in enumerate(previousOrder)}
+    windows = [window for window in order if window in previousPosition]
+    # longest increasing subsequence of the previous positions: the windows in it kept their relative order
+    # tails[k]: smallest previous position a subsequence of length k + 1 ends with, ends[k]: index of that window
+    tails, ends = [], []
+    predecessors = [None] * len(windows)
+    for i, window in enumerate(windows):
+        k = bisect_left(tails, previousPosition[window])
+        if k == len(tails):
+            tails.append(previousPosition[window])
+            ends.append(i)
+        else:
+            tails[k] = previousPosition[window]
+            ends[k] = i
+        predecessors[i] = ends[k - 1] if k > 0 else None
+    kept = set()
+    i = ends[-1] if ends else None
+    while i is not None:
+        kept.add(windows[i])
+        i = predecessors[i]
+    return {window for window in windows if window not in kept}
+
+
+class ZOrder:
+    """
+    Ordered set of the top-level windows from back to front, used as the child window list of the screen. Raising and
+    lowering a window is O(1) and does nothing if the window already is at that end, so the window tree and caches
+    depending on it stay valid. Supports the list operations used on child window lists (iteration, indexing, append,
+    insert, remove), the window objects themselves are the handles. Positions are not stored: index, indexing and
+    inserting in the middle are O(n), callers that need the windows in front of a window use inFrontOf instead.
+    """
+    def __init__(self, windows=()):
+        self.windows = OrderedDict((window, None) for window in windows)
+        # increased on every change of the order, caches compare it to find out if they are still valid
+        self.generation = 0
+        # list of the windows in z-order, rebuilt lazily after the order changed
+        self.snapshot = None
+
+    def changed(self):
+        self.generation += 1
+        self.snapshot = None
+
+    def list(self):
+        """
+        :return: list of the windows from back to front (must not be modified)
+        """
+        if self.snapshot is None:
+            self.snapshot = list(self.windows)
+        return self.snapshot
+
+    def front(self):
+        """
+        :return: frontmost (focused) window or None if there are no windows
+        """
+        if not self.windows:
+            return None
+        return next(reversed(self.windows))
+
+    def inFrontOf(self, window):
+        """
+        :param window: window that is part of the z-order
+        :return: list of the windows in front of the given one, from back to front (found from the front, so the cost
+        depends on the number of these windows instead of the number of all windows)
+        """
+        windows = list(takewhile(lambda other: other is not window, reversed(self.windows)))
+        windows.reverse()
+        return windows
+
+    def raiseWindow(self, window):
+        """
+        Bring the given window to the front.
+        :param window: window that is already part of the z-order
+        :return: True if the order changed, False if the window already was frontmost
+        """
+        if self.front() is window:
+            return False
+        self.windows.move_to_end(window)
+        self.changed()
+        return True
+
+    def lowerWindow(self, window):
+        """
+        Move the given window to the back.
+        :param window: window that is already part of the z-order
+        :return: True if the order changed, False if the window already was at the back
+        """
+        if next(iter(self.windows)) is window:
+            return False
+        self.windows.move_to_end(window, last=False)
+        self.changed()
+        return True
+
+    def append(self, window):
+        self.windows[window] = None
+        self.windows.move_to_end(window)
+        self.changed()
+
+    def insert(self, index, window):
+        if index == 0:
+            self.windows[window] = None
+            self.windows.move_to_end(window, last=False)
+            self.changed()
+        elif index >= len(self.windows):
+            self.append(window)
+        else:
+            windows = [w for w in self.list() if w is not window]
+            windows.insert(index, window)
+            self.windows = OrderedDict((w, None) for w in windows)
+            self.changed()
+
+    def remove(self, window):
+        if window not in self.windows:
+            raise ValueError("Window is not part of the z-order")
+        del self.windows[window]
+        self.changed()
+
+    def index(self, window):
+        return self.list().index(window)
+
+    def __contains__(self, window):
+        return window in self.windows
+
+    def __len__(self):
+        return len(self.windows)
+
+    def __getitem__(self, index):
+        return self.list()[index]
+
+    def __iter__(self):
+        # iterate over the snapshot, so the order can be changed while iterating
+        return iter(self.list())
+
+    def __reversed__(self):
+        return reversed(self.list())
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+
+Behaviour tests of the window system. Run them from the repository root with Python 3.12 (the version
+GraphicsEventSystem.pyc was compiled for): python -m unittest
+"""
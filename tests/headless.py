@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+from HeadlessEventSystem import HeadlessEventSystem
+from WindowSystem import WindowSystem
+
+
+class ScriptedWindowSystem(WindowSystem, HeadlessEventSystem):
+    """
+    Window system on the headless backend that runs a test script after the first paint. Apps build their widgets
+    right away and don't hibernate, so the script sees their complete state. The main loop (and the constructor) ends
+    once the script and the timers it scheduled are done, exceptions of the script are raised by the constructor.
+    """
+    script = None
+
+    def start(self):
+        super().start()
+        self.lazyConstruction = False
+        self.windowManager.hibernationDelay = None
+        self.scheduleTimer(0, self.script)
+
+
+def runHeadless(script, width=1600, height=800, **options):
+    """
+    Start a headless window system and run the script in it.
+    :param script: function called with the window system
+    :param width: screen width
+    :param height: screen height
+    :param options: class attributes of the window system (e.g. sessionPath, see WindowSystem.main)
+    :return: the window system after its main loop ended
+    """
+    options["script"] = script
+    return type("WindowSystem", (ScriptedWindowSystem,), options)(width, height)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import AppRegistry
+from AppRegistry import AppRegistry as Registry, defaultRegistry
+
+DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_MODULES = ["HelloWorldApp", "ColorsApp", "CalculatorApp", "ResizingApp"]
+
+
+class AppRegistryTest(unittest.TestCase):
+    def testModuleIsImportedOnFirstLaunch(self):
+        registry = Registry()
+        registry.registerApp("Decoder", "json", "JSONDecoder", 10, 20)
+        self.assertEqual(registry.loadedClasses, {})
+        with mock.patch.object(AppRegistry.importlib, "import_module", wraps=AppRegistry.importlib.import_module) as \
+                importModule:
+            self.assertIs(registry.loadClass("JSONDecoder"), json.JSONDecoder)
+            self.assertIs(registry.loadClass("JSONDecoder"), json.JSONDecoder)
+        importModule.assert_called_once_with("json")
+        # the factory creates the app with the window manager
+        windowManager = mock.Mock()
+        registry.entries[0].factory(windowManager, 10, 20)
+        windowManager.createApp.assert_called_once_with(json.JSONDecoder, 10, 20)
+
+    def testEntries(self):
+        self.assertEqual([entry.name for entry in defaultRegistry.entries],
+                         ["Hello World", "Colors", "Calculator", "Resizing", "Shutdown"])
+        self.assertIs(defaultRegistry.entryForClassName("CalculatorApp"), defaultRegistry.entries[2])
+        self.assertIsNone(defaultRegistry.entryForClassName("Shutdown"))
+        self.assertFalse(defaultRegistry.isIsolated("CalculatorApp"))
+
+    def testImportingTheWindowSystemDoesNotImportApps(self):
+        # in a fresh interpreter, the apps of this process are already imported by other tests
+        script = "import sys, WindowSystem; print(' '.join(sorted(sys.modules)))"
+        result = subprocess.run([sys.executable, "-c", script], cwd=DIRECTORY, capture_output=True, text=True,
+                                check=True)
+        modules = result.stdout.split()
+        self.assertIn("WindowManager", modules)
+        for module in APP_MODULES:
+            self.assertNotIn(module, modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
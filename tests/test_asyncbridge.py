@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import Session
+from tests.headless import runHeadless
+
+
+class AsyncBridgeTest(unittest.TestCase):
+    def testCoroutineHandler(self):
+        results = {}
+
+        async def handler(value):
+            await asyncio.sleep(0.01)
+            results["value"] = value
+            results["thread"] = threading.current_thread()
+
+        def script(windowSystem):
+            results["frames"] = windowSystem.framesPainted
+            results["task"] = windowSystem.asyncBridge.runHandler(handler, 42)
+
+        # the main loop runs until the task is done
+        windowSystem = runHeadless(script)
+        self.assertEqual(results["value"], 42)
+        self.assertIs(results["thread"], threading.current_thread())
+        self.assertTrue(results["task"].done())
+        # the finished task repainted the screen
+        self.assertGreater(windowSystem.framesPainted, results["frames"])
+        self.assertFalse(windowSystem.asyncBridge.tickScheduled)
+
+    def testPlainHandler(self):
+        def script(windowSystem):
+            self.assertEqual(windowSystem.asyncBridge.runHandler(lambda value: value + 1, 1), 2)
+            # no event loop is needed for plain handlers
+            self.assertIsNone(windowSystem.asyncBridge.eventLoop)
+
+        runHeadless(script)
+
+    def testRunInBackground(self):
+        results = {}
+
+        def blocking(value):
+            time.sleep(0.01)
+            return value * 2, threading.current_thread()
+
+        async def task(bridge):
+            results["value"], results["thread"] = await bridge.runInBackground(blocking, 21)
+
+        runHeadless(lambda windowSystem: windowSystem.asyncBridge.runTask(task(windowSystem.asyncBridge)))
+        self.assertEqual(results["value"], 42)
+        self.assertIsNot(results["thread"], threading.current_thread())
+
+    def testCancellation(self):
+        results = {}
+
+        async def endless():
+            while True:
+                await asyncio.sleep(0.01)
+
+        def script(windowSystem):
+            results["task"] = windowSystem.asyncBridge.runTask(endless())
+            windowSystem.scheduleTimer(50, results["task"].cancel)
+
+        # the loop stops ticking (and the main loop ends) once the cancelled task is done
+        windowSystem = runHeadless(script)
+        self.assertTrue(results["task"].cancelled())
+        self.assertFalse(windowSystem.asyncBridge.tickScheduled)
+
+    def testTaskErrorsAreReported(self):
+        errors = []
+
+        async def failing():
+            raise RuntimeError("app task failed")
+
+        def script(windowSystem):
+            loop = windowSystem.asyncBridge.loop
+            loop.set_exception_handler(lambda _, context: errors.append(context["exception"]))
+            windowSystem.asyncBridge.runTask(failing())
+
+        runHeadless(script)
+        self.assertEqual([str(error) for error in errors], ["app task failed"])
+
+    def testUpdatesAreBatchedBeforePaint(self):
+        updates = []
+
+        def script(windowSystem):
+            bridge = windowSystem.asyncBridge
+            frames = windowSystem.framesPainted
+            bridge.callOnUIThread(updates.append, "first")
+            bridge.callOnUIThread(updates.append, "second")
+            self.assertEqual(updates, [])
+            # after the next tick
+            windowSystem.scheduleTimer(bridge.tickInterval + 50,
+                                       lambda: updates.append(windowSystem.framesPainted - frames))
+
+        runHeadless(script)
+        # both updates were applied with one frame
+        self.assertEqual(updates, ["first", "second", 1])
+
+    def testCallFromOtherThread(self):
+        results = {}
+
+        def worker(bridge):
+            time.sleep(0.05)
+            bridge.callOnUIThread(lambda: results.setdefault("thread", threading.current_thread()))
+
+        def script(windowSystem):
+            threading.Thread(target=worker, args=(windowSystem.asyncBridge,)).start()
+            # the framework repaints after the event whose handler started the thread
+            windowSystem.requestRepaint()
+
+        # the main loop keeps checking for updates while the thread runs, so the update is applied before it ends
+        windowSystem = runHeadless(script)
+        self.assertIs(results.get("thread"), threading.current_thread())
+        self.assertFalse(windowSystem.asyncBridge.watchScheduled)
+        self.assertFalse(windowSystem.asyncBridge.wakeRequested.is_set())
+
+    def testSessionIsWrittenInBackground(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.dws")
+
+            def script(windowSystem):
+                windowSystem.windowManager.launchApp("Hello World")
+                windowSystem.checkSessionSave()
+
+            windowSystem = runHeadless(script, sessionPath=path, sessionSaveDelay=0)
+            self.assertIsNotNone(windowSystem.asyncBridge.executor)
+            with open(path, "rb") as file:
+                self.assertEqual([record.className for record in Session.parseSession(file.read())],
+                                 ["HelloWorldApp"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Color import CLEAR, colorBytes, colorId, packedToHex, packRGB, packRGBA, rgbToHex, unpackColor
+from GraphicsEventSystem import COLOR_BLACK, COLOR_CLEAR, COLOR_ORANGE, COLOR_WHITE
+
+
+class ColorIdTest(unittest.TestCase):
+    def testNamedColors(self):
+        self.assertEqual(colorId(COLOR_BLACK), 0x000000ff)
+        self.assertEqual(colorId(COLOR_WHITE), 0xffffffff)
+        self.assertEqual(colorId(COLOR_ORANGE), packRGBA(255, 140, 0))
+
+    def testClear(self):
+        self.assertEqual(colorId(COLOR_CLEAR), CLEAR)
+
+    def testHexColors(self):
+        self.assertEqual(colorId("#12ab9F"), 0x12ab9fff)
+        # short form: every digit is doubled
+        self.assertEqual(colorId("#1a9"), colorId("#11aa99"))
+
+    def testUnknownColor(self):
+        for color in ("chartreuse", "#12345", "#12ab9f0"):
+            with self.assertRaises(ValueError):
+                colorId(color)
+
+
+class PackingTest(unittest.TestCase):
+    def testPackRGBA(self):
+        self.assertEqual(packRGBA(0x12, 0x34, 0x56), 0x123456ff)
+        self.assertEqual(packRGBA(0x12, 0x34, 0x56, 0x78), 0x12345678)
+
+    def testUnpackRoundTrip(self):
+        for components in ((0, 0, 0, 0), (255, 255, 255, 255), (1, 2, 3, 4), (200, 100, 50, 255)):
+            self.assertEqual(unpackColor(packRGBA(*components)), components)
+        self.assertEqual(colorBytes(packRGBA(1, 2, 3, 4)), b"\x01\x02\x03\x04")
+
+    def testPackRGB(self):
+        self.assertEqual(packRGB(1, 0, 0.5), packRGBA(255, 0, 127))
+
+
+class HexTest(unittest.TestCase):
+    def testPackedToHex(self):
+        self.assertEqual(packedToHex(colorId("#12ab9f")), "#12ab9f")
+        # alpha is ignored
+        self.assertEqual(packedToHex(packRGBA(0x12, 0xab, 0x9f, 0)), "#12ab9f")
+
+    def testPackedToHexIsInterned(self):
+        self.assertIs(packedToHex(packRGBA(1, 2, 3)), packedToHex(int("010203ff", 16)))
+
+    def testRgbToHex(self):
+        self.assertEqual(rgbToHex(1, 1, 1), "#ffffff")
+        self.assertEqual(rgbToHex(0, 0.5, 0), "#007f00")
+
+    def testRgbToHexOutOfRange(self):
+        with self.assertRaises(ValueError):
+            rgbToHex(1.5, 0, 0)
+        with self.assertRaises(ValueError):
+            rgbToHex(0, -0.1, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
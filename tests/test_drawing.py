@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import random
+import tkinter
+import unittest
+from array import array
+from unittest import mock
+
+from Drawing import drawLines, fillRects
+from Framebuffer import FramebufferContext
+from GraphicsEventSystem import COLOR_CLEAR, GraphicsContext
+from tests.headless import runHeadless
+from UITK import Button
+from Window import Window
+
+COLORS = ["red", "#00FF00", "#123456", "white", COLOR_CLEAR]
+
+
+# graphics context without fillRects / drawLines: Drawing falls back to single calls on the framebuffer
+class SingleCallContext:
+    def __init__(self, framebuffer):
+        self.framebuffer = framebuffer
+
+    def setFillColor(self, color):
+        self.framebuffer.setFillColor(color)
+
+    def setStrokeColor(self, color):
+        self.framebuffer.setStrokeColor(color)
+
+    def fillRect(self, x1, y1, x2, y2):
+        self.framebuffer.fillRect(x1, y1, x2, y2)
+
+    def drawLine(self, x1, y1, x2, y2):
+        self.framebuffer.drawLine(x1, y1, x2, y2)
+
+
+# Tcl interpreter without display with a fake canvas command ".c" that records its arguments
+class RecordingTcl:
+    def __init__(self):
+        self.tcl = tkinter.Tcl()
+        self.tcl.eval("set ::calls {}; proc .c {args} {lappend ::calls $args; return [llength $::calls]}")
+        # calls from Python into Tcl
+        self.evals = 0
+        self.calls = 0
+
+    def eval(self, script):
+        self.evals += 1
+        return self.tcl.tk.eval(script)
+
+    def call(self, *args):
+        self.calls += 1
+        return self.tcl.tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.tcl.tk, name)
+
+    def commands(self):
+        commands = self.tcl.splitlist(self.tcl.eval("set ::calls"))
+        self.tcl.eval("set ::calls {}")
+        return commands
+
+
+def randomQuads(count, seed):
+    generator = random.Random(seed)
+    return [(generator.uniform(-20, 120), generator.uniform(-20, 120), generator.uniform(-20, 120),
+             generator.uniform(-20, 120)) for _ in range(count)]
+
+
+def axisAlignedLines(count, seed):
+    generator = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        x, y, length = generator.randint(-10, 100), generator.randint(-10, 100), generator.randint(0, 50)
+        lines.append((x, y, x + length, y) if generator.random() < 0.5 else (x, y, x, y + length))
+    return lines
+
+
+class FramebufferBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.batch = FramebufferContext(100, 100)
+        self.single = FramebufferContext(100, 100)
+        self.addCleanup(self.batch.close)
+        self.addCleanup(self.single.close)
+        for ctx in (self.batch, self.single):
+            ctx.clear("black")
+            ctx.setOrigin(3, 4.5)
+
+    def assertSamePixels(self):
+        self.assertEqual(bytes(self.batch.buffer), bytes(self.single.buffer))
+
+    def testFillRects(self):
+        rects = randomQuads(200, 1)
+        colors = [random.Random(2).choice(COLORS) for _ in rects]
+        fillRects(self.batch, rects, colors)
+        fillRects(SingleCallContext(self.single), rects, colors)
+        self.assertSamePixels()
+
+    def testFillRectsFromBuffer(self):
+        rects = randomQuads(50, 3)
+        fillRects(self.batch, array("f", [value for rect in rects for value in rect]), "#123456")
+        fillRects(SingleCallContext(self.single), [tuple(array("f", rect)) for rect in rects], "#123456")
+        self.assertSamePixels()
+
+    def testDrawLines(self):
+        lines = axisAlignedLines(200, 4) + [(0, 0, 90, 60), (80, 5, 10, 70)]
+        colors = [random.Random(5).choice(COLORS) for _ in lines]
+        drawLines(self.batch, lines, colors)
+        drawLines(SingleCallContext(self.single), lines, colors)
+        self.assertSamePixels()
+
+
+class TkBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.tcl = RecordingTcl()
+        canvas = tkinter.Canvas.__new__(tkinter.Canvas)
+        canvas.tk = self.tcl
+        canvas._w = ".c"
+        self.ctx = GraphicsContext(canvas)
+        self.ctx._isDrawing = True
+        self.ctx.setOrigin(5, 7.5)
+
+    # commands of single fillRect / drawLine calls, color changes only when the color differs (like the fallback)
+    def singleCallCommands(self, draw, items, colors):
+        previousColor = None
+        for item, color in zip(items, [colors] * len(items) if isinstance(colors, str) else colors):
+            if color != previousColor:
+                (self.ctx.setFillColor if draw == "rect" else self.ctx.setStrokeColor)(color)
+                previousColor = color
+            (self.ctx.fillRect if draw == "rect" else self.ctx.drawLine)(*item)
+        return self.tcl.commands()
+
+    def testFillRectsCreateSameItemsWithOneCall(self):
+        rects = randomQuads(100, 6) + [(0, 0, 10, 10)]
+        colors = [random.Random(7).choice(COLORS) for _ in rects]
+        expected = self.singleCallCommands("rect", rects, colors)
+        self.tcl.calls = 0
+        fillRects(self.ctx, rects, colors)
+        self.assertEqual(self.tcl.commands(), expected)
+        self.assertEqual((self.tcl.evals, self.tcl.calls), (1, 0))
+        # the fill color is left as after single calls
+        self.assertEqual(self.ctx.fillColor, colors[-1])
+
+    def testDrawLinesCreateSameItemsWithOneCall(self):
+        lines = axisAlignedLines(100, 8)
+        expected = self.singleCallCommands("line", lines, "#ABCDEF")
+        self.tcl.calls = 0
+        drawLines(self.ctx, lines, "#ABCDEF")
+        self.assertEqual(self.tcl.commands(), expected)
+        self.assertEqual((self.tcl.evals, self.tcl.calls), (1, 0))
+
+    def testClearItemsOnly(self):
+        fillRects(self.ctx, [(0, 0, 10, 10)], COLOR_CLEAR)
+        self.assertEqual((self.tcl.evals, self.tcl.commands()), (0, ()))
+
+    def testOutsideOfPaint(self):
+        self.ctx._isDrawing = False
+        with mock.patch("builtins.print") as printed:
+            fillRects(self.ctx, [(0, 0, 10, 10)], "red")
+        printed.assert_called_once_with("ERROR: Tried to draw outside of handlePaint")
+        self.assertEqual(self.tcl.commands(), ())
+
+
+class ButtonGridTest(unittest.TestCase):
+    def testGridIsDrawnLikeSingleButtons(self):
+        def script(windowSystem):
+            from CalculatorApp import CalculatorApp
+            app = CalculatorApp(windowSystem, 100, 100)
+            window = app.appWindow
+            # hover and press buttons to draw them in all states
+            app.buttons[5].changeState("HOVERED")
+            app.buttons[10].changeState("PRESSED")
+            framebuffer = windowSystem.graphicsContext
+
+            def windowPixels():
+                windowSystem.requestRepaint()
+                rowStride = framebuffer.width * 4
+                return [bytes(framebuffer.buffer[y * rowStride + window.x * 4:y * rowStride + (window.x + window.width) * 4])
+                        for y in range(window.y, window.y + window.height)]
+
+            with mock.patch.object(Button, "drawGroup", wraps=Button.drawGroup) as drawGroup:
+                grouped = windowPixels()
+            # one group per button row
+            self.assertEqual(drawGroup.call_count, 5)
+            self.assertEqual([len(call.args[1]) for call in drawGroup.call_args_list], [4] * 5)
+            with mock.patch.object(Button, "drawGroupKey", Window.drawGroupKey):
+                single = windowPixels()
+            self.assertEqual(grouped, single)
+
+        runHeadless(script)
+
+    def testButtonsWithoutContainerAreDrawnAlone(self):
+        def script(windowSystem):
+            window = windowSystem.createWindowOnScreen(100, 100, 200, 100, "1 Window")
+            button = Button(0, 0, 50, 20, "Button", "OK", "red", "blue")
+            window.addChildWindow(button)
+            self.assertIsNone(button.drawGroupKey())
+
+        runHeadless(script)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from array import array
+from multiprocessing import shared_memory
+from unittest import mock
+
+import Framebuffer
+from Framebuffer import FramebufferContext
+from GraphicsEventSystem import COLOR_CLEAR
+
+RED = b"\xff\x00\x00\xff"
+BLUE = b"\x00\x00\xff\xff"
+GREEN = b"\x00\xff\x00\xff"
+# shared memory starts zeroed
+EMPTY = b"\x00\x00\x00\x00"
+
+
+class FramebufferPixelTest:
+    """
+    Pixel tests of the framebuffer, run with the NumPy and the pure Python implementation (see subclasses).
+    """
+    useNumpy = True
+
+    def createFramebuffer(self, width=10, height=10):
+        if self.useNumpy:
+            framebuffer = FramebufferContext(width, height)
+        else:
+            with mock.patch.object(Framebuffer, "numpy", None):
+                framebuffer = FramebufferContext(width, height)
+        self.addCleanup(framebuffer.close)
+        self.assertEqual(framebuffer.pixels is not None, self.useNumpy)
+        return framebuffer
+
+    @staticmethod
+    def pixel(framebuffer, x, y):
+        start = (y * framebuffer.width + x) * 4
+        return bytes(framebuffer.buffer[start:start + 4])
+
+    # returns the positions of all pixels with the given color
+    def pixelsWithColor(self, framebuffer, color):
+        return {(x, y) for y in range(framebuffer.height) for x in range(framebuffer.width)
+                if self.pixel(framebuffer, x, y) == color}
+
+    def testFillAreaIsClipped(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.fillArea(-5, -5, 3, 2, Framebuffer.colorId("red"))
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED), {(x, y) for x in range(3) for y in range(2)})
+        framebuffer.fillArea(8, 8, 20, 20, Framebuffer.colorId("#0000FF"))
+        self.assertEqual(self.pixelsWithColor(framebuffer, BLUE), {(8, 8), (9, 8), (8, 9), (9, 9)})
+        # empty areas, areas outside and the clear color change nothing
+        framebuffer.fillArea(5, 5, 5, 8, Framebuffer.colorId("#00FF00"))
+        framebuffer.fillArea(20, 0, 30, 5, Framebuffer.colorId("#00FF00"))
+        framebuffer.fillArea(0, 0, 10, 10, Framebuffer.colorId(COLOR_CLEAR))
+        self.assertEqual(len(self.pixelsWithColor(framebuffer, EMPTY)), 100 - 6 - 4)
+
+    def testClear(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.clear("#00FF00")
+        self.assertEqual(len(self.pixelsWithColor(framebuffer, GREEN)), 100)
+
+    def testFillRectUsesOriginAndSortsCorners(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.setOrigin(2, 3)
+        framebuffer.setFillColor("red")
+        framebuffer.fillRect(3, 2, 1, 0)
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED), {(x, y) for x in range(3, 5) for y in range(3, 5)})
+
+    def testFillRects(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.setOrigin(1, 1)
+        framebuffer.fillRects([(0, 0, 2, 1), (5, 5, 6, 7), (0, 3, 1, 4)], ["red", "#0000FF", COLOR_CLEAR])
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED), {(1, 1), (2, 1)})
+        self.assertEqual(self.pixelsWithColor(framebuffer, BLUE), {(6, 6), (6, 7)})
+        self.assertEqual(len(self.pixelsWithColor(framebuffer, EMPTY)), 96)
+        # flat buffer with one color for all rects
+        framebuffer.fillRects(array("f", [0, 8, 2, 9, 7, 0, 8, 1]), "#00FF00")
+        self.assertEqual(self.pixelsWithColor(framebuffer, GREEN), {(1, 9), (2, 9), (8, 1)})
+
+    def testDrawLine(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.setStrokeColor("red")
+        # horizontal and vertical lines include their end point
+        framebuffer.drawLine(1, 0, 4, 0)
+        framebuffer.drawLine(9, 5, 9, 3)
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED),
+                         {(1, 0), (2, 0), (3, 0), (4, 0), (9, 3), (9, 4), (9, 5)})
+        framebuffer.setStrokeColor("#0000FF")
+        framebuffer.drawLine(0, 2, 5, 7)
+        self.assertEqual(self.pixelsWithColor(framebuffer, BLUE), {(i, i + 2) for i in range(6)})
+        framebuffer.setStrokeColor("#00FF00")
+        framebuffer.drawLine(0, 9, 6, 3, dashLength=2, dashGap=1)
+        self.assertEqual(self.pixelsWithColor(framebuffer, GREEN), {(0, 9), (1, 8), (3, 6), (4, 5), (6, 3)})
+
+    def testDrawLineInClearColor(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.setStrokeColor(COLOR_CLEAR)
+        framebuffer.drawLine(0, 0, 9, 9)
+        self.assertEqual(len(self.pixelsWithColor(framebuffer, EMPTY)), 100)
+
+    def testStrokeRect(self):
+        framebuffer = self.createFramebuffer()
+        framebuffer.setStrokeColor("red")
+        framebuffer.strokeRect(1, 1, 3, 4)
+        border = {(x, y) for x in range(1, 4) for y in range(1, 5)} - {(2, 2), (2, 3)}
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED), border)
+
+    def testBlit(self):
+        source = self.createFramebuffer(3, 2)
+        source.setFillColor("red")
+        source.fillRect(0, 0, 3, 1)
+        source.setFillColor("#0000FF")
+        source.fillRect(0, 1, 3, 2)
+        framebuffer = self.createFramebuffer()
+        framebuffer.blit(source, 2, 4)
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED), {(2, 4), (3, 4), (4, 4)})
+        self.assertEqual(self.pixelsWithColor(framebuffer, BLUE), {(2, 5), (3, 5), (4, 5)})
+        # clipped at the edges of the framebuffer
+        framebuffer.blit(source, -2, 9)
+        self.assertEqual(self.pixel(framebuffer, 0, 9), RED)
+        self.assertEqual(self.pixel(framebuffer, 1, 9), EMPTY)
+        # completely outside
+        framebuffer.blit(source, 10, 0)
+        self.assertEqual(len(self.pixelsWithColor(framebuffer, RED)), 4)
+
+    def testSavePNG(self):
+        framebuffer = self.createFramebuffer(4, 3)
+        framebuffer.clear("#0000FF")
+        framebuffer.setFillColor("red")
+        framebuffer.fillRect(1, 1, 3, 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frame.png")
+            framebuffer.savePNG(path)
+            with open(path, "rb") as file:
+                data = file.read()
+        self.assertEqual(data[:8], b"\x89PNG\r\n\x1a\n")
+        chunks = {}
+        position = 8
+        while position < len(data):
+            length, = struct.unpack(">I", data[position:position + 4])
+            chunkType = data[position + 4:position + 8]
+            content = data[position + 8:position + 8 + length]
+            crc, = struct.unpack(">I", data[position + 8 + length:position + 12 + length])
+            self.assertEqual(crc, zlib.crc32(chunkType + content) & 0xffffffff)
+            chunks[chunkType] = content
+            position += 12 + length
+        self.assertEqual(struct.unpack(">IIBBBBB", chunks[b"IHDR"]), (4, 3, 8, 6, 0, 0, 0))
+        self.assertIn(b"IEND", chunks)
+        rows = [b"\x00" + BLUE * 4, b"\x00" + BLUE + RED * 2 + BLUE, b"\x00" + BLUE * 4]
+        self.assertEqual(zlib.decompress(chunks[b"IDAT"]), b"".join(rows))
+
+
+@unittest.skipIf(Framebuffer.numpy is None, "NumPy is not installed")
+class NumpyFramebufferTest(FramebufferPixelTest, unittest.TestCase):
+    useNumpy = True
+
+    def testBlitFromPurePythonFramebuffer(self):
+        self.useNumpy = False
+        source = self.createFramebuffer(2, 2)
+        source.clear("red")
+        self.useNumpy = True
+        framebuffer = self.createFramebuffer()
+        framebuffer.blit(source, 8, 8)
+        self.assertEqual(self.pixelsWithColor(framebuffer, RED), {(8, 8), (9, 8), (8, 9), (9, 9)})
+
+
+class PurePythonFramebufferTest(FramebufferPixelTest, unittest.TestCase):
+    useNumpy = False
+
+
+class SharedMemoryTest(unittest.TestCase):
+    def testAttachedFramebufferSharesPixels(self):
+        framebuffer = FramebufferContext(4, 4)
+        attached = FramebufferContext.attach(framebuffer.name, 4, 4)
+        attached.setFillColor("red")
+        attached.fillRect(0, 0, 4, 4)
+        self.assertEqual(bytes(framebuffer.buffer[:4]), RED)
+        # closing the attached context keeps the memory of the owner
+        attached.close()
+        self.assertEqual(bytes(framebuffer.buffer[:4]), RED)
+        framebuffer.close()
+
+    def testCloseUnlinksSharedMemory(self):
+        framebuffer = FramebufferContext(4, 4)
+        name = framebuffer.name
+        framebuffer.close()
+        # the buffer is released and the block is removed
+        with self.assertRaises(ValueError):
+            framebuffer.buffer[0]
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import json
+import os
+import tempfile
+import tkinter
+import unittest
+from multiprocessing import shared_memory
+
+import WindowSystem
+from HeadlessEventSystem import HeadlessFont
+from tests.headless import runHeadless
+from UITK import Label, internFont
+
+# opens the calculator from the start menu and computes 7+2
+TRACE = [{"time": 0, "type": "pressed", "x": 20, "y": 780}, {"type": "released", "x": 20, "y": 780},
+         {"time": 20, "type": "pressed", "x": 100, "y": 640}, {"type": "released", "x": 100, "y": 640},
+         {"time": 100, "type": "key", "char": "7"}, {"type": "key", "char": "+"}, {"type": "key", "char": "2"},
+         {"type": "key", "char": "="}]
+
+
+class HeadlessFontTest(unittest.TestCase):
+    def testOptionsAndMetrics(self):
+        font = HeadlessFont(family="Courier", size=20, weight="bold")
+        self.assertEqual(str(font), font.name)
+        self.assertNotEqual(HeadlessFont().name, font.name)
+        self.assertEqual(font.configure(), {"family": "Courier", "size": 20, "weight": "bold", "slant": "roman",
+                                            "underline": 0, "overstrike": 0})
+        self.assertEqual(font.cget("family"), "Courier")
+        self.assertEqual(font.actual("size"), 20)
+        self.assertEqual(font.measure("abcde"), 60)
+        self.assertEqual(font.metrics("ascent"), 20)
+        self.assertEqual(font.metrics()["linespace"], 25)
+        font.configure(size=-10)
+        self.assertEqual(font.measure("abcde"), 30)
+
+
+class HeadlessEventSystemTest(unittest.TestCase):
+    def testFontsWithoutTk(self):
+        def script(windowSystem):
+            # widgets get their fonts from the backend, tkinter has no root
+            self.assertIsNone(tkinter._default_root)
+            font = internFont(family="Helvetica", size=14)
+            self.assertIsInstance(font, HeadlessFont)
+            self.assertIs(internFont(family="Helvetica", size=14), font)
+            self.assertIsInstance(Label(0, 0, 100, 30, "Label", "Text").font, HeadlessFont)
+
+        runHeadless(script)
+        self.assertIsNone(tkinter._default_root)
+
+    def testSharedMemoryIsReleasedOnShutdown(self):
+        names = []
+
+        def script(windowSystem):
+            names.append(windowSystem.graphicsContext.name)
+
+        windowSystem = runHeadless(script)
+        with self.assertRaises(ValueError):
+            windowSystem.graphicsContext.buffer[0]
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=names[0])
+
+    def testSharedMemoryIsReleasedAfterErrors(self):
+        names = []
+
+        def script(windowSystem):
+            names.append(windowSystem.graphicsContext.name)
+            raise RuntimeError("script failed")
+
+        with self.assertRaises(RuntimeError):
+            runHeadless(script)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=names[0])
+
+    @staticmethod
+    def writeTrace(directory):
+        path = os.path.join(directory, "trace.jsonl")
+        with open(path, "w") as file:
+            file.writelines(json.dumps(event) + "\n" for event in TRACE)
+        return path
+
+    def testReplay(self):
+        with tempfile.TemporaryDirectory() as directory:
+            windowSystem = runHeadless(lambda windowSystem: None, replayPath=self.writeTrace(directory))
+        self.assertEqual([type(app).__name__ for app in windowSystem.apps], ["CalculatorApp"])
+        self.assertEqual(windowSystem.apps[0].inputLabel.text, "9")
+
+    def testMainStopsAfterFrames(self):
+        frames = []
+        handlePaint = WindowSystem.WindowSystem.handlePaint
+
+        def countFrames(windowSystem):
+            handlePaint(windowSystem)
+            frames.append(windowSystem.framesPainted)
+
+        WindowSystem.WindowSystem.handlePaint = countFrames
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                WindowSystem.main(["--backend", "headless", "--frames", "3", "--resolution", "1600x800",
+                                   "--replay", self.writeTrace(directory)])
+        finally:
+            WindowSystem.WindowSystem.handlePaint = handlePaint
+        # the replay would paint more frames
+        self.assertEqual(frames[-1], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
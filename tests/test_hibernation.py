@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from tests.headless import runHeadless
+
+
+class HibernationTest(unittest.TestCase):
+    @staticmethod
+    def taskbarIconX(windowSystem, app):
+        # center of the taskbar icon of the app (the start menu button comes first)
+        size = windowSystem.windowManager.taskBarHeight + 1
+        return (windowSystem.apps.index(app) + 1) * size + size / 2
+
+    def testMinimizedAppIsRebuiltWhenRestored(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            windowManager.hibernationDelay = 0
+            app = windowManager.launchApp("Calculator")
+            for char in "7+2":
+                app.handleInput(char)
+            windowManager.minimizeWindow(app.appWindow)
+            windowManager.checkHibernation()
+            self.assertIn(app, windowManager.hibernatedApps)
+            self.assertEqual(app.buttons, [])
+            self.assertEqual(app.appWindow.childWindows, [])
+            # the session keeps the state the app hibernated with
+            self.assertEqual(windowManager.appState(app)["text"], "2")
+            # restored from the taskbar
+            windowManager.handleTaskBarClicked(self.taskbarIconX(windowSystem, app))
+            self.assertNotIn(app, windowManager.hibernatedApps)
+            self.assertEqual(len(app.buttons), 20)
+            self.assertEqual(app.inputLabel.text, "2")
+            app.handleInput("=")
+            self.assertEqual(app.inputLabel.text, "9")
+
+        runHeadless(script)
+
+    def testCoveredAppWakesWhenUncovered(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            windowManager.hibernationDelay = 0
+            app = windowManager.createApp(windowManager.appRegistry.loadClass("ColorsApp"), 100, 100,
+                                          findPosition=False)
+            app.sliders[0].setValue(0.25)
+            cover = windowSystem.createWindowOnScreen(50, 50, 800, 600, "1 Cover")
+            windowSystem.requestRepaint()
+            self.assertEqual(windowManager.windowVisibility[app.appWindow], "occluded")
+            windowManager.checkHibernation()
+            self.assertIn(app, windowManager.hibernatedApps)
+            self.assertEqual(app.sliders, [])
+            # the cover moves away
+            cover.x = 900
+            windowManager.topLevelWindowChanged(cover)
+            windowSystem.requestRepaint()
+            self.assertNotIn(app, windowManager.hibernatedApps)
+            self.assertAlmostEqual(app.sliders[0].sliderValue, 0.25, places=2)
+
+        runHeadless(script)
+
+    def testAppsThatAreBuildingTheirWidgetsStayAwake(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            windowManager.hibernationDelay = 0
+            windowSystem.lazyConstruction = True
+            app = windowManager.launchApp("Calculator")
+            windowManager.minimizeWindow(app.appWindow)
+            self.assertFalse(windowManager.canHibernate(app))
+            windowManager.checkHibernation()
+            self.assertNotIn(app, windowManager.hibernatedApps)
+            # checked again later: hibernated once the widgets are built
+            self.assertTrue(windowManager.hibernationTimerScheduled)
+            windowSystem.scheduleTimer(0, check, windowSystem, app, 100)
+
+        def check(windowSystem, app, tries):
+            if app not in windowSystem.windowManager.hibernatedApps:
+                self.assertGreater(tries, 0)
+                windowSystem.scheduleTimer(10, check, windowSystem, app, tries - 1)
+                return
+            self.assertEqual(app.buttons, [])
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
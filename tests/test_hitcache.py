@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from tests.headless import runHeadless
+from UITK import ListView
+from Window import Window
+
+
+class HitCacheTest(unittest.TestCase):
+    def testRepeatedHitsAreCached(self):
+        def script(windowSystem):
+            screen = windowSystem.screen
+            window = windowSystem.createWindowOnScreen(100, 100, 300, 200, "1 Window")
+            child = Window(20, 40, 50, 50, "Child")
+            window.addChildWindow(child)
+            self.assertIs(screen.childWindowAtLocation(130, 150), child)
+            hits = screen.hitCacheHits
+            self.assertIs(screen.childWindowAtLocation(140, 160), child)
+            self.assertEqual(screen.hitCacheHits, hits + 1)
+            # outside of the child: the window itself
+            self.assertIs(screen.childWindowAtLocation(300, 250), window)
+
+        runHeadless(script)
+
+    def testHiddenRowsAreNotHit(self):
+        def script(windowSystem):
+            screen = windowSystem.screen
+            window = windowSystem.createWindowOnScreen(100, 100, 300, 300, "1 Window")
+            listView = ListView(10, 40, 200, 100, "List", items=list(range(10)))
+            window.addChildWindow(listView)
+            lastRow = listView.rows[-1]
+            x, y = lastRow.convertPositionToScreen(5, 5)
+            self.assertIs(screen.childWindowAtLocation(x, y), lastRow)
+            # fewer items than rows: the last row is hidden, the position hits the list view
+            listView.setItems([1, 2])
+            self.assertTrue(lastRow.isHidden)
+            self.assertIs(screen.childWindowAtLocation(x, y), listView)
+            listView.setItems(list(range(10)))
+            self.assertIs(screen.childWindowAtLocation(x, y), lastRow)
+
+        runHeadless(script)
+
+    def testShownWindowInFrontIsHit(self):
+        def script(windowSystem):
+            screen = windowSystem.screen
+            back = windowSystem.createWindowOnScreen(100, 100, 300, 200, "1 Back")
+            front = windowSystem.createWindowOnScreen(150, 150, 100, 100, "1 Front")
+            # hidden windows are not hit, the cached hit of the window behind is invalid when it is shown again
+            front.isHidden = True
+            self.assertIs(screen.childWindowAtLocation(200, 200), back)
+            front.isHidden = False
+            self.assertIs(screen.childWindowAtLocation(200, 200), front)
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
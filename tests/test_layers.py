@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Replay import dispatchEvent
+from tests.headless import runHeadless
+from tests.test_windowitems import RecordingCanvas
+
+
+class LayersTest(unittest.TestCase):
+    @staticmethod
+    def startMenuItemY(windowSystem, item):
+        windowManager = windowSystem.windowManager
+        top = windowSystem.height - windowManager.taskBarHeight - windowManager.startMenuHeight
+        return top + (item + 0.5) * windowManager.startMenuItemHeight
+
+    def testPaintTagsTheLayers(self):
+        def script(windowSystem):
+            canvas = windowSystem._canvas = RecordingCanvas()
+            window = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Window")
+            windowSystem.requestRepaint()
+            tags = [call[1] for call in canvas.calls if call[0] == "addtag_withtag" and call[2] == "!layered"]
+            # the items of the windows layer are also tagged with their top-level window
+            self.assertEqual(tags, ["desktop", windowSystem.canvasTagOf(window), "windows", "chrome", "overlay"])
+
+        runHeadless(script)
+
+    def testStartMenuHoverRedrawsTheOverlayOnly(self):
+        def script(windowSystem):
+            canvas = windowSystem._canvas = RecordingCanvas()
+            windowSystem.windowManager.startMenuVisible = True
+            windowSystem.requestRepaint()
+            frames = windowSystem.framesPainted
+            canvas.calls.clear()
+            dispatchEvent(windowSystem, {"type": "moved", "x": 20, "y": self.startMenuItemY(windowSystem, 1)})
+            self.assertEqual(windowSystem.windowManager.startMenuItemHovered, 1)
+            self.assertEqual(windowSystem.framesPainted, frames)
+            self.assertEqual([call for call in canvas.calls if call[0] in ("delete", "tag_raise")],
+                             [("delete", "overlay")])
+            self.assertIn(("addtag_withtag", "overlay", "!layered"), canvas.calls)
+            # the same item: nothing is drawn
+            canvas.calls.clear()
+            dispatchEvent(windowSystem, {"type": "moved", "x": 25, "y": self.startMenuItemY(windowSystem, 1)})
+            self.assertEqual(canvas.calls, [])
+
+        runHeadless(script)
+
+    def testLayersInFrontAreRaised(self):
+        def script(windowSystem):
+            canvas = windowSystem._canvas = RecordingCanvas()
+            windowSystem.requestRepaint()
+            canvas.calls.clear()
+            windowSystem.repaintLayers(["chrome"], afterEvent=False)
+            self.assertEqual([call for call in canvas.calls if call[0] in ("delete", "tag_raise")],
+                             [("delete", "chrome"), ("tag_raise", "overlay")])
+
+        runHeadless(script)
+
+    def testWithoutCanvasTheScreenIsRepainted(self):
+        def script(windowSystem):
+            windowSystem.windowManager.startMenuVisible = True
+            windowSystem.requestRepaint()
+            frames = windowSystem.framesPainted
+            dispatchEvent(windowSystem, {"type": "moved", "x": 20, "y": self.startMenuItemY(windowSystem, 2)})
+            self.assertEqual(windowSystem.framesPainted, frames + 1)
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Layout import DEFAULT_CONSTRAINTS, FlexLayout, GridCell, GridLayout, LayoutConstraints, resolveSizes
+
+
+class ResolveSizesTest(unittest.TestCase):
+    def testEvenDistribution(self):
+        self.assertEqual(resolveSizes(300, [DEFAULT_CONSTRAINTS] * 3), [100, 100, 100])
+
+    def testGrowFactors(self):
+        self.assertEqual(resolveSizes(300, [LayoutConstraints(grow=2), LayoutConstraints(grow=1)]), [200, 100])
+
+    def testBasisWithoutGrow(self):
+        # the free space only goes to the item that can grow
+        sizes = resolveSizes(300, [LayoutConstraints(grow=0, basis=50), LayoutConstraints(grow=1, basis=50)])
+        self.assertEqual(sizes, [50, 250])
+
+    def testShrinkByBasis(self):
+        # missing space is taken away relative to shrink * basis
+        sizes = resolveSizes(200, [LayoutConstraints(basis=100), LayoutConstraints(basis=300)])
+        self.assertEqual(sizes, [50, 150])
+
+    def testMaxSizeClamp(self):
+        # the space the clamped item can't take is distributed between the others
+        sizes = resolveSizes(300, [LayoutConstraints(maxSize=50), DEFAULT_CONSTRAINTS, DEFAULT_CONSTRAINTS])
+        self.assertEqual(sizes, [50, 125, 125])
+
+    def testMinSizeClamp(self):
+        sizes = resolveSizes(120, [LayoutConstraints(basis=100), LayoutConstraints(basis=100, minSize=90)])
+        self.assertEqual(sizes, [30, 90])
+
+    def testMinSizeOverflow(self):
+        # not enough space for the minimum sizes: the items keep them
+        self.assertEqual(resolveSizes(30, [DEFAULT_CONSTRAINTS] * 3), [20, 20, 20])
+
+    def testFreezeLoop(self):
+        # the first pass only violates the first maximum (40 each), the second pass the second one (130 / 3 each)
+        constraints = [LayoutConstraints(maxSize=30), LayoutConstraints(maxSize=40), DEFAULT_CONSTRAINTS,
+                       DEFAULT_CONSTRAINTS]
+        self.assertEqual(resolveSizes(160, constraints), [30, 40, 45, 45])
+
+    def testSizesFillAvailableSpace(self):
+        constraints = [LayoutConstraints(grow=3, maxSize=70), LayoutConstraints(grow=1, minSize=60),
+                       LayoutConstraints(grow=2, basis=10)]
+        sizes = resolveSizes(400, constraints)
+        self.assertAlmostEqual(sum(sizes), 400)
+        for size, constraint in zip(sizes, constraints):
+            self.assertGreaterEqual(size, constraint.minSize)
+            self.assertLessEqual(size, constraint.maxSize)
+
+    def testNoItems(self):
+        self.assertEqual(resolveSizes(100, []), [])
+
+
+class FlexLayoutTest(unittest.TestCase):
+    def testHorizontalSpacing(self):
+        frames = FlexLayout(horizontal=True, spacing=10).arrange(320, 40, ["a", "b", "c"],
+                                                                 lambda window: DEFAULT_CONSTRAINTS)
+        self.assertEqual(frames, [(0, 0, 100, 40), (110, 0, 100, 40), (220, 0, 100, 40)])
+
+    def testVerticalConstraints(self):
+        constraints = {"a": LayoutConstraints(maxSize=50), "b": DEFAULT_CONSTRAINTS}
+        frames = FlexLayout(horizontal=False).arrange(80, 200, ["a", "b"], constraints.get)
+        self.assertEqual(frames, [(0, 0, 80, 50), (0, 50, 80, 150)])
+
+
+class GridLayoutTest(unittest.TestCase):
+    def testRowByRowPlacement(self):
+        frames = GridLayout(rows=2, columns=2, spacing=10).arrange(210, 110, ["a", "b", "c"], lambda window: None)
+        self.assertEqual(frames, [(0, 0, 100, 50), (110, 0, 100, 50), (0, 60, 100, 50)])
+
+    def testCellsAndSpans(self):
+        cells = {"wide": GridCell(0, 0, columnSpan=2), "tall": GridCell(1, 2, rowSpan=5)}
+        frames = GridLayout(rows=2, columns=3).arrange(300, 200, ["wide", "tall"], cells.get)
+        # the span of the tall window is cut at the last row
+        self.assertEqual(frames, [(0, 0, 200, 100), (200, 100, 100, 100)])
+
+    def testTrackConstraints(self):
+        layout = GridLayout(rows=1, columns=2, columnConstraints=(LayoutConstraints(maxSize=60), DEFAULT_CONSTRAINTS))
+        frames = layout.arrange(200, 50, ["a", "b"], lambda window: None)
+        self.assertEqual(frames, [(0, 0, 60, 50), (60, 0, 140, 50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
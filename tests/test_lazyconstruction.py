@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from CalculatorApp import CALCULATOR_TEMPLATE, CalculatorApp
+from tests.headless import runHeadless
+from UITK import buildInChunks
+
+
+class LazyConstructionTest(unittest.TestCase):
+    def setUp(self):
+        # the first calculator of a size is built in steps, later ones are copied
+        CALCULATOR_TEMPLATE.prototypes.clear()
+        self.addCleanup(CALCULATOR_TEMPLATE.prototypes.clear)
+
+    def testWindowIsPaintedBeforeTheButtonsExist(self):
+        apps = []
+        # number of child windows of the app window at every paint after the app was opened
+        childrenPainted = []
+
+        def script(windowSystem):
+            windowSystem.lazyConstruction = True
+            handlePaint = windowSystem.handlePaint
+
+            def countChildren():
+                handlePaint()
+                childrenPainted.append(len(apps[0].appWindow.childWindows))
+
+            windowSystem.handlePaint = countChildren
+            apps.append(CalculatorApp(windowSystem, 100, 100))
+            # like the repaint after the start menu click
+            windowSystem.requestRepaint()
+            self.assertIs(windowSystem.screen.childWindows.front(), apps[0].appWindow)
+            self.assertEqual(apps[0].buttons, [])
+            # input before the buttons exist is handled once they are built
+            apps[0].handleInput("7")
+
+        runHeadless(script)
+        app = apps[0]
+        self.assertTrue(app.widgetsBuilt)
+        self.assertEqual(app.inputLabel.text, "7")
+        # the window is painted with its title bar only, then after every step (the label, then one container with a
+        # row of buttons each)
+        self.assertEqual(childrenPainted, [1, 2, 7, 12, 17, 22, 27])
+
+    def testCopiesAreBuiltInOneStep(self):
+        def script(windowSystem):
+            CalculatorApp(windowSystem, 100, 100)
+            app = CalculatorApp(windowSystem, 400, 100)
+            app.releaseWidgets()
+            # the generator creates all widgets without yielding
+            self.assertEqual(list(app.buildWidgets()), [])
+            self.assertEqual(len(app.buttons), 20)
+
+        runHeadless(script)
+
+    def testWithoutLazyConstructionEverythingIsBuiltAtOnce(self):
+        def script(windowSystem):
+            app = CalculatorApp(windowSystem, 100, 100)
+            self.assertTrue(app.widgetsBuilt)
+            self.assertEqual(len(app.buttons), 20)
+            done = []
+            buildInChunks(windowSystem, iter(range(3)), lambda: done.append(True))
+            self.assertEqual(done, [True])
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Replay import dispatchEvent
+from tests.headless import runHeadless
+from UITK import Container, ListRow, ListView
+from Window import LayoutAnchor
+
+
+class ListViewTest(unittest.TestCase):
+    def testRowCountIsBoundedByTheViewport(self):
+        def script(windowSystem):
+            window = windowSystem.createWindowOnScreen(100, 100, 300, 180, "1 Window")
+            listView = ListView(10, 40, 200, 100, "List", items=list(range(100000)), rowHeight=20,
+                                layoutAnchors=LayoutAnchor.top | LayoutAnchor.bottom | LayoutAnchor.left)
+            window.addChildWindow(listView)
+            self.assertEqual(len(listView.rows), 5)
+            self.assertEqual(len(listView.childWindows), 5)
+            self.assertEqual([row.text for row in listView.rows], ["0", "1", "2", "3", "4"])
+            # the list view keeps its margins to the top and bottom of the window
+            window.resize(100, 100, 300, 300)
+            self.assertEqual(listView.height, 220)
+            self.assertEqual(len(listView.rows), 11)
+            window.resize(100, 100, 300, 160)
+            self.assertEqual(len(listView.rows), 4)
+            self.assertEqual(len(listView.childWindows), 4)
+
+        runHeadless(script)
+
+    def testScrollingRebindsRows(self):
+        def script(windowSystem):
+            window = windowSystem.createWindowOnScreen(100, 100, 300, 300, "1 Window")
+            listView = ListView(10, 40, 200, 100, "List", items=["Item " + str(i) for i in range(50)], rowHeight=20)
+            window.addChildWindow(listView)
+            rows = list(listView.rows)
+            listView.selectItem(4)
+            listView.scrollBy(3)
+            # the same row widgets show other items
+            self.assertEqual(listView.rows, rows)
+            self.assertEqual([row.text for row in rows], ["Item " + str(i) for i in range(3, 8)])
+            self.assertEqual([row.itemIndex for row in rows], [3, 4, 5, 6, 7])
+            # the selection moves with its item
+            self.assertEqual(rows[1].backgroundColor, listView.selectedBackgroundColor)
+            self.assertEqual(rows[0].backgroundColor, listView.rowBackgroundColor)
+            # scrolling stops at the end of the list
+            listView.scrollBy(100)
+            self.assertEqual(listView.firstVisibleIndex, 45)
+            self.assertEqual(rows[-1].text, "Item 49")
+
+        runHeadless(script)
+
+    def testHitTestingAfterScrolling(self):
+        def script(windowSystem):
+            screen = windowSystem.screen
+            clicked = []
+            window = windowSystem.createWindowOnScreen(100, 100, 300, 300, "1 Window")
+            listView = ListView(10, 40, 200, 100, "List", items=list(range(50)), rowHeight=20,
+                                action=lambda index, item: clicked.append(item))
+            window.addChildWindow(listView)
+            x, y = listView.rows[1].convertPositionToScreen(5, 5)
+            self.assertIs(screen.childWindowAtLocation(x, y), listView.rows[1])
+            # one wheel step down scrolls by three rows
+            dispatchEvent(windowSystem, {"type": "wheel", "x": x, "y": y, "delta": -1})
+            self.assertEqual(listView.firstVisibleIndex, 3)
+            self.assertIs(screen.childWindowAtLocation(x, y), listView.rows[1])
+            dispatchEvent(windowSystem, {"type": "pressed", "x": x, "y": y})
+            dispatchEvent(windowSystem, {"type": "released", "x": x, "y": y})
+            self.assertEqual(clicked, [4])
+            self.assertEqual(listView.selectedIndex, 4)
+
+        runHeadless(script)
+
+    def testRowsFollowWidthChanges(self):
+        def script(windowSystem):
+            window = windowSystem.createWindowOnScreen(100, 100, 300, 300, "1 Window")
+            listView = ListView(10, 40, 200, 100, "List", items=list(range(50)), rowHeight=20)
+            window.addChildWindow(listView)
+            container = Container(10, 40, 280, 220, "Container", [listView], layoutAnchors=LayoutAnchor.top |
+                                  LayoutAnchor.bottom | LayoutAnchor.left | LayoutAnchor.right)
+            window.addChildWindow(container)
+            # laid out by the container, which keeps its margins in the window: the list view fills it
+            window.resize(100, 100, 300, 300)
+            self.assertEqual((listView.width, listView.height), (280, 220))
+            self.assertEqual({row.width for row in listView.rows}, {280})
+            self.assertEqual(len(listView.rows), 11)
+            window.resize(100, 100, 200, 200)
+            self.assertEqual({row.width for row in listView.rows}, {180})
+            self.assertEqual(len(listView.rows), 6)
+            self.assertTrue(all(isinstance(child, ListRow) for child in listView.childWindows))
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from RemoteApp import OP_FILL_RECT, DisplayListContext
+from tests.headless import runHeadless
+from Window import LayoutAnchor, Window
+
+
+class CountingWindow(Window):
+    # child window that counts how often it is laid out
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layoutCount = 0
+
+    def resize(self, x, y, width, height):
+        self.layoutCount += 1
+        super().resize(x, y, width, height)
+
+
+class LiveResizeTest(unittest.TestCase):
+    # creates a window that is laid out when the resize drag ends or pauses, with a child anchored to all sides
+    @staticmethod
+    def createWindow(windowSystem):
+        window = windowSystem.createWindowOnScreen(100, 100, 300, 200, "1 Window")
+        window.setBackgroundColor("#FFFFFF")
+        window.deferLayoutWhileResizing = True
+        child = CountingWindow(10, 30, 280, 160, "Child", LayoutAnchor.top | LayoutAnchor.right | LayoutAnchor.bottom
+                               | LayoutAnchor.left)
+        window.addChildWindow(child)
+        child.layoutCount = 0
+        windowSystem.bringWindowToFront(window)
+        return window, child
+
+    # presses the resize corner of the window and drags it by the given offsets
+    @staticmethod
+    def drag(windowSystem, offsets):
+        windowSystem.handleMousePressed(398, 298)
+        for offset in offsets:
+            windowSystem.handleMouseDragged(398 + offset, 298 + offset)
+
+    def testLayoutOnRelease(self):
+        def script(windowSystem):
+            window, child = self.createWindow(windowSystem)
+            self.drag(windowSystem, range(5, 100, 5))
+            self.assertEqual(child.layoutCount, 0)
+            self.assertEqual((window.width, window.height), (395, 295))
+            windowSystem.handleMouseReleased(493, 393)
+            self.assertEqual(child.layoutCount, 1)
+            self.assertEqual((child.width, child.height), (375, 235))
+
+        runHeadless(script)
+
+    def testLayoutOnPause(self):
+        def script(windowSystem):
+            window, child = self.createWindow(windowSystem)
+            self.drag(windowSystem, range(5, 50, 5))
+            windowSystem.scheduleTimer(windowSystem.windowManager.liveResizePauseDelay + 100, paused, windowSystem,
+                                       window, child)
+
+        def paused(windowSystem, window, child):
+            self.assertEqual(child.layoutCount, 1)
+            self.assertIsNone(windowSystem.windowManager.liveResizeWindow)
+            # the drag goes on after the pause, the window is laid out again when it ends
+            windowSystem.handleMouseDragged(398 + 60, 298 + 60)
+            self.assertEqual(child.layoutCount, 1)
+            windowSystem.handleMouseReleased(398 + 60, 298 + 60)
+            self.assertEqual(child.layoutCount, 2)
+
+        runHeadless(script)
+
+    def testRevealedAreaIsCleared(self):
+        def script(windowSystem):
+            window, child = self.createWindow(windowSystem)
+            self.drag(windowSystem, [50])
+            ctx = DisplayListContext()
+            windowSystem.windowManager.drawOverlays(ctx)
+            top = windowSystem.windowManager.titleBarHeight
+            # right of and below the size the window was laid out for
+            fills = [op[1:] for op in ctx.ops if op[0] == OP_FILL_RECT]
+            self.assertEqual(fills, [(300, top, 350, 250), (0, 200, 300, 250)])
+            windowSystem.handleMouseReleased(448, 348)
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
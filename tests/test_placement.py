@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import random
+import unittest
+
+from Placement import CASCADE_LINE_OFFSET, CASCADE_OFFSET, WindowPlacement
+from tests.headless import runHeadless
+from Window import Window
+
+
+class WindowPlacementTest(unittest.TestCase):
+    def runPlacement(self, script):
+        # runs the script with the window system and its placement, the work area is (0, 0, 1600, 765)
+        runHeadless(lambda windowSystem: script(windowSystem, windowSystem.windowManager.placement))
+
+    # finds the position of a new window and adds it to the screen there
+    @staticmethod
+    def place(windowSystem, placement, x, y, width, height, strategy="cascade"):
+        window = Window(0, 0, width, height, "Window " + str(len(windowSystem.screen.childWindows)))
+        window.x, window.y = placement.findPosition(window, x, y, strategy)
+        windowSystem.screen.addChildWindow(window)
+        return window.x, window.y
+
+    def testWorkArea(self):
+        def script(windowSystem, placement):
+            self.assertEqual(placement.workArea(), (0, 0, 1600, 800 - windowSystem.windowManager.taskBarHeight))
+
+        self.runPlacement(script)
+
+    def testCascade(self):
+        def script(windowSystem, placement):
+            positions = [self.place(windowSystem, placement, 100, 100, 200, 200) for _ in range(3)]
+            self.assertEqual(positions, [(100, 100), (100 + CASCADE_OFFSET, 100 + CASCADE_OFFSET),
+                                         (100 + 2 * CASCADE_OFFSET, 100 + 2 * CASCADE_OFFSET)])
+
+        self.runPlacement(script)
+
+    def testCascadeWrapsAtBottom(self):
+        def script(windowSystem, placement):
+            # the fourth window would end below the work area (470 + 300 > 765): a new cascade starts at the top
+            positions = [self.place(windowSystem, placement, 0, 440, 200, 300) for _ in range(4)]
+            self.assertEqual(positions, [(0, 440), (10, 450), (20, 460), (CASCADE_LINE_OFFSET, 0)])
+
+        self.runPlacement(script)
+
+    def testCascadeWrapsAtRightEdge(self):
+        def script(windowSystem, placement):
+            self.place(windowSystem, placement, 40, 460, 1560, 300)
+            # the next cascade would start too far to the right, so it starts at the left edge
+            self.assertEqual(self.place(windowSystem, placement, 40, 460, 1560, 300), (0, 0))
+
+        self.runPlacement(script)
+
+    def testCascadeAvoidsMinimizedWindows(self):
+        def script(windowSystem, placement):
+            self.place(windowSystem, placement, 100, 100, 200, 200)
+            windowSystem.windowManager.minimizeWindow(windowSystem.screen.childWindows[-1])
+            self.assertEqual(self.place(windowSystem, placement, 100, 100, 200, 200), (110, 110))
+
+        self.runPlacement(script)
+
+    def testClampedToWorkArea(self):
+        def script(windowSystem, placement):
+            self.assertEqual(self.place(windowSystem, placement, 1500, 700, 200, 300), (1400, 465))
+            self.assertEqual(self.place(windowSystem, placement, -50, -50, 200, 300), (0, 0))
+            # windows bigger than the work area are placed at its top left corner
+            self.assertEqual(self.place(windowSystem, placement, 100, 100, 2000, 900, "leastOverlap"), (0, 0))
+            self.assertEqual(self.place(windowSystem, placement, 100, 100, 2000, 900, "tile"), (0, 0))
+
+        self.runPlacement(script)
+
+    def testTile(self):
+        def script(windowSystem, placement):
+            positions = [self.place(windowSystem, placement, 0, 0, 400, 300, "tile") for _ in range(3)]
+            self.assertEqual(positions, [(0, 0), (400, 0), (800, 0)])
+            # a minimized window does not cover its cell
+            windowSystem.windowManager.minimizeWindow(windowSystem.screen.childWindows[-1])
+            self.assertEqual(self.place(windowSystem, placement, 0, 0, 400, 300, "tile"), (800, 0))
+
+        self.runPlacement(script)
+
+    def testTileFallsBackToLeastOverlap(self):
+        def script(windowSystem, placement):
+            # 4 x 2 cells, all covered
+            for _ in range(8):
+                self.place(windowSystem, placement, 0, 0, 400, 300, "tile")
+            _, y = self.place(windowSystem, placement, 0, 0, 400, 300, "tile")
+            # the strip below the cells is the least covered position
+            self.assertEqual(y, 765 - 300)
+
+        self.runPlacement(script)
+
+    def testLeastOverlap(self):
+        def script(windowSystem, placement):
+            windowSystem.createWindowOnScreen(0, 0, 800, 765, "Left Half")
+            # the closest position that covers nothing
+            self.assertEqual(self.place(windowSystem, placement, 100, 100, 400, 300, "leastOverlap"), (800, 100))
+            # a free position is kept
+            self.assertEqual(self.place(windowSystem, placement, 1100, 400, 400, 300, "leastOverlap"), (1100, 400))
+
+        self.runPlacement(script)
+
+    def testUnknownStrategy(self):
+        def script(windowSystem, placement):
+            with self.assertRaises(ValueError):
+                placement.findPosition(Window(0, 0, 100, 100, "Window"), 0, 0, "random")
+
+        self.runPlacement(script)
+
+    def testLaunchedAppsCascade(self):
+        def script(windowSystem, placement):
+            first = windowSystem.windowManager.launchApp("Hello World").appWindow
+            second = windowSystem.windowManager.launchApp("Hello World").appWindow
+            self.assertEqual((second.x, second.y), (first.x + CASCADE_OFFSET, first.y + CASCADE_OFFSET))
+
+        self.runPlacement(script)
+
+
+class PlacementIndexTest(unittest.TestCase):
+    # checks that the updated index is the same as an index built from scratch for the current windows
+    def assertIndexIsCurrent(self, windowSystem, placement):
+        placement.updateIndex()
+        fresh = WindowPlacement(windowSystem.windowManager)
+        for window in windowSystem.screen.childWindows:
+            fresh.windowChanged(window)
+        fresh.updateIndex()
+        self.assertEqual(placement.entries, fresh.entries)
+        self.assertEqual(dict(placement.origins), dict(fresh.origins))
+        self.assertEqual(dict(placement.grid), dict(fresh.grid))
+        # the free rects cover the same area (they are not merged after windows were removed)
+        for rect in fresh.freeRectangles():
+            self.assertFalse(placement.overlap(rect))
+        for rect in placement.freeRectangles():
+            self.assertFalse(fresh.overlap(rect))
+
+    def testOnlyChangedWindowsAreUpdated(self):
+        def script(windowSystem):
+            placement = windowSystem.windowManager.placement
+            windows = [windowSystem.createWindowOnScreen(i * 20, i * 10, 200, 150, "1 Window") for i in range(20)]
+            placement.updateIndex()
+            self.assertEqual(placement.changedWindows, set())
+            windowSystem.windowManager.handleTitleBarDragged(windows[3], 700, 400, 0, 0)
+            windowSystem.windowManager.minimizeWindow(windows[5])
+            windowSystem.windowManager.closeWindow(windows[7])
+            self.assertEqual(placement.changedWindows, {windows[3], windows[5], windows[7]})
+            self.assertIndexIsCurrent(windowSystem, placement)
+            self.assertEqual(placement.windowCount, 19)
+            self.assertNotIn((60, 30), placement.origins)
+
+        runHeadless(script)
+
+    def testRandomChanges(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            placement = windowManager.placement
+            generator = random.Random(47)
+            windows = []
+            # the free rects are in use while the windows change
+            placement.freeRectangles()
+            for _ in range(300):
+                change = generator.randrange(5)
+                if change == 0 or not windows:
+                    windows.append(windowSystem.createWindowOnScreen(generator.randrange(1400), generator.randrange(600),
+                                                                    generator.randrange(50, 400),
+                                                                    generator.randrange(50, 300), "1 Window"))
+                    continue
+                window = generator.choice(windows)
+                if change == 1:
+                    windowManager.handleTitleBarDragged(window, generator.randrange(1400), generator.randrange(600),
+                                                        0, 0)
+                elif change == 2:
+                    window.resize(window.x, window.y, generator.randrange(50, 400), generator.randrange(50, 300))
+                elif change == 3:
+                    windowManager.minimizeWindow(window)
+                else:
+                    windows.remove(window)
+                    windowManager.closeWindow(window)
+                if generator.randrange(10) == 0:
+                    self.assertIndexIsCurrent(windowSystem, placement)
+            self.assertIndexIsCurrent(windowSystem, placement)
+
+        runHeadless(script, snapThreshold=0)
+
+    def testFreedSpaceIsUsed(self):
+        def script(windowSystem):
+            placement = windowSystem.windowManager.placement
+            left = windowSystem.createWindowOnScreen(0, 0, 800, 765, "1 Left")
+            right = windowSystem.createWindowOnScreen(800, 0, 800, 765, "1 Right")
+            placement.freeRectangles()
+            window = Window(0, 0, 400, 300, "1 Window")
+            # the screen is covered
+            x, y = placement.findPosition(window, 100, 100, "leastOverlap")
+            self.assertEqual(placement.overlap((x, y, x + 400, y + 300)), 400 * 300)
+            windowSystem.windowManager.closeWindow(right)
+            self.assertEqual(placement.findPosition(window, 100, 100, "leastOverlap"), (800, 100))
+            # the freed parts are merged again if the window only fits into more than one of them
+            left.resize(0, 0, 800, 400)
+            self.assertEqual(placement.findPosition(Window(0, 0, 1000, 300, "1 Wide"), 300, 300, "leastOverlap"),
+                             (300, 400))
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
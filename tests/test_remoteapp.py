@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import multiprocessing
+import random
+import time
+import unittest
+
+from CalculatorApp import CalculatorApp
+from HeadlessEventSystem import HeadlessFont
+from RemoteApp import (OP_FONT, OP_ORIGIN, AppProcessSystem, DisplayListContext, RemoteApp, applyDelta, encodeDelta,
+                       replayDisplayList)
+from tests.headless import runHeadless
+from UITK import Button, Label, internFont, setFontFactory
+from Window import Window
+
+
+class DeltaTest(unittest.TestCase):
+    def assertRoundTrip(self, previousOps, ops):
+        delta = encodeDelta(previousOps, ops)
+        self.assertEqual(applyDelta(previousOps, delta), ops)
+        return delta
+
+    def testUnchanged(self):
+        ops = [(0, "a"), (1, "b")]
+        self.assertEqual(self.assertRoundTrip(ops, list(ops)), (2, 0, []))
+
+    def testEmptyLists(self):
+        self.assertEqual(self.assertRoundTrip([], []), (0, 0, []))
+        self.assertEqual(self.assertRoundTrip([], [1, 2]), (0, 0, [1, 2]))
+        self.assertEqual(self.assertRoundTrip([1, 2], []), (0, 0, []))
+
+    def testChangeAtFront(self):
+        # no common prefix
+        self.assertEqual(self.assertRoundTrip([1, 2, 3, 4], [9, 2, 3, 4]), (0, 3, [9]))
+
+    def testChangeAtEnd(self):
+        # no common suffix
+        self.assertEqual(self.assertRoundTrip([1, 2, 3, 4], [1, 2, 3, 9]), (3, 0, [9]))
+
+    def testEverythingChanged(self):
+        self.assertEqual(self.assertRoundTrip([1, 2, 3], [4, 5]), (0, 0, [4, 5]))
+
+    def testInsertAndRemoveInTheMiddle(self):
+        ops = list(range(1000))
+        inserted = ops[:500] + ["new"] + ops[500:]
+        self.assertEqual(self.assertRoundTrip(ops, inserted), (500, 500, ["new"]))
+        self.assertEqual(self.assertRoundTrip(inserted, ops), (500, 500, []))
+        # one op inserted at the front does not shift all ops into the delta
+        self.assertEqual(self.assertRoundTrip(ops, ["new"] + ops), (0, 1000, ["new"]))
+
+    def testPrefixAndSuffixDontOverlap(self):
+        self.assertEqual(self.assertRoundTrip([1, 1], [1, 1, 1]), (2, 0, [1]))
+        self.assertEqual(self.assertRoundTrip([1, 1, 1], [1, 1]), (2, 0, []))
+
+    def testRandomEdits(self):
+        generator = random.Random(27)
+        ops = [generator.randrange(5) for _ in range(50)]
+        for _ in range(500):
+            changed = list(ops)
+            for _ in range(generator.randrange(4)):
+                position = generator.randrange(len(changed) + 1)
+                edit = generator.randrange(3)
+                if edit == 0:
+                    changed.insert(position, generator.randrange(5))
+                elif edit == 1 and position < len(changed):
+                    del changed[position]
+                elif position < len(changed):
+                    changed[position] = generator.randrange(5)
+            self.assertRoundTrip(ops, changed)
+            ops = changed
+
+
+class DisplayListTest(unittest.TestCase):
+    def setUp(self):
+        setFontFactory(HeadlessFont)
+
+    @staticmethod
+    def record(windows):
+        # widgets are clipped to their parent, a window named like the screen is not clipped itself
+        screen = Window(0, 0, 400, 300, "SCREEN")
+        ctx = DisplayListContext()
+        for window in windows:
+            if window.parentWindow is None:
+                screen.addChildWindow(window)
+            window.draw(ctx)
+        return ctx.ops
+
+    def testReplayRecordsTheSameOps(self):
+        label = Label(10, 20, 100, 30, "Label", text="Hello", font=internFont(family="Helvetica", size=14))
+        button = Button(10, 60, 80, 30, "Button", text="OK", hoverBackgroundColor="#A0A0A0",
+                        pressedBackgroundColor="#808080")
+        ops = self.record([label, button])
+        fonts = {}
+        replayed = DisplayListContext()
+        replayDisplayList(ops, replayed, 0, 0, fonts)
+        self.assertEqual(replayed.ops, ops)
+
+        # origins are shifted by the offset of the window, everything else stays the same
+        shifted = DisplayListContext()
+        replayDisplayList(ops, shifted, 5, 7, fonts)
+        self.assertEqual([op for op in shifted.ops if op[0] != OP_ORIGIN], [op for op in ops if op[0] != OP_ORIGIN])
+        self.assertEqual([op[1:] for op in shifted.ops if op[0] == OP_ORIGIN],
+                         [(op[1] + 5, op[2] + 7) for op in ops if op[0] == OP_ORIGIN])
+
+    def testFontsAreCreatedOncePerConfiguration(self):
+        label = Label(0, 0, 100, 30, "Label", text="Hello", font=internFont(family="Helvetica", size=14))
+        ops = self.record([label, label])
+        self.assertEqual(len({op[1] for op in ops if op[0] == OP_FONT}), 1)
+        fonts = {}
+        replayDisplayList(ops, DisplayListContext(), 0, 0, fonts)
+        font = next(iter(fonts.values()))
+        replayDisplayList(ops, DisplayListContext(), 0, 0, fonts)
+        self.assertEqual(len(fonts), 1)
+        self.assertIs(next(iter(fonts.values())), font)
+
+
+class AppProcessSystemTest(unittest.TestCase):
+    def setUp(self):
+        setFontFactory(HeadlessFont)
+        self.connection, appConnection = multiprocessing.Pipe()
+        self.system = AppProcessSystem(appConnection, 1600, 800)
+        self.system.lazyConstruction = False
+        self.app = CalculatorApp(self.system, 0, 0)
+        self.system.app = self.app
+        self.displayList = []
+
+    def tearDown(self):
+        self.connection.close()
+        self.system.connection.close()
+
+    # sends a frame like the app process does and applies it like the window system does
+    def receiveFrame(self):
+        self.system.sendFrame()
+        while self.connection.poll():
+            message = self.connection.recv()
+            self.displayList = applyDelta(self.displayList, message[1])
+
+    def center(self, text):
+        button = next(button for button in self.app.buttons if button.text == text)
+        return button.convertPositionToScreen(button.width / 2, button.height / 2)
+
+    def testFramesReproduceTheAppWindow(self):
+        self.receiveFrame()
+        ctx = DisplayListContext()
+        self.app.appWindow.draw(ctx)
+        self.assertEqual(self.displayList, ctx.ops)
+        # unchanged frames are not sent
+        self.system.sendFrame()
+        self.assertFalse(self.connection.poll())
+
+    def testInputIsDispatchedLikeInTheWindowSystem(self):
+        button = next(button for button in self.app.buttons if button.text == "7")
+        x, y = self.center("7")
+        self.system.handleEvent(("moved", x, y))
+        self.assertEqual(button.state, "HOVERED")
+        self.system.handleEvent(("pressed", x, y))
+        self.assertEqual(button.state, "PRESSED")
+        self.system.handleEvent(("released", x, y))
+        self.system.handleEvent(("clicked", x, y))
+        self.assertEqual(self.app.inputLabel.text, "7")
+        self.system.handleEvent(("moved", -1, -1))
+        self.assertEqual(button.state, "NORMAL")
+        for key in "+2=":
+            self.system.handleEvent(("key", key))
+        self.receiveFrame()
+        self.assertIn("9", [op[1] for op in self.displayList if isinstance(op[1], str)])
+
+
+class IsolatedAppTest(unittest.TestCase):
+    def testLaunchDoesNotBlock(self):
+        results = {}
+
+        def script(windowSystem):
+            start = time.monotonic()
+            app = windowSystem.windowManager.launchApp("Calculator")
+            results["launchTime"] = time.monotonic() - start
+            results["placeholder"] = (app.appWindow.identifier, app.started, app.appWindow.parentWindow is windowSystem.screen)
+            waitUntilStarted(windowSystem, app, time.monotonic() + 30)
+
+        def waitUntilStarted(windowSystem, app, deadline):
+            if not app.started and time.monotonic() < deadline:
+                windowSystem.scheduleTimer(50, waitUntilStarted, windowSystem, app, deadline)
+                return
+            results["size"] = (app.appWindow.width, app.appWindow.height)
+            for key in "7+2=":
+                app.handleInput(key)
+            windowSystem.scheduleTimer(50, waitForResult, windowSystem, app, deadline)
+
+        def waitForResult(windowSystem, app, deadline):
+            texts = [op[1] for op in app.displayList if isinstance(op[1], str)]
+            if "9" not in texts and time.monotonic() < deadline:
+                windowSystem.scheduleTimer(50, waitForResult, windowSystem, app, deadline)
+                return
+            results["texts"] = texts
+            # closing the window stops the app process and its poll timer, so the main loop ends
+            windowSystem.windowManager.closeWindow(app.appWindow)
+
+        windowSystem = runHeadless(script, isolatedApps=("CalculatorApp",))
+        self.assertLess(results["launchTime"], 0.5)
+        self.assertEqual(results["placeholder"], ("1 Calculator", False, True))
+        self.assertEqual(results["size"], (220, 350))
+        self.assertIn("9", results["texts"])
+        self.assertEqual(windowSystem.apps, [])
+
+    def testStartTimeout(self):
+        results = {}
+
+        def script(windowSystem):
+            app = RemoteApp(windowSystem, CalculatorApp, 0, 0, startTimeout=0)
+            windowSystem.apps.append(app)
+            windowSystem.windowManager.appsByWindow[app.appWindow] = app
+            results["app"] = app
+
+        with self.assertLogs("RemoteApp", "WARNING"):
+            windowSystem = runHeadless(script)
+        # the window of the app was closed, the window system keeps running
+        self.assertTrue(results["app"].closed)
+        self.assertIsNone(results["app"].appWindow.parentWindow)
+        self.assertEqual(windowSystem.apps, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import os
+import tempfile
+import unittest
+
+import Session
+from tests.headless import runHeadless
+
+
+# apps, positions, sizes, visibility and state of the desktop, in z-order
+def desktopOf(windowSystem):
+    windowManager = windowSystem.windowManager
+    apps = {app.appWindow: app for app in windowSystem.apps}
+    return [(type(apps[window]).__name__, window.identifier, window.x, window.y, window.width, window.height,
+             window.isHidden, windowManager.appState(apps[window]))
+            for window in windowSystem.screen.childWindows if window in apps]
+
+
+# opens some apps and changes their state, position, z-order and visibility
+def arrangeDesktop(windowSystem):
+    windowManager = windowSystem.windowManager
+    calculator = windowManager.launchApp("Calculator")
+    hello = windowManager.launchApp("Hello World")
+    colors = windowManager.launchApp("Colors")
+    for userInput in "12+3":
+        calculator.handleInput(userInput)
+    hello.changeLanguage("German")
+    hello.appWindow.resize(300, 250, 320, 240)
+    windowManager.minimizeWindow(colors.appWindow)
+    windowSystem.bringWindowToFront(calculator.appWindow)
+
+
+class SessionTest(unittest.TestCase):
+    def testRoundTrip(self):
+        saved = {}
+
+        def save(windowSystem):
+            arrangeDesktop(windowSystem)
+            saved["desktop"] = desktopOf(windowSystem)
+            saved["data"] = Session.serializeSession(windowSystem)
+
+        def restore(windowSystem):
+            restored = Session.restoreSession(windowSystem, saved["data"])
+            self.assertEqual(len(restored), 3)
+            self.assertEqual(desktopOf(windowSystem), saved["desktop"])
+            # nothing is lost or added by a second round trip
+            self.assertEqual(Session.serializeSession(windowSystem), saved["data"])
+
+        runHeadless(save)
+        self.assertEqual([record.className for record in Session.parseSession(saved["data"])],
+                         ["CalculatorApp", "HelloWorldApp", "ColorsApp"])
+        calculatorState = saved["desktop"][-1][-1]
+        self.assertEqual((calculatorState["text"], calculatorState["prevOperation"]), ("3", "ADD"))
+        runHeadless(restore)
+
+    def testCorruptSessionIsIgnored(self):
+        def restoreCorrupt(windowSystem):
+            arrangeDesktop(windowSystem)
+            data = Session.serializeSession(windowSystem)
+            outdated = data[:4] + (Session.SESSION_VERSION + 1).to_bytes(2, "little") + data[6:]
+            for corrupt in (b"", b"no session", data[:Session.HEADER.size + 10], data[:-1], outdated):
+                with self.assertLogs("Session", "WARNING"):
+                    self.assertEqual(Session.restoreSession(windowSystem, corrupt), [])
+            self.assertEqual(len(windowSystem.apps), 3)
+
+        runHeadless(restoreCorrupt)
+
+    def testSaveAndLoad(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.dws")
+
+            def save(windowSystem):
+                arrangeDesktop(windowSystem)
+                Session.saveSession(windowSystem, path)
+                self.assertEqual(os.listdir(directory), ["session.dws"])
+
+            def load(windowSystem):
+                self.assertEqual(len(Session.loadSession(windowSystem, path)), 3)
+                with self.assertLogs("Session", "WARNING"):
+                    self.assertEqual(Session.loadSession(windowSystem, os.path.join(directory, "missing.dws")), [])
+
+            runHeadless(save)
+            runHeadless(load)
+
+    def testAutosave(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.dws")
+
+            # the main loop ends after the save timer of the changes ran
+            windowSystem = runHeadless(arrangeDesktop, sessionPath=path, sessionSaveDelay=10)
+            with open(path, "rb") as file:
+                records = Session.parseSession(file.read())
+            self.assertEqual(len(records), 3)
+            self.assertEqual(len(windowSystem.apps), 3)
+
+            # the next start restores the session
+            opened = []
+            runHeadless(lambda restored: opened.extend(restored.apps), sessionPath=path, sessionSaveDelay=10)
+            self.assertEqual([type(app).__name__ for app in opened], ["CalculatorApp", "HelloWorldApp", "ColorsApp"])
+
+    def testRestoredIdentifiersAreNotReused(self):
+        saved = {}
+
+        def save(windowSystem):
+            windowManager = windowSystem.windowManager
+            first = windowManager.launchApp("Calculator")
+            windowManager.launchApp("Calculator")
+            windowManager.closeWindow(first.appWindow)
+            saved["data"] = Session.serializeSession(windowSystem)
+
+        def restore(windowSystem):
+            windowManager = windowSystem.windowManager
+            launched = windowManager.launchApp("Calculator")
+            self.assertEqual(launched.appWindow.identifier, "1 Calculator")
+            [restored] = Session.restoreSession(windowSystem, saved["data"])
+            self.assertEqual(restored.appWindow.identifier, "2 Calculator")
+            self.assertEqual(windowManager.launchApp("Calculator").appWindow.identifier, "3 Calculator")
+            self.assertEqual(windowManager.launchApp("Hello World").appWindow.identifier, "1 HelloWorld")
+
+        runHeadless(save)
+        runHeadless(restore)
+
+    def testCloseWindowWithSameIdentifier(self):
+        saved = {}
+
+        def save(windowSystem):
+            windowSystem.windowManager.launchApp("Calculator")
+            saved["data"] = Session.serializeSession(windowSystem)
+
+        def restore(windowSystem):
+            windowManager = windowSystem.windowManager
+            # the restored window has the identifier of the window that is already open
+            launched = windowManager.launchApp("Calculator")
+            [restored] = Session.restoreSession(windowSystem, saved["data"])
+            self.assertEqual(restored.appWindow.identifier, launched.appWindow.identifier)
+            windowManager.closeWindow(restored.appWindow)
+            self.assertEqual(windowSystem.apps, [launched])
+            self.assertIs(launched.appWindow.parentWindow, windowSystem.screen)
+
+        runHeadless(save)
+        runHeadless(restore)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Replay import dispatchEvent
+from tests.headless import runHeadless
+from UITK import Slider
+
+
+class SliderRepaintTest(unittest.TestCase):
+    # creates a slider whose action records the value and the number of frames painted before it ran
+    @staticmethod
+    def createSlider(windowSystem, actions):
+        window = windowSystem.createWindowOnScreen(100, 100, 400, 200, "1 Window")
+        slider = Slider(50, 80, 300, 20, "Slider",
+                        action=lambda: actions.append((slider.sliderValue, windowSystem.framesPainted)))
+        window.addChildWindow(slider)
+        return slider
+
+    def testOneRepaintPerDragEvent(self):
+        results = {"actions": [], "ticks": []}
+
+        def script(windowSystem):
+            slider = self.createSlider(windowSystem, results["actions"])
+            windowSystem.scheduleTimer(50, drag, windowSystem, slider)
+
+        def drag(windowSystem, slider):
+            results["framesBefore"] = windowSystem.framesPainted
+            x, y = slider.convertPositionToScreen(150, 10)
+            dispatchEvent(windowSystem, {"type": "pressed", "x": x, "y": y})
+            for i in range(1, 11):
+                windowSystem.scheduleTimer(i * 40, dragTo, windowSystem, x + i * 10, y)
+            windowSystem.scheduleTimer(500, done, windowSystem)
+
+        def dragTo(windowSystem, x, y):
+            dispatchEvent(windowSystem, {"type": "dragged", "x": x, "y": y})
+            # the action runs with the repaint after the event, the event loop is not woken up for it
+            results["ticks"].append(windowSystem.asyncBridge.tickScheduled)
+
+        def done(windowSystem):
+            results["frames"] = windowSystem.framesPainted - results["framesBefore"]
+
+        runHeadless(script)
+        # the press (in the middle of the slider, the value stays 0.5) and the drag events painted one frame each, the
+        # action ran once per drag event, before the frame was painted
+        framesBefore = results["framesBefore"]
+        self.assertEqual(results["frames"], 11)
+        self.assertEqual([frame for _, frame in results["actions"]], list(range(framesBefore + 1, framesBefore + 11)))
+        self.assertEqual(results["ticks"], [False] * 10)
+
+    def testValueChangedOutsideOfEvents(self):
+        results = {"actions": []}
+
+        def script(windowSystem):
+            slider = self.createSlider(windowSystem, results["actions"])
+            windowSystem.scheduleTimer(50, change, windowSystem, slider)
+
+        def change(windowSystem, slider):
+            results["framesBefore"] = windowSystem.framesPainted
+            slider.setValue(0.2)
+            slider.setValue(0.3)
+            results["frames"] = windowSystem.framesPainted - results["framesBefore"]
+
+        runHeadless(script)
+        # every change outside of an event is painted, the action runs before each frame
+        self.assertEqual(results["frames"], 2)
+        self.assertEqual(results["actions"], [(0.2, results["framesBefore"]), (0.3, results["framesBefore"] + 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
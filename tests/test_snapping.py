@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Snapping import EdgeIndex, nearestEdge
+from tests.headless import runHeadless
+
+
+class NearestEdgeTest(unittest.TestCase):
+    def testWithinThreshold(self):
+        self.assertEqual(nearestEdge([0, 100, 200], 108, 10), 100)
+        # the threshold is inclusive
+        self.assertEqual(nearestEdge([0, 100, 200], 90, 10), 100)
+
+    def testOutsideThreshold(self):
+        self.assertIsNone(nearestEdge([0, 100, 200], 111, 10))
+        self.assertIsNone(nearestEdge([], 0, 10))
+
+    def testClosestEdge(self):
+        self.assertEqual(nearestEdge([100, 108], 105, 10), 108)
+        self.assertEqual(nearestEdge([100, 108], 103, 10), 100)
+        # before the first and after the last edge
+        self.assertEqual(nearestEdge([100, 200], 95, 10), 100)
+        self.assertEqual(nearestEdge([100, 200], 205, 10), 200)
+
+
+class EdgeIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = EdgeIndex()
+        self.index.update("screen", (0, 1600), (0, 765))
+        self.index.update("window", (400, 600), (300, 450))
+
+    def testSnapStartEdge(self):
+        # left edge to the right edge of the window, top edge to the top of the screen
+        self.assertEqual(self.index.snap(605, 6, 100, 100, 10), (600, 0))
+
+    def testSnapEndEdge(self):
+        # right edge to the left edge of the window, bottom edge to the top of the taskbar
+        self.assertEqual(self.index.snap(292, 670, 100, 100, 10), (300, 665))
+
+    def testCloserEdgeWins(self):
+        # the left edge is 4px from 400, the right edge (396 + 207) 3px from 600
+        self.assertEqual(self.index.snap(396, 200, 207, 100, 10), (393, 200))
+
+    def testNoSnapOutsideThreshold(self):
+        self.assertEqual(self.index.snap(615, 20, 100, 100, 10), (615, 20))
+        # snapping is disabled with threshold 0 unless the edges already touch
+        self.assertEqual(self.index.snap(605, 6, 100, 100, 0), (605, 6))
+
+    def testUpdateReplacesEdges(self):
+        self.index.update("window", (800, 1000), (300, 450))
+        self.assertEqual(self.index.xEdges, [0, 800, 1000, 1600])
+        self.assertEqual(self.index.snap(605, 200, 100, 100, 10), (605, 200))
+        self.assertEqual(self.index.snap(1005, 200, 100, 100, 10), (1000, 200))
+
+    def testUpdateWithSameEdges(self):
+        self.index.update("window", (400, 600), (300, 450))
+        self.assertEqual(self.index.xEdges, [0, 400, 600, 1600])
+        self.assertEqual(self.index.yEdges, [0, 300, 450, 765])
+
+    def testDuplicateEdgesOfDifferentOwners(self):
+        self.index.update("other", (400, 500), (0, 100))
+        self.index.remove("window")
+        self.assertEqual(self.index.xEdges, [0, 400, 500, 1600])
+        self.assertEqual(self.index.yEdges, [0, 0, 100, 765])
+
+    def testRemove(self):
+        self.index.remove("window")
+        self.index.remove("unknown")
+        self.assertEqual(self.index.owners(), ["screen"])
+        self.assertEqual(self.index.snap(605, 200, 100, 100, 10), (605, 200))
+
+
+class TitleBarSnappingTest(unittest.TestCase):
+    def testDraggedWindowSnaps(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            target = windowSystem.createWindowOnScreen(400, 300, 200, 150, "1 Target")
+            dragged = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Dragged")
+            # right edge 4px left of the target (handleTitleBarDragged(window, x, y, offsetX, offsetY))
+            windowManager.handleTitleBarDragged(dragged, 196, 100, 0, 0)
+            self.assertEqual((dragged.x, dragged.y), (200, 100))
+            windowManager.handleTitleBarDragged(dragged, 185, 100, 0, 0)
+            self.assertEqual((dragged.x, dragged.y), (185, 100))
+            windowManager.handleTitleBarDragged(dragged, 7, 3, 0, 0)
+            self.assertEqual((dragged.x, dragged.y), (0, 0))
+            windowManager.endTitleBarDrag()
+
+            # minimized windows have no edges
+            windowManager.minimizeWindow(target)
+            windowManager.handleTitleBarDragged(dragged, 196, 100, 0, 0)
+            self.assertEqual((dragged.x, dragged.y), (196, 100))
+            windowManager.endTitleBarDrag()
+
+            windowManager.snapThreshold = 0
+            windowManager.handleTitleBarDragged(dragged, 7, 3, 0, 0)
+            self.assertEqual((dragged.x, dragged.y), (7, 3))
+
+        runHeadless(script)
+
+    def testOnlyChangedWindowsAreIndexed(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            windows = [windowSystem.createWindowOnScreen(i * 50, i * 20, 200, 150, "1 Window") for i in range(20)]
+            dragged = windows[-1]
+            windowManager.handleTitleBarDragged(dragged, 1000, 600, 0, 0)
+            windowManager.endTitleBarDrag()
+            self.assertEqual(len(windowManager.edgeIndex.owners()), 20)
+
+            updatedOwners = []
+            update = windowManager.edgeIndex.update
+            windowManager.edgeIndex.update = lambda owner, *edges: (updatedOwners.append(owner), update(owner, *edges))
+            windows[0].resize(0, 0, 300, 300)
+            windowManager.closeWindow(windows[1])
+            windowManager.handleTitleBarDragged(windows[2], 700, 20, 0, 0)
+            self.assertEqual(set(updatedOwners) - {windowSystem.screen}, {windows[0], dragged})
+            edges = windowManager.edgeIndex.edgesByOwner
+            self.assertEqual(edges[windows[0]], ((0, 300), (0, 300)))
+            self.assertEqual(edges[dragged], ((1000, 1200), (600, 750)))
+            self.assertNotIn(windows[1], edges)
+            self.assertNotIn(windows[2], edges)
+            windowManager.endTitleBarDrag()
+
+        runHeadless(script)
+
+    def testVisibilityIsComputedWhenTheDragEnds(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            back = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Back")
+            front = windowSystem.createWindowOnScreen(500, 100, 300, 300, "1 Front")
+            windowManager.updateVisibility()
+            windowManager.handleTitleBarDragged(front, 90, 90, 0, 0)
+            self.assertFalse(windowManager.updateVisibility())
+            self.assertEqual(windowManager.windowVisibility[back], "shown")
+            windowManager.endTitleBarDrag()
+            self.assertTrue(windowManager.updateVisibility())
+            self.assertEqual(windowManager.windowVisibility[back], "occluded")
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from AppRegistry import AppEntry, AppRegistry
+from tests.headless import runHeadless
+
+ICON = ([(0, 0, 35, 35)], ["red"], [(5, 5, 30, 30)])
+
+
+class StartMenuTest(unittest.TestCase):
+    @staticmethod
+    def registryWithItems(count, launched):
+        registry = AppRegistry()
+        for i in range(count):
+            registry.register(AppEntry("Item " + str(i), ICON,
+                                       lambda windowManager, x, y, i=i: launched.append((i, x, y)), i, 2 * i))
+        return registry
+
+    def testItemsAreResolvedByIndex(self):
+        launched = []
+
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            windowManager.appRegistry = self.registryWithItems(3, launched)
+            windowManager.startMenuVisible = True
+            bottom = windowSystem.height - windowManager.taskBarHeight
+            top = bottom - windowManager.startMenuHeight
+            self.assertEqual(windowManager.startMenuHeight, 3 * windowManager.startMenuItemHeight)
+            self.assertEqual([windowManager.startMenuItemAtY(y) for y in (top, top + 49, top + 50, bottom - 1)],
+                             [0, 0, 1, 2])
+            # no items above and below the start menu
+            self.assertIsNone(windowManager.startMenuItemAtY(top - 1))
+            self.assertIsNone(windowManager.startMenuItemAtY(bottom))
+            windowManager.handleStartMenuClicked(top + 60)
+            windowManager.handleStartMenuClicked(bottom + 5)
+            self.assertEqual(launched, [(1, 1, 2)])
+
+        runHeadless(script)
+
+    def testScrolling(self):
+        launched = []
+
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            windowManager.appRegistry = self.registryWithItems(40, launched)
+            visibleItems = windowManager.startMenuVisibleItems()
+            self.assertLess(visibleItems, 40)
+            # the start menu fits between the top of the screen and the taskbar
+            self.assertEqual(windowManager.startMenuHeight, visibleItems * windowManager.startMenuItemHeight)
+            bottom = windowSystem.height - windowManager.taskBarHeight
+            top = bottom - windowManager.startMenuHeight
+            windowManager.scrollStartMenu(-5)
+            self.assertEqual(windowManager.startMenuItemAtY(top), 5)
+            # scrolling stops at the last and the first item
+            windowManager.scrollStartMenu(-100)
+            self.assertEqual(windowManager.startMenuItemAtY(bottom - 1), 39)
+            windowManager.scrollStartMenu(100)
+            self.assertEqual(windowManager.startMenuScroll, 0)
+            # the open start menu is drawn with the visible items only
+            windowManager.startMenuVisible = True
+            windowSystem.requestRepaint()
+
+        runHeadless(script)
+
+    def testIconsAreCachedUntilTheRegistryChanges(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            registry = self.registryWithItems(2, [])
+            windowManager.appRegistry = registry
+            icon = windowManager.startMenuIcon(1)
+            # moved to the position of the icon in the item
+            self.assertEqual(icon, ([(10, 7.5, 45, 42.5)], ["red"], [(15, 12.5, 40, 37.5)]))
+            self.assertIs(windowManager.startMenuIcon(1), icon)
+            registry.register(AppEntry("No Icon", None, lambda windowManager, x, y: None))
+            self.assertIsNot(windowManager.startMenuIcon(1), icon)
+            self.assertEqual(windowManager.startMenuIcon(1), icon)
+            self.assertIsNone(windowManager.startMenuIcon(2))
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import gc
+import unittest
+
+import UITK
+from tests.headless import runHeadless
+from UITK import Button, InternTable, Label, Style, internFont, internStyle, resolveStyle
+
+
+class InternTableTest(unittest.TestCase):
+    def testKeepsMostRecentlyUsedValues(self):
+        table = InternTable(3)
+        first = table.intern("a", lambda: ["a"])
+        table.intern("b", lambda: ["b"])
+        table.intern("c", lambda: ["c"])
+        # using "a" again makes "b" the least recently used value
+        self.assertIs(table.intern("a", lambda: ["new a"]), first)
+        table.intern("d", lambda: ["d"])
+        self.assertEqual(len(table), 3)
+        self.assertIs(table.intern("a", lambda: ["new a"]), first)
+        self.assertEqual(table.intern("b", lambda: ["new b"]), ["new b"])
+
+    def testWeakValuesStayWhileReferenced(self):
+        class Value:
+            pass
+
+        table = InternTable(1, weak=True)
+        used = table.intern("used", Value)
+        table.intern("unused", Value)
+        # dropped from the table but still referenced: the same value is returned
+        self.assertIs(table.intern("used", Value), used)
+        table.intern("other", Value)
+        gc.collect()
+        self.assertNotIn("unused", table.weakValues)
+
+
+class StyleTest(unittest.TestCase):
+    def testWidgetsShareStyles(self):
+        def script(windowSystem):
+            font = internFont(family="Helvetica", size=14)
+            first = Label(0, 0, 100, 30, "First", "One", font=font, fontColor="red")
+            second = Label(0, 40, 100, 30, "Second", "Two", font=internFont(family="Helvetica", size=14),
+                           fontColor="red")
+            self.assertIs(first.style, second.style)
+            button = Button(0, 0, 40, 40, "Button", "OK", "red", "blue", font=font, fontColor="red")
+            other = Button(50, 0, 40, 40, "Other", "OK", "red", "blue", font=font, fontColor="red")
+            self.assertIs(button.style, other.style)
+            self.assertIs(button.resolvedStyle(), other.resolvedStyle())
+
+        runHeadless(script)
+
+    def testStylePropertyCopiesOnWrite(self):
+        def script(windowSystem):
+            first = Label(0, 0, 100, 30, "First", "One", fontColor="red")
+            second = Label(0, 40, 100, 30, "Second", "Two", fontColor="red")
+            sharedStyle = first.style
+            first.fontColor = "blue"
+            # the other label and the shared style are unchanged
+            self.assertEqual(first.fontColor, "blue")
+            self.assertEqual(second.fontColor, "red")
+            self.assertIs(second.style, sharedStyle)
+            self.assertEqual(sharedStyle.fontColor, "red")
+            # the new style is shared with labels that look the same
+            third = Label(0, 80, 100, 30, "Third", "Three", fontColor="blue")
+            self.assertIs(third.style, first.style)
+            self.assertEqual(third.resolvedStyle().fontColor, "blue")
+            # setting the same value keeps the style
+            style = second.style
+            second.fontColor = "red"
+            self.assertIs(second.style, style)
+
+        runHeadless(script)
+
+    def testUsedStylesStayInternedWhenTheTableIsFull(self):
+        def script(windowSystem):
+            label = Label(0, 0, 100, 30, "Label", "Text", fontColor="red")
+            button = Button(0, 0, 40, 40, "Button", "OK", "red", "blue")
+            resolved = button.resolvedStyle()
+            # e.g. the color of a label follows a slider
+            slider = Label(0, 40, 100, 30, "Slider", "0", fontColor="red")
+            for i in range(UITK.MAX_INTERNED_STYLES * 2):
+                slider.fontColor = "#%06x" % i
+                slider.resolvedStyle()
+                # the other widgets are created and drawn in between
+                internStyle(Style(label.style.font, "red", label.style.backgroundColor))
+                button.resolvedStyle()
+            self.assertLessEqual(len(UITK.internedStyles), UITK.MAX_INTERNED_STYLES)
+            self.assertLessEqual(len(UITK.resolvedStyles), UITK.MAX_INTERNED_STYLES)
+            self.assertIs(Label(0, 80, 100, 30, "Copy", "Text", fontColor="red").style, label.style)
+            self.assertIs(resolveStyle(Button, button.style, "NORMAL"), resolved)
+
+        runHeadless(script)
+
+    def testFontsAreBounded(self):
+        def script(windowSystem):
+            font = internFont(family="Helvetica", size=14)
+            for size in range(UITK.MAX_INTERNED_FONTS * 2):
+                internFont(family="Helvetica", size=size + 100)
+            self.assertLessEqual(len(UITK.internedFonts), UITK.MAX_INTERNED_FONTS)
+            # still used: the same font
+            self.assertIs(internFont(family="Helvetica", size=14), font)
+            self.assertIs(internFont(size=14, family="Helvetica"), font)
+
+        runHeadless(script)
+
+
+if __name__ == '__main__':
+    unittest.main()
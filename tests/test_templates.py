@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from CalculatorApp import CALCULATOR_TEMPLATE
+from Templates import Template
+from tests.headless import runHeadless
+from UITK import Button, Container, Label
+from Window import Window, deferredLayout
+
+# label over the full width and a row of two buttons in a container that grows with the parent
+SPECS = [{"type": "Label", "id": "title", "frame": [0, 10, 0, 30], "anchors": ["top"], "text": "Title",
+          "font": {"family": "Helvetica", "size": 14}},
+         {"type": "Container", "id": "row", "frame": [10, 50, -20, 40], "anchors": ["left", "right", "bottom"],
+          "spacing": 10,
+          "items": [{"type": "Button", "id": "ok", "frame": [0, 0, 40, 40], "text": "OK",
+                     "hoverBackgroundColor": "#A0A0A0", "pressedBackgroundColor": "#808080"},
+                    {"type": "Button", "id": "cancel", "frame": [0, 0, 40, 40], "text": "Cancel",
+                     "hoverBackgroundColor": "#A0A0A0", "pressedBackgroundColor": "#808080"}]}]
+
+
+# frames (relative to the parent) and texts of a window tree, in the order of the child window lists
+def treeOf(window):
+    return [(type(child).__name__, child.identifier, child.x, child.y, child.width, child.height,
+             getattr(child, "text", None), treeOf(child)) for child in window.childWindows]
+
+
+# all windows of a tree (without the root)
+def windowsOf(window):
+    windows = []
+    for child in window.childWindows:
+        windows.append(child)
+        windows.extend(windowsOf(child))
+    return windows
+
+
+class TemplateTest(unittest.TestCase):
+    def testCopyMatchesFreshBuild(self):
+        def script(windowSystem):
+            template = Template(SPECS)
+            first = windowSystem.createWindowOnScreen(0, 0, 300, 200, "1 First")
+            second = windowSystem.createWindowOnScreen(400, 0, 300, 200, "1 Second")
+            firstWidgets = template.instantiate(first)
+            self.assertIn((300, 200), template.prototypes)
+            secondWidgets = template.instantiate(second)
+            self.assertEqual(treeOf(second), treeOf(first))
+            self.assertEqual(set(secondWidgets), {"title", "row", "ok", "cancel"})
+            self.assertIsInstance(secondWidgets["row"], Container)
+            self.assertIsInstance(secondWidgets["ok"], Button)
+            self.assertIsInstance(secondWidgets["title"], Label)
+
+            # the copy shares no windows with the first instance and the prototype
+            prototypeWindows = {id(window) for root in template.prototypes[(300, 200)]
+                                for window in [root] + windowsOf(root)}
+            for window in windowsOf(second):
+                self.assertNotIn(window, firstWidgets.values())
+                self.assertNotIn(id(window), prototypeWindows)
+                self.assertIs(window.getTopLevelWindow(), second)
+            # the container of the copy lays out the copied buttons
+            row = secondWidgets["row"]
+            self.assertEqual(row.containerWindows, [secondWidgets["ok"], secondWidgets["cancel"]])
+            self.assertIs(secondWidgets["ok"].layoutContainer, row)
+
+            # both are laid out the same way after a resize
+            first.resize(0, 0, 500, 260)
+            second.resize(400, 0, 500, 260)
+            self.assertEqual(treeOf(second), treeOf(first))
+            self.assertEqual(secondWidgets["cancel"].x, 255)
+            self.assertEqual(firstWidgets["cancel"].x, 255)
+
+        runHeadless(script)
+
+    def testNewPrototypePerSize(self):
+        def script(windowSystem):
+            template = Template(SPECS)
+            small = windowSystem.createWindowOnScreen(0, 0, 300, 200, "1 Small")
+            big = windowSystem.createWindowOnScreen(0, 0, 500, 260, "1 Big")
+            template.instantiate(small)
+            template.instantiate(big)
+            self.assertEqual(set(template.prototypes), {(300, 200), (500, 260)})
+            self.assertEqual(template.instantiate(Window(0, 0, 500, 260, "1 Detached"))["cancel"].x, 255)
+
+        runHeadless(script)
+
+    def testNoPrototypeWhileLayoutIsDeferred(self):
+        def script(windowSystem):
+            template = Template(SPECS)
+            with deferredLayout():
+                template.instantiate(windowSystem.createWindowOnScreen(0, 0, 300, 200, "1 Deferred"))
+            self.assertEqual(template.prototypes, {})
+
+        runHeadless(script)
+
+    def testStepsOfFreshBuildAndCopy(self):
+        def script(windowSystem):
+            template = Template(SPECS)
+            steps = template.instantiateInSteps(windowSystem.createWindowOnScreen(0, 0, 300, 200, "1 First"))
+            # one step per top-level spec
+            self.assertEqual(sum(1 for _ in steps), len(SPECS) - 1)
+            steps = template.instantiateInSteps(windowSystem.createWindowOnScreen(0, 0, 300, 200, "1 Second"))
+            self.assertEqual(sum(1 for _ in steps), 0)
+
+        runHeadless(script)
+
+
+class CalculatorTemplateTest(unittest.TestCase):
+    # clicks the calculator button with the given label
+    @staticmethod
+    def click(windowSystem, calculator, text):
+        button = next(button for button in calculator.buttons if button.text == text)
+        x, y = button.convertPositionToScreen(button.width / 2, button.height / 2)
+        windowSystem.handleMousePressed(x, y)
+        windowSystem.handleMouseReleased(x, y)
+
+    def testCopiedCalculatorMatchesFreshBuild(self):
+        def script(windowSystem):
+            CALCULATOR_TEMPLATE.prototypes.clear()
+            first = windowSystem.windowManager.launchApp("Calculator")
+            second = windowSystem.windowManager.launchApp("Calculator")
+            self.assertEqual(len(CALCULATOR_TEMPLATE.prototypes), 1)
+            self.assertEqual(treeOf(second.appWindow), treeOf(first.appWindow))
+
+            # the buttons of the copy call the copied app
+            for text in ("7", "+", "2", "="):
+                self.click(windowSystem, second, text)
+            self.assertEqual(second.inputLabel.text, "9")
+            self.assertEqual(first.inputLabel.text, "0")
+            # the first calculator is covered by the second one
+            windowSystem.bringWindowToFront(first.appWindow)
+            for text in ("3", "x", "4", "="):
+                self.click(windowSystem, first, text)
+            self.assertEqual(first.inputLabel.text, "12")
+            self.assertEqual(second.inputLabel.text, "9")
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
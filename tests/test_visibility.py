@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+from unittest import mock
+
+from tests.headless import runHeadless
+from Window import Window
+
+
+class RecordingWindow(Window):
+    """
+    Child window that records its visibility events.
+    """
+    def __init__(self, x, y, width, height, identifier):
+        super().__init__(x, y, width, height, identifier)
+        self.events = []
+
+    def handleVisibilityChanged(self, event):
+        super().handleVisibilityChanged(event)
+        self.events.append(event)
+
+
+class VisibilityTest(unittest.TestCase):
+    @staticmethod
+    def moveWindow(windowSystem, window, x, y):
+        window.x, window.y = x, y
+        Window.layoutGeneration += 1
+        windowSystem.windowManager.topLevelWindowChanged(window)
+
+    def testEventsOfTopLevelWindows(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            window = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Window")
+            child = RecordingWindow(10, 30, 50, 50, "Child")
+            window.addChildWindow(child)
+            windowManager.updateVisibility()
+            windowManager.minimizeWindow(window)
+            window.isHidden = False
+            windowManager.topLevelWindowChanged(window)
+            windowManager.updateVisibility()
+            cover = windowSystem.createWindowOnScreen(50, 50, 400, 400, "1 Cover")
+            windowManager.updateVisibility()
+            self.moveWindow(windowSystem, cover, 500, 50)
+            windowManager.updateVisibility()
+            self.assertEqual(child.events, ["hidden", "shown", "occluded", "exposed"])
+            # nothing changed: no events
+            self.assertFalse(windowManager.updateVisibility())
+
+        runHeadless(script)
+
+    def testPartlyCoveredWindowStaysShown(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            window = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Window")
+            # covered by two windows together
+            windowSystem.createWindowOnScreen(50, 50, 200, 300, "1 Left")
+            right = windowSystem.createWindowOnScreen(240, 50, 200, 300, "1 Right")
+            windowManager.updateVisibility()
+            self.assertEqual(windowManager.windowVisibility[window], "occluded")
+            self.moveWindow(windowSystem, right, 260, 50)
+            windowManager.updateVisibility()
+            self.assertEqual(windowManager.windowVisibility[window], "shown")
+
+        runHeadless(script)
+
+    def testOnlyWindowsNearChangesAreComputed(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            far = windowSystem.createWindowOnScreen(1000, 100, 200, 150, "1 Far")
+            near = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Near")
+            moved = windowSystem.createWindowOnScreen(400, 100, 200, 150, "1 Moved")
+            windowManager.updateVisibility()
+            self.moveWindow(windowSystem, moved, 150, 120)
+            with mock.patch.object(windowManager, "isFullyOccluded", wraps=windowManager.isFullyOccluded) as occluded:
+                windowManager.updateVisibility()
+            self.assertEqual({call.args[0] for call in occluded.call_args_list}, {near, moved})
+
+        runHeadless(script)
+
+    def testClippedChildIsHidden(self):
+        def script(windowSystem):
+            window = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Window")
+            child = RecordingWindow(150, 30, 40, 40, "Child")
+            window.addChildWindow(child)
+            window.getDrawingSize()
+            child.getDrawingSize()
+            self.assertEqual(child.events, [])
+            window.width = 120
+            child.getDrawingSize()
+            window.width = 200
+            child.getDrawingSize()
+            self.assertEqual(child.events, ["hidden", "shown"])
+
+        runHeadless(script)
+
+    def testHiddenColorsAppDefersItsUpdate(self):
+        def script(windowSystem):
+            windowManager = windowSystem.windowManager
+            app = windowManager.launchApp("Colors")
+            windowManager.minimizeWindow(app.appWindow)
+            color = app.hexLabel.text
+            app.sliders[0].setValue(1)
+            app.updateColors()
+            self.assertEqual(app.hexLabel.text, color)
+            self.assertTrue(app.colorsOutdated)
+            app.appWindow.isHidden = False
+            windowManager.topLevelWindowChanged(app.appWindow)
+            windowManager.updateVisibility()
+            self.assertNotEqual(app.hexLabel.text, color)
+            self.assertFalse(app.colorsOutdated)
+
+        runHeadless(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
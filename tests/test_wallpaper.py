@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Framebuffer import FramebufferContext
+from Wallpaper import WALLPAPER_CELL_SIZE, draw_wallpaper, loadWallpaper
+
+
+class WallpaperTest(unittest.TestCase):
+    def testCellsCoverTheScreen(self):
+        rects, colors = loadWallpaper()
+        self.assertEqual(len(rects), len(colors))
+        for color in colors:
+            self.assertRegex(color, "^#[0-9a-f]{6}$")
+        # a grid without gaps that covers the default resolution
+        columns = {x1 for x1, _, _, _ in rects}
+        rows = {y1 for _, y1, _, _ in rects}
+        self.assertEqual(len(rects), len(columns) * len(rows))
+        self.assertEqual(sorted(columns), list(range(0, len(columns) * WALLPAPER_CELL_SIZE, WALLPAPER_CELL_SIZE)))
+        self.assertGreaterEqual(len(columns) * WALLPAPER_CELL_SIZE, 1600)
+        self.assertGreaterEqual(len(rows) * WALLPAPER_CELL_SIZE, 800)
+        # read only once
+        self.assertIs(loadWallpaper()[0], rects)
+
+    def testDrawnColors(self):
+        rects, colors = loadWallpaper()
+        framebuffer = FramebufferContext(200, 100)
+        self.addCleanup(framebuffer.close)
+        framebuffer.setOrigin(30, 30)
+        draw_wallpaper(framebuffer)
+        for (x1, y1, x2, y2), color in zip(rects, colors):
+            if x2 <= 200 and y2 <= 100:
+                start = ((y1 + 1) * framebuffer.width + x1 + 1) * 4
+                self.assertEqual(bytes(framebuffer.buffer[start:start + 3]).hex(), color[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
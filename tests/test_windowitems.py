@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from Replay import dispatchEvent
+from tests.headless import runHeadless
+from WindowSystem import HANDLED_WITHOUT_REPAINT
+
+
+class RecordingCanvas:
+    """
+    Records the calls of the window system to the canvas of the Tk backend (the headless backend has none).
+    """
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name,) + args)
+
+
+class WindowItemsTest(unittest.TestCase):
+    def runWithCanvas(self, script):
+        def start(windowSystem):
+            windowSystem._canvas = RecordingCanvas()
+            script(windowSystem, windowSystem._canvas)
+
+        runHeadless(start)
+
+    def testMovedWindowKeepsItsItems(self):
+        def script(windowSystem, canvas):
+            back = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Back")
+            front = windowSystem.createWindowOnScreen(500, 100, 300, 300, "1 Front")
+            windowSystem.windowManager.updateVisibility()
+            # the window covers the other one after the move (it snaps to its origin): its items are moved anyway, the
+            # visibility is computed when the drag ends
+            result = windowSystem.windowManager.handleTitleBarDragged(front, 90, 90, 0, 0)
+            self.assertIn(("move", windowSystem.canvasTagOf(front), -400, 0), canvas.calls)
+            self.assertEqual(result, HANDLED_WITHOUT_REPAINT)
+            self.assertEqual(windowSystem.windowManager.windowVisibility[back], "shown")
+
+        self.runWithCanvas(script)
+
+    def testRaisedWindowKeepsItsItems(self):
+        def script(windowSystem, canvas):
+            first = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 First")
+            second = windowSystem.createWindowOnScreen(500, 100, 200, 150, "1 Second")
+            windowSystem.windowManager.updateVisibility()
+            windowSystem.bringWindowToFront(first)
+            self.assertTrue(windowSystem.raiseWindowItems(first, second))
+            self.assertIn(("tag_lower", windowSystem.canvasTagOf(first), "chrome"), canvas.calls)
+
+        self.runWithCanvas(script)
+
+    def testRaiseThatUncoversAWindowRepaints(self):
+        def script(windowSystem, canvas):
+            covered = windowSystem.createWindowOnScreen(100, 100, 200, 150, "1 Covered")
+            cover = windowSystem.createWindowOnScreen(50, 50, 400, 400, "1 Cover")
+            windowSystem.windowManager.updateVisibility()
+            self.assertEqual(windowSystem.windowManager.windowVisibility[covered], "occluded")
+            windowSystem.bringWindowToFront(covered)
+            # the items are raised first, the visibility is computed after the raise
+            self.assertFalse(windowSystem.raiseWindowItems(covered, cover))
+            self.assertIn(("tag_lower", windowSystem.canvasTagOf(covered), "chrome"), canvas.calls)
+            self.assertEqual(windowSystem.windowManager.windowVisibility[covered], "shown")
+
+        self.runWithCanvas(script)
+
+    def testEventAfterPartialRepaintRepaints(self):
+        def script(windowSystem, canvas):
+            from CalculatorApp import CalculatorApp
+            app = CalculatorApp(windowSystem, 100, 100)
+            windowSystem.requestRepaint()
+            taskbarY = windowSystem.height - 5
+            frames = windowSystem.framesPainted
+            # opening the start menu only redraws its layers
+            dispatchEvent(windowSystem, {"type": "pressed", "x": 5, "y": taskbarY})
+            dispatchEvent(windowSystem, {"type": "released", "x": 5, "y": taskbarY})
+            self.assertIn(("delete", "overlay"), canvas.calls)
+            self.assertEqual(windowSystem.framesPainted, frames)
+            # the next event is repainted after, even though the previous one was not
+            dispatchEvent(windowSystem, {"type": "key", "char": "7"})
+            self.assertEqual(windowSystem.framesPainted, frames + 1)
+            # a press on the taskbar changes nothing, a press on the window that is already in front is repainted
+            dispatchEvent(windowSystem, {"type": "pressed", "x": 5, "y": taskbarY})
+            self.assertEqual(windowSystem.framesPainted, frames + 1)
+            x, y = app.appWindow.convertPositionToScreen(5, 5)
+            dispatchEvent(windowSystem, {"type": "pressed", "x": x, "y": y})
+            self.assertEqual(windowSystem.framesPainted, frames + 2)
+
+        self.runWithCanvas(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
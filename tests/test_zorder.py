@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Window System - Submission
+by Felix Umland (#406886)
+and Jannick Brändel (#405391)
+"""
+
+import unittest
+
+from tests.headless import runHeadless
+from Window import Window
+from ZOrder import ZOrder, reorderedWindows
+
+
+class ZOrderTest(unittest.TestCase):
+    def setUp(self):
+        # any hashable objects work as windows
+        self.order = ZOrder(["a", "b", "c"])
+
+    def testRaiseWindow(self):
+        self.assertTrue(self.order.raiseWindow("a"))
+        self.assertEqual(list(self.order), ["b", "c", "a"])
+        self.assertEqual(self.order.front(), "a")
+
+    def testRaiseFrontWindowKeepsGeneration(self):
+        generation = self.order.generation
+        self.assertFalse(self.order.raiseWindow("c"))
+        self.assertEqual(self.order.generation, generation)
+
+    def testLowerWindow(self):
+        generation = self.order.generation
+        self.assertFalse(self.order.lowerWindow("a"))
+        self.assertEqual(self.order.generation, generation)
+        self.assertTrue(self.order.lowerWindow("c"))
+        self.assertEqual(list(self.order), ["c", "a", "b"])
+        self.assertGreater(self.order.generation, generation)
+
+    def testAppendAndInsert(self):
+        self.order.append("d")
+        self.order.insert(0, "e")
+        self.order.insert(2, "f")
+        self.order.insert(10, "g")
+        self.assertEqual(list(self.order), ["e", "a", "f", "b", "c", "d", "g"])
+        self.assertEqual(self.order.index("f"), 2)
+        self.assertEqual(self.order[-1], "g")
+        self.assertEqual(len(self.order), 7)
+
+    def testRemove(self):
+        self.order.remove("b")
+        self.assertEqual(list(self.order), ["a", "c"])
+        self.assertNotIn("b", self.order)
+        with self.assertRaises(ValueError):
+            self.order.remove("b")
+
+    def testFrontOfEmptyOrder(self):
+        self.assertIsNone(ZOrder().front())
+
+    def testChangeWhileIterating(self):
+        # iteration uses a snapshot, so raising windows in the loop visits every window once
+        visited = []
+        for window in self.order:
+            self.order.raiseWindow(window)
+            visited.append(window)
+        self.assertEqual(visited, ["a", "b", "c"])
+        self.assertEqual(list(reversed(self.order)), ["c", "b", "a"])
+
+    def testInFrontOf(self):
+        self.order.raiseWindow("a")
+        self.assertEqual(self.order.inFrontOf("b"), ["c", "a"])
+        self.assertEqual(self.order.inFrontOf("a"), [])
+        # the windows are found without building the list of all windows
+        self.assertIsNone(self.order.snapshot)
+
+
+class WindowsInFrontTest(unittest.TestCase):
+    def testChildWindowList(self):
+        parent = Window(0, 0, 100, 100, "Parent")
+        children = [Window(0, 0, 10, 10, "Child " + str(i)) for i in range(4)]
+        parent.childWindows = list(children)
+        for child in children:
+            child.parentWindow = parent
+        self.assertEqual(children[1].windowsInFront(), children[2:])
+        self.assertEqual(children[3].windowsInFront(), [])
+
+    def testTopLevelWindows(self):
+        def script(windowSystem):
+            windows = [windowSystem.createWindowOnScreen(i * 10, 0, 100, 100, str(i) + " Window") for i in range(5)]
+            widget = Window(20, 40, 30, 30, "Widget")
+            windows[0].addChildWindow(widget)
+            windowSystem.bringWindowToFront(windows[1])
+            self.assertEqual(windows[2].windowsInFront(), [windows[3], windows[4], windows[1]])
+            # repainting a widget alone checks the windows in front of its window without the list of all windows
+            self.assertIsNone(windowSystem.screen.childWindows.snapshot)
+            self.assertFalse(windowSystem.canRepaintAlone(widget))
+            self.assertIsNone(windowSystem.screen.childWindows.snapshot)
+
+        runHeadless(script)
+
+
+class ReorderedWindowsTest(unittest.TestCase):
+    def testUnchanged(self):
+        self.assertEqual(reorderedWindows(["a", "b", "c"], ["a", "b", "c"]), set())
+
+    def testRaisedWindow(self):
+        self.assertEqual(reorderedWindows(["a", "b", "c", "d"], ["a", "c", "d", "b"]), {"b"})
+
+    def testLoweredWindow(self):
+        self.assertEqual(reorderedWindows(["a", "b", "c", "d"], ["d", "a", "b", "c"]), {"d"})
+
+    def testAddedAndRemovedWindowsAreIgnored(self):
+        self.assertEqual(reorderedWindows(["a", "b", "c"], ["a", "x", "c"]), set())
+
+    def testFewestMovedWindows(self):
+        moved = reorderedWindows(["a", "b", "c", "d", "e"], ["b", "a", "d", "c", "e"])
+        # one window of each swapped pair moved
+        self.assertEqual(len(moved), 2)
+        self.assertEqual(len(moved & {"a", "b"}), 1)
+        self.assertEqual(len(moved & {"c", "d"}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()